@@ -26,6 +26,7 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Query
@@ -43,6 +44,21 @@ _MULTI_MODEL_CONTEXT_ENV = "BR3_AUTO_CONTEXT"
 
 _SUPPORTED_MODELS = {"claude", "codex", "ollama", "below"}
 
+# One ContextRouter per process: its assembler holds the fingerprint-keyed section
+# cache and the persistent read-only DB connections, so it must outlive a request.
+_context_router: ContextRouter | None = None
+_context_router_lock = threading.Lock()
+
+
+def _get_context_router() -> ContextRouter:
+    """Lazily create the process-wide ContextRouter (import stays side-effect free)."""
+    global _context_router
+    if _context_router is None:
+        with _context_router_lock:
+            if _context_router is None:
+                _context_router = ContextRouter()
+    return _context_router
+
 
 def _multi_model_context_enabled() -> bool:
     return os.environ.get(_MULTI_MODEL_CONTEXT_ENV, "").strip().lower() == "on"
@@ -141,9 +157,7 @@ async def get_context(
         )
 
     try:
-        router_inst = ContextRouter()
-
-        bundle = router_inst.route(
+        bundle = _get_context_router().route(
             model=model_key,
             query=query,
             phase=phase,
@@ -6,10 +6,12 @@ This enables the UI to have full CLI functionality.
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Any, Optional
 import subprocess
 import os
+import json
 from pathlib import Path
 
 from core.runtime.config import RuntimeConfigError, resolve_runtime_selection
@@ -50,6 +52,16 @@ class ReviewSpikeRequest(BaseModel):
     runtimes: list[str] = Field(default_factory=lambda: ["claude", "codex"])
 
 
+class ReviewStreamRequest(BaseModel):
+    """Streamed single-runtime review request."""
+
+    diff_text: str
+    spec_text: str
+    project_root: Optional[str] = None
+    commit_sha: Optional[str] = None
+    runtime: str = "claude"
+
+
 class ReviewSpikeResponse(BaseModel):
     """Normalized review spike response envelope."""
 
@@ -231,6 +243,39 @@ async def execute_review_spike(request: ReviewSpikeRequest) -> ReviewSpikeRespon
         raise HTTPException(status_code=500, detail=f"Review spike failed: {exc}") from exc
 
 
+@router.post("/runtime/review-stream")
+async def stream_review(request: ReviewStreamRequest) -> StreamingResponse:
+    """
+    Streamed review: runtime events as newline-delimited JSON while the review runs.
+
+    Each event (started, token/line chunks, completed/error) is also broadcast to
+    live-update websocket clients as a ``runtime_stream`` message. The final
+    ``completed`` event carries the full result plus ttfb_ms and duration_ms.
+    """
+    if request.runtime not in {"claude", "codex", "ollama"}:
+        raise HTTPException(status_code=400, detail=f"Unsupported runtime: {request.runtime}")
+
+    project_root = request.project_root or str(Path.cwd())
+    if not os.path.exists(project_root):
+        raise HTTPException(status_code=400, detail=f"Project root does not exist: {project_root}")
+
+    from api.websockets.live_updates import broadcast_runtime_stream
+    from core.cluster.cross_model_review import stream_review_spike
+
+    async def ndjson():
+        async for task_id, event in stream_review_spike(
+            diff_text=request.diff_text,
+            spec_text=request.spec_text,
+            commit_sha=request.commit_sha,
+            project_root=project_root,
+            runtime=request.runtime,
+        ):
+            await broadcast_runtime_stream(task_id, request.runtime, event)
+            yield json.dumps({"task_id": task_id, **event.to_dict()}) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.get("/runtime/resolve", response_model=RuntimeResolutionResponse)
 async def resolve_runtime(runtime: Optional[str] = None, cwd: Optional[str] = None) -> RuntimeResolutionResponse:
     """Resolve runtime selection using explicit -> project -> user -> default precedence."""
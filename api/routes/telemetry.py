@@ -41,6 +41,7 @@ def get_event_collector() -> EventCollector:
             storage_path=storage_path,
             db_path=db_path,
             use_sqlite=True,
+            write_behind=True,
         )
     return _event_collector
 
@@ -6,6 +6,7 @@ Provides real-time updates for:
 - Telemetry events
 - Session updates
 - Progress notifications
+- Runtime output streams (token/line chunks while a runtime task runs)
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
@@ -15,6 +16,7 @@ import json
 from datetime import datetime
 
 # Import core modules
+from core.runtime.result_schema import StreamEvent
 from core.telemetry import Event
 
 router = APIRouter()
@@ -251,6 +253,24 @@ async def broadcast_session_update(session_id: str, status: str, data: Dict = No
     await manager.broadcast(message)
 
 
+async def broadcast_runtime_stream(task_id: str, runtime: str, event: StreamEvent):
+    """
+    Broadcast one runtime StreamEvent (token/line chunk or lifecycle event).
+
+    Args:
+        task_id: Runtime task identifier
+        runtime: Runtime name (claude, codex, ollama)
+        event: StreamEvent from BaseRuntime.stream_events / RuntimeRegistry.stream
+    """
+    message = {
+        "type": "runtime_stream",
+        "task_id": task_id,
+        "runtime": runtime,
+        **event.to_dict(),
+    }
+    await manager.broadcast(message)
+
+
 def get_connection_manager() -> ConnectionManager:
     """
     Get the global connection manager.
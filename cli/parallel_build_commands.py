@@ -26,6 +26,7 @@ from core.parallel_build_coordinator import (
     ParallelBuildCoordinator,
     InstanceStatus,
 )
+from core.parallel_state_store import ParallelStateStore
 
 console = Console()
 
@@ -36,7 +37,11 @@ def find_build_spec() -> Optional[Path]:
     if not buildrunner_dir.exists():
         return None
 
-    # Check for parallel_state.json to find active build
+    # Check the coordination store (or a legacy parallel_state.json) for the active build
+    recorded = ParallelStateStore.read_build_spec(buildrunner_dir / "parallel_state.db")
+    if recorded and Path(recorded).exists():
+        return Path(recorded)
+
     state_file = buildrunner_dir / "parallel_state.json"
     if state_file.exists():
         try:
@@ -67,7 +72,7 @@ def get_coordinator(build_spec: Optional[str] = None) -> ParallelBuildCoordinato
         spec_path = find_build_spec()
         if not spec_path:
             raise typer.BadParameter(
-                "No BUILD spec found. Specify with --spec or ensure parallel_state.json exists"
+                "No BUILD spec found. Specify with --spec or ensure parallel_state.db exists"
             )
 
     if not spec_path.exists():
@@ -385,10 +390,12 @@ def build_finish(
 
         # Cleanup state file
         if cleanup:
-            state_file = coord.state_file
-            if state_file.exists():
-                state_file.unlink()
-                console.print(f"\n[green]Cleaned up: {state_file}[/green]")
+            removed = coord.store.delete()
+            if coord.legacy_state_file.exists():
+                coord.legacy_state_file.unlink()
+                removed.append(coord.legacy_state_file)
+            if removed:
+                console.print(f"\n[green]Cleaned up: {coord.state_file}[/green]")
 
         console.print()
 
@@ -5,7 +5,7 @@ Features:
 - Success rate tracking per agent type (explore, test, review, refactor, implement)
 - Cost calculation (token usage × model pricing)
 - Quality scoring (test pass rate, error rate, file changes)
-- Persistence to .buildrunner/agent_metrics.json and SQLite database
+- Persistence to SQLite with per-hour/per-day rollups updated on insert
 - Historical performance analysis
 - Per-task-type performance breakdown
 """
@@ -14,13 +14,14 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
 import json
 import logging
-from collections import defaultdict
+from collections import deque
 
 from core.agents.claude_agent_bridge import AgentType
 from core.persistence.database import Database
+from core.persistence.rollups import RollupTables
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +150,26 @@ class AgentPerformanceSummary:
         return asdict(self)
 
 
+# Per-hour/per-day rollup measures: column -> (aggregate, expression over an agent_metrics row)
+ROLLUP_MEASURES = {
+    "tasks": ("sum", "1"),
+    "successes": ("sum", "CASE WHEN success THEN 1 ELSE 0 END"),
+    "cost_usd": ("sum", "cost_usd"),
+    "min_cost_usd": ("min", "cost_usd"),
+    "max_cost_usd": ("max", "cost_usd"),
+    "total_tokens": ("sum", "total_tokens"),
+    "duration_ms": ("sum", "duration_ms"),
+    "min_duration_ms": ("min", "duration_ms"),
+    "max_duration_ms": ("max", "duration_ms"),
+    "test_pass_rate": ("sum", "test_pass_rate"),
+    "error_rate": ("sum", "error_rate"),
+    "files_created": ("sum", "files_created"),
+    "files_modified": ("sum", "files_modified"),
+}
+
+EXPORT_PAGE_SIZE = 1000
+
+
 class AgentMetrics:
     """Tracks and analyzes agent performance metrics."""
 
@@ -156,13 +177,16 @@ class AgentMetrics:
         self,
         storage_path: Optional[Path] = None,
         db_path: Optional[Path] = None,
+        recent_size: int = 1000,
     ):
         """
         Initialize agent metrics tracker.
 
         Args:
-            storage_path: Path to store metrics JSON (default: .buildrunner/agent_metrics.json)
+            storage_path: Legacy metrics JSON, imported once into an empty database
+                (default: .buildrunner/agent_metrics.json)
             db_path: Path to SQLite database (default: .buildrunner/telemetry.db)
+            recent_size: Number of metrics recorded this session kept in memory
         """
         self.storage_path = storage_path or Path.cwd() / ".buildrunner" / "agent_metrics.json"
         self.db_path = db_path or Path.cwd() / ".buildrunner" / "telemetry.db"
@@ -172,13 +196,20 @@ class AgentMetrics:
 
         # Initialize database
         self.db = Database(self.db_path)
+        self.rollups = RollupTables(
+            self.db,
+            raw_table="agent_metrics",
+            prefix="agent_metrics",
+            keys=["agent_type", "model_used"],
+            measures=ROLLUP_MEASURES,
+        )
         self._init_database()
 
-        # In-memory metrics for current session
-        self.metrics: List[AgentMetric] = []
+        # Recent metrics for the current session; history stays in SQLite
+        self.metrics: Deque[AgentMetric] = deque(maxlen=recent_size)
 
-        # Load existing metrics from file
-        self._load_metrics()
+        # Bring a pre-SQLite metrics file into the database
+        self._import_legacy_json()
 
     def _init_database(self):
         """Initialize SQLite database schema for agent metrics."""
@@ -212,6 +243,9 @@ class AgentMetrics:
         if not self.db.table_exists("agent_metrics"):
             self.db.run_migration(schema)
 
+        # Hourly/daily rollups; backfilled from existing rows on first run
+        self.rollups.create()
+
     def record_metric(
         self,
         agent_type: str,
@@ -273,14 +307,7 @@ class AgentMetrics:
             error_message=error_message,
         )
 
-        # Store in memory
-        self.metrics.append(metric)
-
-        # Store in database
-        self._insert_metric_db(metric)
-
-        # Save to file
-        self._save_metrics()
+        self.add_metric(metric)
 
         logger.info(
             f"Recorded metric for {agent_type} agent on task {task_id}: "
@@ -289,6 +316,16 @@ class AgentMetrics:
 
         return metric
 
+    def add_metric(self, metric: AgentMetric):
+        """
+        Store an already-built metric (e.g. one with a historical timestamp).
+
+        Args:
+            metric: Metric to store
+        """
+        self.metrics.append(metric)
+        self._insert_metrics_db([metric])
+
     def _calculate_cost(self, model_used: str, input_tokens: int, output_tokens: int) -> float:
         """Calculate cost in USD for token usage."""
         # Determine model type from model string
@@ -324,6 +361,9 @@ class AgentMetrics:
         """
         Get performance summary for an agent type.
 
+        Answered from the hourly/daily rollups, so the cost does not grow with
+        the amount of recorded history.
+
         Args:
             agent_type: Agent type to summarize (e.g., "explore"). None for all agents.
             time_period_days: Number of days to include in summary
@@ -331,84 +371,42 @@ class AgentMetrics:
         Returns:
             AgentPerformanceSummary: Performance summary, or None if no data
         """
-        # Filter metrics by agent type and time period
         cutoff_time = datetime.now() - timedelta(days=time_period_days)
+        filters = {"agent_type": agent_type} if agent_type is not None else {}
 
-        filtered_metrics = [
-            m
-            for m in self.metrics
-            if (agent_type is None or m.agent_type == agent_type) and m.timestamp >= cutoff_time
-        ]
-
-        if not filtered_metrics:
+        by_model = self.rollups.window(cutoff_time, filters=filters, group_by=["model_used"])
+        if not by_model:
             return None
 
+        def total(name: str):
+            return sum(row[name] for row in by_model)
+
         # Calculate summary statistics
-        total_tasks = len(filtered_metrics)
-        successful_tasks = sum(1 for m in filtered_metrics if m.success)
+        total_tasks = total("tasks")
+        successful_tasks = total("successes")
         failed_tasks = total_tasks - successful_tasks
-        success_rate = successful_tasks / total_tasks if total_tasks > 0 else 0.0
+        success_rate = successful_tasks / total_tasks
 
         # Cost metrics
-        total_cost = sum(m.cost_usd for m in filtered_metrics)
-        avg_cost = total_cost / total_tasks if total_tasks > 0 else 0.0
-        costs = [m.cost_usd for m in filtered_metrics]
-        min_cost = min(costs) if costs else 0.0
-        max_cost = max(costs) if costs else 0.0
+        total_cost = total("cost_usd")
+        avg_cost = total_cost / total_tasks
 
         # Token metrics
-        total_tokens = sum(m.total_tokens for m in filtered_metrics)
-        avg_tokens = total_tokens // total_tasks if total_tasks > 0 else 0
-
-        # Quality metrics
-        avg_test_pass_rate = (
-            sum(m.test_pass_rate for m in filtered_metrics) / total_tasks
-            if total_tasks > 0
-            else 0.0
-        )
-        avg_error_rate = (
-            sum(m.error_rate for m in filtered_metrics) / total_tasks if total_tasks > 0 else 0.0
-        )
-        avg_files_created = (
-            sum(m.files_created for m in filtered_metrics) / total_tasks if total_tasks > 0 else 0.0
-        )
-        avg_files_modified = (
-            sum(m.files_modified for m in filtered_metrics) / total_tasks
-            if total_tasks > 0
-            else 0.0
-        )
-
-        # Performance metrics
-        durations = [m.duration_ms for m in filtered_metrics]
-        avg_duration = sum(durations) / len(durations) if durations else 0.0
-        min_duration = min(durations) if durations else 0.0
-        max_duration = max(durations) if durations else 0.0
-
-        # Model usage breakdown
-        model_usage = defaultdict(int)
-        cost_by_model = defaultdict(float)
-        for m in filtered_metrics:
-            model_usage[m.model_used] += 1
-            cost_by_model[m.model_used] += m.cost_usd
+        total_tokens = total("total_tokens")
+        avg_tokens = total_tokens // total_tasks
 
         # Calculate trend (7-day trend by comparing to prior period)
         prior_cutoff = cutoff_time - timedelta(days=time_period_days)
-        prior_metrics = [
-            m
-            for m in self.metrics
-            if (agent_type is None or m.agent_type == agent_type)
-            and prior_cutoff <= m.timestamp < cutoff_time
-        ]
+        prior = self.rollups.window(prior_cutoff, cutoff_time, filters=filters)
 
         success_rate_trend = 0.0
         cost_trend = 0.0
 
-        if prior_metrics:
-            prior_success_rate = sum(1 for m in prior_metrics if m.success) / len(prior_metrics)
+        if prior:
+            prior_success_rate = prior[0]["successes"] / prior[0]["tasks"]
             success_rate_trend = success_rate - prior_success_rate
 
-            prior_cost = sum(m.cost_usd for m in prior_metrics)
-            prior_avg_cost = prior_cost / len(prior_metrics)
+            prior_avg_cost = prior[0]["cost_usd"] / prior[0]["tasks"]
             cost_trend = (
                 (avg_cost - prior_avg_cost) / prior_avg_cost * 100 if prior_avg_cost > 0 else 0.0
             )
@@ -421,19 +419,19 @@ class AgentMetrics:
             success_rate=success_rate,
             total_cost_usd=total_cost,
             avg_cost_per_task=avg_cost,
-            min_cost_per_task=min_cost,
-            max_cost_per_task=max_cost,
+            min_cost_per_task=min(row["min_cost_usd"] for row in by_model),
+            max_cost_per_task=max(row["max_cost_usd"] for row in by_model),
             total_tokens=total_tokens,
             avg_tokens_per_task=avg_tokens,
-            avg_test_pass_rate=avg_test_pass_rate,
-            avg_error_rate=avg_error_rate,
-            avg_files_created=avg_files_created,
-            avg_files_modified=avg_files_modified,
-            avg_duration_ms=avg_duration,
-            min_duration_ms=min_duration,
-            max_duration_ms=max_duration,
-            model_usage=dict(model_usage),
-            cost_by_model=dict(cost_by_model),
+            avg_test_pass_rate=total("test_pass_rate") / total_tasks,
+            avg_error_rate=total("error_rate") / total_tasks,
+            avg_files_created=total("files_created") / total_tasks,
+            avg_files_modified=total("files_modified") / total_tasks,
+            avg_duration_ms=total("duration_ms") / total_tasks,
+            min_duration_ms=min(row["min_duration_ms"] for row in by_model),
+            max_duration_ms=max(row["max_duration_ms"] for row in by_model),
+            model_usage={row["model_used"]: row["tasks"] for row in by_model},
+            cost_by_model={row["model_used"]: row["cost_usd"] for row in by_model},
             success_rate_trend=success_rate_trend,
             cost_trend=cost_trend,
         )
@@ -469,28 +467,26 @@ class AgentMetrics:
         Returns:
             AgentPerformanceSummary filtered for the task type, or None
         """
-        # Filter metrics by task description patterns
-        filtered_metrics = [
-            m for m in self.metrics if task_type.lower() in m.task_description.lower()
-        ]
+        # Task descriptions are free text, so this one aggregates the raw rows
+        row = self.db.query_one(
+            f"SELECT {self._aggregate_columns(['tasks', 'successes', 'cost_usd'])} "
+            "FROM agent_metrics WHERE instr(lower(task_description), ?) > 0",
+            (task_type.lower(),),
+        )
 
-        if not filtered_metrics:
+        if not row or not row["tasks"]:
             return None
 
         # Create a summary for the task type
         summary = AgentPerformanceSummary(agent_type=f"task_type:{task_type}")
 
-        summary.total_tasks = len(filtered_metrics)
-        summary.successful_tasks = sum(1 for m in filtered_metrics if m.success)
+        summary.total_tasks = row["tasks"]
+        summary.successful_tasks = row["successes"]
         summary.failed_tasks = summary.total_tasks - summary.successful_tasks
-        summary.success_rate = (
-            summary.successful_tasks / summary.total_tasks if summary.total_tasks > 0 else 0.0
-        )
+        summary.success_rate = summary.successful_tasks / summary.total_tasks
 
-        summary.total_cost_usd = sum(m.cost_usd for m in filtered_metrics)
-        summary.avg_cost_per_task = (
-            summary.total_cost_usd / summary.total_tasks if summary.total_tasks > 0 else 0.0
-        )
+        summary.total_cost_usd = row["cost_usd"]
+        summary.avg_cost_per_task = summary.total_cost_usd / summary.total_tasks
 
         return summary
 
@@ -504,31 +500,18 @@ class AgentMetrics:
         Returns:
             Model name with best success rate and cost efficiency, or None
         """
-        # Filter metrics for this agent type
-        agent_metrics = [m for m in self.metrics if m.agent_type == agent_type]
-
-        if not agent_metrics:
-            return None
-
-        # Group by model and calculate metrics
-        model_stats = defaultdict(lambda: {"success": 0, "total": 0, "cost": 0.0})
-
-        for m in agent_metrics:
-            model_stats[m.model_used]["total"] += 1
-            if m.success:
-                model_stats[m.model_used]["success"] += 1
-            model_stats[m.model_used]["cost"] += m.cost_usd
+        # Group by model across all history (served by the daily rollup)
+        model_stats = self.rollups.window(
+            filters={"agent_type": agent_type}, group_by=["model_used"]
+        )
 
         # Find best model by success rate and cost efficiency
         best_model = None
         best_score = -1.0
 
-        for model, stats in model_stats.items():
-            if stats["total"] == 0:
-                continue
-
-            success_rate = stats["success"] / stats["total"]
-            avg_cost = stats["cost"] / stats["total"]
+        for stats in model_stats:
+            success_rate = stats["successes"] / stats["tasks"]
+            avg_cost = stats["cost_usd"] / stats["tasks"]
 
             # Score: favor high success rate, penalize high cost
             # Weight: 70% success rate, 30% cost efficiency
@@ -540,78 +523,66 @@ class AgentMetrics:
 
             if score > best_score:
                 best_score = score
-                best_model = model
+                best_model = stats["model_used"]
 
         return best_model
 
-    def _insert_metric_db(self, metric: AgentMetric):
-        """Insert metric into database."""
+    @staticmethod
+    def _aggregate_columns(names: List[str]) -> str:
+        """SQL select list aggregating raw agent_metrics rows the way the rollups do."""
+        columns = []
+        for name in names:
+            kind, expr = ROLLUP_MEASURES[name]
+            columns.append(f"{kind.upper()}({expr}) AS {name}")
+        return ", ".join(columns)
+
+    def _insert_metrics_db(self, metrics: List[AgentMetric]):
+        """Insert metrics into database, updating the rollups in the same transaction."""
         try:
-            self.db.insert(
-                "agent_metrics",
-                {
-                    "timestamp": metric.timestamp.isoformat(),
-                    "agent_type": metric.agent_type,
-                    "task_id": metric.task_id,
-                    "task_description": metric.task_description,
-                    "model_used": metric.model_used,
-                    "duration_ms": metric.duration_ms,
-                    "input_tokens": metric.input_tokens,
-                    "output_tokens": metric.output_tokens,
-                    "total_tokens": metric.total_tokens,
-                    "cost_usd": metric.cost_usd,
-                    "success": metric.success,
-                    "test_pass_rate": metric.test_pass_rate,
-                    "error_rate": metric.error_rate,
-                    "files_created": metric.files_created,
-                    "files_modified": metric.files_modified,
-                    "error_message": metric.error_message,
-                },
-            )
+            self.rollups.insert_many([metric.to_dict() for metric in metrics])
         except Exception as e:
             logger.error(f"Failed to insert metric into database: {e}")
 
-    def _save_metrics(self):
-        """Save metrics to JSON file for backup."""
-        try:
-            metrics_data = [m.to_dict() for m in self.metrics]
-            self.storage_path.write_text(json.dumps(metrics_data, indent=2, default=str))
-        except Exception as e:
-            logger.error(f"Failed to save metrics to file: {e}")
+    @staticmethod
+    def _metric_from_dict(item: Dict) -> AgentMetric:
+        """Build a metric from a stored JSON or database row."""
+        return AgentMetric(
+            timestamp=datetime.fromisoformat(item["timestamp"]),
+            agent_type=item["agent_type"],
+            task_id=item["task_id"],
+            task_description=item.get("task_description") or "",
+            model_used=item["model_used"],
+            duration_ms=item["duration_ms"],
+            input_tokens=item["input_tokens"],
+            output_tokens=item["output_tokens"],
+            total_tokens=item["total_tokens"],
+            cost_usd=item["cost_usd"],
+            success=bool(item["success"]),
+            test_pass_rate=item.get("test_pass_rate", 1.0),
+            error_rate=item.get("error_rate", 0.0),
+            files_created=item.get("files_created", 0),
+            files_modified=item.get("files_modified", 0),
+            error_message=item.get("error_message"),
+        )
 
-    def _load_metrics(self):
-        """Load metrics from JSON file."""
+    def _import_legacy_json(self):
+        """One-time import of a pre-rollup agent_metrics.json into an empty database."""
         if not self.storage_path.exists():
             return
+        if self.db.query_one("SELECT 1 AS found FROM agent_metrics LIMIT 1"):
+            return
 
         try:
             data = json.loads(self.storage_path.read_text())
-            for item in data:
-                metric = AgentMetric(
-                    timestamp=datetime.fromisoformat(item["timestamp"]),
-                    agent_type=item["agent_type"],
-                    task_id=item["task_id"],
-                    task_description=item.get("task_description", ""),
-                    model_used=item["model_used"],
-                    duration_ms=item["duration_ms"],
-                    input_tokens=item["input_tokens"],
-                    output_tokens=item["output_tokens"],
-                    total_tokens=item["total_tokens"],
-                    cost_usd=item["cost_usd"],
-                    success=item["success"],
-                    test_pass_rate=item.get("test_pass_rate", 1.0),
-                    error_rate=item.get("error_rate", 0.0),
-                    files_created=item.get("files_created", 0),
-                    files_modified=item.get("files_modified", 0),
-                    error_message=item.get("error_message"),
-                )
-                self.metrics.append(metric)
+            self._insert_metrics_db([self._metric_from_dict(item) for item in data])
+            logger.info(f"Imported {len(data)} legacy metrics from {self.storage_path}")
         except Exception as e:
             logger.error(f"Failed to load metrics from file: {e}")
 
     def clear_metrics(self):
         """Clear all stored metrics."""
         self.metrics.clear()
+        self.rollups.clear()
         if self.storage_path.exists():
             self.storage_path.unlink()
         logger.info("Cleared all stored metrics")
@@ -627,9 +598,26 @@ class AgentMetrics:
             True if successful, False otherwise
         """
         try:
-            metrics_data = [m.to_dict() for m in self.metrics]
-            export_path.write_text(json.dumps(metrics_data, indent=2, default=str))
-            logger.info(f"Exported {len(self.metrics)} metrics to {export_path}")
+            count = 0
+            last_id = 0
+            with open(export_path, "w") as f:
+                f.write("[")
+                # Page through the table so exports do not load all history at once
+                while True:
+                    rows = self.db.query(
+                        "SELECT * FROM agent_metrics WHERE id > ? ORDER BY id LIMIT ?",
+                        (last_id, EXPORT_PAGE_SIZE),
+                    )
+                    if not rows:
+                        break
+                    for row in rows:
+                        f.write(",\n  " if count else "\n  ")
+                        f.write(json.dumps(self._metric_from_dict(row).to_dict(), default=str))
+                        count += 1
+                    last_id = rows[-1]["id"]
+                f.write("\n]\n" if count else "]\n")
+
+            logger.info(f"Exported {count} metrics to {export_path}")
             return True
         except Exception as e:
             logger.error(f"Failed to export metrics: {e}")
@@ -647,30 +635,11 @@ class AgentMetrics:
         """
         try:
             data = json.loads(import_path.read_text())
-            for item in data:
-                metric = AgentMetric(
-                    timestamp=datetime.fromisoformat(item["timestamp"]),
-                    agent_type=item["agent_type"],
-                    task_id=item["task_id"],
-                    task_description=item.get("task_description", ""),
-                    model_used=item["model_used"],
-                    duration_ms=item["duration_ms"],
-                    input_tokens=item["input_tokens"],
-                    output_tokens=item["output_tokens"],
-                    total_tokens=item["total_tokens"],
-                    cost_usd=item["cost_usd"],
-                    success=item["success"],
-                    test_pass_rate=item.get("test_pass_rate", 1.0),
-                    error_rate=item.get("error_rate", 0.0),
-                    files_created=item.get("files_created", 0),
-                    files_modified=item.get("files_modified", 0),
-                    error_message=item.get("error_message"),
-                )
-                self.metrics.append(metric)
+            metrics = [self._metric_from_dict(item) for item in data]
 
             # Save to database
-            for metric in self.metrics:
-                self._insert_metric_db(metric)
+            self.metrics.extend(metrics)
+            self._insert_metrics_db(metrics)
 
             logger.info(f"Imported {len(data)} metrics from {import_path}")
             return True
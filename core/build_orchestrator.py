@@ -184,8 +184,7 @@ class BuildOrchestrator:
 
         # Update task queue status
         for task_id in checkpoint.tasks_completed:
-            if task_id in self.task_queue.tasks:
-                self.task_queue.tasks[task_id].status = TaskStatus.COMPLETED
+            self.task_queue.set_status(task_id, TaskStatus.COMPLETED)
 
         # Reset tasks completed after checkpoint
         files_to_remove = self.checkpoint_manager.get_files_to_rollback(checkpoint_id)
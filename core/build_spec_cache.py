@@ -0,0 +1,104 @@
+"""
+Build Spec Cache - Parse-once cache for BUILD spec analyses
+
+BUILD specs are polled constantly (available-phase queries, claims, /begin
+admission) but change rarely. Each consumer registers a parser under a name;
+the result is computed once per spec version and reused until the spec
+changes. A spec version is identified by (resolved path, mtime_ns, size), so a
+lookup against an unchanged spec costs one stat() and no reads or parsing.
+
+Usage:
+    analysis = get_build_spec_cache().get(Path("BUILD_3.5.md"), "phase_analysis", parse_fn)
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+SpecVersion = Tuple[int, int]  # (st_mtime_ns, st_size)
+
+
+@dataclass
+class _SpecEntry:
+    version: SpecVersion
+    parsed: Dict[str, Any] = field(default_factory=dict)
+
+
+class BuildSpecCache:
+    """
+    LRU cache of parsed BUILD spec analyses, keyed by path and spec version.
+
+    Parsed results are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_specs: int = 32):
+        """
+        Initialize cache.
+
+        Args:
+            max_specs: Number of distinct spec paths kept
+        """
+        self.max_specs = max_specs
+        self._entries: "OrderedDict[Path, _SpecEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path, name: str, parse: Callable[[str], T]) -> T:
+        """
+        Return ``parse(spec_text)`` for the current version of the spec.
+
+        Args:
+            path: BUILD spec path
+            name: Cache slot for this parser (one result per name per version)
+            parse: Function from spec text to the parsed result
+
+        Raises:
+            FileNotFoundError: If the spec does not exist
+        """
+        key = Path(path).resolve()
+        stat = key.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version and name in entry.parsed:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.parsed[name]
+
+        # Parse outside the lock; a concurrent miss just parses twice
+        text = key.read_text(encoding="utf-8")
+        result = parse(text)
+
+        with self._lock:
+            self.misses += 1
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version:
+                entry = _SpecEntry(version=version)
+                self._entries[key] = entry
+            entry.parsed[name] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_specs:
+                self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """Drop one spec (or all specs) from the cache."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(path).resolve(), None)
+
+
+_cache = BuildSpecCache()
+
+
+def get_build_spec_cache() -> BuildSpecCache:
+    """Process-wide BUILD spec cache."""
+    return _cache
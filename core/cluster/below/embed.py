@@ -8,6 +8,12 @@ Usage:
     # Returns list[list[float]], each vector is 768-d.
     # On Below-offline: raises BelowOfflineError (callers should catch and fall through).
 
+    # Many small concurrent callers (e.g. the semantic cache embedding one prompt
+    # per Below call) should use the in-process micro-batcher instead: requests
+    # arriving within MICRO_BATCH_WINDOW_SECONDS are sent as one embed_batch call.
+    from core.cluster.below.embed import embed_coalesced
+    [vector] = embed_coalesced([prompt])
+
 Below API endpoint: POST http://10.0.1.105:11434/api/embed
 Model: nomic-embed-text (768-d output, normalized)
 """
@@ -15,7 +21,11 @@ Model: nomic-embed-text (768-d output, normalized)
 from __future__ import annotations
 
 import logging
+import queue
+import threading
 import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Optional
 
 import httpx
@@ -45,6 +55,13 @@ _CIRCUIT_RESET_WINDOW_SECONDS: float = 60.0
 # Expected embedding dimension
 EMBED_DIM: int = 768
 
+# Micro-batcher: collect concurrent single-text requests for a short window
+MICRO_BATCH_WINDOW_SECONDS: float = 0.005
+MICRO_BATCH_MAX_SIZE: int = 64
+MICRO_BATCH_MAX_IN_FLIGHT: int = 4
+# Upper bound a caller waits for its coalesced vector (covers retries plus queueing)
+MICRO_BATCH_RESULT_TIMEOUT_SECONDS: float = 60.0
+
 
 # ---------------------------------------------------------------------------
 # Exceptions
@@ -198,6 +215,145 @@ def embed_batch(
     ) from last_error
 
 
+# ---------------------------------------------------------------------------
+# Micro-batcher
+# ---------------------------------------------------------------------------
+
+
+class _MicroBatcher:
+    """
+    Coalesces concurrent embed requests into batched embed_batch calls.
+
+    Callers enqueue (model, text, future) items. A lazily started dispatcher
+    thread takes the first waiting item, keeps collecting for `window` seconds
+    or until `max_size` items, groups them by model and hands each group to a
+    small pool that calls embed_batch (at most `max_in_flight` HTTP calls at
+    once). Vectors — or the batch's exception — are fanned back out per item.
+    """
+
+    def __init__(self, window: float, max_size: int, max_in_flight: int) -> None:
+        self._window = window
+        self._max_size = max_size
+        self._max_in_flight = max_in_flight
+        self._queue: "queue.Queue[tuple[str, str, Future]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._dispatcher: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self.batches_sent: int = 0
+        self.items_sent: int = 0
+
+    def submit(self, texts: list[str], model: str) -> list[Future]:
+        self._ensure_started()
+        futures = []
+        for text in texts:
+            fut: Future = Future()
+            self._queue.put((model, text, fut))
+            futures.append(fut)
+        return futures
+
+    def _ensure_started(self) -> None:
+        if self._dispatcher is not None and self._dispatcher.is_alive():
+            return
+        with self._lock:
+            if self._dispatcher is not None and self._dispatcher.is_alive():
+                return
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_in_flight, thread_name_prefix="below-embed"
+                )
+            self._dispatcher = threading.Thread(
+                target=self._run, name="below-embed-batcher", daemon=True
+            )
+            self._dispatcher.start()
+
+    def _run(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            deadline = time.monotonic() + self._window
+            while len(items) < self._max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            by_model: dict[str, list[tuple[str, Future]]] = {}
+            for model, text, fut in items:
+                by_model.setdefault(model, []).append((text, fut))
+            for model, group in by_model.items():
+                try:
+                    self._pool.submit(self._send, model, group)
+                except BaseException as exc:  # noqa: BLE001 — keep the dispatcher alive
+                    logger.warning("Embed micro-batch dispatch failed: %s", exc)
+                    for _, fut in group:
+                        _settle(fut, exc=exc)
+
+    def _send(self, model: str, group: list[tuple[str, Future]]) -> None:
+        texts = [text for text, _ in group]
+        try:
+            vectors = embed_batch(texts, model=model)
+            if len(vectors) != len(group):
+                raise MalformedEmbedResponse(
+                    f"Expected {len(group)} embeddings, got {len(vectors)}"
+                )
+        except BaseException as exc:  # noqa: BLE001 — fan out to every waiter
+            for _, fut in group:
+                _settle(fut, exc=exc)
+            return
+        with self._lock:
+            self.batches_sent += 1
+            self.items_sent += len(group)
+        for (_, fut), vec in zip(group, vectors):
+            _settle(fut, vec)
+
+
+def _settle(fut: Future, result=None, exc: Optional[BaseException] = None) -> None:
+    """Resolve a caller's future unless the caller already gave up on it (timeout/cancel)."""
+    if fut.done():
+        return
+    try:
+        if exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result)
+    except InvalidStateError:
+        pass  # cancelled between the done() check and the set
+
+
+_batcher = _MicroBatcher(
+    MICRO_BATCH_WINDOW_SECONDS, MICRO_BATCH_MAX_SIZE, MICRO_BATCH_MAX_IN_FLIGHT
+)
+
+
+def embed_coalesced(
+    texts: list[str],
+    *,
+    model: str = EMBED_MODEL,
+) -> list[list[float]]:
+    """
+    Embed texts through the in-process micro-batcher.
+
+    Same contract as embed_batch (order preserved, same exceptions), but
+    requests from concurrent callers within a few milliseconds of each other
+    share one HTTP call to Below. The circuit breaker is enforced by the
+    batched embed_batch call, so an open breaker fails the whole batch at once.
+    """
+    if not texts:
+        raise ValueError("embed_coalesced requires at least one text")
+
+    futures = _batcher.submit(texts, model)
+    deadline = time.monotonic() + MICRO_BATCH_RESULT_TIMEOUT_SECONDS
+    try:
+        return [fut.result(timeout=max(0.0, deadline - time.monotonic())) for fut in futures]
+    except FutureTimeoutError as exc:
+        for fut in futures:
+            fut.cancel()
+        raise BelowOfflineError(
+            f"Coalesced embed timed out after {MICRO_BATCH_RESULT_TIMEOUT_SECONDS}s"
+        ) from exc
+
+
 # ---------------------------------------------------------------------------
 # Response validation helpers
 # ---------------------------------------------------------------------------
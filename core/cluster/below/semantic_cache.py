@@ -1,5 +1,5 @@
 """
-semantic_cache.py — Semantic answer cache backed by sqlite-vec.
+semantic_cache.py — Semantic answer cache: SQLite storage + in-memory vector index.
 
 Stores Claude/LLM responses keyed by (model, method_name, prompt_embedding,
 normalized_prompt_hash) so the same prompt family can be served from cache
@@ -8,6 +8,13 @@ without paying for a redundant API call.
 DB location: $HOME/.buildrunner/state/answer_cache.db  (NOT in repo)
 Table:        answer_cache (created on first use)
 
+Vector index:
+    Each (model, method) partition is loaded from SQLite once into a matrix of
+    L2-normalized embeddings (NumPy when installed, pre-normalized tuples
+    otherwise). Lookup is a single matrix–vector product + argmax; store and
+    TTL eviction update the partition in place. Rows written by other
+    processes are picked up incrementally via `id > last_seen_id`.
+
 Cache key design:
     - model:               prevents cross-model response bleed
     - method_name:         separates review, summarize, classify, etc.
@@ -42,6 +49,7 @@ import argparse
 import hashlib
 import json
 import logging
+import struct
 import time
 from pathlib import Path
 from typing import Optional
@@ -67,7 +75,7 @@ EMBED_DIM: int = 768
 
 class SemanticCache:
     """
-    Semantic answer cache using sqlite-vec for approximate nearest-neighbour lookup.
+    Semantic answer cache with a per-(model, method) in-memory vector index.
 
     Args:
         db_path:    Path to the SQLite database file (created if absent).
@@ -89,6 +97,7 @@ class SemanticCache:
         self.warmup_days = warmup_days
         self._conn = None
         self._initialized = False
+        self._indexes: dict[tuple[str, str], _VectorIndex] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -190,6 +199,7 @@ class SemanticCache:
             self._ensure_init()
             cur = self._conn.execute("DELETE FROM answer_cache")
             self._conn.commit()
+            self._indexes.clear()
             return cur.rowcount
         except Exception as exc:
             logger.debug("clear failed: %s", exc)
@@ -254,15 +264,36 @@ class SemanticCache:
             );
             CREATE INDEX IF NOT EXISTS idx_answer_cache_model_method
                 ON answer_cache (model, method);
+            CREATE INDEX IF NOT EXISTS idx_answer_cache_stored_at
+                ON answer_cache (stored_at);
         """)
         self._conn.commit()
 
     def _embed(self, prompt: str) -> list[float]:
-        """Embed prompt via Below. Raises BelowOfflineError on failure."""
-        from core.cluster.below.embed import embed_batch
-        vecs = embed_batch([prompt])
+        """Embed prompt via Below's micro-batcher. Raises BelowOfflineError on failure."""
+        from core.cluster.below.embed import embed_coalesced
+        vecs = embed_coalesced([prompt])
         return vecs[0]
 
+    def _index_for(self, model: str, method: str) -> "_VectorIndex":
+        """Return the (model, method) index, pulling in rows added since last sync."""
+        key = (model, method)
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._indexes[key] = _VectorIndex()
+        cur = self._conn.execute(
+            "SELECT id, prompt_hash, embedding, stored_at FROM answer_cache "
+            "WHERE model = ? AND method = ? AND id > ? ORDER BY id",
+            (model, method, index.max_id),
+        )
+        for row_id, stored_hash, blob, stored_at in cur.fetchall():
+            stored_vec = _unpack(blob)
+            if len(stored_vec) != EMBED_DIM:
+                index.max_id = max(index.max_id, row_id)
+                continue
+            index.upsert(row_id, stored_hash, stored_vec, stored_at)
+        return index
+
     def _query(
         self,
         model: str,
@@ -271,56 +302,32 @@ class SemanticCache:
         prompt_hash: str,
     ) -> Optional[str]:
         """Find the nearest cached entry for (model, method) and return answer if above threshold."""
-        import struct
-
         # Evict expired entries first
         self._evict_expired()
 
-        # Retrieve all entries for (model, method)
-        cur = self._conn.execute(
-            "SELECT prompt_hash, embedding, answer, stored_at FROM answer_cache "
-            "WHERE model = ? AND method = ?",
-            (model, method),
-        )
-        rows = cur.fetchall()
-        if not rows:
+        index = self._index_for(model, method)
+        if not index:
             return None
 
-        best_score = -1.0
-        best_answer: Optional[str] = None
-        best_stored_at: Optional[float] = None
-
-
-        for row in rows:
-            stored_hash = row[0]
-            blob = row[1]
-            answer = row[2]
-            stored_at = row[3]
-
-            # Deserialize embedding
-            n = len(blob) // 4
-            stored_vec = list(struct.unpack(f"{n}f", blob))
-            if len(stored_vec) != EMBED_DIM:
-                continue
-
-            # Cosine similarity
-            score = _cosine_similarity(vec, stored_vec)
-
-            # Exact-match bonus: if hashes match, treat as perfect hit
-            if stored_hash == prompt_hash:
-                score = 1.0
-
-            if score > best_score:
-                best_score = score
-                best_answer = answer
-                best_stored_at = stored_at
+        # Exact-match guard: identical normalized prompt is a perfect hit
+        row_id = index.id_for_hash(prompt_hash)
+        best_score = 1.0
+        if row_id is None:
+            row_id, best_score = index.top1(vec)
+        if row_id is None or best_score < self.threshold:
+            return None
 
-        if best_score < self.threshold:
+        row = self._conn.execute(
+            "SELECT answer, stored_at FROM answer_cache WHERE id = ?", (row_id,)
+        ).fetchone()
+        if row is None:
+            # Deleted by another process (e.g. admin clear) — forget it
+            index.remove(row_id)
             return None
+        best_answer, best_stored_at = row[0], row[1]
 
         # Warm-up guard: log but don't serve during warm-up period
         if best_stored_at is not None:
-            entry_age_days = (time.time() - best_stored_at) / 86400
             cache_age_days = (time.time() - self._cache_created_at()) / 86400
             if cache_age_days < self.warmup_days:
                 logger.info(
@@ -343,23 +350,34 @@ class SemanticCache:
         prompt_hash: str,
         answer: str,
     ) -> None:
-        import struct
         blob = struct.pack(f"{len(vec)}f", *vec)
         now = time.time()
-        self._conn.execute(
+        cur = self._conn.execute(
             "INSERT OR REPLACE INTO answer_cache "
             "(model, method, prompt_hash, embedding, answer, stored_at) "
             "VALUES (?, ?, ?, ?, ?, ?)",
             (model, method, prompt_hash, blob, answer, now),
         )
         self._conn.commit()
+        index = self._indexes.get((model, method))
+        if index is not None and len(vec) == EMBED_DIM:
+            index.upsert(cur.lastrowid, prompt_hash, vec, now)
 
     def _evict_expired(self) -> None:
         cutoff = time.time() - self.ttl_days * 86400
-        self._conn.execute(
-            "DELETE FROM answer_cache WHERE stored_at < ?", (cutoff,)
+        expired = self._conn.execute(
+            "SELECT id, model, method FROM answer_cache WHERE stored_at < ?", (cutoff,)
+        ).fetchall()
+        if not expired:
+            return
+        self._conn.executemany(
+            "DELETE FROM answer_cache WHERE id = ?", [(row_id,) for row_id, _, _ in expired]
         )
         self._conn.commit()
+        for row_id, model, method in expired:
+            index = self._indexes.get((model, method))
+            if index is not None:
+                index.remove(row_id)
 
     def _cache_created_at(self) -> float:
         """Return timestamp of oldest entry (proxy for cache creation time)."""
@@ -369,11 +387,128 @@ class SemanticCache:
         return time.time()  # empty cache → treat as new
 
 
+# ---------------------------------------------------------------------------
+# In-memory vector index
+# ---------------------------------------------------------------------------
+
+
+class _VectorIndex:
+    """
+    L2-normalized embeddings for one (model, method) partition.
+
+    Uses a growable NumPy float32 matrix when NumPy is importable so top-1 is
+    one matrix–vector product; otherwise falls back to pre-normalized tuples
+    (still no per-lookup BLOB decoding or norm computation).
+    """
+
+    def __init__(self) -> None:
+        self.max_id: int = 0
+        self._ids: list[int] = []
+        self._pos: dict[int, int] = {}
+        self._hash_to_id: dict[str, int] = {}
+        self._id_to_hash: dict[int, str] = {}
+        self._np = _numpy()
+        self._rows: list = []      # pure-Python fallback storage
+        self._matrix = None        # NumPy storage, capacity >= len(self)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def upsert(self, row_id: int, prompt_hash: str, vec: list[float], stored_at: float) -> None:
+        old = self._hash_to_id.get(prompt_hash)
+        if old is not None:
+            self.remove(old)
+        pos = len(self._ids)
+        self._pos[row_id] = pos
+        self._ids.append(row_id)
+        self._hash_to_id[prompt_hash] = row_id
+        self._id_to_hash[row_id] = prompt_hash
+        self.max_id = max(self.max_id, row_id)
+        np = self._np
+        if np is None:
+            self._rows.append(_normalize(vec))
+            return
+        if self._matrix is None or pos >= self._matrix.shape[0]:
+            grown = np.zeros((max(64, pos * 2), len(vec)), dtype=np.float32)
+            if self._matrix is not None:
+                grown[:pos] = self._matrix[:pos]
+            self._matrix = grown
+        row = np.asarray(vec, dtype=np.float32)
+        norm = float(np.linalg.norm(row))
+        self._matrix[pos] = row / norm if norm > 0.0 else row
+
+    def remove(self, row_id: int) -> None:
+        """Swap-remove a row in O(1)."""
+        pos = self._pos.pop(row_id, None)
+        if pos is None:
+            return
+        last = len(self._ids) - 1
+        if pos != last:
+            moved_id = self._ids[last]
+            self._ids[pos] = moved_id
+            self._pos[moved_id] = pos
+            if self._np is None:
+                self._rows[pos] = self._rows[last]
+            else:
+                self._matrix[pos] = self._matrix[last]
+        self._ids.pop()
+        if self._np is None:
+            self._rows.pop()
+        prompt_hash = self._id_to_hash.pop(row_id, None)
+        if self._hash_to_id.get(prompt_hash) == row_id:
+            del self._hash_to_id[prompt_hash]
+
+    def id_for_hash(self, prompt_hash: str) -> Optional[int]:
+        return self._hash_to_id.get(prompt_hash)
+
+    def top1(self, vec: list[float]) -> tuple[Optional[int], float]:
+        """Return (row_id, cosine score) of the nearest stored vector."""
+        if not self._ids:
+            return None, -1.0
+        np = self._np
+        if np is not None:
+            query = np.asarray(vec, dtype=np.float32)
+            norm = float(np.linalg.norm(query))
+            if norm == 0.0:
+                return self._ids[0], 0.0
+            scores = self._matrix[:len(self._ids)] @ (query / norm)
+            best = int(scores.argmax())
+            return self._ids[best], float(scores[best])
+        query = _normalize(vec)
+        best, best_score = 0, -1.0
+        for i, row in enumerate(self._rows):
+            score = sum(x * y for x, y in zip(query, row))
+            if score > best_score:
+                best, best_score = i, score
+        return self._ids[best], best_score
+
+
+def _numpy():
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+
+def _unpack(blob: bytes) -> list[float]:
+    n = len(blob) // 4
+    return list(struct.unpack(f"{n}f", blob))
+
+
 # ---------------------------------------------------------------------------
 # Math helpers
 # ---------------------------------------------------------------------------
 
 
+def _normalize(v: list[float]) -> tuple[float, ...]:
+    """L2-normalize a vector. Zero vectors stay zero (cosine 0 against anything)."""
+    norm = sum(x * x for x in v) ** 0.5
+    if norm == 0.0:
+        return tuple(0.0 for _ in v)
+    return tuple(x / norm for x in v)
+
+
 def _cosine_similarity(a: list[float], b: list[float]) -> float:
     """Compute cosine similarity between two vectors."""
     dot = sum(x * y for x, y in zip(a, b))
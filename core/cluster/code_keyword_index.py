@@ -0,0 +1,166 @@
+"""
+BR3 Cluster — Lockwood Code Keyword Index
+SQLite FTS5 (BM25) keyword leg for hybrid code search on node_semantic.
+
+Kept in lock-step with the `codebase` LanceDB table by run_index: the same chunk
+IDs are upserted after embedding and deleted with stale chunks. Lives next to
+the LanceDB table at ``<LANCE_DIR>/codebase_fts.db``.
+
+Tokenization is tuned for identifier lookups:
+    - `text`   — unicode61 with `_` as a token char, so `run_index` and
+                 `SemanticCache` (lower-cased) match as whole identifiers
+    - `idents` — camelCase / snake_case parts (`semantic cache`, `run index`)
+                 so natural-language queries still hit identifier-heavy code
+
+Usage (from node_semantic):
+    from core.cluster.code_keyword_index import CodeKeywordIndex, rrf_fuse
+
+    kw = CodeKeywordIndex(path)
+    kw.upsert(rows)                      # rows shaped like LanceDB codebase rows
+    hits = kw.search("parse_phase_dependencies", limit=10)
+    fused = rrf_fuse([vector_ids, [h["id"] for h in hits]])
+"""
+
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Optional
+
+FTS_FILENAME = "codebase_fts.db"
+RRF_K = 60
+
+_WORD_RE = re.compile(r"\w+")
+_IDENT_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+KEYWORD_COLUMNS = (
+    "id", "repo", "file", "start_line", "end_line", "block_name", "block_type", "text",
+)
+
+
+def identifier_parts(text: str) -> str:
+    """Split camelCase / snake_case identifiers into lower-case words."""
+    parts = []
+    for ident in _IDENT_RE.findall(text):
+        pieces = [p.lower() for chunk in ident.split("_") for p in _CAMEL_RE.findall(chunk)]
+        if len(pieces) > 1:
+            parts.extend(pieces)
+    return " ".join(parts)
+
+
+def _match_expr(query: str) -> str:
+    """Build an FTS5 MATCH expression: OR of quoted query terms (BM25 ranks all-term hits first)."""
+    terms = []
+    for term in _WORD_RE.findall(query.lower()):
+        if term not in terms:
+            terms.append(term)
+    return " OR ".join(f'"{t}"' for t in terms)
+
+
+def rrf_fuse(rankings: list[list[str]], k: int = RRF_K) -> list[tuple[str, float]]:
+    """Reciprocal-rank fusion of ranked ID lists. Returns (id, score) best-first."""
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (k + rank + 1)
+    return sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+
+
+class CodeKeywordIndex:
+    """BM25 full-text index over codebase chunks, backed by SQLite FTS5."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        os.makedirs(self.path.parent, exist_ok=True)
+        with self._connect() as conn:
+            # External-content FTS5: `chunks` holds the rows (unique index on id keeps
+            # deletes O(log n)); triggers keep `chunks_fts` in sync.
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS chunks (
+                    rowid       INTEGER PRIMARY KEY,
+                    id          TEXT NOT NULL UNIQUE,
+                    repo        TEXT,
+                    file        TEXT,
+                    start_line  INTEGER,
+                    end_line    INTEGER,
+                    block_name  TEXT,
+                    block_type  TEXT,
+                    text        TEXT,
+                    idents      TEXT
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
+                    text, idents, content='chunks', content_rowid='rowid',
+                    tokenize="unicode61 tokenchars '_'"
+                );
+                CREATE TRIGGER IF NOT EXISTS chunks_ai AFTER INSERT ON chunks BEGIN
+                    INSERT INTO chunks_fts(rowid, text, idents)
+                    VALUES (new.rowid, new.text, new.idents);
+                END;
+                CREATE TRIGGER IF NOT EXISTS chunks_ad AFTER DELETE ON chunks BEGIN
+                    INSERT INTO chunks_fts(chunks_fts, rowid, text, idents)
+                    VALUES ('delete', old.rowid, old.text, old.idents);
+                END;
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per call: searches run on request threads while run_index writes
+        conn = sqlite3.connect(str(self.path), timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def upsert(self, rows: Iterable[dict]) -> int:
+        """Insert chunk rows (LanceDB `codebase` shape), replacing any with the same ID."""
+        rows = list(rows)
+        if not rows:
+            return 0
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM chunks WHERE id = ?", [(r["id"],) for r in rows])
+            conn.executemany(
+                "INSERT INTO chunks (id, repo, file, start_line, end_line, block_name, "
+                "block_type, text, idents) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        r["id"], r.get("repo", ""), r.get("file", ""),
+                        int(r.get("start_line", 0) or 0), int(r.get("end_line", 0) or 0),
+                        r.get("block_name", "") or "", r.get("block_type", "") or "",
+                        r.get("text", ""), identifier_parts(r.get("text", "")),
+                    )
+                    for r in rows
+                ],
+            )
+        return len(rows)
+
+    def delete(self, ids: Iterable[str]) -> None:
+        """Remove chunks by ID."""
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM chunks WHERE id = ?", [(i,) for i in ids])
+
+    def ids(self) -> set[str]:
+        with self._connect() as conn:
+            return {row[0] for row in conn.execute("SELECT id FROM chunks")}
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    def search(self, query: str, limit: int = 10, repo: Optional[str] = None) -> list[dict]:
+        """BM25-ranked chunk rows for `query`, best first. Empty list on no usable terms."""
+        expr = _match_expr(query)
+        if not expr:
+            return []
+        cols = ", ".join(f"c.{col}" for col in KEYWORD_COLUMNS)
+        sql = (
+            f"SELECT {cols}, bm25(chunks_fts, 1.0, 0.5) AS rank FROM chunks_fts "
+            "JOIN chunks c ON c.rowid = chunks_fts.rowid WHERE chunks_fts MATCH ?"
+        )
+        params: list = [expr]
+        if repo:
+            sql += " AND c.repo = ?"
+            params.append(repo)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [dict(zip(KEYWORD_COLUMNS + ("bm25",), row)) for row in rows]
@@ -6,12 +6,17 @@ and the research library into a sized bundle ready for injection.
 Feature-gated: BR3_AUTO_CONTEXT=on must be set. Default OFF until Phase 13.
 
 IMPORTANT: Read-only surface. No mutation of any source through this module.
+Sources are extracted concurrently and each section is cached per assembler, keyed
+by a source fingerprint (file stat, SQLite data_version, query), so a dispatch only
+rebuilds sections whose sources changed.
 IMPORTANT: Two-layer [private] filter — filter runs here as defense-in-depth AFTER
            sync-cluster-context.sh already stripped [private] lines at the mirror.
            Filtering ONLY here is insufficient (raw decisions.log would still be readable
            on Otis/Below outside the bundle path).
-IMPORTANT: Token budgets enforced via count-tokens.sh (tokenizer-true). No byte fallback.
-           If count-tokens.sh exits 2 (tokenizer missing), bundle is REFUSED — never assembled.
+IMPORTANT: Token budgets enforced via the in-process tokenizer registry (tokenizer-true,
+           same tokenizers as count-tokens.sh; falls back to count-tokens.sh itself when
+           a tokenizer can't be loaded in-process). No byte fallback. If neither is
+           available, bundle is REFUSED — never assembled.
 """
 
 from __future__ import annotations
@@ -19,14 +24,16 @@ from __future__ import annotations
 import logging
 import os
 import sqlite3
-import subprocess
-import tempfile
-from dataclasses import dataclass, field
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Hashable
 
 from core.cluster.log_utils import get_decisions_log_path
+from core.cluster.tokenizer_registry import MODEL_TOKENIZERS, get_tokenizer
 
 logger = logging.getLogger(__name__)
 
@@ -57,9 +64,6 @@ _JIMMY_MEMORY_DB = Path("/srv/jimmy/memory/memory.db")
 _JIMMY_INTEL_DB = Path("/srv/jimmy/memory/intel.db")
 _JIMMY_RESEARCH = Path("/srv/jimmy/research-library")
 
-# count-tokens.sh path (Phase 10 deliverable)
-_COUNT_TOKENS_SH = HOME / ".buildrunner" / "scripts" / "count-tokens.sh"
-
 # Exclusion patterns — NEVER include files matching these in any bundle
 _EXCLUSION_PATTERNS = [
     "secrets.env",
@@ -111,6 +115,7 @@ class ContextBundle:
         token_total — sum of tokens across all sections (tokenizer-true)
         budget      — {limit, used, tokenizer} for the response
         assembled_at — UTC ISO timestamp
+        section_stats — {source_type: {cache_hit, build_ms}} for this assembly
     """
 
     model: str
@@ -118,6 +123,7 @@ class ContextBundle:
     token_total: int = 0
     budget: dict[str, Any] = field(default_factory=dict)
     assembled_at: str = ""
+    section_stats: dict[str, dict[str, Any]] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -135,6 +141,7 @@ class ContextBundle:
             "token_total": self.token_total,
             "budget": self.budget,
             "assembled_at": self.assembled_at,
+            "section_stats": self.section_stats,
         }
 
     def to_prompt_block(self) -> str:
@@ -149,67 +156,36 @@ class ContextBundle:
 
 
 # ---------------------------------------------------------------------------
-# Token counting — via count-tokens.sh (exit-2 = fail-closed)
+# Token counting — in-process tokenizer registry (missing tokenizer = fail-closed)
 # ---------------------------------------------------------------------------
 
 
 def count_tokens(text: str, model: str) -> int:
     """Return tokenizer-true token count for text.
 
-    Calls count-tokens.sh --model <model> via subprocess.
-    Raises RuntimeError on exit 2 (tokenizer unavailable) — NO byte fallback.
-    Maps 'ollama' → 'ollama', everything else → 'claude' or 'codex' per spec.
+    Uses the process-wide tokenizer for the model (loaded once).
+    Raises RuntimeError when the tokenizer is unavailable — NO byte fallback.
+    Maps 'ollama' → qwen2.5, 'claude'/'codex' → cl100k_base.
 
     Args:
         text:  Content to count.
         model: One of 'claude', 'codex', 'ollama'.
 
     Raises:
-        RuntimeError: tokenizer unavailable (exit 2) — bundle must be refused.
+        RuntimeError: tokenizer unavailable — bundle must be refused.
         ValueError:   bad model argument.
     """
-    if not _COUNT_TOKENS_SH.exists():
-        raise RuntimeError(
-            f"count-tokens.sh not found at {_COUNT_TOKENS_SH}. "
-            "Cannot enforce token budgets. Bundle refused."
-        )
-
-    valid_models = ("claude", "codex", "ollama")
-    if model not in valid_models:
-        raise ValueError(f"Unknown model '{model}'. Must be one of: {valid_models}")
+    return count_tokens_batch([text], model)[0]
 
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".txt", delete=False, encoding="utf-8"
-    ) as tf:
-        tf.write(text)
-        tmp_path = tf.name
 
-    try:
-        result = subprocess.run(
-            [str(_COUNT_TOKENS_SH), "--model", model, tmp_path],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+def count_tokens_batch(texts: list[str], model: str) -> list[int]:
+    """Return tokenizer-true token counts for several texts, encoded in one batch.
 
-    if result.returncode == 2:
-        raise RuntimeError(
-            f"count-tokens.sh exited 2 (tokenizer unavailable for model={model}). "
-            "Bundle REFUSED — no byte-count fallback permitted."
-        )
-    if result.returncode != 0:
-        raise RuntimeError(
-            f"count-tokens.sh failed (exit {result.returncode}): {result.stderr.strip()}"
-        )
-
-    try:
-        return int(result.stdout.strip())
-    except ValueError as exc:
-        raise RuntimeError(
-            f"count-tokens.sh returned non-integer: {result.stdout!r}"
-        ) from exc
+    Raises:
+        RuntimeError: tokenizer unavailable — bundle must be refused.
+        ValueError:   bad model argument.
+    """
+    return get_tokenizer(model).count_batch(texts)
 
 
 # ---------------------------------------------------------------------------
@@ -481,6 +457,93 @@ def _rerank_research_candidates(
     return out
 
 
+# ---------------------------------------------------------------------------
+# Source fingerprints — a section is rebuilt only when its fingerprint changes
+# ---------------------------------------------------------------------------
+
+
+def _file_fingerprint(*paths: Path) -> tuple:
+    """Stat identity (inode, mtime, size) of each path; missing files included."""
+    out: list[tuple] = []
+    for path in paths:
+        try:
+            st = path.stat()
+            out.append((str(path), st.st_ino, st.st_mtime_ns, st.st_size))
+        except OSError:
+            out.append((str(path), None))
+    return tuple(out)
+
+
+def _research_fingerprint(query: str, ttl_days: int = 30) -> tuple:
+    """Candidate set + mtimes of the research library, the query and today's date.
+
+    The date keeps the mtime-TTL fallback honest as documents age out.
+    """
+    for research_root in (_RESEARCH_LIBRARY, _JIMMY_RESEARCH):
+        if research_root.exists():
+            break
+    else:
+        return ("missing", query)
+
+    stats: list[tuple[str, int, int]] = []
+    for ext in ("*.md", "*.txt", "*.json"):
+        for doc in research_root.rglob(ext):
+            try:
+                st = doc.stat()
+            except OSError:
+                continue
+            stats.append((str(doc), st.st_mtime_ns, st.st_size))
+    stats.sort()
+    today = datetime.now(tz=timezone.utc).date().isoformat()
+    return (str(research_root), query, ttl_days, today, len(stats), hash(tuple(stats)))
+
+
+class _DataVersionWatcher:
+    """Persistent read-only connections used to read PRAGMA data_version.
+
+    data_version changes whenever another connection commits, including WAL
+    writes that have not touched the main file's mtime yet. One connection is
+    kept per DB path (reopened if the file is replaced).
+    """
+
+    def __init__(self) -> None:
+        self._conns: dict[str, tuple[int, sqlite3.Connection]] = {}
+        self._lock = threading.Lock()
+
+    def fingerprint(self, *candidates: Path) -> Hashable | None:
+        """Fingerprint of the first existing candidate DB; None if unreadable."""
+        for db_path in candidates:
+            if db_path.exists():
+                break
+        else:
+            return ("missing",)
+
+        try:
+            inode = db_path.stat().st_ino
+            key = str(db_path)
+            with self._lock:
+                entry = self._conns.get(key)
+                if entry is None or entry[0] != inode:
+                    if entry is not None:
+                        entry[1].close()
+                    conn = sqlite3.connect(
+                        f"file:{db_path}?mode=ro", uri=True, timeout=5, check_same_thread=False
+                    )
+                    entry = (inode, conn)
+                    self._conns[key] = entry
+                (version,) = entry[1].execute("PRAGMA data_version").fetchone()
+        except (sqlite3.Error, OSError) as exc:
+            logger.debug("_DataVersionWatcher: cannot read %s: %s", db_path, exc)
+            return None
+        return (key, inode, version)
+
+    def close(self) -> None:
+        with self._lock:
+            for _inode, conn in self._conns.values():
+                conn.close()
+            self._conns.clear()
+
+
 # ---------------------------------------------------------------------------
 # Bundle assembler
 # ---------------------------------------------------------------------------
@@ -489,12 +552,107 @@ def _rerank_research_candidates(
 class ContextBundleAssembler:
     """Assembles per-model context bundles.
 
+    The five sources are extracted concurrently. Extracted sections are cached
+    on the assembler keyed by source fingerprint, so repeated dispatches only
+    rebuild sections whose logs, DBs or query changed.
+
     Usage::
 
         assembler = ContextBundleAssembler()
         bundle = assembler.assemble(model="codex", token_budget=48000)
+        assembler.cache_stats()  # {source_type: {hits, misses, hit_rate, avg_build_ms}}
     """
 
+    def __init__(self, cache_sections: bool = True) -> None:
+        """
+        Args:
+            cache_sections: Reuse extracted sections while their fingerprint is unchanged.
+        """
+        self.cache_sections = cache_sections
+        self._cache: dict[str, tuple[Hashable, BundleSection]] = {}
+        self._stats: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._versions = _DataVersionWatcher()
+
+    def _section_sources(
+        self, query: str
+    ) -> list[tuple[str, Callable[[], BundleSection], Callable[[], Hashable | None]]]:
+        """(source_type, extractor, fingerprint) for the five sources, in bundle order."""
+        return [
+            (
+                "logs",
+                _extract_logs,
+                lambda: _file_fingerprint(_BROWSER_LOG, _SUPABASE_LOG, _DEVICE_LOG, _QUERY_LOG),
+            ),
+            (
+                "decisions",
+                _extract_decisions,
+                lambda: _file_fingerprint(_DECISIONS_PUBLIC_LOG, _DECISIONS_LOG),
+            ),
+            (
+                "memory",
+                _extract_memory,
+                lambda: self._versions.fingerprint(_MEMORY_DB, _JIMMY_MEMORY_DB),
+            ),
+            (
+                "intel",
+                _extract_intel,
+                lambda: self._versions.fingerprint(_INTEL_DB, _JIMMY_INTEL_DB),
+            ),
+            (
+                "research",
+                lambda: _extract_research(query=query),
+                lambda: _research_fingerprint(query),
+            ),
+        ]
+
+    def _build_section(
+        self,
+        source_type: str,
+        extract: Callable[[], BundleSection],
+        fingerprint: Callable[[], Hashable | None],
+    ) -> tuple[BundleSection, bool, float]:
+        """Return (section, cache_hit, build_ms); the section is safe to mutate."""
+        start = time.perf_counter()
+        key = fingerprint() if self.cache_sections else None
+
+        cached = self._cache.get(source_type)
+        if key is not None and cached is not None and cached[0] == key:
+            section, hit = replace(cached[1]), True
+        else:
+            section, hit = extract(), False
+            if key is not None:
+                with self._lock:
+                    self._cache[source_type] = (key, replace(section))
+
+        build_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            stats = self._stats.setdefault(
+                source_type, {"hits": 0, "misses": 0, "build_ms_total": 0.0}
+            )
+            stats["hits" if hit else "misses"] += 1
+            stats["build_ms_total"] += build_ms
+        return section, hit, build_ms
+
+    def cache_stats(self) -> dict[str, dict[str, float]]:
+        """Cumulative per-section cache hit rate and average build time."""
+        with self._lock:
+            out = {}
+            for source_type, stats in self._stats.items():
+                builds = stats["hits"] + stats["misses"]
+                out[source_type] = {
+                    "hits": stats["hits"],
+                    "misses": stats["misses"],
+                    "hit_rate": stats["hits"] / builds if builds else 0.0,
+                    "avg_build_ms": stats["build_ms_total"] / builds if builds else 0.0,
+                }
+            return out
+
+    def clear_cache(self) -> None:
+        """Drop cached sections (forces a full rebuild on the next assemble)."""
+        with self._lock:
+            self._cache.clear()
+
     def assemble(
         self,
         model: str,
@@ -506,8 +664,8 @@ class ContextBundleAssembler:
         """Assemble a context bundle for the given model.
 
         Returns a ContextBundle with all five source types populated (where available).
-        Token budget is enforced via count-tokens.sh. If tokenizer is unavailable,
-        raises RuntimeError (fail-closed — never falls back to byte counting).
+        Token budget is enforced with the in-process tokenizer. If tokenizer is
+        unavailable, raises RuntimeError (fail-closed — never falls back to byte counting).
 
         Args:
             model:        Target model — 'claude', 'codex', or 'ollama'.
@@ -517,7 +675,7 @@ class ContextBundleAssembler:
             skill:        Optional skill hint.
 
         Raises:
-            RuntimeError: tokenizer unavailable (count-tokens.sh exit 2).
+            RuntimeError: tokenizer unavailable.
             ValueError:   unsupported model.
         """
         if not _multi_model_context_enabled():
@@ -530,25 +688,37 @@ class ContextBundleAssembler:
                 assembled_at=datetime.now(tz=timezone.utc).isoformat(),
             )
 
-        valid_models = ("claude", "codex", "ollama")
-        if model not in valid_models:
-            raise ValueError(f"Unknown model '{model}'. Must be one of: {valid_models}")
+        if model not in MODEL_TOKENIZERS:
+            raise ValueError(
+                f"Unknown model '{model}'. Must be one of: {tuple(MODEL_TOKENIZERS)}"
+            )
 
         # Determine tokenizer name for budget field
-        tokenizer_name = "cl100k_base" if model in ("claude", "codex") else "qwen2.5"
-
-        # Extract all five source types. Query is forwarded to the
-        # research extractor so Phase-7 reranking replaces the legacy
-        # 30-day mtime glob when a query is provided.
-        sections_raw = [
-            _extract_logs(),
-            _extract_decisions(),
-            _extract_memory(),
-            _extract_intel(),
-            _extract_research(query=query),
-        ]
+        tokenizer_name = MODEL_TOKENIZERS[model]
+
+        # Extract all five source types concurrently, reusing cached sections
+        # whose fingerprint is unchanged. Query is forwarded to the research
+        # extractor (and its fingerprint) so Phase-7 reranking replaces the
+        # legacy 30-day mtime glob when a query is provided.
+        sources = self._section_sources(query)
+        with ThreadPoolExecutor(
+            max_workers=len(sources), thread_name_prefix="context-bundle"
+        ) as pool:
+            built = list(pool.map(lambda src: self._build_section(*src), sources))
+
+        sections_raw = [section for section, _hit, _ms in built]
+        section_stats = {
+            source_type: {"cache_hit": hit, "build_ms": round(build_ms, 3)}
+            for (source_type, _extract, _fp), (_section, hit, build_ms) in zip(sources, built)
+        }
 
-        # Count tokens per section; trim to budget
+        # Count all non-empty sections in one batch (fail-closed: a tokenizer
+        # error propagates — never falls back to bytes); trim to budget
+        counts = iter(
+            count_tokens_batch(
+                [s.content for s in sections_raw if s.content.strip()], model
+            )
+        )
         assembled_sections: list[BundleSection] = []
         used_tokens = 0
 
@@ -558,11 +728,7 @@ class ContextBundleAssembler:
                 assembled_sections.append(section)
                 continue
 
-            try:
-                tok = count_tokens(section.content, model)
-            except RuntimeError:
-                # Tokenizer unavailable — fail-closed, do NOT fall back to bytes
-                raise
+            tok = next(counts)
 
             if used_tokens + tok > token_budget:
                 # Trim content to fit remaining budget
@@ -573,10 +739,8 @@ class ContextBundleAssembler:
                     section.tokens = 0
                     assembled_sections.append(section)
                     continue
-                # Binary-search trim: take first N chars that fit
-                trimmed = _trim_to_budget(section.content, model, remaining)
-                section.content = trimmed
-                tok = count_tokens(trimmed, model)
+                # Single-pass trim at a token boundary
+                section.content, tok = _trim_to_budget(section.content, model, remaining)
 
             section.tokens = tok
             used_tokens += tok
@@ -592,31 +756,28 @@ class ContextBundleAssembler:
                 "tokenizer": tokenizer_name,
             },
             assembled_at=datetime.now(tz=timezone.utc).isoformat(),
+            section_stats=section_stats,
         )
 
 
-def _trim_to_budget(text: str, model: str, max_tokens: int) -> str:
-    """Trim text to fit within max_tokens using binary search on character count."""
-    if not text:
-        return text
+_TRIM_MARKER = "\n...[trimmed to budget]"
 
-    lo, hi = 0, len(text)
-    best = ""
 
-    for _ in range(20):  # max iterations
-        mid = (lo + hi) // 2
-        candidate = text[:mid]
-        try:
-            tok = count_tokens(candidate, model)
-        except RuntimeError:
-            raise
-        if tok <= max_tokens:
-            best = candidate
-            lo = mid + 1
-        else:
-            hi = mid - 1
+def _trim_to_budget(text: str, model: str, max_tokens: int) -> tuple[str, int]:
+    """Trim text to fit within max_tokens, cutting at a token boundary.
 
-        if lo > hi:
-            break
+    The trim marker's tokens are reserved out of max_tokens before cutting.
 
-    return best + ("\n...[trimmed to budget]" if best != text else "")
+    Returns:
+        (trimmed text, its token count)
+    """
+    if not text:
+        return text, 0
+
+    tokenizer = get_tokenizer(model)
+    marker_tokens = tokenizer.count(_TRIM_MARKER)
+    prefix, _ = tokenizer.truncate(text, max_tokens - marker_tokens)
+    if not prefix:
+        return "", 0
+    trimmed = prefix + _TRIM_MARKER
+    return trimmed, tokenizer.count(trimmed)
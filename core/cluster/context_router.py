@@ -5,7 +5,7 @@ Skills MUST NOT bypass this module when fetching model context.
 
 Feature-gated: BR3_AUTO_CONTEXT=on. Default OFF until Phase 13.
 
-Per-model token budgets (tokenizer-true via count-tokens.sh):
+Per-model token budgets (tokenizer-true via core.cluster.tokenizer_registry):
   claude  → 32K tokens  (cl100k_base)
   codex   → 48K tokens  (cl100k_base)
   ollama  → 16K tokens  (qwen2.5)
@@ -42,7 +42,7 @@ class ModelRoutingConfig:
     Fields:
         model            — canonical model name
         token_budget     — hard output bundle limit (tokenizer-true)
-        tokenizer_name   — name passed to count-tokens.sh --model
+        tokenizer_name   — tokenizer_registry model key for this model
         tokenizer_display — human-readable name for the budget.tokenizer field
         sources          — ordered list of source type names to include
         description      — brief role description
@@ -152,7 +152,7 @@ class ContextRouter:
         """Assemble a context bundle for model using the authoritative per-model config.
 
         If BR3_AUTO_CONTEXT is OFF, returns an empty ContextBundle.
-        If the tokenizer is unavailable (count-tokens.sh exit 2), raises RuntimeError
+        If the tokenizer is unavailable (TokenizerUnavailable), raises RuntimeError
         (fail-closed — never falls back to byte counting).
 
         Args:
@@ -184,13 +184,24 @@ class ContextRouter:
                 assembled_at="",
             )
 
-        return self._assembler.assemble(
+        bundle = self._assembler.assemble(
             model=config.model,
             token_budget=config.token_budget,
             query=query,
             phase=phase,
             skill=skill,
         )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "ContextRouter: model=%s sections %s",
+                config.model,
+                _format_section_stats(bundle.section_stats),
+            )
+        return bundle
+
+    def cache_stats(self) -> dict[str, dict[str, float]]:
+        """Cumulative per-section cache hit rate and average build time (ms)."""
+        return self._assembler.cache_stats()
 
     def list_models(self) -> list[str]:
         """Return canonical model names (excluding aliases)."""
@@ -199,3 +210,11 @@ class ContextRouter:
     def budgets(self) -> dict[str, int]:
         """Return {model: token_budget} for all canonical models."""
         return {m: ROUTING_TABLE[m].token_budget for m in self.list_models()}
+
+
+def _format_section_stats(section_stats: dict[str, dict[str, Any]]) -> str:
+    """Render {source: {cache_hit, build_ms}} as 'logs=hit/0.1ms memory=miss/4.2ms'."""
+    return " ".join(
+        f"{source}={'hit' if stats.get('cache_hit') else 'miss'}/{stats.get('build_ms', 0):.1f}ms"
+        for source, stats in section_stats.items()
+    )
@@ -36,6 +36,7 @@ import subprocess
 import sys
 import tempfile
 import time
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -736,7 +737,12 @@ async def run_review_spike_async(
     registry = create_phase1_runtime_registry(config)
     selected_runtimes = registry.create_many(runtime_names)
 
-    results = await asyncio.gather(*(registration.adapter.run_review(task) for registration in selected_runtimes))
+    # One copy of the task per runtime, dispatched together through the registry
+    # fan-out: wall time tracks the slowest runtime, not the sum.
+    results = await registry.execute_many_async(
+        replace(task, authoritative_runtime=registration.name)
+        for registration in selected_runtimes
+    )
     return {
         "task_id": task.task_id,
         "mode": "parallel",
@@ -748,6 +754,30 @@ async def run_review_spike_async(
     }
 
 
+async def stream_review_spike(
+    diff_text, spec_text, commit_sha, project_root, runtime="claude", config=None
+):
+    """Run one runtime's review and yield ``(task_id, StreamEvent)`` as output arrives.
+
+    Same task compilation and routing as run_review_spike_async(); the last event
+    is ``completed`` (payload: result dict, ttfb_ms, duration_ms) or ``error``.
+    """
+    from core.runtime.context_compiler import compile_review_task
+    from core.runtime.runtime_registry import create_phase1_runtime_registry
+
+    config = config or load_config()
+    task, _context_summary = compile_review_task(
+        diff_text=diff_text,
+        spec_text=spec_text,
+        project_root=project_root,
+        commit_sha=commit_sha,
+    )
+    registry = create_phase1_runtime_registry(config)
+    registration = registry.create_many([runtime])[0]
+    async for event in registry.stream(replace(task, authoritative_runtime=registration.name)):
+        yield task.task_id, event
+
+
 def run_review_spike(diff_text, spec_text, commit_sha, project_root, runtimes=None, config=None):
     """Sync wrapper for CLI/tests around the async Phase 1 review spike."""
     return asyncio.run(
@@ -11,12 +11,15 @@ import asyncio
 import json
 import logging
 import os
+import sqlite3
+import threading
 import time
 from pathlib import Path
 from typing import Optional
 
 from core.cluster.cluster_config import get_jimmy_semantic_url, get_below_ollama_url, get_below_model
-from core.cluster.utils import last_checked_lock, cosine_similarity
+from core.cluster.title_index import dedup_embeddings, pack_embedding, unpack_embedding
+from core.cluster.utils import last_checked_lock, title_hash
 
 try:
     import httpx
@@ -31,6 +34,12 @@ JIMMY_URL = get_jimmy_semantic_url()        # single source of truth — core/cl
 BELOW_OLLAMA_URL = get_below_ollama_url()   # single source of truth — core/cluster/cluster_config.py
 BELOW_MODEL = get_below_model()             # single source of truth — core/cluster/cluster_config.py
 BELOW_EMBED_MODEL = os.environ.get("BELOW_EMBED_MODEL", "nomic-embed-text")
+EMBED_BATCH_SIZE = int(os.environ.get("HUNT_EMBED_BATCH_SIZE", "64"))  # titles per /api/embed call
+TITLE_CACHE_PATH = Path(os.environ.get(
+    "HUNT_TITLE_CACHE_DB",
+    os.path.expanduser("~/.buildrunner/state/hunt_title_embeddings.db"),
+))
+TITLE_CACHE_MAX_AGE_DAYS = int(os.environ.get("HUNT_TITLE_CACHE_MAX_AGE_DAYS", "30"))
 CHECK_HUNTS_INTERVAL = int(os.environ.get("CHECK_HUNTS_INTERVAL", "300"))  # 5min
 
 
@@ -382,71 +391,164 @@ async def _detect_pairs(hunt_id: int, config: dict):
         logger.error(f"Pair detection failed: {e}")
 
 
+# --- Title Embedding Cache ---
+
+class TitleEmbeddingCache:
+    """SQLite cache of listing-title embeddings keyed by (model, normalized title hash).
+
+    Listings reappear on every hunt cycle, so each title is embedded once and
+    reused until unused for TITLE_CACHE_MAX_AGE_DAYS. Cache errors are logged
+    and treated as misses.
+
+    One instance is shared by the sourcer thread and the API event loop, so the
+    connection is opened with check_same_thread=False and every use holds _lock.
+    """
+
+    def __init__(self, db_path: Path = None):
+        self.db_path = Path(db_path or TITLE_CACHE_PATH)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        """Open the connection on first use. Caller must hold _lock."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS title_embeddings (
+                       model TEXT NOT NULL,
+                       title_hash TEXT NOT NULL,
+                       embedding BLOB NOT NULL,
+                       used_at REAL NOT NULL,
+                       PRIMARY KEY (model, title_hash)
+                   )"""
+            )
+            conn.execute(
+                "DELETE FROM title_embeddings WHERE used_at < ?",
+                (time.time() - TITLE_CACHE_MAX_AGE_DAYS * 86400,),
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, model: str, titles: list[str]) -> dict[str, list[float]]:
+        """Return {title: embedding} for the titles already cached."""
+        # Titles that normalize to the same hash (e.g. differ only by case) share an entry
+        by_hash: dict[str, list[str]] = {}
+        for t in titles:
+            by_hash.setdefault(title_hash(t), []).append(t)
+        found = {}
+        hits = []
+        try:
+            with self._lock:
+                conn = self._db()
+                hashes = list(by_hash)
+                for start in range(0, len(hashes), 500):
+                    chunk = hashes[start:start + 500]
+                    rows = conn.execute(
+                        f"""SELECT title_hash, embedding FROM title_embeddings
+                            WHERE model = ? AND title_hash IN ({",".join("?" * len(chunk))})""",
+                        (model, *chunk),
+                    ).fetchall()
+                    for hashed, blob in rows:
+                        hits.append(hashed)
+                        vec = unpack_embedding(blob)
+                        for t in by_hash[hashed]:
+                            found[t] = vec
+                if hits:
+                    now = time.time()
+                    conn.executemany(
+                        "UPDATE title_embeddings SET used_at = ?"
+                        " WHERE model = ? AND title_hash = ?",
+                        [(now, model, hashed) for hashed in hits],
+                    )
+                    conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Title embedding cache read failed: {e}")
+        return found
+
+    def put_many(self, model: str, embeddings: dict[str, list[float]]):
+        """Store embeddings for titles."""
+        if not embeddings:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._db()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO title_embeddings VALUES (?, ?, ?, ?)",
+                    [(model, title_hash(t), pack_embedding(v), now) for t, v in embeddings.items()],
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Title embedding cache write failed: {e}")
+
+
+_title_cache: Optional[TitleEmbeddingCache] = None
+_title_cache_lock = threading.Lock()
+
+
+def _get_title_cache() -> TitleEmbeddingCache:
+    global _title_cache
+    with _title_cache_lock:
+        if _title_cache is None:
+            _title_cache = TitleEmbeddingCache()
+        return _title_cache
+
+
 # --- Below Dedup (Title Similarity) ---
 
+async def _embed_titles(client, titles: list[str]) -> dict[str, list[float]]:
+    """Embed titles via Below in batches of EMBED_BATCH_SIZE. Failed batches are skipped."""
+    embeddings = {}
+    for start in range(0, len(titles), EMBED_BATCH_SIZE):
+        chunk = titles[start:start + EMBED_BATCH_SIZE]
+        try:
+            resp = await client.post(
+                f"{BELOW_OLLAMA_URL}/api/embed",
+                json={"model": BELOW_EMBED_MODEL, "input": chunk},
+            )
+            if resp.status_code != 200:
+                continue
+            embs = resp.json().get("embeddings", [])
+            if len(embs) == len(chunk):
+                embeddings.update((t, e) for t, e in zip(chunk, embs) if e)
+        except Exception as e:
+            logger.debug(f"Title embed batch failed: {e}")
+    return embeddings
+
+
 async def _dedup_by_title_similarity(items: list[dict], threshold: float = 0.85) -> list[dict]:
     """Remove items whose titles are too similar to each other.
     Uses Below's embedding endpoint for semantic dedup.
+
+    Titles are looked up in the persistent embedding cache first; only unseen
+    titles are sent to Below, in batched requests.
     """
     if not httpx or not items or len(items) < 2:
         return items
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Get embeddings for all titles
-            embeddings = {}
-            for item in items:
-                title = item.get("name", "")
-                if not title:
-                    continue
-                try:
-                    resp = await client.post(
-                        f"{BELOW_OLLAMA_URL}/api/embed",
-                        json={"model": BELOW_EMBED_MODEL, "input": title},
-                    )
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        embs = data.get("embeddings", [])
-                        if embs:
-                            embeddings[id(item)] = embs[0]
-                except Exception:
-                    continue
-
-            if len(embeddings) < 2:
-                return items
-
-            # Remove duplicates using shared cosine_similarity
-            kept = []
-            seen_ids = set()
-
-            for item in items:
-                item_id = id(item)
-                if item_id in seen_ids:
-                    continue
-
-                emb = embeddings.get(item_id)
-                if not emb:
-                    kept.append(item)
-                    continue
-
-                is_dup = False
-                for kept_item in kept:
-                    kept_emb = embeddings.get(id(kept_item))
-                    if not kept_emb:
-                        continue
-                    sim = cosine_similarity(emb, kept_emb)
-                    if sim > threshold:
-                        is_dup = True
-                        break
-
-                if not is_dup:
-                    kept.append(item)
-                else:
-                    seen_ids.add(item_id)
-
-            if len(items) != len(kept):
-                logger.info(f"Title dedup: {len(items)} -> {len(kept)} items")
-            return kept
+        titles = list(dict.fromkeys(item.get("name", "") for item in items if item.get("name")))
+        cache = _get_title_cache()
+        embeddings = cache.get_many(BELOW_EMBED_MODEL, titles)
+        missing = [t for t in titles if t not in embeddings]
+        if missing:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                fresh = await _embed_titles(client, missing)
+            cache.put_many(BELOW_EMBED_MODEL, fresh)
+            embeddings.update(fresh)
+
+        vectors = [embeddings.get(item.get("name", "")) for item in items]
+        if sum(1 for v in vectors if v) < 2:
+            return items
+
+        kept = [items[i] for i in dedup_embeddings(vectors, threshold)]
+        if len(items) != len(kept):
+            logger.info(f"Title dedup: {len(items)} -> {len(kept)} items")
+        return kept
 
     except Exception as e:
         logger.warning(f"Title dedup failed: {e}")
@@ -0,0 +1,172 @@
+"""
+BR3 Cluster — Lockwood Index Manifest
+Persisted per-file manifest for the incremental `codebase` LanceDB indexer.
+
+Stored next to the LanceDB table (``<LANCE_DIR>/codebase.manifest.json``) so a
+restart of the semantic node only re-embeds files that actually changed:
+
+    {"version": 1, "files": {"<abs path>": {"mtime": ..., "size": ...,
+                                           "hash": "<sha1>", "chunk_ids": [...]}}}
+
+Change detection is two-tier: a matching (mtime, size) pair short-circuits
+without reading the file; otherwise the content hash decides whether the file
+must be re-chunked. A touched-but-identical file only refreshes its stat fields.
+
+Usage (from node_semantic.run_index):
+    from core.cluster.index_manifest import IndexManifest, ManifestEntry
+
+    manifest = IndexManifest.load(path)
+    plan = manifest.diff(files)
+    ... delete plan.stale_chunk_ids, embed plan.changed ...
+    manifest.save()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+MANIFEST_FILENAME = "codebase.manifest.json"
+
+
+def content_hash(path: Path) -> str:
+    """SHA-1 of the file's bytes. Returns "" if the file can't be read."""
+    h = hashlib.sha1()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(65536), b""):
+                h.update(block)
+    except OSError:
+        return ""
+    return h.hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    """Indexed state of one source file."""
+    mtime: float
+    size: int
+    hash: str
+    chunk_ids: list[str] = field(default_factory=list)
+
+
+@dataclass
+class IndexPlan:
+    """Result of diffing the manifest against the files currently on disk.
+
+    ``changed`` maps path -> fresh entry (chunk_ids empty until re-indexed);
+    ``touched`` maps path -> entry whose content is unchanged but stat moved;
+    ``stale_chunk_ids`` are chunks of changed or deleted files to drop.
+    """
+    changed: dict[str, ManifestEntry] = field(default_factory=dict)
+    touched: dict[str, ManifestEntry] = field(default_factory=dict)
+    deleted: list[str] = field(default_factory=list)
+    stale_chunk_ids: set[str] = field(default_factory=set)
+    unchanged: int = 0
+
+
+class IndexManifest:
+    """Path -> ManifestEntry map persisted as JSON with atomic replace."""
+
+    def __init__(self, path: Path, files: Optional[dict[str, ManifestEntry]] = None):
+        self.path = Path(path)
+        self.files: dict[str, ManifestEntry] = files or {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path) -> "IndexManifest":
+        """Load a manifest from disk. Missing or corrupt files yield an empty manifest."""
+        path = Path(path)
+        if not path.exists():
+            return cls(path)
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") != MANIFEST_VERSION:
+                logger.warning("Index manifest %s has unknown version, starting fresh", path)
+                return cls(path)
+            files = {
+                key: ManifestEntry(
+                    mtime=float(raw.get("mtime", 0.0)),
+                    size=int(raw.get("size", 0)),
+                    hash=str(raw.get("hash", "")),
+                    chunk_ids=list(raw.get("chunk_ids", [])),
+                )
+                for key, raw in data.get("files", {}).items()
+            }
+            return cls(path, files)
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Index manifest %s unreadable (%s), starting fresh", path, e)
+            return cls(path)
+
+    def save(self) -> None:
+        """Write the manifest atomically (tmp file + os.replace)."""
+        with self._lock:
+            payload = {
+                "version": MANIFEST_VERSION,
+                "files": {key: asdict(entry) for key, entry in self.files.items()},
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(json.dumps(payload, separators=(",", ":")))
+            os.replace(tmp, self.path)
+
+    def all_chunk_ids(self) -> set[str]:
+        """Every chunk ID the manifest claims is in the table."""
+        ids: set[str] = set()
+        for entry in self.files.values():
+            ids.update(entry.chunk_ids)
+        return ids
+
+    def diff(self, files: Iterable[Path]) -> IndexPlan:
+        """Compare on-disk files against the manifest. Does not mutate the manifest."""
+        plan = IndexPlan()
+        seen: set[str] = set()
+        for f in files:
+            key = str(f)
+            seen.add(key)
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            prev = self.files.get(key)
+            if prev is not None and prev.mtime == st.st_mtime and prev.size == st.st_size:
+                plan.unchanged += 1
+                continue
+            fh = content_hash(f)
+            if prev is not None and fh and prev.hash == fh:
+                plan.touched[key] = ManifestEntry(st.st_mtime, st.st_size, fh, list(prev.chunk_ids))
+                continue
+            plan.changed[key] = ManifestEntry(st.st_mtime, st.st_size, fh)
+            if prev is not None:
+                plan.stale_chunk_ids.update(prev.chunk_ids)
+
+        for key, entry in self.files.items():
+            if key not in seen:
+                plan.deleted.append(key)
+                plan.stale_chunk_ids.update(entry.chunk_ids)
+        return plan
+
+    def apply(self, plan: IndexPlan, indexed: dict[str, list[str]]) -> None:
+        """Fold a completed plan back in.
+
+        ``indexed`` maps path -> chunk IDs actually inserted. Changed files that
+        are missing from it (embed/insert failure) are dropped from the manifest
+        so the next run retries them.
+        """
+        with self._lock:
+            for key in plan.deleted:
+                self.files.pop(key, None)
+            self.files.update(plan.touched)
+            for key, entry in plan.changed.items():
+                if key in indexed:
+                    entry.chunk_ids = list(indexed[key])
+                    self.files[key] = entry
+                else:
+                    self.files.pop(key, None)
@@ -114,6 +114,9 @@ def _ensure_intel_tables(conn: sqlite3.Connection):
         ("active_hunts", "completion_notes", "TEXT"),
         # Phase 2: persistent last_checked_at for multi-process double-fire guard
         ("active_hunts", "last_checked_at", "TEXT"),
+        # Title embeddings for semantic dedup (float32 BLOB, written by intel_scoring)
+        ("intel_items", "title_embedding", "BLOB"),
+        ("deal_items", "title_embedding", "BLOB"),
     ]
     for table, col, col_def in _migrate_columns:
         try:
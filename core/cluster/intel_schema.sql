@@ -22,7 +22,8 @@ CREATE TABLE IF NOT EXISTS intel_items (
     dismissed INTEGER NOT NULL DEFAULT 0,
     opus_reviewed INTEGER NOT NULL DEFAULT 0,
     needs_opus_review INTEGER NOT NULL DEFAULT 0,
-    url_hash TEXT  -- for deduplication
+    url_hash TEXT,  -- for deduplication
+    title_embedding BLOB  -- float32 title embedding for semantic dedup
 );
 
 CREATE INDEX IF NOT EXISTS idx_intel_priority ON intel_items(priority);
@@ -79,6 +80,7 @@ CREATE TABLE IF NOT EXISTS deal_items (
     seller_verification_source TEXT,  -- 'apify_reddit', 'apify_ebay', 'ebay_api'
     seller_verified_at TEXT,  -- when verification ran
     seller_verification_error TEXT,  -- error message if verification failed
+    title_embedding BLOB,  -- float32 name embedding for semantic dedup
     FOREIGN KEY (hunt_id) REFERENCES active_hunts(id)
 );
 
@@ -19,7 +19,7 @@ import threading
 from typing import Optional
 
 from core.cluster.cluster_config import get_below_ollama_url, get_below_model
-from core.cluster.utils import cosine_similarity
+from core.cluster.title_index import TitleIndex, pack_embedding, unpack_embedding
 
 try:
     import httpx
@@ -36,6 +36,8 @@ BELOW_REQUEST_TIMEOUT = float(os.environ.get("BELOW_REQUEST_TIMEOUT", "60"))
 DISCORD_DEAL_WEBHOOK_URL = os.environ.get("DISCORD_DEAL_WEBHOOK_URL", "")
 SCORING_INTERVAL = int(os.environ.get("SCORING_INTERVAL", "1800"))  # 30 minutes
 DEDUP_SIMILARITY_THRESHOLD = float(os.environ.get("DEDUP_SIMILARITY_THRESHOLD", "0.92"))
+EMBED_BATCH_SIZE = int(os.environ.get("EMBED_BATCH_SIZE", "64"))  # titles per /api/embed call
+DEDUP_WINDOW = "-2 days"  # SQLite datetime modifier for the dedup lookback
 
 # Valid values
 VALID_CATEGORIES = {
@@ -111,7 +113,33 @@ async def _call_below_embed(text: str) -> Optional[list[float]]:
         return None
 
 
-# cosine_similarity imported from core.cluster.utils
+async def _call_below_embed_batch(texts: list[str]) -> Optional[list[list[float]]]:
+    """Embed several texts in one /api/embed request. Returns None on failure."""
+    if not texts:
+        return []
+    if not httpx:
+        return None
+
+    try:
+        async with httpx.AsyncClient(
+            timeout=httpx.Timeout(BELOW_REQUEST_TIMEOUT, connect=BELOW_CONNECT_TIMEOUT)
+        ) as client:
+            resp = await client.post(
+                f"{BELOW_OLLAMA_URL}/api/embed",
+                json={"model": BELOW_MODEL, "input": texts},
+            )
+            resp.raise_for_status()
+            embeddings = resp.json().get("embeddings", [])
+            if len(embeddings) != len(texts):
+                logger.warning(
+                    f"Below embed returned {len(embeddings)} vectors for {len(texts)} inputs"
+                )
+                return None
+            return embeddings
+    except Exception as e:
+        logger.warning(f"Below embed failed: {e}")
+        return None
+
 
 # --- Intel Scoring ---
 
@@ -268,49 +296,98 @@ def _flag_needs_opus_review(item_id: int, item_type: str = "intel"):
 
 # --- Deduplication ---
 
+# item_type -> (table, title column, "already scored" condition)
+_DEDUP_TABLES = {
+    "intel": ("intel_items", "title", "scored = 1"),
+    "deal": ("deal_items", "name", "deal_score IS NOT NULL"),
+}
+
+
+async def _store_title_embeddings(conn, item_type: str, items: list[tuple[int, str]]) -> dict:
+    """Embed titles lacking a stored embedding (batched Below calls) and persist them.
+
+    Titles are sent EMBED_BATCH_SIZE at a time; a failed chunk is skipped and its
+    items are embedded again on a later cycle.
+
+    Returns {item_id: embedding} for the items that were embedded.
+    """
+    table = _DEDUP_TABLES[item_type][0]
+    stored = {}
+    for start in range(0, len(items), EMBED_BATCH_SIZE):
+        chunk = items[start:start + EMBED_BATCH_SIZE]
+        embeddings = await _call_below_embed_batch([title for _, title in chunk])
+        if not embeddings:
+            continue
+        for (item_id, _), vec in zip(chunk, embeddings):
+            if vec:
+                conn.execute(
+                    f"UPDATE {table} SET title_embedding = ? WHERE id = ?",
+                    (pack_embedding(vec), item_id),
+                )
+                stored[item_id] = vec
+        conn.commit()
+    return stored
+
+
+async def _load_dedup_index(conn, item_type: str = "intel") -> TitleIndex:
+    """Load stored title embeddings of already-scored items from the last 48h.
+
+    Rows scored before embeddings were persisted are embedded once here and
+    written back, so later cycles read them straight from the DB.
+    """
+    table, title_col, scored = _DEDUP_TABLES[item_type]
+    rows = conn.execute(
+        f"""SELECT id, {title_col} AS title, title_embedding FROM {table}
+            WHERE collected_at >= datetime('now', ?) AND {scored}""",
+        (DEDUP_WINDOW,),
+    ).fetchall()
+
+    index = TitleIndex()
+    missing = []
+    for row in rows:
+        if row["title_embedding"] is None:
+            missing.append((row["id"], row["title"]))
+        else:
+            index.add(row["id"], row["title"], unpack_embedding(row["title_embedding"]))
+
+    backfilled = await _store_title_embeddings(conn, item_type, missing)
+    for item_id, title in missing:
+        if item_id in backfilled:
+            index.add(item_id, title, backfilled[item_id])
+    return index
+
+
+def _find_duplicate(title: str, embedding: list[float], index: TitleIndex) -> bool:
+    """Return True if the embedding is within the dedup threshold of an indexed title."""
+    _, match_title, sim = index.best_match(embedding)
+    if sim > DEDUP_SIMILARITY_THRESHOLD:
+        logger.info(
+            f"Duplicate detected: '{title}' similar to '{match_title}' (cosine={sim:.3f})"
+        )
+        return True
+    return False
+
+
 async def _check_duplicate_by_embedding(title: str, item_type: str = "intel") -> bool:
     """Check if a title is a semantic duplicate of recent items via Below embeddings.
     Returns True if duplicate found (cosine similarity > threshold).
+
+    Compares against the stored embeddings of the last 48h, so only the new
+    title is embedded. score_intel_items loads the window once per cycle and
+    calls _find_duplicate directly instead.
     """
     from core.cluster.intel_collector import _get_intel_db
     conn = _get_intel_db()
 
     try:
-        # Get recent titles from last 48h
-        if item_type == "intel":
-            rows = conn.execute(
-                """SELECT title FROM intel_items
-                   WHERE collected_at >= datetime('now', '-2 days')
-                   AND scored = 1""",
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                """SELECT name as title FROM deal_items
-                   WHERE collected_at >= datetime('now', '-2 days')
-                   AND deal_score IS NOT NULL""",
-            ).fetchall()
-
-        if not rows:
+        index = await _load_dedup_index(conn, item_type)
+        if not len(index):
             return False
 
-        # Get embedding for new title
         new_embedding = await _call_below_embed(title)
         if not new_embedding:
             return False  # Can't check — not a duplicate
-
-        # Check against each recent title
-        for row in rows:
-            existing_embedding = await _call_below_embed(row["title"])
-            if existing_embedding:
-                sim = cosine_similarity(new_embedding, existing_embedding)
-                if sim > DEDUP_SIMILARITY_THRESHOLD:
-                    logger.info(
-                        f"Duplicate detected: '{title}' similar to '{row['title']}' "
-                        f"(cosine={sim:.3f})"
-                    )
-                    return True
-
-        return False
+        return _find_duplicate(title, new_embedding, index)
     finally:
         conn.close()
 
@@ -365,6 +442,19 @@ async def score_intel_items() -> dict:
     unscored = conn.execute(
         "SELECT * FROM intel_items WHERE scored = 0 ORDER BY collected_at ASC"
     ).fetchall()
+
+    # Embed each title once (batched) and keep it; dedup then runs against the
+    # in-memory 48h window instead of re-embedding every recent title per item.
+    embeddings = {
+        row["id"]: unpack_embedding(row["title_embedding"])
+        for row in unscored if row["title_embedding"] is not None
+    }
+    embeddings.update(await _store_title_embeddings(
+        conn, "intel",
+        [(row["id"], row["title"]) for row in unscored if row["id"] not in embeddings],
+    ))
+    dedup_index = await _load_dedup_index(conn, "intel") if unscored else TitleIndex()
+    window_start = conn.execute("SELECT datetime('now', ?)", (DEDUP_WINDOW,)).fetchone()[0]
     conn.close()
 
     stats = {"total": len(unscored), "scored": 0, "flagged": 0, "duplicates": 0, "errors": 0}
@@ -372,9 +462,13 @@ async def score_intel_items() -> dict:
     for row in unscored:
         item = dict(row)
         item_id = item["id"]
+        embedding = embeddings.get(item_id)
 
-        # Deduplication check
-        is_dup = await _check_duplicate_by_embedding(item["title"], "intel")
+        # Deduplication check. Every item ends up scored = 1 below, so later
+        # items in this cycle dedup against it too (if it is inside the window).
+        is_dup = bool(embedding) and _find_duplicate(item["title"], embedding, dedup_index)
+        if embedding and item["collected_at"] >= window_start:
+            dedup_index.add(item_id, item["title"], embedding)
         if is_dup:
             # Mark as scored but with low priority to avoid re-processing
             conn = _get_intel_db()
@@ -0,0 +1,74 @@
+"""
+BR3 Cluster — Incremental Log Tailing
+Byte-offset checkpoints for append-only project logs.
+
+Each LogTail remembers the file identity (st_dev, st_ino) and the offset it
+has consumed up to, so a poll reads only bytes appended since the last one.
+A new inode (rotation) or a file shorter than the checkpoint (truncation)
+restarts the tail. The first read of a file, and the first read after a
+restart, only looks at the last ``bootstrap_bytes`` / ``tail_lines``. This
+matches what a whole-file read that keeps the last N lines would see, without
+reading multi-hundred-MB logs.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+TAIL_LINES = 500
+BOOTSTRAP_BYTES = 1024 * 1024
+
+
+class LogTail:
+    """Incremental reader for one log file."""
+
+    def __init__(self, path, tail_lines: int = TAIL_LINES, bootstrap_bytes: int = BOOTSTRAP_BYTES):
+        self.path = Path(path)
+        self.tail_lines = tail_lines
+        self.bootstrap_bytes = bootstrap_bytes
+        self.identity: Optional[tuple[int, int]] = None
+        self.offset = 0
+        self._partial = b""
+
+    def read_lines(self) -> tuple[list[str], bool]:
+        """Return (complete lines appended since the last call, restarted).
+
+        ``restarted`` is True when the file was rotated or truncated since the
+        previous read, i.e. lines returned earlier no longer describe this file.
+        A trailing line without a newline is held back until it is completed.
+
+        Raises:
+            OSError: If the file can't be stat'ed or read
+        """
+        st = os.stat(self.path)
+        identity = (st.st_dev, st.st_ino)
+        restarted = False
+        bootstrap = False
+        if identity != self.identity or st.st_size < self.offset:
+            restarted = self.identity is not None
+            self.identity = identity
+            self.offset = max(0, st.st_size - self.bootstrap_bytes)
+            self._partial = b""
+            bootstrap = True
+
+        if st.st_size == self.offset:
+            return [], restarted
+
+        skip_first = False
+        with open(self.path, "rb") as f:
+            if bootstrap and self.offset > 0:
+                # Started mid-file: drop the first line unless it begins exactly here
+                f.seek(self.offset - 1)
+                skip_first = f.read(1) != b"\n"
+            f.seek(self.offset)
+            data = f.read(st.st_size - self.offset)
+        self.offset += len(data)
+
+        chunks = (self._partial + data).split(b"\n")
+        self._partial = chunks.pop()
+        if skip_first and chunks:
+            chunks = chunks[1:]
+        lines = [chunk.decode("utf-8", errors="replace") for chunk in chunks]
+        if bootstrap:
+            lines = lines[-self.tail_lines:]
+        return lines, restarted
@@ -7,8 +7,10 @@ Run: uvicorn core.cluster.node_analysis:app --host 0.0.0.0 --port 8200
 """
 
 import os
+import asyncio
 import re
 import time
+import bisect
 import json
 import sqlite3
 import hashlib
@@ -17,10 +19,11 @@ import subprocess
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, deque
 
 
 from core.cluster.base_service import create_app
+from core.cluster.log_tail import TAIL_LINES, LogTail
 
 # --- Config ---
 # On Muddy, logs are local — no SSH sync needed
@@ -117,49 +120,70 @@ BROWSER_RE = re.compile(
 WARNING_RE = re.compile(r'^\s+[⚠!]\s+(\w+)\s+[—-]\s+(.*)')
 
 
-def _parse_supabase_log(filepath: str) -> list[dict]:
-    entries = []
+def _read_tail_lines(filepath: str) -> Optional[list[str]]:
     try:
-        lines = Path(filepath).read_text(errors="replace").split("\n")
+        return Path(filepath).read_text(errors="replace").split("\n")[-TAIL_LINES:]
     except Exception:
-        return []
+        return None
+
+
+class _SupabaseParser:
+    """Streaming supabase.log parser.
+
+    Warning lines belong to the request above them, so an entry is only
+    emitted once the next entry starts (or on flush()).
+    """
+
+    def __init__(self):
+        self._current: Optional[dict] = None
 
-    current = None
-    for line in lines[-500:]:  # Last 500 lines
+    def feed(self, line: str) -> list[dict]:
         m = SUPABASE_RE.match(line)
         if m:
-            if current:
-                entries.append(current)
             status = int(m.group(5))
             size = int(m.group(7))
             level = "error" if status >= 500 else "warn" if status >= 400 or (status == 200 and size == 0) else "info"
-            current = {
+            return self._start({
                 "timestamp": m.group(1), "log_type": "supabase",
                 "event_type": m.group(2).lower(), "method": m.group(3),
                 "url": m.group(4), "status_code": status,
                 "duration_ms": int(m.group(6)), "response_size": size,
                 "level": level, "message": line.strip(),
-            }
-            continue
+            })
 
         w = WARNING_RE.match(line)
-        if w and current:
-            current["payload"] = json.dumps({"warning": w.group(1), "detail": w.group(2)})
-            current["level"] = "warn"
-            continue
+        if w and self._current:
+            self._current["payload"] = json.dumps({"warning": w.group(1), "detail": w.group(2)})
+            self._current["level"] = "warn"
+            return []
 
         e = BROWSER_RE.match(line)
         if e:
-            if current:
-                entries.append(current)
-            current = {
+            return self._start({
                 "timestamp": e.group(1), "log_type": "supabase",
                 "event_type": e.group(2).lower(), "level": "info",
                 "message": e.group(3),
-            }
+            })
+        return []
 
-    if current:
-        entries.append(current)
+    def flush(self) -> list[dict]:
+        return self._start(None)
+
+    def _start(self, entry: Optional[dict]) -> list[dict]:
+        done = [self._current] if self._current else []
+        self._current = entry
+        return done
+
+
+def _parse_supabase_log(filepath: str) -> list[dict]:
+    lines = _read_tail_lines(filepath)
+    if lines is None:
+        return []
+    parser = _SupabaseParser()
+    entries = []
+    for line in lines:
+        entries.extend(parser.feed(line))
+    entries.extend(parser.flush())
     return entries
 
 
@@ -168,82 +192,104 @@ NET_RE = re.compile(
 )
 
 
-def _parse_browser_log(filepath: str) -> list[dict]:
-    entries = []
-    try:
-        lines = Path(filepath).read_text(errors="replace").split("\n")
-    except Exception:
-        return []
+def _parse_browser_line(line: str) -> Optional[dict]:
+    m = BROWSER_RE.match(line)
+    if not m:
+        return None
 
-    for line in lines[-500:]:
-        m = BROWSER_RE.match(line)
-        if not m:
-            continue
+    raw_level = m.group(2).lower()
+    message = m.group(3)
 
-        raw_level = m.group(2).lower()
-        message = m.group(3)
-
-        # --- Parse [NET] lines specially to extract status, URL, method ---
-        if raw_level == "net":
-            net_match = NET_RE.match(f"[NET] {message}")
-            if net_match:
-                method = net_match.group(1)
-                url = net_match.group(2)
-                status_raw = net_match.group(3)
-                duration = int(net_match.group(4))
-
-                # Determine level from status
-                if status_raw == "ERR":
-                    level = "error"
-                    status_code = 0  # network failure / timeout
-                elif status_raw.isdigit():
-                    status_code = int(status_raw)
-                    level = "error" if status_code >= 500 else "warn" if status_code >= 400 else "info"
-                else:
-                    status_code = 0
-                    level = "warn"
-
-                entries.append({
-                    "timestamp": m.group(1), "log_type": "browser",
-                    "event_type": "network", "level": level,
-                    "message": message,
-                    "method": method, "url": url,
-                    "status_code": status_code, "duration_ms": duration,
-                })
-            continue
+    # --- Parse [NET] lines specially to extract status, URL, method ---
+    if raw_level == "net":
+        net_match = NET_RE.match(f"[NET] {message}")
+        if not net_match:
+            return None
+        method = net_match.group(1)
+        url = net_match.group(2)
+        status_raw = net_match.group(3)
+        duration = int(net_match.group(4))
 
-        # --- Regular console entries ---
-        if raw_level in ("error", "err"):
+        # Determine level from status
+        if status_raw == "ERR":
             level = "error"
-        elif raw_level in ("warn", "warning"):
-            level = "warn"
+            status_code = 0  # network failure / timeout
+        elif status_raw.isdigit():
+            status_code = int(status_raw)
+            level = "error" if status_code >= 500 else "warn" if status_code >= 400 else "info"
         else:
-            level = raw_level
+            status_code = 0
+            level = "warn"
 
-        entries.append({
+        return {
             "timestamp": m.group(1), "log_type": "browser",
-            "event_type": "console", "level": level,
+            "event_type": "network", "level": level,
             "message": message,
-        })
-    return entries
+            "method": method, "url": url,
+            "status_code": status_code, "duration_ms": duration,
+        }
+
+    # --- Regular console entries ---
+    if raw_level in ("error", "err"):
+        level = "error"
+    elif raw_level in ("warn", "warning"):
+        level = "warn"
+    else:
+        level = raw_level
+
+    return {
+        "timestamp": m.group(1), "log_type": "browser",
+        "event_type": "console", "level": level,
+        "message": message,
+    }
+
+
+def _parse_browser_log(filepath: str) -> list[dict]:
+    lines = _read_tail_lines(filepath)
+    if lines is None:
+        return []
+    return [e for e in map(_parse_browser_line, lines) if e]
+
+
+def _parse_generic_line(line: str, log_type: str) -> Optional[dict]:
+    m = BROWSER_RE.match(line)
+    if not m:
+        return None
+    return {
+        "timestamp": m.group(1), "log_type": log_type,
+        "event_type": m.group(2).lower(),
+        "level": "info", "message": m.group(3),
+    }
 
 
 def _parse_generic_log(filepath: str, log_type: str) -> list[dict]:
-    entries = []
-    try:
-        lines = Path(filepath).read_text(errors="replace").split("\n")
-    except Exception:
+    lines = _read_tail_lines(filepath)
+    if lines is None:
+        return []
+    return [e for e in (_parse_generic_line(line, log_type) for line in lines) if e]
+
+
+class _LineParser:
+    """Stateless per-line parser with the _SupabaseParser interface."""
+
+    def __init__(self, parse_line):
+        self._parse_line = parse_line
+
+    def feed(self, line: str) -> list[dict]:
+        entry = self._parse_line(line)
+        return [entry] if entry else []
+
+    def flush(self) -> list[dict]:
         return []
 
-    for line in lines[-500:]:
-        m = BROWSER_RE.match(line)
-        if m:
-            entries.append({
-                "timestamp": m.group(1), "log_type": log_type,
-                "event_type": m.group(2).lower(),
-                "level": "info", "message": m.group(3),
-            })
-    return entries
+
+# log file name -> (log_type, parser factory)
+LOG_SOURCES = {
+    "supabase.log": ("supabase", _SupabaseParser),
+    "browser.log": ("browser", lambda: _LineParser(_parse_browser_line)),
+    "device.log": ("device", lambda: _LineParser(lambda line: _parse_generic_line(line, "device"))),
+    "query.log": ("query", lambda: _LineParser(lambda line: _parse_generic_line(line, "query"))),
+}
 
 
 # --- Error Fingerprinting ---
@@ -260,257 +306,526 @@ def _fingerprint(entry: dict) -> str:
 
 
 # --- Pattern Detection ---
+# Cap at 5 minutes — any duration above that is a supabaseLogger sleep artifact
+# (performance.now() advances while the OS is asleep) and corrupts averages.
+SLEEP_ARTIFACT_CEILING_MS = 300_000
+
+
+def _is_edge_fn_call(e: dict) -> bool:
+    blob = (e.get("url") or "") + " " + (e.get("message") or "")
+    return "/functions/v1/" in blob or "[EDGE_FN" in blob or (e.get("event_type") or "").startswith("edge_fn")
+
+
+def _is_timed_query(e: dict) -> bool:
+    """Supabase entry that counts toward latency degradation.
+
+    Excludes ALL edge function calls — they run arbitrary server work (LLM calls,
+    scraping, multi-step pipelines) and routinely take 30–90s. The 800ms bar is
+    a DB/REST latency bar, not an edge-function bar. Also skips any entry tagged
+    [EDGE_FN] or [EDGE_FN:*] even if the URL parse missed it.
+    """
+    return bool(
+        e.get("duration_ms") and 0 < e.get("duration_ms") <= SLEEP_ARTIFACT_CEILING_MS
+        and not _is_edge_fn_call(e)
+    )
+
+
 def _detect_patterns(entries: list[dict]) -> list[dict]:
-    patterns = []
+    """Detect patterns over a full set of entries (one-shot _PatternWindow)."""
+    window = _PatternWindow(per_source=max(len(entries), 1))
+    window.add("batch", entries)
+    return window.patterns(entries)
 
-    # Group by log_type
-    by_type = defaultdict(list)
+
+# --- Cross-File Correlation ---
+def _correlate(entries: list[dict]) -> list[dict]:
+    """Correlate a batch of entries by 500ms bucket (one-shot _CorrelationJoin)."""
+    join = _CorrelationJoin()
+    correlations = []
     for e in entries:
-        by_type[e.get("log_type", "unknown")].append(e)
-
-    # --- Auth refresh loop (only flag if 5+ TOKEN_REFRESHED in 30s window) ---
-    auth_events = [e for e in entries if "TOKEN_REFRESHED" in e.get("message", "")]
-    if len(auth_events) >= 5:
-        timestamps = []
-        for e in auth_events:
-            ts = e.get("timestamp", "")
-            if ts:
-                try:
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                    timestamps.append(dt)
-                except (ValueError, TypeError):
-                    pass
-        timestamps.sort()
-        rapid_burst = False
-        if len(timestamps) >= 5:
-            for i in range(len(timestamps) - 4):
-                window = (timestamps[i + 4] - timestamps[i]).total_seconds()
-                if window <= 30:
-                    rapid_burst = True
-                    break
-        if rapid_burst:
-            patterns.append({
-                "pattern_type": "auth_refresh_loop",
-                "severity": "critical",
-                "description": f"{len(auth_events)} TOKEN_REFRESHED events with rapid bursts (5+ in 30s) — refresh loop",
-                "count": len(auth_events),
-            })
+        correlations.extend(join.add(e, _bucket_key(e)))
+    return correlations
 
-    # --- RLS denial spike ---
-    # Exclude HEAD requests — they return 0 bytes by design (count-only queries)
-    supabase_entries = by_type.get("supabase", [])
-    queries = [e for e in supabase_entries if e.get("event_type") == "query"]
-    empty_200s = [e for e in queries if e.get("status_code") == 200 and e.get("response_size") == 0 and e.get("method", "").upper() != "HEAD"]
-    if len(queries) >= 10 and len(empty_200s) / len(queries) > 0.3:
-        patterns.append({
-            "pattern_type": "rls_denial_spike",
-            "severity": "high",
-            "description": f"{len(empty_200s)}/{len(queries)} queries returning empty (RLS denial)",
-            "count": len(empty_200s),
-        })
-    elif len(empty_200s) >= 3:
-        patterns.append({
-            "pattern_type": "rls_denial",
-            "severity": "medium",
-            "description": f"{len(empty_200s)} RLS denials (EMPTY_200)",
-            "count": len(empty_200s),
-        })
-
-    # --- Server errors (5xx) from any source ---
-    server_errors = [e for e in entries if e.get("status_code", 0) >= 500]
-    if server_errors:
-        patterns.append({
+
+# --- Streaming Detection ---
+# Each detector keeps O(window) state and is updated once per entry as it
+# enters (+1) or leaves (-1) the analysis window; patterns() reads that state
+# without touching the entries. Together they reproduce _detect_patterns.
+def _epoch(ts: str) -> Optional[float]:
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _bucket_key(entry: dict) -> Optional[int]:
+    """500ms correlation bucket, as used by _correlate."""
+    ts = _epoch(entry.get("timestamp") or "")
+    return int(ts * 2) if ts is not None else None
+
+
+def _edge_fn_error(e: dict) -> bool:
+    return "/functions/v1/" in (e.get("url") or e.get("message") or "") and (
+        e.get("status_code", 0) >= 400
+        or e.get("status_code") == 0
+        or e.get("level") == "error"
+    )
+
+
+def _entry_facts(e: dict) -> dict:
+    """Per-entry values the detectors need, computed once when the entry arrives."""
+    level = e.get("level")
+    facts = {
+        "bucket": _bucket_key(e),
+        "fp": _fingerprint(e) if level in ("error", "err") else None,
+        "auth_ts": None,
+    }
+    if "TOKEN_REFRESHED" in e.get("message", ""):
+        facts["auth_ts"] = _epoch(e.get("timestamp", ""))
+    return facts
+
+
+class _Detector:
+    """Streaming pattern detector."""
+
+    def update(self, seq: int, e: dict, facts: dict, sign: int):
+        raise NotImplementedError
+
+    def patterns(self) -> list[dict]:
+        raise NotImplementedError
+
+
+class _AuthRefreshLoop(_Detector):
+    """5+ TOKEN_REFRESHED events within 30s.
+
+    Keeps the sorted event times and the number of 5-event runs spanning
+    <= 30s; an insert or evict only changes the runs around its position.
+    """
+
+    RUN, SPAN = 5, 30
+
+    def __init__(self):
+        self.count = 0
+        self.times: list[float] = []
+        self.bursts = 0
+
+    def _runs(self, lo: int, hi: int) -> int:
+        times, last = self.times, len(self.times) - self.RUN
+        return sum(
+            1 for i in range(max(lo, 0), min(hi, last) + 1)
+            if times[i + self.RUN - 1] - times[i] <= self.SPAN
+        )
+
+    def update(self, seq, e, facts, sign):
+        if "TOKEN_REFRESHED" not in e.get("message", ""):
+            return
+        self.count += sign
+        ts = facts["auth_ts"]
+        if ts is None:
+            return
+        span = self.RUN - 1
+        if sign > 0:
+            idx = bisect.bisect_right(self.times, ts)
+            before = self._runs(idx - span, idx - 1)
+            self.times.insert(idx, ts)
+            self.bursts += self._runs(idx - span, idx) - before
+        else:
+            idx = bisect.bisect_left(self.times, ts)
+            before = self._runs(idx - span, idx)
+            del self.times[idx]
+            self.bursts += self._runs(idx - span, idx - 1) - before
+
+    def patterns(self):
+        if self.count < 5 or not self.bursts:
+            return []
+        return [{
+            "pattern_type": "auth_refresh_loop",
+            "severity": "critical",
+            "description": f"{self.count} TOKEN_REFRESHED events with rapid bursts (5+ in 30s) — refresh loop",
+            "count": self.count,
+        }]
+
+
+class _RlsDenials(_Detector):
+    """Supabase queries returning 200 with an empty body (HEAD excluded)."""
+
+    def __init__(self):
+        self.queries = 0
+        self.empty_200 = 0
+
+    def update(self, seq, e, facts, sign):
+        if e.get("log_type") != "supabase" or e.get("event_type") != "query":
+            return
+        self.queries += sign
+        if (e.get("status_code") == 200 and e.get("response_size") == 0
+                and e.get("method", "").upper() != "HEAD"):
+            self.empty_200 += sign
+
+    def patterns(self):
+        if self.queries >= 10 and self.empty_200 / self.queries > 0.3:
+            return [{
+                "pattern_type": "rls_denial_spike",
+                "severity": "high",
+                "description": f"{self.empty_200}/{self.queries} queries returning empty (RLS denial)",
+                "count": self.empty_200,
+            }]
+        if self.empty_200 >= 3:
+            return [{
+                "pattern_type": "rls_denial",
+                "severity": "medium",
+                "description": f"{self.empty_200} RLS denials (EMPTY_200)",
+                "count": self.empty_200,
+            }]
+        return []
+
+
+class _ServerErrors(_Detector):
+    def __init__(self):
+        self.count = 0
+
+    def update(self, seq, e, facts, sign):
+        if e.get("status_code", 0) >= 500:
+            self.count += sign
+
+    def patterns(self):
+        if not self.count:
+            return []
+        return [{
             "pattern_type": "server_error",
             "severity": "high",
-            "description": f"{len(server_errors)} server errors (5xx)",
-            "count": len(server_errors),
-        })
-
-    # --- Edge function errors (400 OR timeout from /functions/v1/) ---
-    edge_fn_errors = [
-        e for e in entries
-        if "/functions/v1/" in (e.get("url") or e.get("message") or "")
-        and (
-            (e.get("status_code", 0) >= 400)  # 400, 401, 500, etc.
-            or e.get("status_code") == 0  # network timeout (ERR)
-            or e.get("level") == "error"  # any error level
-        )
-    ]
-    if edge_fn_errors:
-        # Distinguish timeout vs HTTP error
-        timeouts = [e for e in edge_fn_errors if e.get("status_code") == 0 or (e.get("duration_ms", 0) > 30000)]
-        http_errors = [e for e in edge_fn_errors if e.get("status_code", 0) >= 400]
+            "description": f"{self.count} server errors (5xx)",
+            "count": self.count,
+        }]
+
+
+class _EdgeFunctionErrors(_Detector):
+    """Edge function timeouts and HTTP errors."""
 
-        if timeouts:
+    def __init__(self):
+        self.timeouts = 0
+        self.by_status: Counter = Counter()
+
+    def update(self, seq, e, facts, sign):
+        if not _edge_fn_error(e):
+            return
+        status = e.get("status_code", 0)
+        if status == 0 or e.get("duration_ms", 0) > 30000:
+            self.timeouts += sign
+        if status >= 400:
+            self.by_status[status] += sign
+            if not self.by_status[status]:
+                del self.by_status[status]
+
+    def patterns(self):
+        patterns = []
+        if self.timeouts:
             patterns.append({
                 "pattern_type": "edge_function_timeout",
                 "severity": "critical",
-                "description": f"{len(timeouts)} edge function timeouts — function exceeded execution limit",
-                "count": len(timeouts),
+                "description": f"{self.timeouts} edge function timeouts — function exceeded execution limit",
+                "count": self.timeouts,
             })
+        http_errors = sum(self.by_status.values())
         if http_errors:
+            codes = ", ".join(sorted(str(code) for code in self.by_status))
             patterns.append({
                 "pattern_type": "edge_function_error",
                 "severity": "high",
-                "description": f"{len(http_errors)} edge function errors ({', '.join(set(str(e.get('status_code')) for e in http_errors))})",
-                "count": len(http_errors),
+                "description": f"{http_errors} edge function errors ({codes})",
+                "count": http_errors,
             })
+        return patterns
+
 
-    # --- Browser [ERROR] lines (catch-all for any runtime error) ---
-    # Catch things like "[plan-ai] generateX failed: {}"
-    browser_errors = [
-        e for e in entries
-        if e.get("log_type") == "browser"
-        and e.get("level") == "error"
-        and e.get("event_type") == "console"
-        and "vite" not in (e.get("message") or "").lower()  # skip HMR noise
-    ]
-    if browser_errors:
-        patterns.append({
+class _RuntimeErrors(_Detector):
+    """Browser console errors, oldest first (HMR noise skipped)."""
+
+    def __init__(self):
+        self.messages: dict[int, str] = {}  # seq -> message, insertion-ordered
+
+    def update(self, seq, e, facts, sign):
+        if (
+            e.get("log_type") != "browser" or e.get("level") != "error"
+            or e.get("event_type") != "console"
+            or "vite" in (e.get("message") or "").lower()
+        ):
+            return
+        if sign > 0:
+            self.messages[seq] = e.get("message", "")
+        else:
+            del self.messages[seq]
+
+    def patterns(self):
+        if not self.messages:
+            return []
+        first = next(iter(self.messages.values()))
+        return [{
             "pattern_type": "runtime_error",
             "severity": "high",
-            "description": f"{len(browser_errors)} runtime errors: {browser_errors[0].get('message', '')[:80]}",
-            "count": len(browser_errors),
-        })
-
-    # --- Latency degradation ---
-    # Exclude ALL edge function calls — they run arbitrary server work (LLM calls,
-    # scraping, multi-step pipelines) and routinely take 30–90s. The 800ms bar is
-    # a DB/REST latency bar, not an edge-function bar. Also skip any entry tagged
-    # [EDGE_FN] or [EDGE_FN:*] even if the URL parse missed it.
-    def _is_edge_fn_call(e):
-        blob = (e.get("url") or "") + " " + (e.get("message") or "")
-        return "/functions/v1/" in blob or "[EDGE_FN" in blob or (e.get("event_type") or "").startswith("edge_fn")
-    # Cap at 5 minutes — any duration above that is a supabaseLogger sleep artifact
-    # (performance.now() advances while the OS is asleep) and corrupts averages.
-    SLEEP_ARTIFACT_CEILING_MS = 300_000
-    timed_entries = [
-        e for e in supabase_entries
-        if e.get("duration_ms") and 0 < e.get("duration_ms") <= SLEEP_ARTIFACT_CEILING_MS
-        and not _is_edge_fn_call(e)
-    ]
-    if len(timed_entries) >= 10:
-        avg_duration = sum(e["duration_ms"] for e in timed_entries) / len(timed_entries)
-        slow = [e for e in timed_entries if e["duration_ms"] > 800]
-        if avg_duration > 500 or len(slow) > len(timed_entries) * 0.2:
-            patterns.append({
-                "pattern_type": "latency_degradation",
-                "severity": "high" if avg_duration > 800 else "medium",
-                "description": f"Avg latency {avg_duration:.0f}ms, {len(slow)} slow requests (>800ms)",
-                "count": len(slow),
-            })
+            "description": f"{len(self.messages)} runtime errors: {first[:80]}",
+            "count": len(self.messages),
+        }]
 
-    # --- Network errors ---
-    net_errors = [e for e in by_type.get("device", []) if "network" in e.get("message", "").lower() or "offline" in e.get("message", "").lower()]
-    if len(net_errors) >= 3:
-        patterns.append({
+
+class _LatencyDegradation(_Detector):
+    def __init__(self):
+        self.timed = 0
+        self.total_ms = 0
+        self.slow = 0
+
+    def update(self, seq, e, facts, sign):
+        if e.get("log_type") != "supabase" or not _is_timed_query(e):
+            return
+        self.timed += sign
+        self.total_ms += sign * e["duration_ms"]
+        self.slow += sign * (e["duration_ms"] > 800)
+
+    def patterns(self):
+        if self.timed < 10:
+            return []
+        avg_duration = self.total_ms / self.timed
+        if avg_duration <= 500 and self.slow <= self.timed * 0.2:
+            return []
+        return [{
+            "pattern_type": "latency_degradation",
+            "severity": "high" if avg_duration > 800 else "medium",
+            "description": f"Avg latency {avg_duration:.0f}ms, {self.slow} slow requests (>800ms)",
+            "count": self.slow,
+        }]
+
+
+class _NetworkErrors(_Detector):
+    def __init__(self):
+        self.count = 0
+
+    def update(self, seq, e, facts, sign):
+        if e.get("log_type") == "device":
+            msg = e.get("message", "").lower()
+            if "network" in msg or "offline" in msg:
+                self.count += sign
+
+    def patterns(self):
+        if self.count < 3:
+            return []
+        return [{
             "pattern_type": "network_error",
             "severity": "medium",
-            "description": f"{len(net_errors)} network errors in device log",
-            "count": len(net_errors),
-        })
+            "description": f"{self.count} network errors in device log",
+            "count": self.count,
+        }]
 
-    # --- New errors (never seen before) ---
-    for e in entries:
-        if e.get("level") in ("error", "err"):
-            fp = _fingerprint(e)
-            if fp not in _known_fingerprints:
-                _known_fingerprints.add(fp)
-                patterns.append({
-                    "pattern_type": "new_error",
-                    "severity": "medium",
-                    "description": f"New error: {e.get('message', '')[:100]}",
-                    "count": 1,
-                    "fingerprint": fp,
-                })
-            if fp in _resolved_fingerprints:
-                patterns.append({
-                    "pattern_type": "regression",
-                    "severity": "critical",
-                    "description": f"Regression: {e.get('message', '')[:100]}",
-                    "count": 1,
-                    "fingerprint": fp,
-                })
 
-    # --- JS errors ---
-    js_errors = [e for e in by_type.get("browser", []) if e.get("level") == "error"]
-    if js_errors:
-        # Group by fingerprint
-        by_fp = defaultdict(list)
-        for e in js_errors:
-            by_fp[_fingerprint(e)].append(e)
-
-        for fp, group in by_fp.items():
-            if len(group) >= 3:
-                patterns.append({
-                    "pattern_type": "repeated_error",
-                    "severity": "medium",
-                    "description": f"{len(group)}x: {group[0].get('message', '')[:100]}",
-                    "count": len(group),
-                    "fingerprint": fp,
-                })
+class _FingerprintGroups(_Detector):
+    """Window entries grouped by error fingerprint: {fp: {seq: message}}."""
 
-    return patterns
+    def __init__(self, accept):
+        self.accept = accept
+        self.groups: dict[str, dict[int, str]] = {}
 
+    def update(self, seq, e, facts, sign):
+        fp = facts["fp"]
+        if not fp or not self.accept(e):
+            return
+        if sign > 0:
+            self.groups.setdefault(fp, {})[seq] = e.get("message", "")
+        else:
+            group = self.groups[fp]
+            del group[seq]
+            if not group:
+                del self.groups[fp]
 
-# --- Cross-File Correlation ---
-def _correlate(entries: list[dict]) -> list[dict]:
-    correlations = []
 
-    # Sort by timestamp
-    timed = [e for e in entries if e.get("timestamp")]
-    timed.sort(key=lambda e: e.get("timestamp", ""))
+class _Regressions(_FingerprintGroups):
+    """Errors whose fingerprint was marked resolved."""
 
-    # Build time-indexed buckets (500ms windows)
-    buckets = defaultdict(list)
-    for e in timed:
-        try:
-            ts = datetime.fromisoformat(e["timestamp"].replace("Z", "+00:00"))
-            bucket_key = int(ts.timestamp() * 2)  # 500ms buckets
-            buckets[bucket_key].append(e)
-        except (ValueError, KeyError):
-            continue
+    def __init__(self):
+        super().__init__(lambda e: True)
 
-    for bucket_key, bucket_entries in buckets.items():
-        sources = set(e.get("log_type") for e in bucket_entries)
-        if len(sources) < 2:
-            continue  # Only multi-source buckets are interesting
-
-        # Rule: Auth failure + browser redirect
-        has_auth_fail = any(e.get("status_code") in (401, 403) for e in bucket_entries)
-        has_redirect = any("redirect" in e.get("message", "").lower() or "login" in e.get("message", "").lower() for e in bucket_entries)
-        if has_auth_fail and has_redirect:
-            correlations.append({
-                "rule_name": "Auth Cascade",
+    def patterns(self):
+        return [
+            {
+                "pattern_type": "regression",
                 "severity": "critical",
-                "description": "Auth failure causing redirect — possible auth cascade",
-                "sources": list(sources),
-            })
+                "description": f"Regression: {message[:100]}",
+                "count": 1,
+                "fingerprint": fp,
+            }
+            for fp in _resolved_fingerprints & self.groups.keys()
+            for message in self.groups[fp].values()
+        ]
 
-        # Rule: EMPTY_200 + empty UI state
-        has_empty_200 = any(e.get("status_code") == 200 and e.get("response_size") == 0 for e in bucket_entries)
-        has_empty_ui = any("undefined" in e.get("message", "").lower() or "null" in e.get("message", "").lower() or "empty" in e.get("message", "").lower() for e in bucket_entries)
-        if has_empty_200 and has_empty_ui:
-            correlations.append({
-                "rule_name": "RLS Denial Chain",
-                "severity": "high",
-                "description": "RLS denial causing empty UI state",
-                "sources": list(sources),
-            })
 
-        # Rule: Slow query + stale/refetch
-        has_slow = any(e.get("duration_ms", 0) > 1000 for e in bucket_entries)
-        has_stale = any("stale" in e.get("message", "").lower() or "refetch" in e.get("message", "").lower() for e in bucket_entries)
-        if has_slow and has_stale:
-            correlations.append({
-                "rule_name": "Slow Query Impact",
+class _RepeatedErrors(_FingerprintGroups):
+    """The same browser error 3+ times."""
+
+    def __init__(self):
+        super().__init__(lambda e: e.get("log_type") == "browser" and e.get("level") == "error")
+
+    def patterns(self):
+        return [
+            {
+                "pattern_type": "repeated_error",
                 "severity": "medium",
-                "description": "Slow DB query causing React Query staleness",
-                "sources": list(sources),
-            })
+                "description": f"{len(group)}x: {next(iter(group.values()))[:100]}",
+                "count": len(group),
+                "fingerprint": fp,
+            }
+            for fp, group in self.groups.items()
+            if len(group) >= 3
+        ]
+
+
+# Correlation rules: name -> (severity, description, left predicate, right predicate).
+# A rule fires when one 500ms bucket spanning 2+ log types holds entries matching both.
+CORRELATION_RULES = {
+    "Auth Cascade": (
+        "critical", "Auth failure causing redirect — possible auth cascade",
+        lambda e: e.get("status_code") in (401, 403),
+        lambda e: any(w in e.get("message", "").lower() for w in ("redirect", "login")),
+    ),
+    "RLS Denial Chain": (
+        "high", "RLS denial causing empty UI state",
+        lambda e: e.get("status_code") == 200 and e.get("response_size") == 0,
+        lambda e: any(w in e.get("message", "").lower() for w in ("undefined", "null", "empty")),
+    ),
+    "Slow Query Impact": (
+        "medium", "Slow DB query causing React Query staleness",
+        lambda e: e.get("duration_ms", 0) > 1000,
+        lambda e: any(w in e.get("message", "").lower() for w in ("stale", "refetch")),
+    ),
+}
+
+
+class _CorrelationJoin:
+    """Incremental time-bucket join behind _correlate.
+
+    Each 500ms bucket keeps per-source and per-rule-side counts. Adding an
+    entry only re-checks its own bucket, and a rule fires once per bucket
+    (the first time both sides are present across 2+ log types).
+    """
 
-    return correlations
+    def __init__(self):
+        # bucket -> {"sources": Counter, "sides": Counter, "fired": set}
+        self.buckets: dict[int, dict] = {}
+
+    def add(self, e: dict, bucket: Optional[int]) -> list[dict]:
+        if bucket is None:
+            return []
+        state = self.buckets.setdefault(
+            bucket, {"sources": Counter(), "sides": Counter(), "fired": set()}
+        )
+        state["sources"][e.get("log_type")] += 1
+        for name, (_, _, left, right) in CORRELATION_RULES.items():
+            state["sides"][(name, 0)] += bool(left(e))
+            state["sides"][(name, 1)] += bool(right(e))
+
+        if len(state["sources"]) < 2:
+            return []
+        fired = []
+        for name, (severity, description, _, _) in CORRELATION_RULES.items():
+            if (name not in state["fired"]
+                    and state["sides"][(name, 0)] and state["sides"][(name, 1)]):
+                state["fired"].add(name)
+                fired.append({
+                    "rule_name": name,
+                    "severity": severity,
+                    "description": description,
+                    "sources": list(state["sources"]),
+                })
+        return fired
+
+    def remove(self, e: dict, bucket: Optional[int]):
+        state = self.buckets.get(bucket)
+        if state is None:
+            return
+        sources = state["sources"]
+        sources[e.get("log_type")] -= 1
+        if not sources[e.get("log_type")]:
+            del sources[e.get("log_type")]
+        if not sources:
+            del self.buckets[bucket]
+            return
+        for name, (_, _, left, right) in CORRELATION_RULES.items():
+            state["sides"][(name, 0)] -= bool(left(e))
+            state["sides"][(name, 1)] -= bool(right(e))
+
+
+class _PatternWindow:
+    """Last TAIL_LINES entries of every tailed log, feeding the streaming detectors.
+
+    Entries are added as they are tailed and evicted once a log holds more
+    than ``per_source`` entries (or the log is dropped/rotated). Each insert
+    and evict updates every detector and the correlation join once, so
+    patterns() never passes over the entries.
+    """
+
+    def __init__(self, per_source: int = TAIL_LINES):
+        self.per_source = per_source
+        self._sources: dict[str, deque] = {}  # log path -> deque of (seq, entry, facts)
+        self._seq = 0
+        self._size = 0
+        self.detectors: list[_Detector] = [
+            _AuthRefreshLoop(), _RlsDenials(), _ServerErrors(), _EdgeFunctionErrors(),
+            _RuntimeErrors(), _LatencyDegradation(), _NetworkErrors(),
+            _Regressions(), _RepeatedErrors(),
+        ]
+        self.correlation = _CorrelationJoin()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, source: str, entries: list[dict]) -> list[dict]:
+        """Add a log's new entries. Returns correlations they completed."""
+        window = self._sources.setdefault(source, deque())
+        correlations = []
+        for entry in entries:
+            self._seq += 1
+            facts = _entry_facts(entry)
+            window.append((self._seq, entry, facts))
+            self._size += 1
+            for detector in self.detectors:
+                detector.update(self._seq, entry, facts, 1)
+            correlations.extend(self.correlation.add(entry, facts["bucket"]))
+        while len(window) > self.per_source:
+            self._evict(window.popleft())
+        return correlations
+
+    def drop(self, source: str) -> bool:
+        """Evict every entry from one log. Returns True if anything was evicted."""
+        window = self._sources.pop(source, None)
+        for item in window or ():
+            self._evict(item)
+        return bool(window)
+
+    def _evict(self, item: tuple):
+        seq, entry, facts = item
+        self._size -= 1
+        for detector in self.detectors:
+            detector.update(seq, entry, facts, -1)
+        self.correlation.remove(entry, facts["bucket"])
+
+    def entries(self) -> list[dict]:
+        items = [item for window in self._sources.values() for item in window]
+        return [entry for _, entry, _ in sorted(items, key=lambda item: item[0])]
+
+    def patterns(self, new_entries: list[dict]) -> list[dict]:
+        """Patterns for the current window; new_error only fires for new_entries."""
+        patterns = []
+        for detector in self.detectors:
+            patterns.extend(detector.patterns())
+        for e in new_entries:
+            if e.get("level") in ("error", "err"):
+                fp = _fingerprint(e)
+                if fp not in _known_fingerprints:
+                    _known_fingerprints.add(fp)
+                    patterns.append({
+                        "pattern_type": "new_error",
+                        "severity": "medium",
+                        "description": f"New error: {e.get('message', '')[:100]}",
+                        "count": 1,
+                        "fingerprint": fp,
+                    })
+        return patterns
 
 
 # --- Log Sync (SSH tail from Muddy) ---
@@ -796,8 +1111,141 @@ def _auto_fix_redeploy_edge_function(fn_name: str):
 
 
 # --- Analysis Loop ---
+MAX_LOG_AGE_HOURS = 24  # skip stale logs (not modified in the last 24 hours)
+
+
+class _TailedLog:
+    """Live state for one project log: tail checkpoint, parser and recent raw lines."""
+
+    def __init__(self, path: Path, make_parser):
+        self.tail = LogTail(path)
+        self.make_parser = make_parser
+        self.parser = make_parser()
+        self.lines: deque = deque(maxlen=TAIL_LINES)  # non-empty raw lines, for clustering
+        self.version = 0  # bumps whenever lines change
+        self.updated_at = 0.0
+
+    def restart(self):
+        self.parser = self.make_parser()
+        self.lines.clear()
+        self.version += 1
+
+
+_log_tails: dict[str, _TailedLog] = {}  # log path -> live state
+_window = _PatternWindow()
+_cluster_cache: dict[str, dict] = {}  # log path -> {"version", "response"}
+_pattern_snapshot: Optional[list[dict]] = None  # unresolved pattern rows as of the last cycle
+
+
+def _ingest_new_entries(projects: list[str]) -> tuple[list[dict], list[dict]]:
+    """Parse the lines appended to each live project log since the last poll.
+
+    New entries go through the pattern window; logs that went stale,
+    disappeared or were rotated have their old entries evicted.
+
+    Returns:
+        (new entries, correlations completed by them)
+    """
+    new_entries, correlations = [], []
+    live = set()
+    now = time.time()
+
+    # Read logs directly from local project directories
+    for project in projects:
+        if project not in _known_projects:
+            _known_projects.add(project)
+
+        project_dir = Path(PROJECTS_DIR) / project / ".buildrunner"
+        if not project_dir.exists():
+            continue
+
+        for logname, (_, make_parser) in LOG_SOURCES.items():
+            logpath = project_dir / logname
+            try:
+                if now - logpath.stat().st_mtime >= MAX_LOG_AGE_HOURS * 3600:
+                    continue
+            except OSError:
+                continue
+            key = str(logpath)
+            live.add(key)
+            log = _log_tails.get(key)
+            if log is None:
+                log = _log_tails[key] = _TailedLog(logpath, make_parser)
+
+            try:
+                lines, restarted = log.tail.read_lines()
+            except OSError:
+                continue
+            if restarted:
+                log.restart()
+                _window.drop(key)
+
+            entries = []
+            for line in lines:
+                entries.extend(log.parser.feed(line))
+            if lines:
+                log.lines.extend(ln.rstrip() for ln in lines if ln.strip())
+                log.version += 1
+                log.updated_at = now
+            else:
+                # Idle log: the pending multi-line entry is complete
+                entries.extend(log.parser.flush())
+            for e in entries:
+                e["project"] = project
+            if entries:
+                correlations.extend(_window.add(key, entries))
+                new_entries.extend(entries)
+
+    for key in list(_log_tails):
+        if key not in live:
+            del _log_tails[key]
+            _cluster_cache.pop(key, None)
+            _window.drop(key)
+    return new_entries, correlations
+
+
+def _cluster_summary(log_path: Path, lines: list[str]) -> dict:
+    """/api/logs/clusters response for a log's recent non-empty lines."""
+    if len(lines) < 30:
+        return {"skipped": True, "reason": "too few lines"}
+
+    lines = lines[-500:]  # tail
+    try:
+        from core.cluster.below.log_cluster import cluster_lines, format_cluster_summary
+        result = cluster_lines(lines, max_lines=500)
+        summary = format_cluster_summary(result)
+        return {
+            "skipped": False,
+            "log": str(log_path),
+            "lines_processed": len(lines),
+            "cluster_count": len(result.clusters),
+            "outlier_count": len(result.outliers),
+            "summary": summary,
+        }
+    except RuntimeError:
+        return {"skipped": True, "reason": "BR3_LOG_CLUSTER=off (library)"}
+    except Exception as exc:  # noqa: BLE001
+        return {"skipped": True, "reason": f"clustering failed: {exc}"}
+
+
+def _tailed_log_clusters(key: str, log: _TailedLog) -> dict:
+    """Cluster summary for a tailed log, memoized by (log path, log version).
+
+    Called on demand from /api/logs/clusters, never from the analysis loop, so an
+    offline Below only slows the request that asked. Failed runs are not cached.
+    """
+    version = log.version
+    cached = _cluster_cache.get(key)
+    if cached and cached["version"] == version:
+        return cached["response"]
+    response = _cluster_summary(log.tail.path, list(log.lines))
+    if not response.get("skipped") or response.get("reason") == "too few lines":
+        _cluster_cache[key] = {"version": version, "response": response}
+    return response
+
+
 def _analysis_loop():
-    global _analyzing, _last_analysis_time, _active_patterns
+    global _analyzing, _last_analysis_time, _active_patterns, _pattern_snapshot
 
     while True:
         time.sleep(POLL_INTERVAL)
@@ -807,53 +1255,13 @@ def _analysis_loop():
 
         _analyzing = True
         try:
-            all_entries = []
-            projects = _discover_projects()
-
-            # Read logs directly from local project directories
-            for project in projects:
-                if project not in _known_projects:
-                    _known_projects.add(project)
-
-                project_dir = Path(PROJECTS_DIR) / project / ".buildrunner"
-                if not project_dir.exists():
-                    continue
-
-                # Skip stale logs (not modified in last 24 hours)
-                max_age_hours = 24
-                now = time.time()
-
-                supa_log = project_dir / "supabase.log"
-                if supa_log.exists() and (now - supa_log.stat().st_mtime) < max_age_hours * 3600:
-                    entries = _parse_supabase_log(str(supa_log))
-                    for e in entries:
-                        e["project"] = project
-                    all_entries.extend(entries)
-
-                browser_log = project_dir / "browser.log"
-                if browser_log.exists() and (now - browser_log.stat().st_mtime) < max_age_hours * 3600:
-                    entries = _parse_browser_log(str(browser_log))
-                    for e in entries:
-                        e["project"] = project
-                    all_entries.extend(entries)
-
-                for logname, logtype in [("device.log", "device"), ("query.log", "query")]:
-                    logpath = project_dir / logname
-                    if logpath.exists() and (now - logpath.stat().st_mtime) < max_age_hours * 3600:
-                        entries = _parse_generic_log(str(logpath), logtype)
-                        for e in entries:
-                            e["project"] = project
-                        all_entries.extend(entries)
-
-            if not all_entries:
+            # Detectors and the correlation join are updated as entries arrive
+            new_entries, correlations = _ingest_new_entries(_discover_projects())
+            if not len(_window):
                 _analyzing = False
                 continue
 
-            # Detect patterns
-            patterns = _detect_patterns(all_entries)
-
-            # Cross-file correlation
-            correlations = _correlate(all_entries)
+            patterns = _window.patterns(new_entries)
 
             # Store patterns — deduplicate by pattern_type + project
             conn = _get_db()
@@ -886,6 +1294,9 @@ def _analysis_loop():
             conn.execute("DELETE FROM correlations WHERE timestamp < datetime('now', '-7 days')")
 
             conn.commit()
+            _pattern_snapshot = [dict(r) for r in conn.execute(
+                "SELECT * FROM patterns WHERE resolved = 0 ORDER BY severity, last_seen DESC"
+            ).fetchall()]
             conn.close()
 
             _active_patterns = patterns
@@ -905,7 +1316,7 @@ def _analysis_loop():
                     _send_macos_notification(p)
                     _push_alert_to_walter(p)
                     _push_alert_to_dashboard(p)
-                    _attempt_auto_fix(p, all_entries)
+                    _attempt_auto_fix(p, _window.entries())
 
         except Exception as e:
             print(f"Analysis error: {e}")
@@ -957,7 +1368,12 @@ async def analyze(project: Optional[str] = None):
 
 @app.get("/api/logs/patterns")
 async def get_patterns(resolved: bool = False):
-    """Get active or resolved patterns."""
+    """Get active or resolved patterns.
+
+    Active patterns are served from the analysis loop's last snapshot.
+    """
+    if not resolved and _pattern_snapshot is not None:
+        return {"patterns": _pattern_snapshot}
     conn = _get_db()
     rows = conn.execute(
         "SELECT * FROM patterns WHERE resolved = ? ORDER BY severity, last_seen DESC",
@@ -980,11 +1396,21 @@ async def get_log_clusters(project: Optional[str] = None, log_name: str = "brows
     if _os.environ.get("BR3_LOG_CLUSTER", "on").lower() == "off":
         return {"skipped": True, "reason": "BR3_LOG_CLUSTER=off"}
 
-    # Resolve project log path
+    # Logs tailed by the analysis loop reuse its in-memory lines; clustering is memoized
     projects_dir = _os.environ.get("PROJECTS_DIR", _os.path.expanduser("~/Projects"))
     if project:
         log_path = Path(projects_dir) / project / ".buildrunner" / log_name
+        key = str(log_path) if str(log_path) in _log_tails else None
     else:
+        tailed = [
+            (log.updated_at, key) for key, log in _log_tails.items() if Path(key).name == log_name
+        ]
+        key = max(tailed)[1] if tailed else None
+    if key is not None:
+        return await asyncio.to_thread(_tailed_log_clusters, key, _log_tails[key])
+
+    # Not tailed (stale or outside the loop's projects): cluster on demand
+    if not project:
         # Find most recently modified project with that log
         candidates = sorted(
             Path(projects_dir).glob(f"*/.buildrunner/{log_name}"),
@@ -997,26 +1423,7 @@ async def get_log_clusters(project: Optional[str] = None, log_name: str = "brows
         return {"skipped": True, "reason": f"{log_name} not found"}
 
     lines = [ln.rstrip() for ln in log_path.read_text(errors="replace").splitlines() if ln.strip()]
-    if len(lines) < 30:
-        return {"skipped": True, "reason": "too few lines"}
-
-    lines = lines[-500:]  # tail
-    try:
-        from core.cluster.below.log_cluster import cluster_lines, format_cluster_summary
-        result = cluster_lines(lines, max_lines=500)
-        summary = format_cluster_summary(result)
-        return {
-            "skipped": False,
-            "log": str(log_path),
-            "lines_processed": len(lines),
-            "cluster_count": len(result.clusters),
-            "outlier_count": len(result.outliers),
-            "summary": summary,
-        }
-    except RuntimeError:
-        return {"skipped": True, "reason": "BR3_LOG_CLUSTER=off (library)"}
-    except Exception as exc:  # noqa: BLE001
-        return {"skipped": True, "reason": f"clustering failed: {exc}"}
+    return _cluster_summary(log_path, lines)
 
 
 @app.get("/api/logs/correlations")
@@ -1053,7 +1460,10 @@ async def search_logs(q: str, limit: int = 20):
 @app.post("/api/logs/resolve")
 async def resolve_pattern(fingerprint: str):
     """Mark a pattern as resolved (for regression detection)."""
+    global _pattern_snapshot
     _resolved_fingerprints.add(fingerprint)
+    if _pattern_snapshot is not None:
+        _pattern_snapshot = [p for p in _pattern_snapshot if p.get("fingerprint") != fingerprint]
     conn = _get_db()
     conn.execute("UPDATE patterns SET resolved = 1 WHERE fingerprint = ?", (fingerprint,))
     conn.commit()
@@ -5,6 +5,7 @@ Semantic search, symbol graph, impact analysis across all repos.
 Run: uvicorn core.cluster.node_semantic:app --host 0.0.0.0 --port 8100
 """
 
+import asyncio
 import os
 import time
 import hashlib
@@ -17,6 +18,11 @@ from fastapi import HTTPException, Request
 from pydantic import BaseModel
 
 from core.cluster.base_service import create_app
+from core.cluster.code_keyword_index import (
+    CodeKeywordIndex, FTS_FILENAME, KEYWORD_COLUMNS, rrf_fuse,
+)
+from core.cluster.index_manifest import IndexManifest, MANIFEST_FILENAME
+from core.cluster.query_embedding_cache import QueryEmbeddingCache
 
 # --- Config ---
 REPOS_DIR = os.environ.get("REPOS_DIR", os.path.expanduser("~/repos"))
@@ -24,6 +30,9 @@ CHROMA_DIR = os.environ.get("CHROMA_DIR", os.path.expanduser("~/.lockwood/chroma
 EMBED_MODEL = os.environ.get("EMBED_MODEL", "nomic-ai/CodeRankEmbed")
 INDEX_INTERVAL = int(os.environ.get("INDEX_INTERVAL", "60"))  # seconds between re-index checks
 DISABLE_INDEXER = os.environ.get("DISABLE_INDEXER", "true").lower() in ("true", "1", "yes")
+QUERY_EMBED_CACHE_SIZE = int(os.environ.get("QUERY_EMBED_CACHE_SIZE", "1024"))
+QUERY_EMBED_CACHE_TTL = float(os.environ.get("QUERY_EMBED_CACHE_TTL", "600"))  # seconds
+SEARCH_OVERFETCH = 3  # per-leg fetch multiple of n_results, absorbs the per-file dedup
 
 # --- App ---
 app = create_app(role="semantic-search", version="0.1.0")
@@ -52,7 +61,11 @@ async def _intel_startup():
 _db = None
 _table = None
 _embed_model = None
-_file_hashes: dict[str, str] = {}
+_manifest: Optional[IndexManifest] = None
+_orphans_swept = False
+_keyword_index: Optional[CodeKeywordIndex] = None
+# Shared by search, search_research and search_similar_plans (keyed by model + query)
+_query_embeddings = QueryEmbeddingCache(QUERY_EMBED_CACHE_SIZE, QUERY_EMBED_CACHE_TTL)
 _indexing = False
 _last_index_time = 0.0
 _index_stats = {"total_files": 0, "total_chunks": 0, "last_duration": 0.0}
@@ -222,7 +235,7 @@ def search_similar_plans(query: str, project: str = None, limit: int = 3) -> lis
     if "plan_outcomes" not in db.table_names():
         return []
     table = db.open_table("plan_outcomes")
-    query_embedding = embedder.encode([query]).tolist()[0]
+    query_embedding = _embed_query(embedder, EMBED_MODEL, query)
 
     try:
         search_query = table.search(query_embedding).metric("cosine").limit(limit * 2)
@@ -252,6 +265,13 @@ def search_similar_plans(query: str, project: str = None, limit: int = 3) -> lis
     return hits
 
 
+def _embed_query(embedder, model_name: str, query: str) -> list[float]:
+    """Encode a search query through the shared LRU+TTL cache (concurrent misses coalesce)."""
+    return _query_embeddings.get_or_compute(
+        model_name, query, lambda text: embedder.encode([text]).tolist()[0]
+    )
+
+
 def _get_embedder():
     global _embed_model
     if _embed_model is None:
@@ -463,7 +483,7 @@ def search_research(query: str, domain: str = None, limit: int = 5) -> list[dict
     if "research_library" not in db.table_names():
         return []
     table = db.open_table("research_library")
-    query_embedding = embedder.encode([query]).tolist()[0]
+    query_embedding = _embed_query(embedder, RESEARCH_EMBED_MODEL, query)
 
     try:
         search_query = table.search(query_embedding).metric("cosine").limit(limit * 2)
@@ -734,53 +754,123 @@ def chunk_file(path: Path, chunk_size: int = 2000) -> list[dict]:
 
 
 # --- Indexing (LanceDB — disk-based, no memory pressure) ---
+_DELETE_BATCH = 500
+
+
+def _get_manifest() -> IndexManifest:
+    """Lazy-load the persisted file manifest that lives next to the LanceDB table."""
+    global _manifest
+    if _manifest is None:
+        _manifest = IndexManifest.load(Path(LANCE_DIR) / MANIFEST_FILENAME)
+    return _manifest
+
+
+def _sql_in(ids: list[str]) -> str:
+    return ", ".join("'" + i.replace("'", "''") + "'" for i in ids)
+
+
+def _delete_chunks(table, chunk_ids: set[str]) -> int:
+    """Bulk-delete chunk rows by ID in batches. Returns number of IDs requested."""
+    ids = sorted(chunk_ids)
+    for i in range(0, len(ids), _DELETE_BATCH):
+        table.delete(f"id IN ({_sql_in(ids[i:i + _DELETE_BATCH])})")
+    return len(ids)
+
+
+def _table_columns(table, columns: list[str]) -> list[dict]:
+    """Read selected columns for every row (no vectors) as a list of dicts."""
+    try:
+        return table.to_lance().to_table(columns=columns).to_pylist()
+    except Exception:
+        return _result_rows(table.search().select(columns).limit(max(table.count_rows(), 1)))
+
+
+def _table_chunk_ids(table) -> set[str]:
+    """All chunk IDs currently stored in the table (id column only)."""
+    return {r.get("id", "") for r in _table_columns(table, ["id"])}
+
+
+def _table_rows(table, ids: set[str]) -> list[dict]:
+    """Keyword-index fields for the given chunk IDs, read back from LanceDB."""
+    rows = _table_columns(table, list(KEYWORD_COLUMNS))
+    return [r for r in rows if r.get("id") in ids]
+
+
+def _get_keyword_index() -> CodeKeywordIndex:
+    """Lazy-open the FTS5 keyword index that lives next to the LanceDB table."""
+    global _keyword_index
+    if _keyword_index is None:
+        _keyword_index = CodeKeywordIndex(Path(LANCE_DIR) / FTS_FILENAME)
+    return _keyword_index
+
+
 def run_index():
-    """Index all files, skip unchanged ones. Uses LanceDB for disk-based vector storage."""
-    global _file_hashes, _indexing, _last_index_time, _index_stats, _table
+    """Incrementally index all files into LanceDB using the persisted manifest.
+
+    Only files whose content hash changed are re-chunked and re-embedded. Chunks of
+    changed and deleted files — plus any orphaned rows the manifest doesn't know
+    about — are bulk-deleted before new chunks are inserted.
+    """
+    global _indexing, _last_index_time, _index_stats, _table, _orphans_swept
     if not _indexing_lock.acquire(blocking=False):
         return  # another thread already indexing
     _indexing = True
     start = time.time()
 
     try:
-        embedder = _get_embedder()
-        embed_dim = embedder.get_sentence_embedding_dimension()
+        manifest = _get_manifest()
+        _, table = _get_db()
+        if table is None and manifest.files:
+            manifest.files.clear()  # table was dropped — manifest no longer describes it
         files = discover_files(REPOS_DIR)
+        plan = manifest.diff(files)
 
-        new_hashes = {}
-        chunks_to_add = []
-
-        for f in files:
-            fh = file_hash(f)
-            key = str(f)
-            new_hashes[key] = fh
-
-            if _file_hashes.get(key) == fh:
-                continue  # unchanged
-
-            chunks = chunk_file(f)
-            for chunk in chunks:
-                chunks_to_add.append(chunk)
-
-        # Deduplicate IDs
+        stale_ids = set(plan.stale_chunk_ids)
+        keyword_index = _get_keyword_index()
+        if not _orphans_swept:
+            # Once per process: drop rows left behind by crashes or the pre-manifest
+            # indexer, and backfill the keyword index from LanceDB if it is behind.
+            try:
+                live_ids = manifest.all_chunk_ids()
+                if table is not None:
+                    stale_ids |= _table_chunk_ids(table) - live_ids
+                keyword_ids = keyword_index.ids()
+                keyword_index.delete(keyword_ids - live_ids)
+                missing = live_ids - keyword_ids - stale_ids
+                if missing and table is not None:
+                    keyword_index.upsert(_table_rows(table, missing))
+                _orphans_swept = True
+            except Exception as e:
+                print(f"Orphan sweep skipped: {e}")
+
+        chunks_by_file: dict[str, list[dict]] = {}
         seen_ids = set()
-        unique_chunks = []
-        for c in chunks_to_add:
-            if c["id"] not in seen_ids:
-                seen_ids.add(c["id"])
-                unique_chunks.append(c)
-        chunks_to_add = unique_chunks
+        for key in plan.changed:
+            file_chunks = []
+            for c in chunk_file(Path(key)):
+                if c["id"] not in seen_ids:
+                    seen_ids.add(c["id"])
+                    file_chunks.append(c)
+            chunks_by_file[key] = file_chunks
+        chunks_to_add = [c for file_chunks in chunks_by_file.values() for c in file_chunks]
+
+        if stale_ids:
+            keyword_index.delete(stale_ids)
+        if table is not None and stale_ids:
+            removed = _delete_chunks(table, stale_ids)
+            print(f"Removed {removed} stale chunks ({len(plan.deleted)} deleted files)")
+
+        # Files with no chunks are indexed trivially; the rest only once fully inserted
+        indexed: dict[str, list[str]] = {k: [] for k, v in chunks_by_file.items() if not v}
+        inserted_ids = set()
 
         if chunks_to_add:
-            print(f"Indexing {len(chunks_to_add)} chunks from {len(files)} files...")
-
-            # On first run or full reindex, recreate the table
-            if not _file_hashes:
+            print(f"Indexing {len(chunks_to_add)} chunks from {len(plan.changed)} changed files "
+                  f"({plan.unchanged} unchanged)...")
+            embedder = _get_embedder()
+            embed_dim = embedder.get_sentence_embedding_dimension()
+            if table is None:
                 table = _get_or_create_table(embed_dim)
-            else:
-                _, table = _get_db()
-                if table is None:
-                    table = _get_or_create_table(embed_dim)
 
             # Process in small batches: embed and insert immediately to avoid OOM
             batch_size = 32
@@ -807,7 +897,12 @@ def run_index():
                         })
                     # Insert immediately after embedding
                     table.add(rows)
+                    inserted_ids.update(r["id"] for r in rows)
                     total_inserted += len(rows)
+                    try:
+                        keyword_index.upsert(rows)
+                    except Exception as e:
+                        print(f"  Keyword index error at {i}: {e}")  # backfilled on next start
                     if (i // batch_size) % 50 == 0:
                         print(f"  Progress: {total_inserted}/{len(chunks_to_add)} chunks")
                 except Exception as e:
@@ -816,7 +911,21 @@ def run_index():
             _table = table
             print(f"  Indexed {total_inserted} chunks to LanceDB")
 
-        _file_hashes = new_hashes
+        for key, file_chunks in chunks_by_file.items():
+            ids = [c["id"] for c in file_chunks]
+            if ids and all(cid in inserted_ids for cid in ids):
+                indexed[key] = ids
+            elif ids and table is not None:
+                # Partial insert: drop what landed so the retry starts clean
+                partial = {cid for cid in ids if cid in inserted_ids}
+                if partial:
+                    _delete_chunks(table, partial)
+                    keyword_index.delete(partial)
+
+        manifest.apply(plan, indexed)
+        if plan.changed or plan.touched or plan.deleted:
+            manifest.save()
+
         _last_index_time = time.time()
         _, table = _get_db()
         chunk_count = table.count_rows() if table else 0
@@ -824,7 +933,9 @@ def run_index():
             "total_files": len(files),
             "total_chunks": chunk_count,
             "last_duration": round(time.time() - start, 1),
-            "changed_files": len(chunks_to_add),
+            "changed_files": len(plan.changed),
+            "deleted_files": len(plan.deleted),
+            "stale_chunks_removed": len(stale_ids),
         }
     finally:
         _indexing = False
@@ -947,51 +1058,88 @@ class ImpactRequest(BaseModel):
 # --- API Endpoints ---
 @app.post("/api/search")
 async def search(req: SearchRequest):
-    """Hybrid search: semantic (LanceDB vectors) + keyword (text filter). Research says hybrid beats either alone."""
+    """Hybrid search: LanceDB vectors + FTS5 BM25 keywords, fused with reciprocal-rank fusion.
+
+    The query embedding and the keyword lookup run concurrently. Each leg fetches
+    n_results * SEARCH_OVERFETCH chunks so the per-file dedup still leaves n_results hits.
+
+    Response change for API consumers: ``score`` is now the fused RRF score (higher is
+    better, comparable only within one response). The previous vector similarity,
+    1 / (1 + cosine distance), is returned as ``similarity`` — null for keyword-only hits.
+    """
     if DISABLE_INDEXER:
         return {"query": req.query, "results": [], "error": "Indexer disabled — semantic search unavailable"}
     _, table = _get_db()
     if table is None:
         return {"query": req.query, "results": [], "method": "no_index"}
 
-    embedder = _get_embedder()
-    query_embedding = embedder.encode([req.query]).tolist()[0]
+    def _keyword_leg() -> list[dict]:
+        try:
+            return _get_keyword_index().search(
+                req.query, limit=req.n_results * SEARCH_OVERFETCH, repo=req.repo
+            )
+        except Exception as e:
+            print(f"Keyword search error: {e}")
+            return []
 
-    try:
-        # Semantic search via LanceDB
-        search_query = table.search(query_embedding).metric("cosine").limit(req.n_results * 2)
+    def _vector_leg(query_embedding: list[float]) -> list[dict]:
+        search_query = table.search(query_embedding).metric("cosine")
+        search_query = search_query.limit(req.n_results * SEARCH_OVERFETCH)
         if req.repo:
             search_query = search_query.where(f"repo = '{req.repo}'")
-        results = _result_rows(search_query)
+        return _result_rows(search_query)
+
+    embedder = _get_embedder()
+    embed_task = asyncio.to_thread(_embed_query, embedder, EMBED_MODEL, req.query)
+    query_embedding, keyword_rows = await asyncio.gather(embed_task, asyncio.to_thread(_keyword_leg))
+
+    try:
+        vector_rows = await asyncio.to_thread(_vector_leg, query_embedding)
     except Exception as e:
         print(f"Search error: {e}")
-        return {"query": req.query, "results": [], "error": str(e)}
+        if not keyword_rows:
+            return {"query": req.query, "results": [], "error": str(e)}
+        vector_rows = []
+
+    rows_by_id: dict[str, dict] = {}
+    for row in keyword_rows + vector_rows:
+        rows_by_id.setdefault(row.get("id", ""), row)
+    fused = rrf_fuse([
+        [row.get("id", "") for row in vector_rows],
+        [row.get("id", "") for row in keyword_rows],
+    ])
+    distances = {row.get("id", ""): row.get("_distance", 1.0) for row in vector_rows}
+    keyword_ids = {row.get("id", "") for row in keyword_rows}
 
     hits = []
     seen_files = set()
-    for row in results:
+    for chunk_id, score in fused:
+        row = rows_by_id[chunk_id]
         file_key = f"{row.get('repo', '')}/{row.get('file', '')}"
         # Deduplicate by file — show best chunk per file
         if file_key in seen_files:
             continue
         seen_files.add(file_key)
 
-        distance = row.get("_distance", 1.0)
         hits.append({
-            "id": row.get("id", ""),
+            "id": chunk_id,
             "repo": row.get("repo", ""),
             "file": row.get("file", ""),
             "start_line": int(row.get("start_line", 0)),
             "end_line": int(row.get("end_line", 0)),
             "block_name": row.get("block_name", ""),
             "block_type": row.get("block_type", ""),
-            "score": round(max(0, 1 / (1 + distance)), 4),
+            "score": round(score, 4),
+            "similarity": (round(max(0, 1 / (1 + distances[chunk_id])), 4)
+                           if chunk_id in distances else None),
+            "match": "both" if chunk_id in distances and chunk_id in keyword_ids
+                     else ("vector" if chunk_id in distances else "keyword"),
             "snippet": str(row.get("text", ""))[:300],
         })
         if len(hits) >= req.n_results:
             break
 
-    return {"query": req.query, "results": hits, "method": "hybrid_lance"}
+    return {"query": req.query, "results": hits, "method": "hybrid_rrf"}
 
 
 @app.post("/api/impact")
@@ -1072,6 +1220,7 @@ async def stats():
         "indexing": _indexing,
         "last_index": _last_index_time,
         **_index_stats,
+        "query_embedding_cache": _query_embeddings.stats(),
     }
 
 
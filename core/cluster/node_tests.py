@@ -1,7 +1,7 @@
 """
 BR3 Cluster — Node 2: Walter (Sentinel)
 Continuous testing. Watches repos, runs affected tests, stores results in SQLite.
-Thread-safe queue-based execution with git SHA change detection.
+Per-project run slots drained by a bounded executor pool, with git SHA change detection.
 
 Run: uvicorn core.cluster.node_tests:app --host 0.0.0.0 --port 8100
 """
@@ -15,10 +15,10 @@ import signal
 import sqlite3
 import subprocess
 import threading
-import queue
 import urllib.request
 import urllib.error
 import psutil
+from collections import deque
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -34,24 +34,37 @@ POLL_INTERVAL = int(os.environ.get("POLL_INTERVAL", "60"))
 PROJECT_COOLDOWN = int(os.environ.get("PROJECT_COOLDOWN", "600"))  # min seconds between runs per project
 JIMMY_URL = get_jimmy_semantic_url()  # single source of truth — core/cluster/cluster_config.py
 SERVICE_VERSION = "0.2.0"
+# Concurrent test runs (across projects; a project never has two in flight)
+TEST_POOL_SIZE = int(os.environ.get(
+    "TEST_POOL_SIZE", str(max(1, min(4, (os.cpu_count() or 1) // 4)))
+))
+VITEST_MAX_THREADS = int(os.environ.get("VITEST_MAX_THREADS", "4"))  # cap per local vitest run
+PLAYWRIGHT_MAX_WORKERS = int(os.environ.get("PLAYWRIGHT_MAX_WORKERS", "2"))  # cap per E2E run
 
 # --- App ---
 app = create_app(role="test-runner", version=SERVICE_VERSION)
 
 # --- Thread-Safe State (RC1-RC3 fixes) ---
-_state_lock = threading.Lock()       # Protects _running, _last_run_time, _last_results
+_state_lock = threading.Lock()       # Protects _last_run_time, _last_results
 _db_lock = threading.Lock()          # Serializes all SQLite writes (RC5)
 
-_running = False
 _last_run_time = 0.0
 _last_results = {}
 
-# --- Queue-based execution (RC4 fix) ---
-# Single consumer thread pulls from queue, deduplicates by project+SHA, runs tests serially
-_test_queue: queue.Queue = queue.Queue()
+# --- Per-project run slots (RC4 fix, parallel across projects) ---
+# Each project has at most one pending run (latest wins) and one running run.
+# TEST_POOL_SIZE executor threads take projects off _ready_projects in FIFO order.
+_sched_cond = threading.Condition()
+_pending_runs: dict[str, dict] = {}       # project -> newest queued item
+_ready_projects: deque[str] = deque()     # projects with a pending run and none running
+_active_projects: set[str] = set()        # projects with a run executing
+_queue_waits: deque[float] = deque(maxlen=200)     # seconds from enqueue to start
+_run_durations: deque[float] = deque(maxlen=200)   # seconds from start to finish
+_executors_stop = threading.Event()        # set by _stop_executors(); pool threads exit
+
 _run_status: dict[str, dict] = {}   # run_id -> {status, project, queued_at, started_at, completed_at, result}
 _run_status_lock = threading.Lock()
-_inflight_projects: set[str] = set()  # Projects with queued/running tests (for dedup)
+_inflight_projects: set[str] = set()  # Projects with queued/running tests (for /api/run dedup)
 
 # Track last tested SHA per project for git-based change detection
 _last_tested_sha: dict[str, str] = {}
@@ -483,6 +496,13 @@ def _invalidate_test_map_entries(project: str, changed_files: list[str]):
 
 
 # --- Test Runners ---
+def _worker_share(cap: int) -> int:
+    """Workers a single test run may start: an even share of this host's cores
+    across TEST_POOL_SIZE concurrent runs, at most ``cap`` and at least 1."""
+    cores = os.cpu_count() or 1
+    return max(1, min(cap, cores // max(1, TEST_POOL_SIZE)))
+
+
 def _run_with_process_group(cmd: list[str], cwd: str, timeout: int, env: dict) -> tuple[str, str, int, bool]:
     """Run command in a new process group. Kills entire group on timeout.
 
@@ -639,7 +659,7 @@ def _run_vitest_local(vitest_dir: str, project_name: str, changed_files: list[st
         cmd.append("--changed")
 
     env = {**os.environ, "PATH": f"/opt/homebrew/bin:{os.environ.get('PATH', '')}",
-           "VITEST_MAX_THREADS": "2"}
+           "VITEST_MAX_THREADS": str(_worker_share(VITEST_MAX_THREADS))}
     stdout, stderr, returncode, timed_out = _run_with_process_group(cmd, vitest_dir, timeout=120, env=env)
 
     duration = int((time.time() - start) * 1000)
@@ -694,7 +714,7 @@ def _run_vitest_local(vitest_dir: str, project_name: str, changed_files: list[st
 
 
 def _run_playwright(repo_path: str, project_name: str, changed_files: list[str]) -> dict:
-    """Run Playwright E2E tests. WebKit only, 1 worker, per research."""
+    """Run Playwright E2E tests. WebKit only, workers limited to this run's CPU share."""
     pw_config = Path(repo_path, "playwright.config.ts")
     if not pw_config.exists():
         pw_config = Path(repo_path, "playwright.config.js")
@@ -713,7 +733,7 @@ def _run_playwright(repo_path: str, project_name: str, changed_files: list[str])
     cmd = [
         "npx", "playwright", "test",
         "--reporter=json",
-        "--workers=1",
+        f"--workers={_worker_share(PLAYWRIGHT_MAX_WORKERS)}",
         "--project=webkit",  # lowest memory per research
     ]
     env = {
@@ -901,52 +921,85 @@ def _push_to_lockwood(results: dict, trigger: str = "watch"):
     return False
 
 
-# --- Queue Consumer (RC4 fix: single execution path) ---
-def _queue_consumer():
-    """Single consumer thread that processes test runs serially from the queue.
-    Deduplicates by project+SHA — if a newer SHA is queued for the same project,
-    skip the older entry.
+# --- Test Executor Pool (RC4 fix: single execution path per project) ---
+def _enqueue_run(item: dict):
+    """Put a run in its project's slot. A run already waiting there is superseded.
+
+    The newer run tests from the last tested SHA to the newer HEAD, so it covers
+    the superseded run's changes; a full run (``changed == []``) stays full.
     """
-    while True:
-        try:
-            item = _test_queue.get(timeout=5)
-        except queue.Empty:
-            continue
+    project = item["project"]
+    item = {**item, "enqueued_at": time.monotonic()}
+    with _sched_cond:
+        previous = _pending_runs.get(project)
+        if previous is not None:
+            if not previous.get("changed") or not item.get("changed"):
+                item["changed"] = []
+            else:
+                item["changed"] = sorted(set(previous["changed"]) | set(item["changed"]))
+        _pending_runs[project] = item
+        if previous is None and project not in _active_projects:
+            _ready_projects.append(project)
+            _sched_cond.notify()
+
+    if previous is not None:
+        with _run_status_lock:
+            _run_status[previous["run_id"]] = {
+                "status": "skipped", "project": project,
+                "reason": f"superseded by {item['run_id']}",
+                "completed_at": datetime.now().isoformat()
+            }
+
+
+def _next_run() -> Optional[dict]:
+    """Block until a project has a pending run and none in flight; claim it.
+
+    Returns None once _stop_executors() has been called.
+    """
+    with _sched_cond:
+        while not _executors_stop.is_set():
+            if not _ready_projects:
+                _sched_cond.wait()
+                continue
+            project = _ready_projects.popleft()
+            _active_projects.add(project)
+            item = _pending_runs.pop(project)
+            _queue_waits.append(time.monotonic() - item["enqueued_at"])
+            return item
+        return None
+
+
+def _finish_run(project: str, duration: float):
+    """Release a project's run slot; a run queued meanwhile becomes ready."""
+    with _sched_cond:
+        _active_projects.discard(project)
+        _run_durations.append(duration)
+        queued_again = project in _pending_runs
+        if queued_again:
+            _ready_projects.append(project)
+            _sched_cond.notify()
+    if not queued_again:
+        # Clear inflight flag so new manual runs can be queued for this project
+        with _run_status_lock:
+            _inflight_projects.discard(project)
+
 
+def _stop_executors():
+    """Make idle pool threads exit; busy ones exit after their current run."""
+    with _sched_cond:
+        _executors_stop.set()
+        _sched_cond.notify_all()
+
+
+def _test_executor():
+    """Pool thread: runs one project's tests at a time, any project."""
+    while True:
+        item = _next_run()
+        if item is None:
+            return
         run_id = item["run_id"]
         project = item["project"]
-        repo_path = item["repo_path"]
-        trigger = item.get("trigger", "watch")
-        changed = item.get("changed", [])
-
-        # Dedup: check if a newer entry for same project is already queued
-        # by peeking at the queue (drain and re-add non-dupes)
-        current_sha = _git_sha_full(repo_path)
-        skip = False
-        pending = []
-        try:
-            while True:
-                next_item = _test_queue.get_nowait()
-                if next_item["project"] == project:
-                    # Newer entry for same project — skip current, keep newer
-                    skip = True
-                    pending.append(next_item)
-                else:
-                    pending.append(next_item)
-        except queue.Empty:
-            pass
-        for p in pending:
-            _test_queue.put(p)
-
-        if skip:
-            with _run_status_lock:
-                _run_status[run_id] = {
-                    "status": "skipped", "project": project,
-                    "reason": "superseded by newer SHA",
-                    "completed_at": datetime.now().isoformat()
-                }
-            _test_queue.task_done()
-            continue
+        started = time.monotonic()
 
         # Mark as running
         with _run_status_lock:
@@ -954,12 +1007,10 @@ def _queue_consumer():
                 "status": "running", "project": project,
                 "started_at": datetime.now().isoformat()
             }
-        with _state_lock:
-            global _running
-            _running = True
 
         try:
-            _execute_test_run(run_id, project, repo_path, trigger, changed)
+            _execute_test_run(run_id, project, item["repo_path"],
+                              item.get("trigger", "watch"), item.get("changed", []))
         except Exception as e:
             print(f"Test run error for {project}: {e}")
             with _run_status_lock:
@@ -969,12 +1020,20 @@ def _queue_consumer():
                     "completed_at": datetime.now().isoformat()
                 }
         finally:
-            with _state_lock:
-                _running = False
-            # Clear inflight flag so new runs can be queued for this project
-            with _run_status_lock:
-                _inflight_projects.discard(project)
-            _test_queue.task_done()
+            _finish_run(project, time.monotonic() - started)
+
+
+def _timing_summary(samples) -> dict:
+    """count / p50 / p95 / max (seconds) over recent samples."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0, "p50_s": None, "p95_s": None, "max_s": None}
+    return {
+        "count": len(ordered),
+        "p50_s": round(ordered[len(ordered) // 2], 2),
+        "p95_s": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+        "max_s": round(ordered[-1], 2),
+    }
 
 
 def _execute_test_run(run_id: str, project: str, repo_path: str, trigger: str, changed: list[str]):
@@ -1087,7 +1146,7 @@ def _watch_loop():
                         "status": "queued", "project": project_name,
                         "queued_at": datetime.now().isoformat()
                     }
-                _test_queue.put({
+                _enqueue_run({
                     "run_id": run_id,
                     "project": project_name,
                     "repo_path": repo_path,
@@ -1134,14 +1193,19 @@ async def startup():
     # (psutil cpu_percent(interval=None) returns 0.0 on first invocation).
     process_detector.warmup()
 
-    # Start queue consumer (single thread — serializes all test runs)
-    consumer = threading.Thread(target=_queue_consumer, daemon=True, name="test-consumer")
-    consumer.start()
+    # Start executor pool (one run per project at a time, projects in parallel)
+    for n in range(TEST_POOL_SIZE):
+        threading.Thread(target=_test_executor, daemon=True, name=f"test-executor-{n}").start()
     # Start watch loop (enqueues runs when changes detected)
     watcher = threading.Thread(target=_watch_loop, daemon=True, name="repo-watcher")
     watcher.start()
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    _stop_executors()
+
+
 # --- Extended /health (overrides base_service /health with Walter-specific data) ---
 _service_start_time = time.time()
 
@@ -1164,8 +1228,12 @@ async def walter_health():
                 repo_heads[repo_dir.name] = sha
 
     with _state_lock:
-        running = _running
         last_run = _last_run_time
+    with _sched_cond:
+        running_projects = sorted(_active_projects)
+        queued_projects = sorted(_pending_runs)
+        queue_wait = _timing_summary(_queue_waits)
+        run_duration = _timing_summary(_run_durations)
 
     mem = psutil.virtual_memory()
     snapshot = process_detector.sample_host()
@@ -1188,8 +1256,13 @@ async def walter_health():
         "platform": snapshot["platform"],
         # Walter-specific fields (retained)
         "last_test_run": datetime.fromtimestamp(last_run).isoformat() if last_run > 0 else None,
-        "running": running,
-        "queue_depth": _test_queue.qsize(),
+        "running": bool(running_projects),
+        "running_projects": running_projects,
+        "queue_depth": len(queued_projects),
+        "queued_projects": queued_projects,
+        "pool_size": TEST_POOL_SIZE,
+        "queue_wait": queue_wait,
+        "run_duration": run_duration,
         "repo_count": len(watched_repos),
         "watched_repos": watched_repos,
         "repo_heads": repo_heads,
@@ -1371,7 +1444,7 @@ def trigger_run(project: Optional[str] = None, trigger: str = "manual"):
                 "queued_at": datetime.now().isoformat()
             }
 
-        _test_queue.put({
+        _enqueue_run({
             "run_id": run_id,
             "project": name,
             "repo_path": repo_path_str,
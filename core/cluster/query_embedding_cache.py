@@ -0,0 +1,101 @@
+"""
+BR3 Cluster — Lockwood Query Embedding Cache
+Bounded LRU + TTL cache of query embeddings shared by node_semantic's search paths.
+
+Keyed by (model name, whitespace-normalized query text) so the code embedder and
+the research embedder never share vectors. Concurrent misses for the same key
+are coalesced: the first caller encodes, the rest wait on its result, so a burst
+of identical dashboard queries runs the SentenceTransformer exactly once.
+
+Usage (from node_semantic):
+    from core.cluster.query_embedding_cache import QueryEmbeddingCache
+
+    cache = QueryEmbeddingCache(maxsize=1024, ttl_seconds=600)
+    vec = cache.get_or_compute(EMBED_MODEL, query, lambda q: embedder.encode([q]).tolist()[0])
+    cache.stats()   # {"hits": ..., "misses": ..., "coalesced": ..., "size": ...}
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable
+
+
+def normalize_query(text: str) -> str:
+    """Collapse whitespace. Case is preserved — it matters for code identifiers."""
+    return " ".join(text.split())
+
+
+class QueryEmbeddingCache:
+    """Thread-safe LRU + TTL map of (model, query) -> embedding with single-flight misses."""
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 600.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[float, list[float]]] = OrderedDict()
+        self._inflight: dict[tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    def get_or_compute(
+        self,
+        model_name: str,
+        text: str,
+        compute: Callable[[str], list[float]],
+    ) -> list[float]:
+        """Return the cached embedding or compute it once (coalescing concurrent callers)."""
+        normalized = normalize_query(text)
+        key = (model_name, normalized)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            pending = self._inflight.get(key)
+            owner = pending is None
+            if owner:
+                self._misses += 1
+                pending = self._inflight[key] = Future()
+            else:
+                self._coalesced += 1
+        if not owner:
+            return pending.result()
+
+        try:
+            vector = compute(normalized)
+        except BaseException as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+            pending.set_exception(exc)
+            raise
+        with self._lock:
+            self._inflight.pop(key, None)
+            self._entries[key] = (time.monotonic(), vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        pending.set_result(vector)
+        return vector
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses + self._coalesced
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+                "hit_rate": round((self._hits + self._coalesced) / lookups, 4) if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+            }
@@ -0,0 +1,210 @@
+"""
+BR3 Cluster — Title Embedding Index
+In-memory similarity index over stored intel/deal title embeddings.
+
+Title embeddings are persisted once per item (``title_embedding`` BLOB column,
+float32) so duplicate detection never re-embeds titles it has already seen.
+The dedup window is loaded into a matrix of L2-normalized rows (NumPy when
+installed, pre-normalized tuples otherwise) and each check is a single
+matrix–vector product + argmax. dedup_embeddings runs the same greedy pass
+over a batch of fresh listings, switching to random-hyperplane LSH buckets
+for large batches.
+"""
+
+import math
+import random
+import struct
+from typing import Optional
+
+
+def pack_embedding(vec: list[float]) -> bytes:
+    """Serialize an embedding as float32 for the title_embedding column."""
+    return struct.pack(f"{len(vec)}f", *vec)
+
+
+def unpack_embedding(blob: bytes) -> list[float]:
+    """Inverse of pack_embedding."""
+    return list(struct.unpack(f"{len(blob) // 4}f", blob))
+
+
+def _normalize(vec: list[float]) -> tuple[float, ...]:
+    norm = math.sqrt(sum(x * x for x in vec))
+    if norm == 0.0:
+        return tuple(0.0 for _ in vec)
+    return tuple(x / norm for x in vec)
+
+
+def _numpy():
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+
+class TitleIndex:
+    """Normalized title embeddings keyed by item ID, queried by cosine similarity."""
+
+    def __init__(self):
+        self._ids: list[int] = []
+        self._titles: list[str] = []
+        self._dim: Optional[int] = None
+        self._np = _numpy()
+        self._rows: list = []   # pure-Python fallback storage
+        self._matrix = None     # NumPy storage, capacity >= len(self)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, item_id: int, title: str, vec: list[float]) -> bool:
+        """Add an item's embedding. Returns False if its dimension doesn't match the index."""
+        if not vec:
+            return False
+        if self._dim is None:
+            self._dim = len(vec)
+        elif len(vec) != self._dim:
+            return False
+
+        pos = len(self._ids)
+        self._ids.append(item_id)
+        self._titles.append(title)
+        np = self._np
+        if np is None:
+            self._rows.append(_normalize(vec))
+            return True
+        if self._matrix is None or pos >= self._matrix.shape[0]:
+            grown = np.zeros((max(64, pos * 2), self._dim), dtype=np.float32)
+            if self._matrix is not None:
+                grown[:pos] = self._matrix[:pos]
+            self._matrix = grown
+        row = np.asarray(vec, dtype=np.float32)
+        norm = float(np.linalg.norm(row))
+        self._matrix[pos] = row / norm if norm > 0.0 else row
+        return True
+
+    def best_match(self, vec: list[float]) -> tuple[Optional[int], Optional[str], float]:
+        """Return (item_id, title, cosine similarity) of the nearest stored title."""
+        if not self._ids or not vec or len(vec) != self._dim:
+            return None, None, 0.0
+        np = self._np
+        if np is not None:
+            query = np.asarray(vec, dtype=np.float32)
+            norm = float(np.linalg.norm(query))
+            if norm == 0.0:
+                return None, None, 0.0
+            scores = self._matrix[:len(self._ids)] @ (query / norm)
+            best = int(scores.argmax())
+            return self._ids[best], self._titles[best], float(scores[best])
+
+        query = _normalize(vec)
+        best, best_score = 0, -1.0
+        for i, row in enumerate(self._rows):
+            score = sum(x * y for x, y in zip(query, row))
+            if score > best_score:
+                best, best_score = i, score
+        return self._ids[best], self._titles[best], best_score
+
+
+# --- Greedy dedup ---
+
+LSH_MIN_ITEMS = 1000  # below this, compare against every kept title
+LSH_TABLES = 12
+LSH_BITS = 6
+
+
+class _HyperplaneLSH:
+    """Random-hyperplane buckets: titles with a small angle share a bucket in some table.
+
+    With the defaults, a pair at cosine 0.85 lands together in at least one of
+    the 12 tables ~99% of the time; unrelated titles rarely do.
+    """
+
+    def __init__(self, dim: int, tables: int = LSH_TABLES, bits: int = LSH_BITS, seed: int = 0):
+        rng = random.Random(seed)
+        self.tables = tables
+        self.bits = bits
+        self.planes = [[rng.gauss(0.0, 1.0) for _ in range(dim)] for _ in range(tables * bits)]
+
+    def keys(self, rows) -> list[list[tuple[int, int]]]:
+        """Bucket keys (table, code) for each normalized row."""
+        np = _numpy()
+        if np is not None:
+            planes = np.asarray(self.planes, dtype=np.float32)
+            signs = ((np.asarray(rows, dtype=np.float32) @ planes.T) > 0).tolist()
+        else:
+            signs = [
+                [sum(x * p for x, p in zip(row, plane)) > 0 for plane in self.planes]
+                for row in rows
+            ]
+
+        keys = []
+        for bits in signs:
+            row_keys = []
+            for table in range(self.tables):
+                code = 0
+                for bit in bits[table * self.bits:(table + 1) * self.bits]:
+                    code = (code << 1) | bool(bit)
+                row_keys.append((table, code))
+            keys.append(row_keys)
+        return keys
+
+
+def dedup_embeddings(
+    vectors: list[Optional[list[float]]],
+    threshold: float,
+    lsh_min_items: int = LSH_MIN_ITEMS,
+) -> list[int]:
+    """Greedy semantic dedup: keep a vector unless it is > threshold similar to a kept one.
+
+    Args:
+        vectors: One embedding per item, in priority order; None entries are always kept
+        threshold: Cosine similarity above which an item is a duplicate
+        lsh_min_items: From this many embedded items on, only compare against kept
+            items sharing an LSH bucket (approximate, sub-quadratic)
+
+    Returns:
+        Positions of kept items, ascending
+    """
+    embedded = [i for i, vec in enumerate(vectors) if vec]
+    dims = {len(vectors[i]) for i in embedded}
+    if len(dims) > 1:
+        # Mixed models/dimensions can't be compared; keep everything
+        return list(range(len(vectors)))
+    if len(embedded) < lsh_min_items:
+        index = TitleIndex()
+        kept = []
+        for i, vec in enumerate(vectors):
+            if vec:
+                _, _, sim = index.best_match(vec)
+                if sim > threshold:
+                    continue
+                index.add(i, "", vec)
+            kept.append(i)
+        return kept
+
+    np = _numpy()
+    rows = [_normalize(vectors[i]) for i in embedded]
+    matrix = np.asarray(rows, dtype=np.float32) if np is not None else None
+    row_of = {pos: n for n, pos in enumerate(embedded)}
+    keys = _HyperplaneLSH(len(rows[0])).keys(matrix if matrix is not None else rows)
+
+    buckets: dict[tuple[int, int], list[int]] = {}
+    kept = []
+    for i in range(len(vectors)):
+        if i not in row_of:
+            kept.append(i)
+            continue
+        n = row_of[i]
+        candidates = {m for key in keys[n] for m in buckets.get(key, ())}
+        if candidates:
+            ordered = sorted(candidates)
+            if matrix is not None:
+                best = float((matrix[ordered] @ matrix[n]).max())
+            else:
+                best = max(sum(x * y for x, y in zip(rows[m], rows[n])) for m in ordered)
+            if best > threshold:
+                continue
+        for key in keys[n]:
+            buckets.setdefault(key, []).append(n)
+        kept.append(i)
+    return kept
@@ -0,0 +1,317 @@
+"""tokenizer_registry.py — In-process tokenizers for context bundle budgets.
+
+Replaces the per-call count-tokens.sh subprocess used by context_bundle: each
+tokenizer is loaded once per process and reused for every count, texts are
+encoded in batches, and trimming to a budget is a single pass over token
+offsets instead of a binary search of re-counts.
+
+Tokenizer per model (same mapping as count-tokens.sh):
+    claude / codex → cl100k_base  (tiktoken)
+    ollama         → qwen2.5      (HuggingFace `tokenizers`, tokenizer.json)
+
+The qwen2.5 tokenizer.json is read from $BR3_QWEN_TOKENIZER, then
+~/.buildrunner/tokenizers/qwen2.5/tokenizer.json, then a local HuggingFace hub
+cache snapshot. It is never downloaded at runtime.
+
+If a tokenizer can't be loaded in-process (library not installed, tokenizer
+file missing), the registry logs a warning and falls back to forking
+count-tokens.sh per count — slow, but still tokenizer-true.
+
+IMPORTANT: Fail-closed. When neither the in-process tokenizer nor
+           count-tokens.sh is available, TokenizerUnavailable (a RuntimeError)
+           is raised — there is no byte-count fallback. Load failures are
+           remembered for the life of the process; call reset_tokenizers()
+           after installing a tokenizer.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+HOME = Path.home()
+
+# Target model → tokenizer name
+MODEL_TOKENIZERS = {
+    "claude": "cl100k_base",
+    "codex": "cl100k_base",
+    "ollama": "qwen2.5",
+}
+
+_QWEN_TOKENIZER_ENV = "BR3_QWEN_TOKENIZER"
+_QWEN_TOKENIZER_JSON = HOME / ".buildrunner" / "tokenizers" / "qwen2.5" / "tokenizer.json"
+_QWEN_HF_REPO = "Qwen/Qwen2.5-7B-Instruct"
+
+# Subprocess fallback (the pre-registry counting path)
+_COUNT_TOKENS_SH = HOME / ".buildrunner" / "scripts" / "count-tokens.sh"
+
+
+class TokenizerUnavailable(RuntimeError):
+    """Tokenizer could not be loaded — callers must refuse, never estimate."""
+
+
+class Tokenizer(ABC):
+    """A loaded tokenizer: batch counting and budget truncation."""
+
+    name = ""
+
+    @abstractmethod
+    def count_batch(self, texts: list[str]) -> list[int]:
+        """Token count for each text."""
+
+    @abstractmethod
+    def truncate(self, text: str, max_tokens: int) -> tuple[str, int]:
+        """Longest prefix of text that fits max_tokens.
+
+        Returns:
+            (prefix, token count of prefix)
+        """
+
+    def count(self, text: str) -> int:
+        return self.count_batch([text])[0]
+
+
+class OffsetTokenizer(Tokenizer):
+    """In-process tokenizer with token offsets: batch encoding and one-pass truncation."""
+
+    @abstractmethod
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        """Encode texts (no special tokens) into token ids."""
+
+    @abstractmethod
+    def _scan(self, text: str, max_tokens: int) -> tuple[int, int | None]:
+        """Return (token count, char offset where token #max_tokens starts or None)."""
+
+    def count_batch(self, texts: list[str]) -> list[int]:
+        """Token count for each text, encoded in one batch."""
+        return [len(ids) for ids in self.encode_batch(texts)]
+
+    def truncate(self, text: str, max_tokens: int) -> tuple[str, int]:
+        """Longest prefix of text cut at a token boundary that fits max_tokens.
+
+        One encode finds the cut from the token offsets; the prefix is
+        re-encoded once to confirm the count (BPE can merge differently at the
+        cut, in which case the cut steps back and is confirmed again).
+
+        Returns:
+            (prefix, token count of prefix)
+        """
+        if max_tokens <= 0:
+            return "", 0
+
+        prefix = text
+        while True:
+            count, cut = self._scan(prefix, max_tokens)
+            if cut is None:
+                return prefix, count
+            prefix = prefix[:cut]
+
+
+class _TiktokenTokenizer(OffsetTokenizer):
+    def __init__(self, encoding) -> None:
+        self.name = encoding.name
+        self._encoding = encoding
+
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        return self._encoding.encode_ordinary_batch(texts)
+
+    def _scan(self, text: str, max_tokens: int) -> tuple[int, int | None]:
+        ids = self._encoding.encode_ordinary(text)
+        if len(ids) <= max_tokens:
+            return len(ids), None
+        _decoded, offsets = self._encoding.decode_with_offsets(ids[: max_tokens + 1])
+        return len(ids), offsets[max_tokens]
+
+
+class _HFTokenizer(OffsetTokenizer):
+    def __init__(self, name: str, tokenizer) -> None:
+        self.name = name
+        self._tokenizer = tokenizer
+
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        return [e.ids for e in self._tokenizer.encode_batch(texts, add_special_tokens=False)]
+
+    def _scan(self, text: str, max_tokens: int) -> tuple[int, int | None]:
+        encoding = self._tokenizer.encode(text, add_special_tokens=False)
+        if len(encoding.ids) <= max_tokens:
+            return len(encoding.ids), None
+        return len(encoding.ids), encoding.offsets[max_tokens][0]
+
+
+class _ScriptTokenizer(Tokenizer):
+    """Fallback: one count-tokens.sh subprocess per count."""
+
+    def __init__(self, name: str, model: str, script: Path) -> None:
+        self.name = name
+        self._model = model
+        self._script = script
+
+    def count_batch(self, texts: list[str]) -> list[int]:
+        return [self._count(text) for text in texts]
+
+    def _count(self, text: str) -> int:
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".txt", delete=False, encoding="utf-8"
+        ) as tf:
+            tf.write(text)
+            tmp_path = tf.name
+        try:
+            result = subprocess.run(
+                [str(self._script), "--model", self._model, tmp_path],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
+
+        if result.returncode != 0:
+            raise TokenizerUnavailable(
+                f"count-tokens.sh exited {result.returncode} for model={self._model}: "
+                f"{result.stderr.strip()}. Bundle REFUSED — no byte-count fallback permitted."
+            )
+        try:
+            return int(result.stdout.strip())
+        except ValueError as exc:
+            raise TokenizerUnavailable(
+                f"count-tokens.sh returned non-integer: {result.stdout!r}"
+            ) from exc
+
+    def truncate(self, text: str, max_tokens: int) -> tuple[str, int]:
+        """Binary search on prefix length (no offsets without an in-process tokenizer)."""
+        if max_tokens <= 0:
+            return "", 0
+        total = self._count(text)
+        if total <= max_tokens:
+            return text, total
+
+        lo, hi = 0, len(text) - 1
+        best, best_count = "", 0
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            count = self._count(text[:mid])
+            if count <= max_tokens:
+                best, best_count = text[:mid], count
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        return best, best_count
+
+
+def _load_cl100k() -> Tokenizer:
+    import tiktoken
+
+    return _TiktokenTokenizer(tiktoken.get_encoding("cl100k_base"))
+
+
+def _hf_hub_cache() -> Path:
+    if os.environ.get("HF_HUB_CACHE"):
+        return Path(os.environ["HF_HUB_CACHE"])
+    hf_home = os.environ.get("HF_HOME") or HOME / ".cache" / "huggingface"
+    return Path(hf_home) / "hub"
+
+
+def _qwen_tokenizer_path() -> Path:
+    """Locate the qwen2.5 tokenizer.json on disk (never downloads)."""
+    override = os.environ.get(_QWEN_TOKENIZER_ENV)
+    if override:
+        return Path(override)
+    if _QWEN_TOKENIZER_JSON.exists():
+        return _QWEN_TOKENIZER_JSON
+
+    repo_dir = _hf_hub_cache() / f"models--{_QWEN_HF_REPO.replace('/', '--')}"
+    snapshots = sorted(
+        repo_dir.glob("snapshots/*/tokenizer.json"), key=lambda p: p.stat().st_mtime
+    )
+    if snapshots:
+        return snapshots[-1]
+    raise FileNotFoundError(
+        f"qwen2.5 tokenizer.json not found (set ${_QWEN_TOKENIZER_ENV}, or place it at "
+        f"{_QWEN_TOKENIZER_JSON}, or in the HuggingFace cache under {repo_dir})"
+    )
+
+
+def _load_qwen() -> Tokenizer:
+    from tokenizers import Tokenizer as HFTokenizer
+
+    return _HFTokenizer("qwen2.5", HFTokenizer.from_file(str(_qwen_tokenizer_path())))
+
+
+# Tokenizer name → loader. Loaders raise on any missing piece.
+_LOADERS: dict[str, Callable[[], Tokenizer]] = {
+    "cl100k_base": _load_cl100k,
+    "qwen2.5": _load_qwen,
+}
+
+# Loaded tokenizers and remembered load failures, keyed by tokenizer name
+_tokenizers: dict[str, Tokenizer] = {}
+_failures: dict[str, str] = {}
+# count-tokens.sh fallbacks, keyed by (tokenizer name, model): the script takes the model
+_fallbacks: dict[tuple[str, str], Tokenizer] = {}
+_lock = threading.Lock()
+
+
+def get_tokenizer(model: str) -> Tokenizer:
+    """Return the process-wide tokenizer for a target model, loading it once.
+
+    Args:
+        model: One of 'claude', 'codex', 'ollama'.
+
+    Raises:
+        TokenizerUnavailable: tokenizer cannot be loaded — bundle must be refused.
+        ValueError:           bad model argument.
+    """
+    name = MODEL_TOKENIZERS.get(model)
+    if name is None:
+        raise ValueError(f"Unknown model '{model}'. Must be one of: {tuple(MODEL_TOKENIZERS)}")
+
+    with _lock:
+        tokenizer = _tokenizers.get(name)
+        if tokenizer is not None:
+            return tokenizer
+
+        if (name, model) in _fallbacks:
+            return _fallbacks[(name, model)]
+
+        if name not in _failures:
+            try:
+                tokenizer = _LOADERS[name]()
+            except Exception as exc:  # noqa: BLE001 — any load failure is fail-closed
+                _failures[name] = f"{type(exc).__name__}: {exc}"
+            else:
+                logger.info("tokenizer_registry: loaded %s", name)
+                _tokenizers[name] = tokenizer
+                return tokenizer
+
+        if os.access(_COUNT_TOKENS_SH, os.X_OK):
+            logger.warning(
+                "tokenizer_registry: %s unavailable in-process (%s) — FALLING BACK to "
+                "%s subprocess per count for model=%s (slow). Install tiktoken/tokenizers "
+                "or the tokenizer file to restore in-process counting.",
+                name, _failures[name], _COUNT_TOKENS_SH, model,
+            )
+            fallback = _ScriptTokenizer(name, model, _COUNT_TOKENS_SH)
+            _fallbacks[(name, model)] = fallback
+            return fallback
+
+        raise TokenizerUnavailable(
+            f"tokenizer unavailable for model={model} ({name}: {_failures[name]}; "
+            f"no count-tokens.sh at {_COUNT_TOKENS_SH}). "
+            "Bundle REFUSED — no byte-count fallback permitted."
+        )
+
+
+def reset_tokenizers() -> None:
+    """Forget loaded tokenizers and load failures (e.g. after installing one)."""
+    with _lock:
+        _tokenizers.clear()
+        _failures.clear()
+        _fallbacks.clear()
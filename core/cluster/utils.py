@@ -17,6 +17,11 @@ def url_hash(url: str) -> str:
     return hashlib.sha256(url.strip().lower().encode()).hexdigest()[:16]
 
 
+def title_hash(title: str) -> str:
+    """Generate 16-char hash of a case/whitespace-normalized title."""
+    return hashlib.sha256(" ".join(title.lower().split()).encode()).hexdigest()[:16]
+
+
 def cosine_similarity(v1: list[float], v2: list[float]) -> float:
     """Compute cosine similarity between two vectors."""
     if len(v1) != len(v2) or not v1:
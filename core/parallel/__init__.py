@@ -9,6 +9,7 @@ This module provides parallel task execution:
 """
 
 from .session_manager import SessionManager, Session, SessionStatus
+from .file_lock_index import FileLockIndex
 from .worker_coordinator import WorkerCoordinator, Worker, WorkerStatus
 from .live_dashboard import LiveDashboard, DashboardConfig
 
@@ -16,6 +17,7 @@ __all__ = [
     "SessionManager",
     "Session",
     "SessionStatus",
+    "FileLockIndex",
     "WorkerCoordinator",
     "Worker",
     "WorkerStatus",
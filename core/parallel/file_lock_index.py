@@ -0,0 +1,173 @@
+"""
+File Lock Index - Path trie mapping locked paths to their owning sessions
+
+Features:
+- File and directory-prefix locks ("src/api/" covers everything below it)
+- Conflict checks and lock/unlock in O(files x path depth), independent of
+  how many sessions or locks exist
+"""
+
+import posixpath
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def normalize_lock_path(path: str) -> Tuple[Tuple[str, ...], bool]:
+    """
+    Split a lock path into trie components.
+
+    Args:
+        path: File path, or directory path ending in "/"
+
+    Returns:
+        (components, is_directory)
+    """
+    path = path.replace("\\", "/")
+    is_dir = path.endswith("/")
+    normalized = posixpath.normpath(path) if path else "."
+    parts = tuple(part for part in normalized.split("/") if part and part != ".")
+    if normalized.startswith("/"):
+        parts = ("/",) + parts
+    return parts, is_dir or not parts
+
+
+class _TrieNode:
+    """One path component."""
+
+    __slots__ = ("children", "owners", "subtree")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # session_id -> True if the session holds this path as a directory lock
+        self.owners: Dict[str, bool] = {}
+        # session_id -> number of locks the session holds at or below this node
+        self.subtree: Dict[str, int] = {}
+
+
+class FileLockIndex:
+    """
+    Global lock table for file and directory locks.
+
+    A lock conflicts with another session's lock on the same path, on an
+    ancestor directory lock, or (for directory locks) on anything below it.
+    """
+
+    def __init__(self):
+        """Initialize empty index."""
+        self._root = _TrieNode()
+
+    def conflicts(
+        self,
+        session_id: str,
+        paths: Iterable[str],
+        blocking: Optional[Callable[[str], bool]] = None,
+    ) -> Dict[str, str]:
+        """
+        Find paths that would conflict with locks held by other sessions.
+
+        Args:
+            session_id: Session requesting the locks
+            paths: Paths to check
+            blocking: Predicate selecting which owning sessions block; all
+                other sessions block when omitted
+
+        Returns:
+            Dictionary of requested path -> conflicting session ID
+        """
+        found: Dict[str, str] = {}
+        for path in paths:
+            owner = self._conflicting_owner(session_id, path, blocking)
+            if owner is not None:
+                found[path] = owner
+        return found
+
+    def add(self, session_id: str, paths: Iterable[str]):
+        """Record locks for a session (no conflict checking)."""
+        for path in paths:
+            parts, is_dir = normalize_lock_path(path)
+            node = self._root
+            trail = [node]
+            for part in parts:
+                node = node.children.setdefault(part, _TrieNode())
+                trail.append(node)
+
+            if session_id in node.owners:
+                node.owners[session_id] = node.owners[session_id] or is_dir
+                continue
+            node.owners[session_id] = is_dir
+            for step in trail:
+                step.subtree[session_id] = step.subtree.get(session_id, 0) + 1
+
+    def remove(self, session_id: str, paths: Iterable[str]):
+        """Drop a session's locks on the given paths; unknown paths are ignored."""
+        for path in paths:
+            parts, _ = normalize_lock_path(path)
+            node = self._root
+            trail = [(None, node)]
+            for part in parts:
+                node = node.children.get(part)
+                if node is None:
+                    break
+                trail.append((part, node))
+            if node is None or session_id not in node.owners:
+                continue
+
+            del node.owners[session_id]
+            for _, step in trail:
+                remaining = step.subtree[session_id] - 1
+                if remaining:
+                    step.subtree[session_id] = remaining
+                else:
+                    del step.subtree[session_id]
+
+            # Prune branches that no longer hold any lock
+            for index in range(len(trail) - 1, 0, -1):
+                part, step = trail[index]
+                if step.subtree:
+                    break
+                del trail[index - 1][1].children[part]
+
+    def owners(self, path: str) -> List[str]:
+        """Sessions holding a lock on exactly this path."""
+        node = self._find(normalize_lock_path(path)[0])
+        return list(node.owners) if node else []
+
+    def clear(self):
+        """Remove all locks."""
+        self._root = _TrieNode()
+
+    def _find(self, parts: Tuple[str, ...]) -> Optional[_TrieNode]:
+        node = self._root
+        for part in parts:
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def _conflicting_owner(
+        self,
+        session_id: str,
+        path: str,
+        blocking: Optional[Callable[[str], bool]],
+    ) -> Optional[str]:
+        def blocks(owner: str) -> bool:
+            return owner != session_id and (blocking is None or blocking(owner))
+
+        parts, is_dir = normalize_lock_path(path)
+        node = self._root
+        for part in parts:
+            # Directory locks on an ancestor cover this path
+            for owner, owner_is_dir in node.owners.items():
+                if owner_is_dir and blocks(owner):
+                    return owner
+            node = node.children.get(part)
+            if node is None:
+                return None
+
+        for owner in node.owners:
+            if blocks(owner):
+                return owner
+        if is_dir:
+            for owner in node.subtree:
+                if blocks(owner):
+                    return owner
+        return None
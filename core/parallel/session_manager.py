@@ -6,6 +6,11 @@ Features:
 - Session state management
 - Conflict detection and resolution
 - Session synchronization
+
+Persistence is a snapshot (sessions.json) plus an append-only journal of
+per-session deltas (sessions.journal.jsonl). Locks, unlocks and progress
+updates append one line; the journal is folded into a fresh snapshot once it
+grows past JOURNAL_COMPACT_ENTRIES.
 """
 
 from dataclasses import dataclass, field
@@ -14,8 +19,11 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 import json
+import os
 import uuid
 
+from .file_lock_index import FileLockIndex
+
 
 class SessionStatus(str, Enum):
     """Session status."""
@@ -107,6 +115,9 @@ class Session:
 class SessionManager:
     """Manages multiple concurrent build sessions."""
 
+    # Journal entries appended before the snapshot is rewritten
+    JOURNAL_COMPACT_ENTRIES = 1000
+
     def __init__(self, storage_path: Optional[Path] = None, max_concurrent_sessions: int = 4):
         """
         Initialize session manager.
@@ -116,8 +127,11 @@ class SessionManager:
             max_concurrent_sessions: Maximum number of concurrent sessions
         """
         self.storage_path = storage_path or Path.cwd() / ".buildrunner" / "sessions.json"
+        self.journal_path = self.storage_path.with_suffix(".journal.jsonl")
         self.max_concurrent_sessions = max_concurrent_sessions
         self.sessions: Dict[str, Session] = {}
+        self.lock_index = FileLockIndex()
+        self._journal_entries = 0
         self._load()
 
     def create_session(
@@ -147,7 +161,7 @@ class SessionManager:
         )
 
         self.sessions[session.session_id] = session
-        self._save()
+        self._append_session(session)
 
         return session
 
@@ -202,7 +216,7 @@ class SessionManager:
         session.started_at = datetime.now()
         session.worker_id = worker_id
 
-        self._save()
+        self._append_session(session)
 
     def pause_session(self, session_id: str):
         """Pause a session."""
@@ -211,7 +225,7 @@ class SessionManager:
             raise ValueError(f"Session not found: {session_id}")
 
         session.status = SessionStatus.PAUSED
-        self._save()
+        self._append_session(session)
 
     def complete_session(self, session_id: str):
         """Complete a session."""
@@ -223,7 +237,7 @@ class SessionManager:
         session.completed_at = datetime.now()
         session.progress_percent = 100.0
 
-        self._save()
+        self._append_session(session)
 
     def fail_session(self, session_id: str):
         """Mark session as failed."""
@@ -234,7 +248,7 @@ class SessionManager:
         session.status = SessionStatus.FAILED
         session.completed_at = datetime.now()
 
-        self._save()
+        self._append_session(session)
 
     def cancel_session(self, session_id: str):
         """Cancel a session."""
@@ -245,7 +259,7 @@ class SessionManager:
         session.status = SessionStatus.CANCELLED
         session.completed_at = datetime.now()
 
-        self._save()
+        self._append_session(session)
 
     def update_progress(
         self,
@@ -274,7 +288,7 @@ class SessionManager:
         if session.total_tasks > 0:
             session.progress_percent = (completed_tasks / session.total_tasks) * 100
 
-        self._save()
+        self._append_session(session)
 
     def lock_files(self, session_id: str, files: List[str]):
         """
@@ -291,24 +305,17 @@ class SessionManager:
         if not session:
             raise ValueError(f"Session not found: {session_id}")
 
-        # Check for conflicts
-        for other_session in self.sessions.values():
-            if other_session.session_id == session_id:
-                continue
-
-            if other_session.status not in [SessionStatus.RUNNING, SessionStatus.PAUSED]:
-                continue
-
-            conflicts = set(files) & other_session.files_locked
-            if conflicts:
-                raise ValueError(
-                    f"Files already locked by session {other_session.session_id}: "
-                    f"{', '.join(conflicts)}"
-                )
+        # Check for conflicts with locks held by other active sessions
+        conflicts = self.lock_index.conflicts(session_id, files, blocking=self._holds_locks)
+        if conflicts:
+            owner = next(iter(conflicts.values()))
+            paths = [path for path, holder in conflicts.items() if holder == owner]
+            raise ValueError(f"Files already locked by session {owner}: {', '.join(paths)}")
 
         # Lock files
+        self.lock_index.add(session_id, files)
         session.files_locked.update(files)
-        self._save()
+        self._append("lock", session_id, files=list(files))
 
     def unlock_files(self, session_id: str, files: Optional[List[str]] = None):
         """
@@ -323,11 +330,13 @@ class SessionManager:
             raise ValueError(f"Session not found: {session_id}")
 
         if files is None:
+            self.lock_index.remove(session_id, session.files_locked)
             session.files_locked.clear()
         else:
+            self.lock_index.remove(session_id, files)
             session.files_locked -= set(files)
 
-        self._save()
+        self._append("unlock", session_id, files=None if files is None else list(files))
 
     def mark_files_modified(self, session_id: str, files: List[str]):
         """
@@ -342,7 +351,7 @@ class SessionManager:
             raise ValueError(f"Session not found: {session_id}")
 
         session.files_modified.update(files)
-        self._save()
+        self._append("modified", session_id, files=list(files))
 
     def get_active_sessions(self) -> List[Session]:
         """Get all active (running or paused) sessions."""
@@ -415,13 +424,41 @@ class SessionManager:
                     to_delete.append(session_id)
 
         for session_id in to_delete:
-            del self.sessions[session_id]
+            session = self.sessions.pop(session_id)
+            self.lock_index.remove(session_id, session.files_locked)
 
         if to_delete:
             self._save()
 
+    def _holds_locks(self, session_id: str) -> bool:
+        """Whether a session's file locks block other sessions."""
+        session = self.sessions.get(session_id)
+        return session is not None and session.status in [
+            SessionStatus.RUNNING,
+            SessionStatus.PAUSED,
+        ]
+
+    def _append_session(self, session: Session):
+        """Journal the full state of one session."""
+        self._append("session", session.session_id, session=session.to_dict())
+
+    def _append(self, op: str, session_id: str, **data):
+        """Append one delta to the journal, compacting when it grows too long."""
+        try:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            entry = {"op": op, "session_id": session_id, **data}
+            with open(self.journal_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+        except Exception as e:
+            print(f"Warning: Failed to append session journal: {e}")
+            return
+
+        self._journal_entries += 1
+        if self._journal_entries >= self.JOURNAL_COMPACT_ENTRIES:
+            self._save()
+
     def _save(self):
-        """Save sessions to disk."""
+        """Write a full snapshot of all sessions and truncate the journal."""
         try:
             self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -430,25 +467,66 @@ class SessionManager:
                 "version": "1.0",
             }
 
-            with open(self.storage_path, "w") as f:
+            tmp_path = self.storage_path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
                 json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.storage_path)
+
+            # Journal entries are idempotent, so a crash before this truncate
+            # only replays deltas the snapshot already contains
+            self.journal_path.unlink(missing_ok=True)
+            self._journal_entries = 0
 
         except Exception as e:
             print(f"Warning: Failed to save sessions: {e}")
 
     def _load(self):
-        """Load sessions from disk."""
-        if not self.storage_path.exists():
-            return
-
+        """Load the snapshot, replay the journal and rebuild the lock index."""
         try:
-            with open(self.storage_path, "r") as f:
-                data = json.load(f)
+            if self.storage_path.exists():
+                with open(self.storage_path, "r") as f:
+                    data = json.load(f)
 
-            for session_data in data.get("sessions", []):
-                session = Session.from_dict(session_data)
-                self.sessions[session.session_id] = session
+                for session_data in data.get("sessions", []):
+                    session = Session.from_dict(session_data)
+                    self.sessions[session.session_id] = session
+
+            if self.journal_path.exists():
+                self._replay_journal()
 
         except Exception as e:
             print(f"Warning: Failed to load sessions: {e}")
             self.sessions = {}
+
+        for session in self.sessions.values():
+            self.lock_index.add(session.session_id, session.files_locked)
+
+    def _replay_journal(self):
+        """Apply journal deltas on top of the loaded snapshot."""
+        with open(self.journal_path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final write from a crashed process
+                    break
+                self._journal_entries += 1
+
+                if entry["op"] == "session":
+                    session = Session.from_dict(entry["session"])
+                    self.sessions[session.session_id] = session
+                    continue
+
+                session = self.sessions.get(entry["session_id"])
+                if session is None:
+                    continue
+                files = entry.get("files")
+                if entry["op"] == "lock":
+                    session.files_locked.update(files)
+                elif entry["op"] == "unlock":
+                    if files is None:
+                        session.files_locked.clear()
+                    else:
+                        session.files_locked -= set(files)
+                elif entry["op"] == "modified":
+                    session.files_modified.update(files)
@@ -6,15 +6,28 @@ Features:
 - Worker health monitoring
 - Task assignment and tracking
 - Worker pool management
+
+Scheduling is work-stealing: every worker owns a deque of pending tasks.
+A task goes to the worker expected to finish it first (its running and
+queued cost plus the task's cost, divided by the worker's capacity), so a
+large task may wait for a fast worker rather than start on an idle slow one.
+A worker that goes idle drains its own deque, then the unassigned backlog,
+then steals from the busiest other worker a task it would finish sooner than
+that worker could. Idle workers retry stealing whenever work is queued or a
+task finishes. Costs are estimated minutes throughout.
 """
 
 import threading
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Deque, Dict, List, Optional
 import uuid
 
+from core.routing.complexity_estimator import ComplexityEstimator
+
 
 class WorkerStatus(str, Enum):
     """Worker status."""
@@ -46,21 +59,48 @@ class WorkerCoordinator:
     # Worker heartbeat timeout (seconds)
     HEARTBEAT_TIMEOUT = 30
 
-    def __init__(self, session_manager=None, max_workers: int = 3):
+    # Estimated minutes for a task with no estimate and no description to estimate from
+    DEFAULT_TASK_COST = 60.0
+
+    # Minutes for complexity scores 0 and 100 (TaskDecomposer's simple/complex durations)
+    COMPLEXITY_MINUTES = (60.0, 120.0)
+
+    def __init__(
+        self,
+        session_manager=None,
+        max_workers: int = 3,
+        cost_estimator: Optional[ComplexityEstimator] = None,
+    ):
         """
         Initialize worker coordinator.
 
         Args:
             session_manager: SessionManager instance (optional)
             max_workers: Maximum number of concurrent workers
+            cost_estimator: Estimates task cost from its description and files
         """
         self.session_manager = session_manager
         self.max_workers = max_workers
+        self.cost_estimator = cost_estimator or ComplexityEstimator()
         self.workers: Dict[str, Worker] = {}
-        self.task_queue: List[Dict[str, any]] = []
         self.task_assignments: Dict[str, str] = {}  # task_id -> worker_id
+        self.steals = 0
+        self._seq = 0
+        self._local_queues: Dict[str, Deque[Dict[str, any]]] = {}  # worker_id -> pending tasks
+        self._queued_cost: Dict[str, float] = {}  # worker_id -> cost of its pending tasks
+        self._running: Dict[str, Dict[str, any]] = {}  # worker_id -> running task entry
+        self._unassigned: Deque[Dict[str, any]] = deque()  # tasks with no live worker
         self._lock = threading.Lock()  # serializes all mutable-state access
 
+    @property
+    def task_queue(self) -> List[Dict[str, any]]:
+        """All tasks waiting for a worker (unassigned backlog, then per-worker deques)."""
+        with self._lock:
+            queued = list(self._unassigned)
+            for local in self._local_queues.values():
+                queued.extend(local)
+            return queued
+
     def register_worker(self, metadata: Optional[Dict[str, any]] = None) -> Worker:
         """
         Register a new worker.
@@ -80,6 +120,10 @@ class WorkerCoordinator:
 
         with self._lock:
             self.workers[worker.worker_id] = worker
+            self._local_queues[worker.worker_id] = deque()
+            self._queued_cost[worker.worker_id] = 0.0
+            # A new worker takes backlog or steals straight away
+            self._dispatch_locked(worker)
         return worker
 
     def unregister_worker(self, worker_id: str):
@@ -97,6 +141,7 @@ class WorkerCoordinator:
                     self._requeue_task_locked(worker.current_task)
 
                 del self.workers[worker_id]
+                self._redistribute_locked(worker_id)
 
     def get_worker(self, worker_id: str) -> Optional[Worker]:
         """Get worker by ID."""
@@ -134,32 +179,46 @@ class WorkerCoordinator:
             session_id: Session ID
 
         Returns:
-            Worker ID if assigned, None if no workers available
+            Worker ID if the task started immediately, None if it was queued
         """
+        entry = {
+            "task_id": task_id,
+            "task_data": task_data,
+            "session_id": session_id,
+            "cost": self.estimate_cost(task_data),
+        }
         with self._lock:
-            # Find idle worker
-            idle_workers = [w for w in self.workers.values() if w.status == WorkerStatus.IDLE]
-
-            if not idle_workers:
-                # Queue task for later
-                self.task_queue.append(
-                    {
-                        "task_id": task_id,
-                        "task_data": task_data,
-                        "session_id": session_id,
-                    }
-                )
-                return None
-
-            # Assign to first idle worker
-            worker = idle_workers[0]
-            worker.status = WorkerStatus.BUSY
-            worker.current_task = task_id
-            worker.session_id = session_id
-
-            self.task_assignments[task_id] = worker.worker_id
-
-            return worker.worker_id
+            self._seq += 1
+            entry["seq"] = self._seq
+            return self._place_locked(entry)
+
+    def estimate_cost(self, task_data: Dict[str, any]) -> float:
+        """
+        Estimate how many minutes a task takes on a capacity-1.0 worker.
+
+        Uses an explicit ``estimated_cost`` or ``estimated_minutes`` (both in
+        minutes) from the task data when present, otherwise maps the
+        complexity score of its description and files onto COMPLEXITY_MINUTES.
+
+        Args:
+            task_data: Task data
+
+        Returns:
+            Positive cost estimate in minutes
+        """
+        for key in ("estimated_cost", "estimated_minutes"):
+            value = task_data.get(key)
+            if isinstance(value, (int, float)) and value > 0:
+                return float(value)
+
+        description = task_data.get("description") or task_data.get("name")
+        if not description:
+            return self.DEFAULT_TASK_COST
+
+        files = [Path(f) for f in task_data.get("files", [])]
+        complexity = self.cost_estimator.estimate(description, files=files)
+        low, high = self.COMPLEXITY_MINUTES
+        return low + (high - low) * min(max(complexity.score, 0.0), 100.0) / 100.0
 
     def complete_task(
         self,
@@ -188,13 +247,15 @@ class WorkerCoordinator:
             worker.status = WorkerStatus.IDLE
             worker.current_task = None
             worker.session_id = None
+            self._running.pop(worker_id, None)
 
             # Remove from assignments
             if task_id in self.task_assignments:
                 del self.task_assignments[task_id]
 
-            # Assign next queued task (already holding lock)
+            # Take the next task: own deque, backlog, then steal (already holding lock)
             self._assign_next_queued_task_locked(worker_id)
+            self._dispatch_idle_locked()
 
     def heartbeat(self, worker_id: str):
         """
@@ -209,6 +270,7 @@ class WorkerCoordinator:
                 worker.last_heartbeat = datetime.now()
                 if worker.status == WorkerStatus.OFFLINE:
                     worker.status = WorkerStatus.IDLE
+                    self._dispatch_locked(worker)
 
     def check_worker_health(self):
         """Check worker health and mark offline workers."""
@@ -226,6 +288,7 @@ class WorkerCoordinator:
                         if worker.current_task:
                             self._requeue_task_locked(worker.current_task)
                             worker.current_task = None
+                        self._redistribute_locked(worker.worker_id)
 
     def get_load_distribution(self) -> Dict[str, any]:
         """
@@ -241,7 +304,11 @@ class WorkerCoordinator:
             offline_workers = sum(1 for w in self.workers.values() if w.status == WorkerStatus.OFFLINE)
             total_completed = sum(w.tasks_completed for w in self.workers.values())
             total_failed = sum(w.tasks_failed for w in self.workers.values())
-            queued = len(self.task_queue)
+            queued = len(self._unassigned) + sum(len(q) for q in self._local_queues.values())
+            queued_cost = sum(e["cost"] for e in self._unassigned) + sum(
+                self._queued_cost.values()
+            )
+            steals = self.steals
 
         return {
             "total_workers": total_workers,
@@ -249,6 +316,8 @@ class WorkerCoordinator:
             "busy_workers": busy_workers,
             "offline_workers": offline_workers,
             "queued_tasks": queued,
+            "queued_cost": queued_cost,
+            "steals": steals,
             "total_completed": total_completed,
             "total_failed": total_failed,
             "utilization": (busy_workers / total_workers * 100) if total_workers > 0 else 0,
@@ -282,18 +351,9 @@ class WorkerCoordinator:
 
     def _assign_next_queued_task_locked(self, worker_id: str):
         """Assign next queued task to worker. Caller must hold self._lock."""
-        if not self.task_queue:
-            return
-
         worker = self.workers.get(worker_id)
-        if not worker or worker.status != WorkerStatus.IDLE:
-            return
-
-        task = self.task_queue.pop(0)
-        worker.status = WorkerStatus.BUSY
-        worker.current_task = task["task_id"]
-        worker.current_session = task.get("session_id")
-        self.task_assignments[task["task_id"]] = worker.worker_id
+        if worker:
+            self._dispatch_locked(worker)
 
     def _assign_next_queued_task(self, worker_id: str):
         """Assign next queued task to worker (acquires lock)."""
@@ -302,12 +362,134 @@ class WorkerCoordinator:
 
     def _requeue_task_locked(self, task_id: str):
         """Requeue a task. Caller must hold self._lock."""
-        if task_id not in self.task_assignments:
+        worker_id = self.task_assignments.pop(task_id, None)
+        if worker_id is None:
+            return
+        entry = self._running.pop(worker_id, None)
+        if entry is None or entry["task_id"] != task_id:
+            self._seq += 1
+            entry = {
+                "task_id": task_id,
+                "task_data": {},
+                "session_id": None,
+                "cost": self.DEFAULT_TASK_COST,
+                "seq": self._seq,
+            }
+        self._place_locked(entry, exclude=worker_id)
+
+    def _capacity(self, worker: Worker) -> float:
+        """Relative speed of a worker (``metadata["capacity"]``, default 1.0)."""
+        capacity = worker.metadata.get("capacity", 1.0)
+        return capacity if isinstance(capacity, (int, float)) and capacity > 0 else 1.0
+
+    def _backlog(self, worker_id: str) -> float:
+        """Cost a worker must get through before starting newly queued work."""
+        running = self._running.get(worker_id)
+        return self._queued_cost[worker_id] + (running["cost"] if running else 0.0)
+
+    def _start_locked(self, worker: Worker, entry: Dict[str, any]):
+        """Run a task on an idle worker. Caller must hold self._lock."""
+        worker.status = WorkerStatus.BUSY
+        worker.current_task = entry["task_id"]
+        worker.session_id = entry.get("session_id")
+        worker.current_session = entry.get("session_id")
+        self._running[worker.worker_id] = entry
+        self.task_assignments[entry["task_id"]] = worker.worker_id
+
+    def _place_locked(self, entry: Dict[str, any], exclude: Optional[str] = None) -> Optional[str]:
+        """
+        Send a task to the worker expected to finish it first: start it if
+        that worker is idle, otherwise queue it there. Caller must hold self._lock.
+
+        Returns:
+            Worker ID if the task started, None if it was queued
+        """
+        live = [
+            w
+            for w in self.workers.values()
+            if w.status in (WorkerStatus.IDLE, WorkerStatus.BUSY) and w.worker_id != exclude
+        ]
+        if not live:
+            self._unassigned.append(entry)
+            return None
+
+        target = min(
+            live,
+            key=lambda w: (self._backlog(w.worker_id) + entry["cost"]) / self._capacity(w),
+        )
+        if target.status == WorkerStatus.IDLE:
+            self._start_locked(target, entry)
+            return target.worker_id
+
+        self._local_queues[target.worker_id].append(entry)
+        self._queued_cost[target.worker_id] += entry["cost"]
+        self._dispatch_idle_locked()
+        return None
+
+    def _dispatch_locked(self, worker: Worker):
+        """Give an idle worker its next task. Caller must hold self._lock."""
+        if worker.status != WorkerStatus.IDLE:
             return
-        del self.task_assignments[task_id]
-        self.task_queue.append(
-            {"task_id": task_id, "task_data": {}, "session_id": None}
+
+        local = self._local_queues[worker.worker_id]
+        if local:
+            entry = local.popleft()
+            self._queued_cost[worker.worker_id] -= entry["cost"]
+        elif self._unassigned:
+            entry = self._unassigned.popleft()
+        else:
+            entry = self._steal_locked(worker)
+            if entry is None:
+                return
+
+        self._start_locked(worker, entry)
+
+    def _dispatch_idle_locked(self):
+        """Let every idle worker take or steal work. Caller must hold self._lock."""
+        for worker in list(self.workers.values()):
+            if worker.status == WorkerStatus.IDLE:
+                self._dispatch_locked(worker)
+
+    def _steal_locked(self, thief: Worker) -> Optional[Dict[str, any]]:
+        """
+        Take a task the thief would finish before its owner could, trying
+        victims busiest-first (longest expected time to drain) and, within a
+        victim's deque, the longest-waiting task first. Caller must hold
+        self._lock.
+        """
+        victims = sorted(
+            (wid for wid, local in self._local_queues.items() if local and wid != thief.worker_id),
+            key=lambda wid: self._backlog(wid) / self._capacity(self.workers[wid]),
+            reverse=True,
         )
+        thief_capacity = self._capacity(thief)
+        for victim_id in victims:
+            local = self._local_queues[victim_id]
+            capacity = self._capacity(self.workers[victim_id])
+            running = self._running.get(victim_id)
+            # Cost the victim gets through before finishing each queued task
+            ahead = running["cost"] if running else 0.0
+            for pos, entry in enumerate(local):
+                ahead += entry["cost"]
+                if entry["cost"] / thief_capacity < ahead / capacity:
+                    del local[pos]
+                    self._queued_cost[victim_id] -= entry["cost"]
+                    self.steals += 1
+                    return entry
+        return None
+
+    def _redistribute_locked(self, worker_id: str):
+        """Re-place a removed or offline worker's pending tasks. Caller must hold self._lock."""
+        pending = list(self._local_queues.get(worker_id, ()))
+        if worker_id in self.workers:
+            self._local_queues[worker_id].clear()
+            self._queued_cost[worker_id] = 0.0
+        else:
+            self._local_queues.pop(worker_id, None)
+            self._queued_cost.pop(worker_id, None)
+
+        for entry in pending:
+            self._place_locked(entry, exclude=worker_id)
 
     def _requeue_task(self, task_id: str):
         """Requeue a task that was assigned to a failed worker (acquires lock)."""
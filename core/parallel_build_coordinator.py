@@ -3,10 +3,11 @@
 Parallel Build Coordinator - Cross-instance coordination for BUILD specs
 
 Enables multiple Claude instances to work on different phases of a BUILD spec
-simultaneously. Uses file-based locking for cross-process coordination.
+simultaneously. Coordination state lives in a SQLite WAL database
+(see core/parallel_state_store.py) shared by all instances.
 
 Key features:
-- Atomic file locking via fcntl.flock()
+- Row-level state updates; phase claims are atomic compare-and-set
 - Phase dependency parsing from BUILD specs
 - File conflict detection between phases
 - Instance heartbeat monitoring (5-min timeout)
@@ -22,16 +23,17 @@ Usage:
         coord.mark_completed(instance_id)
 """
 
-import fcntl
-import json
-import os
+import copy
 import re
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
+
+from core.build_spec_cache import get_build_spec_cache
+from core.parallel_state_store import ParallelStateStore
 
 
 class InstanceStatus(str, Enum):
@@ -100,6 +102,7 @@ class PhaseAnalysis:
     parallel_safe: List[List[str]] = field(default_factory=list)
     max_parallel: int = 1
     file_conflicts: Dict[str, List[str]] = field(default_factory=dict)
+    phase_files: Dict[str, List[str]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -109,6 +112,7 @@ class PhaseAnalysis:
             "parallel_safe": self.parallel_safe,
             "max_parallel": self.max_parallel,
             "file_conflicts": self.file_conflicts,
+            "phase_files": self.phase_files,
         }
 
     @classmethod
@@ -120,22 +124,124 @@ class PhaseAnalysis:
             parallel_safe=data.get("parallel_safe", []),
             max_parallel=data.get("max_parallel", 1),
             file_conflicts=data.get("file_conflicts", {}),
+            phase_files=data.get("phase_files", {}),
         )
 
 
+# BUILD spec patterns
+_PHASE_HEADER = re.compile(r"## Phase (\d+):")
+_DEPENDS_ON = re.compile(
+    r"\*\*(?:Depends on|Dependencies):\*\*\s*(?:Phase\s*)?([^\n]+)", re.IGNORECASE
+)
+_COMPONENT = re.compile(r"\*\*Component:\*\*\s*`([^`]+)`")
+_TABLE_FILE = re.compile(r"\|\s*FEAT-[A-Z]+-\d+[^|]*\|[^|]*\|\s*`([^`]+)`")
+_FILES_LIST = re.compile(r"\*\*(?:Files|Target file):\*\*\s*\n((?:\s*-\s*`[^`]+`\n?)+)")
+
+
+def _section_files(section: str) -> List[str]:
+    """File paths named in one phase section (traversal and absolute paths dropped)."""
+    files: Set[str] = set(_COMPONENT.findall(section))
+    files.update(_TABLE_FILE.findall(section))
+    files_match = _FILES_LIST.search(section)
+    if files_match:
+        files.update(re.findall(r"`([^`]+)`", files_match.group(1)))
+    return sorted(f for f in files if ".." not in f and not f.startswith("/"))
+
+
+def analyze_build_spec(content: str) -> PhaseAnalysis:
+    """
+    Parse a BUILD spec into a PhaseAnalysis in one pass over its phase sections.
+
+    Collects per-phase dependencies and files, parallel-safe groups, and
+    pairwise file conflicts (via a file -> phases index).
+    """
+    headers = list(_PHASE_HEADER.finditer(content))
+    dependencies: Dict[str, List[str]] = {}
+    phase_files: Dict[str, List[str]] = {}
+
+    for index, header in enumerate(headers):
+        phase = header.group(1)
+        end = headers[index + 1].start() if index + 1 < len(headers) else len(content)
+        section = content[header.end() : end]
+
+        # Dependencies are read below the header line; a later duplicate header wins
+        newline = section.find("\n")
+        if newline != -1:
+            dep_match = _DEPENDS_ON.search(section, newline + 1)
+            if dep_match:
+                dependencies[phase] = re.findall(r"(\d+)", dep_match.group(1))
+
+        # Files come from the first section for a phase number
+        phase_files.setdefault(phase, _section_files(section))
+
+    phases = sorted(phase_files)
+
+    # Determine parallel-safe groups (phases with no interdependencies)
+    parallel_safe: List[List[str]] = []
+    remaining = set(phases)
+    completed: Set[str] = set()
+
+    while remaining:
+        # Find phases whose deps are all completed
+        ready = [
+            phase
+            for phase in sorted(remaining)
+            if all(d in completed for d in dependencies.get(phase, []))
+        ]
+
+        if not ready:
+            # Circular dependency or error - just take first remaining
+            ready = [sorted(remaining)[0]]
+
+        parallel_safe.append(ready)
+        completed.update(ready)
+        remaining -= set(ready)
+
+    # Max parallel is size of largest group
+    max_parallel = max(len(group) for group in parallel_safe) if parallel_safe else 1
+
+    # Pairwise conflicts from the inverted file -> phases index
+    order = {phase: index for index, phase in enumerate(phases)}
+    file_phases: Dict[str, List[str]] = {}
+    for phase in phases:
+        for path in phase_files[phase]:
+            file_phases.setdefault(path, []).append(phase)
+    pair_files: Dict[tuple, List[str]] = {}
+    for path, owners in file_phases.items():
+        for i, p1 in enumerate(owners):
+            for p2 in owners[i + 1 :]:
+                pair_files.setdefault((p1, p2), []).append(path)
+    file_conflicts = {
+        f"{p1}->{p2}": sorted(files)
+        for (p1, p2), files in sorted(
+            pair_files.items(), key=lambda item: (order[item[0][0]], order[item[0][1]])
+        )
+    }
+
+    return PhaseAnalysis(
+        phases=phases,
+        dependencies=dependencies,
+        parallel_safe=parallel_safe,
+        max_parallel=max_parallel,
+        file_conflicts=file_conflicts,
+        phase_files=phase_files,
+    )
+
+
 class ParallelBuildCoordinator:
     """
     Coordinates multiple Claude instances working on same BUILD spec.
 
-    Uses file-based locking to ensure atomic state updates across processes.
+    Shares state with other instances through a SQLite WAL store, so heartbeats
+    and claims are row-level updates rather than whole-file rewrites.
     First instance to register becomes the coordinator.
     """
 
     # Heartbeat timeout in seconds (5 minutes)
     HEARTBEAT_TIMEOUT = 300
 
-    # State file version
-    STATE_VERSION = "1.0"
+    # State version (v1 = JSON state file, v2 = SQLite store)
+    STATE_VERSION = ParallelStateStore.STATE_VERSION
 
     def __init__(
         self,
@@ -147,124 +253,34 @@ class ParallelBuildCoordinator:
 
         Args:
             build_spec_path: Path to BUILD_*.md spec file
-            state_file: Optional path to state file (default: .buildrunner/parallel_state.json)
+            state_file: Optional path to the state database
+                (default: .buildrunner/parallel_state.db). A ``.json`` path names
+                a legacy state file; the database is created next to it.
+
+        A legacy parallel_state.json beside the database is imported the first
+        time the database is created.
         """
         self.build_spec_path = Path(build_spec_path)
-        self.state_file = state_file or Path(".buildrunner/parallel_state.json")
-
-        # Ensure state file directory exists
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        state_file = Path(state_file or ".buildrunner/parallel_state.db")
+        if state_file.suffix == ".json":
+            self.legacy_state_file = state_file
+            state_file = state_file.with_suffix(".db")
+        else:
+            self.legacy_state_file = state_file.with_suffix(".json")
+        self.state_file = state_file
+        self.store = ParallelStateStore(
+            self.state_file,
+            build_spec=str(self.build_spec_path),
+            legacy_state_file=self.legacy_state_file,
+        )
 
     # =========================================================================
     # FEAT-PARA-001: Instance Lifecycle & Atomic State Management
     # =========================================================================
 
-    def _get_default_state(self) -> Dict:
-        """Return default state structure."""
-        return {
-            "version": self.STATE_VERSION,
-            "build_spec": str(self.build_spec_path),
-            "started_at": datetime.now().isoformat(),
-            "coordinator_id": None,
-            "instances": {},
-            "phase_analysis": PhaseAnalysis().to_dict(),
-            "completed_phases": [],
-            "sync_points": [],
-        }
-
-    def _atomic_update(self, update_fn: Callable[[Dict], Dict]) -> Dict:
-        """
-        Perform atomic read-modify-write on state file.
-
-        Uses fcntl.flock() for cross-process locking.
-
-        Args:
-            update_fn: Function that takes current state and returns modified state
-
-        Returns:
-            Updated state dictionary
-        """
-        # Handle file creation with race condition protection
-        try:
-            with open(self.state_file, "x") as f:
-                # We created it, initialize with lock
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                try:
-                    json.dump(self._get_default_state(), f, indent=2)
-                    f.flush()
-                    os.fsync(f.fileno())
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-        except FileExistsError:
-            pass  # Another process created it, that's fine
-
-        # Open for read+write
-        with open(self.state_file, "r+") as f:
-            # Acquire exclusive lock (blocking)
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            try:
-                # Read current state with error handling
-                f.seek(0)
-                content = f.read()
-                if not content.strip():
-                    state = self._get_default_state()
-                else:
-                    try:
-                        state = json.loads(content)
-                    except json.JSONDecodeError:
-                        # Corrupted file, reinitialize
-                        state = self._get_default_state()
-
-                # Apply update function
-                state = update_fn(state)
-
-                # Write updated state
-                f.seek(0)
-                f.truncate()
-                json.dump(state, f, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
-
-                return state
-            finally:
-                # Always release lock
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-
-    def _initialize_state(self) -> None:
-        """Initialize empty state file."""
-        with open(self.state_file, "w") as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            try:
-                json.dump(self._get_default_state(), f, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
-            except Exception:
-                # On failure, remove the partial file
-                try:
-                    self.state_file.unlink()
-                except OSError:
-                    pass
-                raise
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-
     def _load_state(self) -> Dict:
-        """Load state from file with locking."""
-        if not self.state_file.exists():
-            self._initialize_state()
-
-        with open(self.state_file, "r") as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_SH)  # Shared lock for read
-            try:
-                content = f.read()
-                if not content.strip():
-                    return self._get_default_state()
-                try:
-                    return json.loads(content)
-                except json.JSONDecodeError:
-                    return self._get_default_state()
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        """Snapshot of the whole coordination state (v1 JSON layout)."""
+        return self.store.to_state()
 
     def register_instance(self) -> str:
         """
@@ -276,24 +292,7 @@ class ParallelBuildCoordinator:
             Instance UUID
         """
         instance_id = str(uuid.uuid4())
-        now = datetime.now()
-
-        def update(state: Dict) -> Dict:
-            instance = Instance(
-                id=instance_id,
-                status=InstanceStatus.RUNNING,
-                started_at=now,
-                last_heartbeat=now,
-            )
-            state["instances"][instance_id] = instance.to_dict()
-
-            # First instance becomes coordinator
-            if state["coordinator_id"] is None:
-                state["coordinator_id"] = instance_id
-
-            return state
-
-        self._atomic_update(update)
+        self.store.register_instance(instance_id, datetime.now())
         return instance_id
 
     def update_heartbeat(self, instance_id: str) -> bool:
@@ -306,15 +305,7 @@ class ParallelBuildCoordinator:
         Returns:
             True if updated, False if instance not found
         """
-        now = datetime.now().isoformat()
-
-        def update(state: Dict) -> Dict:
-            if instance_id in state["instances"]:
-                state["instances"][instance_id]["last_heartbeat"] = now
-            return state
-
-        state = self._atomic_update(update)
-        return instance_id in state["instances"]
+        return self.store.heartbeat(instance_id, datetime.now())
 
     def update_progress(self, instance_id: str, progress: float) -> bool:
         """
@@ -333,14 +324,7 @@ class ParallelBuildCoordinator:
         if not 0.0 <= progress <= 1.0:
             raise ValueError(f"Progress must be between 0.0 and 1.0, got {progress}")
 
-        def update(state: Dict) -> Dict:
-            if instance_id in state["instances"]:
-                state["instances"][instance_id]["progress"] = progress
-                state["instances"][instance_id]["last_heartbeat"] = datetime.now().isoformat()
-            return state
-
-        state = self._atomic_update(update)
-        return instance_id in state["instances"]
+        return self.store.update_progress(instance_id, progress, datetime.now())
 
     def mark_completed(self, instance_id: str) -> bool:
         """
@@ -354,27 +338,7 @@ class ParallelBuildCoordinator:
         Returns:
             True if marked, False if instance not found
         """
-
-        def update(state: Dict) -> Dict:
-            if instance_id not in state["instances"]:
-                return state
-
-            instance = state["instances"][instance_id]
-            instance["status"] = InstanceStatus.COMPLETED.value
-            instance["progress"] = 1.0
-
-            # Move phase to completed
-            phase = instance.get("phase")
-            if phase and phase not in state["completed_phases"]:
-                state["completed_phases"].append(phase)
-
-            # Clear locks
-            instance["files_locked"] = []
-
-            return state
-
-        state = self._atomic_update(update)
-        return instance_id in state["instances"]
+        return self.store.mark_completed(instance_id)
 
     def release_instance(self, instance_id: str) -> bool:
         """
@@ -386,46 +350,40 @@ class ParallelBuildCoordinator:
         Returns:
             True if released, False if not found
         """
-
-        def update(state: Dict) -> Dict:
-            if instance_id in state["instances"]:
-                del state["instances"][instance_id]
-
-                # If this was coordinator, pick new one
-                if state["coordinator_id"] == instance_id:
-                    running = [
-                        iid
-                        for iid, inst in state["instances"].items()
-                        if inst["status"] == InstanceStatus.RUNNING.value
-                    ]
-                    state["coordinator_id"] = running[0] if running else None
-
-            return state
-
-        state = self._atomic_update(update)
+        self.store.remove_instance(instance_id)
         return True
 
     def get_instance(self, instance_id: str) -> Optional[Instance]:
         """Get instance by ID."""
-        state = self._load_state()
-        if instance_id in state["instances"]:
-            return Instance.from_dict(state["instances"][instance_id])
-        return None
+        data = self.store.get_instance(instance_id)
+        return Instance.from_dict(data) if data else None
 
     def get_all_instances(self) -> List[Instance]:
         """Get all registered instances."""
-        state = self._load_state()
-        return [Instance.from_dict(data) for data in state["instances"].values()]
+        return [Instance.from_dict(data) for data in self.store.get_instances()]
 
     def is_coordinator(self, instance_id: str) -> bool:
         """Check if instance is the coordinator."""
-        state = self._load_state()
-        return state["coordinator_id"] == instance_id
+        return self.store.coordinator_id() == instance_id
 
     # =========================================================================
     # FEAT-PARA-002: Phase Dependency Parser
     # =========================================================================
 
+    def _analysis(self) -> PhaseAnalysis:
+        """
+        Shared, cached PhaseAnalysis for the current version of the BUILD spec.
+
+        The spec is parsed once per (path, mtime, size); later calls cost one
+        stat(). The returned object is shared — do not mutate it.
+        """
+        try:
+            return get_build_spec_cache().get(
+                self.build_spec_path, "phase_analysis", analyze_build_spec
+            )
+        except FileNotFoundError:
+            return PhaseAnalysis()
+
     def parse_phase_dependencies(self) -> Dict[str, List[str]]:
         """
         Parse BUILD spec for phase dependencies.
@@ -437,30 +395,7 @@ class ParallelBuildCoordinator:
         Returns:
             Dict mapping phase -> list of dependency phases
         """
-        if not self.build_spec_path.exists():
-            return {}
-
-        content = self.build_spec_path.read_text()
-        dependencies: Dict[str, List[str]] = {}
-
-        # Pattern: ## Phase N: Name ... **Depends on:** Phase M
-        # Capture phase number and any dependencies
-        phase_pattern = r"## Phase (\d+):([^\n]*)\n(.*?)(?=## Phase \d+:|$)"
-        dep_pattern = r"\*\*(?:Depends on|Dependencies):\*\*\s*(?:Phase\s*)?([^\n]+)"
-
-        for match in re.finditer(phase_pattern, content, re.DOTALL):
-            phase_num = match.group(1)
-            phase_content = match.group(3)
-
-            # Find dependencies in phase content
-            dep_match = re.search(dep_pattern, phase_content, re.IGNORECASE)
-            if dep_match:
-                dep_text = dep_match.group(1)
-                # Extract phase numbers from text like "Phase 1" or "1, 2"
-                dep_nums = re.findall(r"(\d+)", dep_text)
-                dependencies[phase_num] = dep_nums
-
-        return dependencies
+        return {phase: list(deps) for phase, deps in self._analysis().dependencies.items()}
 
     def build_dependency_graph(self) -> PhaseAnalysis:
         """
@@ -469,52 +404,7 @@ class ParallelBuildCoordinator:
         Returns:
             PhaseAnalysis with phases, dependencies, parallel groups
         """
-        if not self.build_spec_path.exists():
-            return PhaseAnalysis()
-
-        content = self.build_spec_path.read_text()
-
-        # Extract all phases
-        phase_pattern = r"## Phase (\d+):"
-        phases = sorted(set(re.findall(phase_pattern, content)))
-
-        # Get dependencies
-        dependencies = self.parse_phase_dependencies()
-
-        # Determine parallel-safe groups (phases with no interdependencies)
-        parallel_safe: List[List[str]] = []
-        remaining = set(phases)
-        completed: Set[str] = set()
-
-        while remaining:
-            # Find phases whose deps are all completed
-            ready = []
-            for phase in remaining:
-                deps = dependencies.get(phase, [])
-                if all(d in completed for d in deps):
-                    ready.append(phase)
-
-            if not ready:
-                # Circular dependency or error - just take first remaining
-                ready = [sorted(remaining)[0]]
-
-            parallel_safe.append(ready)
-            completed.update(ready)
-            remaining -= set(ready)
-
-        # Max parallel is size of largest group
-        max_parallel = max(len(group) for group in parallel_safe) if parallel_safe else 1
-
-        # Get file conflicts
-        file_conflicts = self.detect_file_conflicts()
-
-        return PhaseAnalysis(
-            phases=phases,
-            dependencies=dependencies,
-            parallel_safe=parallel_safe,
-            max_parallel=max_parallel,
-            file_conflicts=file_conflicts,
-        )
+        return PhaseAnalysis.from_dict(copy.deepcopy(self._analysis().to_dict()))
 
     # =========================================================================
     # FEAT-PARA-003: File Conflict Analyzer
@@ -535,44 +425,7 @@ class ParallelBuildCoordinator:
         Returns:
             List of file paths
         """
-        if not self.build_spec_path.exists():
-            return []
-
-        content = self.build_spec_path.read_text()
-
-        # Find phase content
-        phase_pattern = rf"## Phase {phase}:(.*?)(?=## Phase \d+:|$)"
-        phase_match = re.search(phase_pattern, content, re.DOTALL)
-        if not phase_match:
-            return []
-
-        phase_content = phase_match.group(1)
-        files: Set[str] = set()
-
-        # Pattern 1: **Component:** `path/file.py`
-        component_pattern = r"\*\*Component:\*\*\s*`([^`]+)`"
-        files.update(re.findall(component_pattern, phase_content))
-
-        # Pattern 2: Table format | FEAT-XXX | ... | `path/file.py` |
-        table_pattern = r"\|\s*FEAT-[A-Z]+-\d+[^|]*\|[^|]*\|\s*`([^`]+)`"
-        files.update(re.findall(table_pattern, phase_content))
-
-        # Pattern 3: **Files:** or **Target file:**
-        files_pattern = r"\*\*(?:Files|Target file):\*\*\s*\n((?:\s*-\s*`[^`]+`\n?)+)"
-        files_match = re.search(files_pattern, phase_content)
-        if files_match:
-            file_list = re.findall(r"`([^`]+)`", files_match.group(1))
-            files.update(file_list)
-
-        # Validate paths - reject path traversal attempts
-        validated_files = []
-        for f in files:
-            # Normalize and check for traversal
-            if ".." in f or f.startswith("/"):
-                continue  # Skip absolute paths and traversal attempts
-            validated_files.append(f)
-
-        return validated_files
+        return list(self._analysis().phase_files.get(phase, []))
 
     def detect_file_conflicts(self) -> Dict[str, List[str]]:
         """
@@ -581,29 +434,7 @@ class ParallelBuildCoordinator:
         Returns:
             Dict mapping "phase1->phase2" to list of conflicting files
         """
-        if not self.build_spec_path.exists():
-            return {}
-
-        content = self.build_spec_path.read_text()
-
-        # Get all phases
-        phase_pattern = r"## Phase (\d+):"
-        phases = sorted(set(re.findall(phase_pattern, content)))
-
-        # Extract files per phase
-        phase_files: Dict[str, Set[str]] = {}
-        for phase in phases:
-            phase_files[phase] = set(self.extract_phase_files(phase))
-
-        # Find conflicts between phases
-        conflicts: Dict[str, List[str]] = {}
-        for i, p1 in enumerate(phases):
-            for p2 in phases[i + 1 :]:
-                overlap = phase_files[p1] & phase_files[p2]
-                if overlap:
-                    conflicts[f"{p1}->{p2}"] = list(overlap)
-
-        return conflicts
+        return {pair: list(files) for pair, files in self._analysis().file_conflicts.items()}
 
     # =========================================================================
     # FEAT-PARA-004: Phase Claiming
@@ -613,10 +444,10 @@ class ParallelBuildCoordinator:
         """
         Attempt to claim a phase for an instance.
 
-        Checks:
+        Checks (atomically, as one compare-and-set):
         1. Phase dependencies satisfied (prereqs completed)
         2. No file conflicts with running instances
-        3. Phase not already claimed
+        3. Phase not already claimed or completed
 
         Args:
             instance_id: Instance UUID
@@ -625,59 +456,19 @@ class ParallelBuildCoordinator:
         Returns:
             True if claimed successfully, False otherwise
         """
-        # Get phase analysis
-        analysis = self.build_dependency_graph()
+        analysis = self._analysis()
 
         # Validate phase exists
         if phase not in analysis.phases:
             return False
 
-        phase_files = self.extract_phase_files(phase)
-
-        def update(state: Dict) -> Dict:
-            if instance_id not in state["instances"]:
-                return state
-
-            # Check 1: Phase dependencies satisfied
-            deps = analysis.dependencies.get(phase, [])
-            for dep in deps:
-                if dep not in state["completed_phases"]:
-                    return state  # Dependency not met
-
-            # Check 2: Phase not already claimed by another running instance
-            for iid, inst in state["instances"].items():
-                if iid == instance_id:
-                    continue
-                if inst["status"] == InstanceStatus.RUNNING.value:
-                    if inst.get("phase") == phase:
-                        return state  # Already claimed
-
-            # Check 3: No file conflicts with running instances
-            for iid, inst in state["instances"].items():
-                if iid == instance_id:
-                    continue
-                if inst["status"] == InstanceStatus.RUNNING.value:
-                    locked = set(inst.get("files_locked", []))
-                    conflicts = locked & set(phase_files)
-                    if conflicts:
-                        return state  # File conflict
-
-            # All checks passed - claim the phase
-            instance = state["instances"][instance_id]
-            instance["phase"] = phase
-            instance["files_locked"] = phase_files
-            instance["last_heartbeat"] = datetime.now().isoformat()
-
-            return state
-
-        # Execute atomic update
-        state = self._atomic_update(update)
-
-        # Check if claim succeeded
-        if instance_id in state["instances"]:
-            return state["instances"][instance_id].get("phase") == phase
-
-        return False
+        # Dependency, claim and file-conflict checks run atomically in the store
+        return self.store.claim_phase(
+            instance_id,
+            phase,
+            dependencies=analysis.dependencies.get(phase, []),
+            files=analysis.phase_files.get(phase, []),
+        )
 
     def release_phase(self, instance_id: str) -> bool:
         """
@@ -689,15 +480,7 @@ class ParallelBuildCoordinator:
         Returns:
             True if released, False if not found
         """
-
-        def update(state: Dict) -> Dict:
-            if instance_id in state["instances"]:
-                instance = state["instances"][instance_id]
-                instance["phase"] = None
-                instance["files_locked"] = []
-            return state
-
-        self._atomic_update(update)
+        self.store.release_phase(instance_id)
         return True
 
     def get_available_phases(self) -> List[str]:
@@ -711,30 +494,22 @@ class ParallelBuildCoordinator:
         Returns:
             List of available phase numbers
         """
-        state = self._load_state()
-        analysis = self.build_dependency_graph()
+        completed_phases = set(self.store.get_completed_phases())
+        claimed = self.store.get_claimed_phases()
+        analysis = self._analysis()
 
         available = []
         for phase in analysis.phases:
             # Check dependencies
             deps = analysis.dependencies.get(phase, [])
-            if not all(d in state["completed_phases"] for d in deps):
+            if not all(d in completed_phases for d in deps):
                 continue
 
-            # Check if already claimed
-            claimed = False
-            for inst in state["instances"].values():
-                if inst["status"] == InstanceStatus.RUNNING.value:
-                    if inst.get("phase") == phase:
-                        claimed = True
-                        break
-
-            # Check if already completed
-            if phase in state["completed_phases"]:
+            # Check if already completed or claimed
+            if phase in completed_phases or phase in claimed:
                 continue
 
-            if not claimed:
-                available.append(phase)
+            available.append(phase)
 
         return available
 
@@ -745,16 +520,7 @@ class ParallelBuildCoordinator:
         Returns:
             Dict mapping phase -> instance_id
         """
-        state = self._load_state()
-        claimed = {}
-
-        for iid, inst in state["instances"].items():
-            if inst["status"] == InstanceStatus.RUNNING.value:
-                phase = inst.get("phase")
-                if phase:
-                    claimed[phase] = iid
-
-        return claimed
+        return self.store.get_claimed_phases()
 
     # =========================================================================
     # FEAT-PARA-005: Heartbeat & Stale Detection
@@ -767,19 +533,8 @@ class ParallelBuildCoordinator:
         Returns:
             List of stale instance IDs
         """
-        state = self._load_state()
         cutoff = datetime.now() - timedelta(seconds=self.HEARTBEAT_TIMEOUT)
-        stale = []
-
-        for iid, inst in state["instances"].items():
-            if inst["status"] != InstanceStatus.RUNNING.value:
-                continue
-
-            last_heartbeat = datetime.fromisoformat(inst["last_heartbeat"])
-            if last_heartbeat < cutoff:
-                stale.append(iid)
-
-        return stale
+        return self.store.get_stale_instance_ids(cutoff)
 
     def cleanup_stale_instances(self) -> List[str]:
         """
@@ -792,27 +547,9 @@ class ParallelBuildCoordinator:
         if not stale:
             return []
 
-        def update(state: Dict) -> Dict:
-            for iid in stale:
-                if iid in state["instances"]:
-                    instance = state["instances"][iid]
-                    instance["status"] = InstanceStatus.ABANDONED.value
-                    instance["phase"] = None
-                    instance["files_locked"] = []
-
-                    # If this was coordinator, pick new one
-                    if state["coordinator_id"] == iid:
-                        running = [
-                            i
-                            for i, inst in state["instances"].items()
-                            if inst["status"] == InstanceStatus.RUNNING.value
-                        ]
-                        state["coordinator_id"] = running[0] if running else None
-
-            return state
-
-        self._atomic_update(update)
-        return stale
+        # Heartbeats are re-checked in the same transaction that abandons the instance
+        cutoff = datetime.now() - timedelta(seconds=self.HEARTBEAT_TIMEOUT)
+        return self.store.abandon_instances(stale, cutoff)
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -822,7 +559,7 @@ class ParallelBuildCoordinator:
             Dict with status summary
         """
         state = self._load_state()
-        analysis = self.build_dependency_graph()
+        analysis = self._analysis()
 
         running = [
             i for i in state["instances"].values() if i["status"] == InstanceStatus.RUNNING.value
@@ -0,0 +1,501 @@
+# PRD Feature: FEAT-PARA-001
+"""
+Parallel State Store - SQLite coordination store for ParallelBuildCoordinator
+
+Replaces the whole-file JSON rewrite (fcntl lock + parse + indent=2 dump + fsync
+on every heartbeat) with row-level updates in a WAL-mode SQLite database:
+
+- instances:        one row per instance; heartbeats and progress are single-row UPDATEs
+- file_locks:       one row per (instance, file), indexed by path for conflict checks
+- completed_phases: one row per completed phase
+- meta:             build_spec, coordinator_id, started_at, phase_analysis, sync_points
+
+Phase claims are compare-and-set: the claim checks run and the instance row is
+updated inside one BEGIN IMMEDIATE transaction, and a partial unique index on
+running instances' phase guarantees no two running instances hold the same phase.
+
+An existing .buildrunner/parallel_state.json is imported once, when the database
+is first created.
+
+Usage:
+    store = ParallelStateStore(Path(".buildrunner/parallel_state.db"), "BUILD_3.5.md")
+    store.register_instance(instance_id, now)
+    store.heartbeat(instance_id, now)
+"""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+RUNNING = "running"
+COMPLETED = "completed"
+ABANDONED = "abandoned"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS instances (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    status TEXT NOT NULL,
+    phase TEXT,
+    tasks TEXT NOT NULL DEFAULT '[]',
+    started_at TEXT NOT NULL,
+    last_heartbeat TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0.0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_instances_running_phase
+    ON instances(phase) WHERE status = 'running' AND phase IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_instances_status_heartbeat
+    ON instances(status, last_heartbeat);
+CREATE TABLE IF NOT EXISTS file_locks (
+    instance_id TEXT NOT NULL REFERENCES instances(id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    PRIMARY KEY (instance_id, path)
+);
+CREATE INDEX IF NOT EXISTS idx_file_locks_path ON file_locks(path);
+CREATE TABLE IF NOT EXISTS completed_phases (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    phase TEXT NOT NULL UNIQUE
+);
+"""
+
+
+class ParallelStateStore:
+    """
+    Cross-process coordination state for one BUILD spec, backed by SQLite WAL.
+
+    All writes are short transactions; reads see a consistent snapshot. Safe to
+    share between threads of one process and between processes.
+    """
+
+    STATE_VERSION = "2.0"
+
+    # Milliseconds a writer waits for the database lock before failing
+    BUSY_TIMEOUT_MS = 30000
+
+    def __init__(
+        self,
+        db_path: Path,
+        build_spec: str,
+        legacy_state_file: Optional[Path] = None,
+    ):
+        """
+        Open (creating if needed) the coordination database.
+
+        Args:
+            db_path: SQLite database path
+            build_spec: BUILD spec path recorded on first creation
+            legacy_state_file: JSON state file imported when the database is new
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self.BUSY_TIMEOUT_MS / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA busy_timeout={self.BUSY_TIMEOUT_MS}")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+
+        # executescript() commits on its own, so the (idempotent) schema goes first
+        self._conn.executescript(_SCHEMA)
+        with self.transaction() as conn:
+            created = conn.execute("SELECT 1 FROM meta WHERE key = 'version'").fetchone() is None
+            if created:
+                self._set_meta(conn, "version", self.STATE_VERSION)
+                self._set_meta(conn, "build_spec", build_spec)
+                self._set_meta(conn, "started_at", datetime.now().isoformat())
+                self._set_meta(conn, "coordinator_id", None)
+                self._set_meta(conn, "phase_analysis", json.dumps({}))
+                self._set_meta(conn, "sync_points", json.dumps([]))
+                if legacy_state_file is not None and Path(legacy_state_file).exists():
+                    self._import_legacy(conn, Path(legacy_state_file))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def delete(self) -> List[Path]:
+        """Close the connection and remove the database files. Returns removed paths."""
+        self.close()
+        removed = []
+        for path in (
+            self.db_path,
+            self.db_path.with_name(self.db_path.name + "-wal"),
+            self.db_path.with_name(self.db_path.name + "-shm"),
+        ):
+            if path.exists():
+                path.unlink()
+                removed.append(path)
+        return removed
+
+    @staticmethod
+    def read_build_spec(db_path: Path) -> Optional[str]:
+        """Build spec recorded in an existing database, without creating one."""
+        if not Path(db_path).exists():
+            return None
+        try:
+            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+            try:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'build_spec'").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction (BEGIN IMMEDIATE: the write lock is taken up front)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            else:
+                self._conn.execute("COMMIT")
+
+    # =========================================================================
+    # Migration
+    # =========================================================================
+
+    def _import_legacy(self, conn: sqlite3.Connection, state_file: Path) -> None:
+        """Import instances, claims and completed phases from the v1 JSON state file."""
+        try:
+            state = json.loads(state_file.read_text())
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(state, dict):
+            return
+
+        for key in ("build_spec", "started_at", "coordinator_id"):
+            if state.get(key) is not None:
+                self._set_meta(conn, key, state[key])
+        self._set_meta(conn, "phase_analysis", json.dumps(state.get("phase_analysis", {})))
+        self._set_meta(conn, "sync_points", json.dumps(state.get("sync_points", [])))
+
+        for instance in state.get("instances", {}).values():
+            status = instance.get("status", RUNNING)
+            phase = instance.get("phase")
+            if status == RUNNING and phase is not None:
+                # A corrupt legacy file may hold duplicate claims; first one wins
+                taken = conn.execute(
+                    "SELECT 1 FROM instances WHERE status = ? AND phase = ?", (RUNNING, phase)
+                ).fetchone()
+                if taken:
+                    phase = None
+            conn.execute(
+                "INSERT OR IGNORE INTO instances"
+                " (id, status, phase, tasks, started_at, last_heartbeat, progress)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    instance["id"],
+                    status,
+                    phase,
+                    json.dumps(instance.get("tasks", [])),
+                    instance.get("started_at") or datetime.now().isoformat(),
+                    instance.get("last_heartbeat") or datetime.now().isoformat(),
+                    instance.get("progress", 0.0),
+                ),
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO file_locks (instance_id, path) VALUES (?, ?)",
+                [(instance["id"], path) for path in instance.get("files_locked", [])],
+            )
+
+        conn.executemany(
+            "INSERT OR IGNORE INTO completed_phases (phase) VALUES (?)",
+            [(phase,) for phase in state.get("completed_phases", [])],
+        )
+
+    # =========================================================================
+    # Meta
+    # =========================================================================
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: Optional[str]) -> None:
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?)"
+            " ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    @staticmethod
+    def _elect_coordinator(conn: sqlite3.Connection, leaving: str) -> None:
+        """If ``leaving`` was coordinator, hand over to the earliest running instance."""
+        current = conn.execute("SELECT value FROM meta WHERE key = 'coordinator_id'").fetchone()
+        if current is None or current["value"] != leaving:
+            return
+        successor = conn.execute(
+            "SELECT id FROM instances WHERE status = ? AND id != ? ORDER BY seq LIMIT 1",
+            (RUNNING, leaving),
+        ).fetchone()
+        ParallelStateStore._set_meta(
+            conn, "coordinator_id", successor["id"] if successor else None
+        )
+
+    # =========================================================================
+    # Instances
+    # =========================================================================
+
+    def register_instance(self, instance_id: str, now: datetime) -> None:
+        """Insert a running instance; the first one becomes coordinator."""
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO instances (id, status, started_at, last_heartbeat)"
+                " VALUES (?, ?, ?, ?)",
+                (instance_id, RUNNING, now.isoformat(), now.isoformat()),
+            )
+            conn.execute(
+                "UPDATE meta SET value = ? WHERE key = 'coordinator_id' AND value IS NULL",
+                (instance_id,),
+            )
+
+    def heartbeat(self, instance_id: str, now: datetime) -> bool:
+        """Single-row heartbeat update. Returns False if the instance is unknown."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE instances SET last_heartbeat = ? WHERE id = ?",
+                (now.isoformat(), instance_id),
+            )
+        return cursor.rowcount > 0
+
+    def update_progress(self, instance_id: str, progress: float, now: datetime) -> bool:
+        """Single-row progress + heartbeat update. Returns False if unknown."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE instances SET progress = ?, last_heartbeat = ? WHERE id = ?",
+                (progress, now.isoformat(), instance_id),
+            )
+        return cursor.rowcount > 0
+
+    def mark_completed(self, instance_id: str) -> bool:
+        """Complete an instance: record its phase as completed and drop its file locks."""
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT phase FROM instances WHERE id = ?", (instance_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            conn.execute(
+                "UPDATE instances SET status = ?, progress = 1.0 WHERE id = ?",
+                (COMPLETED, instance_id),
+            )
+            if row["phase"]:
+                conn.execute(
+                    "INSERT OR IGNORE INTO completed_phases (phase) VALUES (?)", (row["phase"],)
+                )
+            conn.execute("DELETE FROM file_locks WHERE instance_id = ?", (instance_id,))
+        return True
+
+    def remove_instance(self, instance_id: str) -> None:
+        """Delete an instance (and its file locks), electing a new coordinator if needed."""
+        with self.transaction() as conn:
+            self._elect_coordinator(conn, instance_id)
+            conn.execute("DELETE FROM instances WHERE id = ?", (instance_id,))
+
+    def abandon_instances(self, instance_ids: List[str], cutoff: datetime) -> List[str]:
+        """
+        Mark running instances abandoned if their heartbeat is still older than cutoff.
+
+        The heartbeat is re-checked inside the transaction, so an instance that
+        heartbeated after it was found stale is left alone.
+
+        Returns:
+            IDs actually abandoned
+        """
+        abandoned = []
+        with self.transaction() as conn:
+            for instance_id in instance_ids:
+                cursor = conn.execute(
+                    "UPDATE instances SET status = ?, phase = NULL"
+                    " WHERE id = ? AND status = ? AND last_heartbeat < ?",
+                    (ABANDONED, instance_id, RUNNING, cutoff.isoformat()),
+                )
+                if cursor.rowcount:
+                    conn.execute("DELETE FROM file_locks WHERE instance_id = ?", (instance_id,))
+                    self._elect_coordinator(conn, instance_id)
+                    abandoned.append(instance_id)
+        return abandoned
+
+    def get_instance(self, instance_id: str) -> Optional[Dict[str, Any]]:
+        """Instance as a v1-compatible dict, or None."""
+        instances = self._instances("WHERE i.id = ?", (instance_id,))
+        return instances[0] if instances else None
+
+    def get_instances(self) -> List[Dict[str, Any]]:
+        """All instances as v1-compatible dicts, in registration order."""
+        return self._instances("", ())
+
+    def _instances(self, where: str, params: tuple) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT i.*, (SELECT json_group_array(path) FROM file_locks f"
+                "             WHERE f.instance_id = i.id) AS files_locked"
+                f" FROM instances i {where} ORDER BY i.seq",
+                params,
+            ).fetchall()
+        return [
+            {
+                "id": row["id"],
+                "status": row["status"],
+                "phase": row["phase"],
+                "tasks": json.loads(row["tasks"]),
+                "files_locked": json.loads(row["files_locked"]),
+                "started_at": row["started_at"],
+                "last_heartbeat": row["last_heartbeat"],
+                "progress": row["progress"],
+            }
+            for row in rows
+        ]
+
+    def get_stale_instance_ids(self, cutoff: datetime) -> List[str]:
+        """Running instances whose last heartbeat is older than cutoff."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM instances WHERE status = ? AND last_heartbeat < ? ORDER BY seq",
+                (RUNNING, cutoff.isoformat()),
+            ).fetchall()
+        return [row["id"] for row in rows]
+
+    def coordinator_id(self) -> Optional[str]:
+        return self._get_meta("coordinator_id")
+
+    def build_spec(self) -> Optional[str]:
+        return self._get_meta("build_spec")
+
+    # =========================================================================
+    # Phases
+    # =========================================================================
+
+    def claim_phase(
+        self,
+        instance_id: str,
+        phase: str,
+        dependencies: List[str],
+        files: List[str],
+    ) -> bool:
+        """
+        Compare-and-set claim of a phase for a running instance.
+
+        Succeeds only if, atomically: the instance exists, the phase is not yet
+        completed, every dependency is completed, no other running instance
+        holds the phase, and none of ``files`` is locked by another running
+        instance.
+        """
+        try:
+            with self.transaction() as conn:
+                if conn.execute(
+                    "SELECT 1 FROM instances WHERE id = ?", (instance_id,)
+                ).fetchone() is None:
+                    return False
+
+                if conn.execute(
+                    "SELECT 1 FROM completed_phases WHERE phase = ?", (phase,)
+                ).fetchone():
+                    return False
+
+                if dependencies:
+                    placeholders = ",".join("?" * len(dependencies))
+                    done = conn.execute(
+                        "SELECT COUNT(*) FROM completed_phases"
+                        f" WHERE phase IN ({placeholders})",
+                        dependencies,
+                    ).fetchone()[0]
+                    if done < len(set(dependencies)):
+                        return False
+
+                if files:
+                    placeholders = ",".join("?" * len(files))
+                    conflict = conn.execute(
+                        "SELECT 1 FROM file_locks f JOIN instances i ON i.id = f.instance_id"
+                        f" WHERE f.path IN ({placeholders})"
+                        " AND i.status = ? AND f.instance_id != ? LIMIT 1",
+                        (*files, RUNNING, instance_id),
+                    ).fetchone()
+                    if conflict:
+                        return False
+
+                # The partial unique index rejects a phase held by another running instance
+                conn.execute(
+                    "UPDATE instances SET phase = ?, last_heartbeat = ? WHERE id = ?",
+                    (phase, datetime.now().isoformat(), instance_id),
+                )
+                conn.execute("DELETE FROM file_locks WHERE instance_id = ?", (instance_id,))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO file_locks (instance_id, path) VALUES (?, ?)",
+                    [(instance_id, path) for path in files],
+                )
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    def release_phase(self, instance_id: str) -> None:
+        """Drop an instance's phase claim and file locks."""
+        with self.transaction() as conn:
+            conn.execute("UPDATE instances SET phase = NULL WHERE id = ?", (instance_id,))
+            conn.execute("DELETE FROM file_locks WHERE instance_id = ?", (instance_id,))
+
+    def get_completed_phases(self) -> List[str]:
+        """Completed phases in completion order."""
+        with self._lock:
+            rows = self._conn.execute("SELECT phase FROM completed_phases ORDER BY seq").fetchall()
+        return [row["phase"] for row in rows]
+
+    def get_claimed_phases(self) -> Dict[str, str]:
+        """Mapping of phase -> instance ID for running instances holding a phase."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT phase, id FROM instances"
+                " WHERE status = ? AND phase IS NOT NULL ORDER BY seq",
+                (RUNNING,),
+            ).fetchall()
+        return {row["phase"]: row["id"] for row in rows}
+
+    # =========================================================================
+    # Snapshot
+    # =========================================================================
+
+    def to_state(self) -> Dict[str, Any]:
+        """Whole state in the v1 JSON layout (for status output and debugging)."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                meta = {
+                    row["key"]: row["value"]
+                    for row in self._conn.execute("SELECT key, value FROM meta")
+                }
+                instances = self.get_instances()
+                completed = self.get_completed_phases()
+            finally:
+                self._conn.execute("COMMIT")
+        return {
+            "version": meta.get("version"),
+            "build_spec": meta.get("build_spec"),
+            "started_at": meta.get("started_at"),
+            "coordinator_id": meta.get("coordinator_id"),
+            "instances": {instance["id"]: instance for instance in instances},
+            "phase_analysis": json.loads(meta.get("phase_analysis") or "{}"),
+            "completed_phases": completed,
+            "sync_points": json.loads(meta.get("sync_points") or "[]"),
+        }
@@ -9,5 +9,6 @@ Provides SQLite database for:
 
 from core.persistence.database import Database
 from core.persistence.models import CostEntry, MetricEntry
+from core.persistence.rollups import RollupTables
 
-__all__ = ["Database", "CostEntry", "MetricEntry"]
+__all__ = ["Database", "CostEntry", "MetricEntry", "RollupTables"]
@@ -58,6 +58,22 @@ class Database:
             logger.error(f"Transaction failed: {e}")
             raise
 
+    @contextmanager
+    def atomic(self):
+        """
+        Run several statements as one transaction, holding the connection lock
+
+        Yields:
+            The underlying connection; commits on success, rolls back on error
+        """
+        with self._lock:
+            try:
+                with self.conn:
+                    yield self.conn
+            except sqlite3.Error as e:
+                logger.error(f"Transaction failed: {e}")
+                raise
+
     def execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
         """
         Execute SQL statement
@@ -81,6 +97,27 @@ class Database:
             logger.error(f"Params: {params}")
             raise
 
+    def executemany(self, sql: str, seq_of_params: List[tuple]) -> int:
+        """
+        Execute SQL statement once per parameter tuple in a single transaction
+
+        Args:
+            sql: SQL statement
+            seq_of_params: Sequence of parameter tuples
+
+        Returns:
+            Number of rows affected
+        """
+        try:
+            with self._lock:
+                with self.conn:
+                    cursor = self.conn.executemany(sql, seq_of_params)
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"SQL error: {e}")
+            logger.error(f"Query: {sql}")
+            raise
+
     def query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """
         Execute SELECT query and return results
@@ -128,6 +165,26 @@ class Database:
         cursor = self.execute(sql, tuple(data.values()))
         return cursor.lastrowid
 
+    def insert_many(
+        self, table: str, columns: List[str], rows: List[tuple], or_ignore: bool = False
+    ) -> int:
+        """
+        Insert many rows sharing one column list in a single transaction
+
+        Args:
+            table: Table name
+            columns: Column names, in the order of each row tuple
+            rows: Row values
+            or_ignore: Use INSERT OR IGNORE (skip rows violating a constraint)
+
+        Returns:
+            Number of rows inserted
+        """
+        verb = "INSERT OR IGNORE" if or_ignore else "INSERT"
+        placeholders = ", ".join("?" * len(columns))
+        sql = f"{verb} INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        return self.executemany(sql, rows)
+
     def update(self, table: str, data: Dict[str, Any], where: str, params: tuple = ()) -> int:
         """
         Update rows in table
@@ -2,22 +2,51 @@
 Event storage with automatic rotation and compression
 
 Provides persistent event storage with:
-- Automatic file rotation when size exceeds threshold
-- Gzip compression of old files
+- Append-only JSON Lines segments (one event per line)
+- Automatic segment roll-over when size exceeds threshold
+- Gzip compression of old segments
+- A sidecar segment index (count and time range per segment) so
+  time-bounded and limited reads only open the segments they need
 - Cleanup of files older than retention period
+
+Segment files written before the JSON Lines format (a single
+``{"events": [...], "version": "1.0"}`` document) are still readable.
 """
 
-import json
 import gzip
+import heapq
+import json
+import os
 import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 import logging
 
 from core.persistence.rotation import FileRotator
 
 logger = logging.getLogger(__name__)
 
+INDEX_VERSION = "1.0"
+
+
+def _segment_stats(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Count and timestamp range of a list of events."""
+    timestamps = [e["timestamp"] for e in events if e.get("timestamp")]
+    return {
+        "count": len(events),
+        "min_ts": min(timestamps) if timestamps else None,
+        "max_ts": max(timestamps) if timestamps else None,
+    }
+
+
+def _merge_stats(stats: Dict[str, Any], events: List[Dict[str, Any]]):
+    """Fold appended events into running segment stats."""
+    added = _segment_stats(events)
+    stats["count"] += added["count"]
+    for key, pick in (("min_ts", min), ("max_ts", max)):
+        if added[key] is not None:
+            stats[key] = added[key] if stats[key] is None else pick(stats[key], added[key])
+
 
 class EventStorage:
     """Manages event storage with rotation and compression."""
@@ -33,13 +62,15 @@ class EventStorage:
         Initialize event storage.
 
         Args:
-            storage_path: Path to events file (default: .buildrunner/events.json)
-            max_file_size: Maximum file size before rotation (bytes)
-            retention_days: Days to retain old files
-            compress: Whether to compress rotated files
+            storage_path: Path to the active events segment (default: .buildrunner/events.json)
+            max_file_size: Maximum segment size before roll-over (bytes)
+            retention_days: Days to retain old segments
+            compress: Whether to compress rolled-over segments
         """
         self.storage_path = storage_path or Path.cwd() / ".buildrunner" / "events.json"
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        # Not matched by the rotated-file glob ("<stem>.*<suffix>*")
+        self.index_path = self.storage_path.with_name(f"{self.storage_path.stem}.segments.idx")
 
         self.rotator = FileRotator(
             max_size_bytes=max_file_size,
@@ -48,9 +79,43 @@ class EventStorage:
         )
         self._lock = threading.Lock()  # serializes should_rotate + _rotate + write
 
+        self._index = self._load_index()
+        self._active_stats = _segment_stats([])
+        self._active_stats = self._scan_active()
+
+    def append(self, events: List[Dict[str, Any]]):
+        """
+        Append events to the active segment, rolling it over if necessary.
+
+        Cost is proportional to the number of new events, not to history.
+
+        Args:
+            events: Event dictionaries to append
+        """
+        if not events:
+            return
+
+        try:
+            lines = "".join(json.dumps(e, default=str) + "\n" for e in events)
+            with self._lock:
+                if self.rotator.should_rotate(self.storage_path):
+                    self._rotate()
+
+                with open(self.storage_path, "a") as f:
+                    f.write(lines)
+                _merge_stats(self._active_stats, events)
+
+            logger.debug(f"Appended {len(events)} events to {self.storage_path}")
+
+        except Exception as e:
+            logger.error(f"Failed to append events: {e}")
+            raise
+
     def save(self, events: List[Dict[str, Any]]):
         """
-        Save events to storage, rotating if necessary.
+        Replace the active segment with the given events, rotating if necessary.
+
+        Prefer append() for new events; save() rewrites the active segment.
 
         Args:
             events: List of event dictionaries to save
@@ -61,14 +126,7 @@ class EventStorage:
                 if self.rotator.should_rotate(self.storage_path):
                     self._rotate()
 
-                # Save events
-                data = {
-                    "events": events,
-                    "version": "1.0",
-                }
-
-                with open(self.storage_path, "w") as f:
-                    json.dump(data, f, indent=2)
+                self._write_active(events)
 
             logger.debug(f"Saved {len(events)} events to {self.storage_path}")
 
@@ -76,9 +134,18 @@ class EventStorage:
             logger.error(f"Failed to save events: {e}")
             raise
 
+    def _write_active(self, events: List[Dict[str, Any]]):
+        """Atomically replace the active segment (caller holds the lock)."""
+        tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            for event in events:
+                f.write(json.dumps(event, default=str) + "\n")
+        os.replace(tmp_path, self.storage_path)
+        self._active_stats = _segment_stats(events)
+
     def load(self) -> List[Dict[str, Any]]:
         """
-        Load events from storage.
+        Load events from the active segment.
 
         Returns:
             List of event dictionaries
@@ -87,10 +154,7 @@ class EventStorage:
             return []
 
         try:
-            with open(self.storage_path, "r") as f:
-                data = json.load(f)
-
-            events = data.get("events", [])
+            events = list(self.iter_segment(self.storage_path))
             logger.debug(f"Loaded {len(events)} events from {self.storage_path}")
             return events
 
@@ -98,18 +162,57 @@ class EventStorage:
             logger.error(f"Failed to load events: {e}")
             return []
 
+    def iter_segment(self, path: Path) -> Iterator[Dict[str, Any]]:
+        """
+        Stream events from a segment (plain or gzip, JSON Lines or legacy document).
+
+        Args:
+            path: Segment path
+
+        Yields:
+            Event dictionaries in file order
+        """
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt") as f:
+            first = f.readline()
+            if first.strip() == "{":
+                # Legacy indented {"events": [...]} document
+                yield from json.loads(first + f.read()).get("events", [])
+                return
+
+            if first:
+                yield from self._parse_line(first)
+            for line in f:
+                yield from self._parse_line(line)
+
+    @staticmethod
+    def _parse_line(line: str) -> Iterator[Dict[str, Any]]:
+        line = line.strip()
+        if not line:
+            return
+        record = json.loads(line)
+        if isinstance(record.get("events"), list) and "version" in record:
+            # Legacy compact {"events": [...], "version": ...} document
+            yield from record["events"]
+        else:
+            yield record
+
     def _rotate(self):
-        """Rotate the current events file."""
+        """Roll the active segment over and record it in the segment index."""
+        stats = dict(self._active_stats)
         rotated_path = self.rotator.rotate_file(self.storage_path)
 
         if rotated_path:
             logger.info(f"Rotated events file to {rotated_path}")
+            self._active_stats = _segment_stats([])
+            self._index[rotated_path.name] = stats
 
             # Cleanup old files
             self.rotator.cleanup_old_files(
                 self.storage_path.parent,
                 pattern=f"{self.storage_path.stem}.*{self.storage_path.suffix}*",
             )
+            self._save_index()
 
     def get_rotated_files(self) -> List[Path]:
         """
@@ -131,15 +234,7 @@ class EventStorage:
             List of event dictionaries
         """
         try:
-            # Check if file is compressed
-            if rotated_path.suffix == ".gz":
-                with gzip.open(rotated_path, "rt") as f:
-                    data = json.load(f)
-            else:
-                with open(rotated_path, "r") as f:
-                    data = json.load(f)
-
-            events = data.get("events", [])
+            events = list(self.iter_segment(rotated_path))
             logger.debug(f"Loaded {len(events)} events from rotated file {rotated_path}")
             return events
 
@@ -147,41 +242,126 @@ class EventStorage:
             logger.error(f"Failed to load events from {rotated_path}: {e}")
             return []
 
-    def load_all_events(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def load_all_events(
+        self,
+        limit: Optional[int] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Load events from current file and all rotated files.
 
+        Segments whose indexed time range falls outside [start_time, end_time]
+        are skipped, and with a limit, segments are read newest-first until no
+        remaining segment can hold a newer event.
+
         Args:
             limit: Maximum number of events to load (most recent)
+            start_time: Only events with timestamp >= this ISO timestamp
+            end_time: Only events with timestamp <= this ISO timestamp
 
         Returns:
             List of event dictionaries, sorted by timestamp (newest first)
         """
-        all_events = []
-
-        # Load current events
-        current_events = self.load()
-        all_events.extend(current_events)
-
-        # Load rotated events
-        for rotated_path in self.get_rotated_files():
-            rotated_events = self.load_from_rotated(rotated_path)
-            all_events.extend(rotated_events)
+        segments = self._segments()
+        segments.sort(key=lambda s: s[1]["max_ts"] or "", reverse=True)
+
+        def in_range(ts: str) -> bool:
+            return (not start_time or ts >= start_time) and (not end_time or ts <= end_time)
+
+        kept: List[tuple] = []  # heap of (timestamp, seq, event); oldest at kept[0]
+        seq = 0
+        opened = 0
+        for path, stats in segments:
+            if stats["count"] == 0:
+                continue
+            if start_time and stats["max_ts"] and stats["max_ts"] < start_time:
+                continue
+            if end_time and stats["min_ts"] and stats["min_ts"] > end_time:
+                continue
+            if limit and len(kept) >= limit and (stats["max_ts"] or "") < kept[0][0]:
+                break
+
+            opened += 1
+            try:
+                for event in self.iter_segment(path):
+                    ts = event.get("timestamp", "") or ""
+                    if (start_time or end_time) and not in_range(ts):
+                        continue
+                    seq += 1
+                    if limit and len(kept) >= limit:
+                        heapq.heappushpop(kept, (ts, seq, event))
+                    else:
+                        heapq.heappush(kept, (ts, seq, event))
+            except Exception as e:
+                logger.error(f"Failed to load events from {path}: {e}")
+
+        # Newest first; for equal timestamps keep file order (as the former stable sort did)
+        kept.sort(key=lambda item: (item[0], -item[1]), reverse=True)
+        all_events = [event for _, _, event in kept]
+
+        logger.info(f"Loaded {len(all_events)} events from {opened} of {len(segments)} files")
+        return all_events
 
-        # Sort by timestamp (newest first)
-        # Assuming events have 'timestamp' field
+    def _segments(self) -> List[tuple]:
+        """(path, stats) for the active segment and every rotated segment."""
+        with self._lock:
+            segments = []
+            if self.storage_path.exists():
+                segments.append((self.storage_path, dict(self._active_stats)))
+
+            rotated = self.get_rotated_files()
+            names = {p.name for p in rotated}
+            changed = False
+            for name in [n for n in self._index if n not in names]:
+                del self._index[name]  # removed by retention cleanup
+                changed = True
+            for path in rotated:
+                if path.name not in self._index:
+                    # Segment rotated before the index existed: scan it once
+                    try:
+                        self._index[path.name] = _segment_stats(list(self.iter_segment(path)))
+                    except Exception as e:
+                        logger.error(f"Failed to index {path}: {e}")
+                        continue
+                    changed = True
+                segments.append((path, dict(self._index[path.name])))
+            if changed:
+                self._save_index()
+            return segments
+
+    def _scan_active(self) -> Dict[str, Any]:
+        """Stats for the active segment (bounded by max_file_size)."""
+        if not self.storage_path.exists():
+            return _segment_stats([])
         try:
-            all_events.sort(key=lambda e: e.get("timestamp", ""), reverse=True)
-        except Exception:
-            # If sorting fails, just return unsorted
-            pass
+            events = list(self.iter_segment(self.storage_path))
+            with open(self.storage_path, "r") as f:
+                legacy = f.readline().strip() == "{"
+            if legacy:
+                # Convert a pre-JSON Lines active file once so append() can extend it
+                with self._lock:
+                    self._write_active(events)
+            return _segment_stats(events)
+        except Exception as e:
+            logger.error(f"Failed to scan {self.storage_path}: {e}")
+            return _segment_stats([])
 
-        # Apply limit if specified
-        if limit:
-            all_events = all_events[:limit]
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, "r") as f:
+                return json.load(f).get("segments", {})
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable segment index {self.index_path}: {e}")
+            return {}
 
-        logger.info(f"Loaded {len(all_events)} total events from all files")
-        return all_events
+    def _save_index(self):
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"segments": self._index, "version": INDEX_VERSION}, f)
+        os.replace(tmp_path, self.index_path)
 
     def cleanup_old_files(self):
         """Remove rotated files older than retention period."""
@@ -209,27 +389,34 @@ class EventStorage:
         # Current file stats
         if self.storage_path.exists():
             stats["current_file_size"] = self.storage_path.stat().st_size
-            stats["current_event_count"] = len(self.load())
+            stats["current_event_count"] = self._active_stats["count"]
 
         # Rotated files stats
-        rotated_files = self.get_rotated_files()
+        segments = dict(self._segments())
         total_rotated_size = 0
+        total_events = stats["current_event_count"]
 
-        for rotated_path in rotated_files:
+        for rotated_path in self.get_rotated_files():
             file_size = rotated_path.stat().st_size
             total_rotated_size += file_size
+            event_count = segments.get(rotated_path, {}).get("count", 0)
+            total_events += event_count
 
             stats["rotated_files"].append(
                 {
                     "path": str(rotated_path),
                     "size": file_size,
                     "compressed": rotated_path.suffix == ".gz",
+                    "event_count": event_count,
                 }
             )
 
         stats["total_rotated_size"] = total_rotated_size
+        stats["total_event_count"] = total_events
         stats["total_files"] = (
-            1 + len(rotated_files) if stats["current_file_exists"] else len(rotated_files)
+            1 + len(stats["rotated_files"])
+            if stats["current_file_exists"]
+            else len(stats["rotated_files"])
         )
 
         return stats
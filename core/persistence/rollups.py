@@ -0,0 +1,325 @@
+"""
+Time-bucket rollups for append-only SQLite tables
+
+A raw table that receives one row per request gets two companion tables,
+<prefix>_hourly and <prefix>_daily, keyed by (bucket, *keys) and holding
+SUM/MIN/MAX measures. Both are UPSERTed in the same transaction as the raw
+insert, so each one always covers the whole raw table. A time window is then
+answered from daily rows for whole days, hourly rows for whole hours at either
+edge and raw rows only for the partial hours at the very ends - the cost of a
+summary no longer depends on how much history has been recorded.
+
+Usage:
+    rollups = RollupTables(
+        db,
+        raw_table="cost_entries",
+        prefix="cost_rollup",
+        keys=["model_name"],
+        measures={"requests": ("sum", "1"), "cost": ("sum", "cost_usd")},
+    )
+    rollups.create()
+    rollups.insert({"timestamp": datetime.now().isoformat(), "model_name": "haiku", ...})
+    rollups.window(start, end, group_by=["model_name"])
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import logging
+
+from core.persistence.database import Database
+
+logger = logging.getLogger(__name__)
+
+# Bucket keys are ISO timestamp prefixes, so they sort and compare as text
+GRAINS = {"hourly": len("YYYY-MM-DDTHH"), "daily": len("YYYY-MM-DD")}
+AGGREGATES = {"sum": "SUM", "min": "MIN", "max": "MAX"}
+
+
+def bucket_key(timestamp: datetime, grain: str) -> str:
+    """
+    Rollup bucket containing a timestamp.
+
+    Args:
+        timestamp: Naive local timestamp (as stored by the trackers)
+        grain: "hourly" or "daily"
+
+    Returns:
+        Bucket key, e.g. "2025-01-18T14" or "2025-01-18"
+    """
+    return timestamp.isoformat()[: GRAINS[grain]]
+
+
+def _floor(timestamp: datetime, grain: str) -> datetime:
+    if grain == "hourly":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next(timestamp: datetime, grain: str) -> datetime:
+    step = timedelta(hours=1) if grain == "hourly" else timedelta(days=1)
+    return _floor(timestamp, grain) + step
+
+
+def _ceil(timestamp: datetime, grain: str) -> datetime:
+    floor = _floor(timestamp, grain)
+    return floor if floor == timestamp else _next(timestamp, grain)
+
+
+def window_segments(
+    start: Optional[datetime], end: Optional[datetime]
+) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """
+    Split the half-open window [start, end) into rollup-sized pieces.
+
+    Args:
+        start: Window start (None for unbounded)
+        end: Window end, exclusive (None for unbounded)
+
+    Returns:
+        List of (source, lo, hi) where source is "raw", "hourly" or "daily" and
+        lo/hi are the inclusive/exclusive bounds on timestamp or bucket key
+        (None for unbounded)
+    """
+    hour_lo = _ceil(start, "hourly") if start is not None else None
+    hour_hi = _floor(end, "hourly") if end is not None else None
+    if hour_lo is not None and hour_hi is not None and hour_lo >= hour_hi:
+        return [("raw", start.isoformat(), end.isoformat())]
+
+    segments = []
+    if start is not None and start < hour_lo:
+        segments.append(("raw", start.isoformat(), hour_lo.isoformat()))
+    if end is not None and hour_hi < end:
+        segments.append(("raw", hour_hi.isoformat(), end.isoformat()))
+
+    day_lo = _ceil(hour_lo, "daily") if hour_lo is not None else None
+    day_hi = _floor(hour_hi, "daily") if hour_hi is not None else None
+    if day_lo is not None and day_hi is not None and day_lo >= day_hi:
+        segments.append(
+            ("hourly", bucket_key(hour_lo, "hourly"), bucket_key(hour_hi, "hourly"))
+        )
+        return segments
+
+    if hour_lo is not None and hour_lo < day_lo:
+        segments.append(("hourly", bucket_key(hour_lo, "hourly"), bucket_key(day_lo, "hourly")))
+    if hour_hi is not None and day_hi < hour_hi:
+        segments.append(("hourly", bucket_key(day_hi, "hourly"), bucket_key(hour_hi, "hourly")))
+    segments.append(
+        (
+            "daily",
+            bucket_key(day_lo, "daily") if day_lo is not None else None,
+            bucket_key(day_hi, "daily") if day_hi is not None else None,
+        )
+    )
+    return segments
+
+
+class RollupTables:
+    """Hourly and daily rollups kept in step with a raw SQLite table."""
+
+    def __init__(
+        self,
+        db: Database,
+        raw_table: str,
+        prefix: str,
+        keys: Sequence[str],
+        measures: Dict[str, Tuple[str, str]],
+    ):
+        """
+        Initialize rollups.
+
+        Args:
+            db: Database holding the raw table
+            raw_table: Raw table name; must have a ``timestamp`` ISO text column
+            prefix: Rollup table prefix (tables are <prefix>_hourly/_daily)
+            keys: Raw columns to group by besides the time bucket (NOT NULL)
+            measures: Rollup column -> (aggregate, SQL expression over a raw row),
+                where aggregate is "sum", "min" or "max"
+        """
+        for kind, _ in measures.values():
+            if kind not in AGGREGATES:
+                raise ValueError(f"Unknown rollup aggregate: {kind}")
+
+        self.db = db
+        self.raw_table = raw_table
+        self.keys = list(keys)
+        self.measures = dict(measures)
+        self.tables = {grain: f"{prefix}_{grain}" for grain in GRAINS}
+        self._upserts = [self._upsert_sql(grain) for grain in GRAINS]
+
+    def create(self) -> bool:
+        """
+        Create missing rollup tables, backfilling them from the raw table.
+
+        Returns:
+            True if any table was created
+        """
+        created = False
+        for grain, table in self.tables.items():
+            if self.db.table_exists(table):
+                continue
+
+            columns = ["bucket TEXT NOT NULL"]
+            columns += [f"{key} TEXT NOT NULL" for key in self.keys]
+            columns += list(self.measures)
+            columns.append(f"PRIMARY KEY (bucket, {', '.join(self.keys)})")
+            with self.db.atomic() as conn:
+                conn.execute(f"CREATE TABLE {table} ({', '.join(columns)})")
+                conn.execute(self._rebuild_sql(grain))
+            logger.info(f"Created rollup table {table}")
+            created = True
+
+        return created
+
+    def insert(self, row: Dict[str, Any]) -> int:
+        """
+        Insert a raw row and fold it into both rollups in one transaction.
+
+        Args:
+            row: Raw column values (must include ``timestamp``)
+
+        Returns:
+            ID of the inserted raw row
+        """
+        return self.insert_many([row])[-1]
+
+    def insert_many(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Insert raw rows and fold them into both rollups in one transaction.
+
+        Args:
+            rows: Raw column values per row (each must include ``timestamp``)
+
+        Returns:
+            IDs of the inserted raw rows
+        """
+        ids = []
+        with self.db.atomic() as conn:
+            for row in rows:
+                columns = ", ".join(row)
+                placeholders = ", ".join("?" * len(row))
+                cursor = conn.execute(
+                    f"INSERT INTO {self.raw_table} ({columns}) VALUES ({placeholders})",
+                    tuple(row.values()),
+                )
+                for upsert in self._upserts:
+                    conn.execute(upsert, (cursor.lastrowid,))
+                ids.append(cursor.lastrowid)
+        return ids
+
+    def window(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        group_by: Sequence[str] = (),
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate all measures over [start, end).
+
+        Args:
+            start: Window start (None for all history)
+            end: Window end, exclusive (None for no upper bound)
+            filters: Key column -> required value
+            group_by: Key columns to group by
+
+        Returns:
+            One dict per group with the group keys and measures; groups without
+            data are omitted (so an empty window returns [])
+        """
+        filters = filters or {}
+        unknown = (set(filters) | set(group_by)) - set(self.keys)
+        if unknown:
+            raise ValueError(f"Not a rollup key: {', '.join(sorted(unknown))}")
+
+        parts, params = [], []
+        for source, lo, hi in window_segments(start, end):
+            if source == "raw":
+                table, column = self.raw_table, "timestamp"
+                values = [f"{expr} AS {name}" for name, (_, expr) in self.measures.items()]
+            else:
+                table, column = self.tables[source], "bucket"
+                values = list(self.measures)
+
+            conditions = []
+            if lo is not None:
+                conditions.append(f"{column} >= ?")
+                params.append(lo)
+            if hi is not None:
+                conditions.append(f"{column} < ?")
+                params.append(hi)
+            for key, value in filters.items():
+                conditions.append(f"{key} = ?")
+                params.append(value)
+
+            where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+            parts.append(f"SELECT {', '.join(self.keys + values)} FROM {table}{where}")
+
+        aggregates = [
+            f"{AGGREGATES[kind]}({name}) AS {name}" for name, (kind, _) in self.measures.items()
+        ]
+        sql = f"SELECT {', '.join([*group_by, *aggregates])} FROM ({' UNION ALL '.join(parts)})"
+        if group_by:
+            sql += f" GROUP BY {', '.join(group_by)}"
+
+        rows = self.db.query(sql, tuple(params))
+        return [row for row in rows if any(row[name] is not None for name in self.measures)]
+
+    def prune(self, cutoff: datetime) -> int:
+        """
+        Delete raw rows older than cutoff and drop them from the rollups.
+
+        Args:
+            cutoff: Oldest timestamp to keep
+
+        Returns:
+            Number of raw rows deleted
+        """
+        with self.db.atomic() as conn:
+            deleted = conn.execute(
+                f"DELETE FROM {self.raw_table} WHERE timestamp < ?", (cutoff.isoformat(),)
+            ).rowcount
+            for grain, table in self.tables.items():
+                # The bucket holding the cutoff is partly kept: rebuild it from raw
+                conn.execute(f"DELETE FROM {table} WHERE bucket <= ?", (bucket_key(cutoff, grain),))
+                conn.execute(
+                    self._rebuild_sql(grain, "WHERE timestamp >= ? AND timestamp < ?"),
+                    (cutoff.isoformat(), _next(cutoff, grain).isoformat()),
+                )
+        return deleted
+
+    def clear(self):
+        """Delete all raw rows and rollups."""
+        with self.db.atomic() as conn:
+            conn.execute(f"DELETE FROM {self.raw_table}")
+            for table in self.tables.values():
+                conn.execute(f"DELETE FROM {table}")
+
+    def _select_columns(self, grain: str, aggregate: bool) -> str:
+        values = [
+            f"{AGGREGATES[kind]}({expr})" if aggregate else expr
+            for kind, expr in self.measures.values()
+        ]
+        return ", ".join([f"substr(timestamp, 1, {GRAINS[grain]})", *self.keys, *values])
+
+    def _rebuild_sql(self, grain: str, where: str = "") -> str:
+        columns = ", ".join(["bucket", *self.keys, *self.measures])
+        return (
+            f"INSERT INTO {self.tables[grain]} ({columns}) "
+            f"SELECT {self._select_columns(grain, aggregate=True)} FROM {self.raw_table} "
+            f"{where} GROUP BY 1, {', '.join(self.keys)}"
+        )
+
+    def _upsert_sql(self, grain: str) -> str:
+        columns = ", ".join(["bucket", *self.keys, *self.measures])
+        updates = ", ".join(
+            f"{name} = {name} + excluded.{name}"
+            if kind == "sum"
+            else f"{name} = {AGGREGATES[kind]}({name}, excluded.{name})"
+            for name, (kind, _) in self.measures.items()
+        )
+        return (
+            f"INSERT INTO {self.tables[grain]} ({columns}) "
+            f"SELECT {self._select_columns(grain, aggregate=False)} FROM {self.raw_table} "
+            f"WHERE rowid = ? "
+            f"ON CONFLICT (bucket, {', '.join(self.keys)}) DO UPDATE SET {updates}"
+        )
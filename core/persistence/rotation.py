@@ -72,6 +72,14 @@ class FileRotator:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             rotated_path = file_path.parent / f"{file_path.stem}.{timestamp}{file_path.suffix}"
 
+            # Several rotations within one second must not overwrite each other
+            sequence = 1
+            while rotated_path.exists() or Path(f"{rotated_path}.gz").exists():
+                rotated_path = (
+                    file_path.parent / f"{file_path.stem}.{timestamp}_{sequence}{file_path.suffix}"
+                )
+                sequence += 1
+
             # Rename original file
             file_path.rename(rotated_path)
             logger.info(f"Rotated file: {file_path} -> {rotated_path}")
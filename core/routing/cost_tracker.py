@@ -7,6 +7,9 @@ Tracks:
 - Cost by model
 - Cost by task type
 - Budget alerts and warnings
+
+Per-hour and per-day rollups are updated in the same transaction as each
+insert, so summaries and budget checks never reload the full history.
 """
 
 from dataclasses import dataclass, field
@@ -16,9 +19,30 @@ from typing import Dict, List, Optional
 import logging
 
 from core.persistence.database import Database
+from core.persistence.rollups import RollupTables
 
 logger = logging.getLogger(__name__)
 
+# Columns added to the original cost_entries schema so entries round-trip
+EXTRA_COLUMNS = {
+    "task_type": "TEXT NOT NULL DEFAULT 'unknown'",
+    "input_cost": "REAL NOT NULL DEFAULT 0",
+    "output_cost": "REAL NOT NULL DEFAULT 0",
+    "success": "BOOLEAN NOT NULL DEFAULT 1",
+    "error": "TEXT",
+    "duration_ms": "REAL NOT NULL DEFAULT 0",
+}
+
+# Per-hour/per-day rollup measures: column -> (aggregate, expression over a cost_entries row)
+ROLLUP_MEASURES = {
+    "requests": ("sum", "1"),
+    "cost_usd": ("sum", "cost_usd"),
+    "input_tokens": ("sum", "input_tokens"),
+    "output_tokens": ("sum", "output_tokens"),
+}
+
+EXPORT_PAGE_SIZE = 1000
+
 
 @dataclass
 class CostEntry:
@@ -94,12 +118,17 @@ class CostTracker:
         self.budget_daily = budget_daily
         self.budget_monthly = budget_monthly
 
+        self.rollups = RollupTables(
+            self.db,
+            raw_table="cost_entries",
+            prefix="cost_rollup",
+            keys=["model_name", "task_type"],
+            measures=ROLLUP_MEASURES,
+        )
+
         # Initialize database schema
         self._init_schema()
 
-        self.entries: List[CostEntry] = []
-        self._load()
-
     def record(
         self,
         model: str,
@@ -147,8 +176,7 @@ class CostTracker:
             duration_ms=duration_ms,
         )
 
-        self.entries.append(entry)
-        self._save()
+        self._save(entry)
 
         # Check budget warnings
         self._check_budgets()
@@ -191,17 +219,21 @@ class CostTracker:
             start_date = now - timedelta(days=30)
             end_date = now
         else:  # "all"
-            if self.entries:
-                start_date = self.entries[0].timestamp
-                end_date = now
+            first = self.db.query_one("SELECT MIN(timestamp) AS first FROM cost_entries")
+            if first and first["first"]:
+                start_date = datetime.fromisoformat(first["first"])
             else:
                 start_date = now
-                end_date = now
+            end_date = now
 
-        # Filter entries
-        filtered = [e for e in self.entries if start_date <= e.timestamp <= end_date]
+        # Aggregate from the rollups (end_date is inclusive)
+        groups = self.rollups.window(
+            start_date,
+            end_date + timedelta(microseconds=1),
+            group_by=["model_name", "task_type"],
+        )
 
-        if not filtered:
+        if not groups:
             return CostSummary(
                 period=period,
                 start_date=start_date,
@@ -209,25 +241,21 @@ class CostTracker:
             )
 
         # Calculate totals
-        total_requests = len(filtered)
-        total_cost = sum(e.total_cost for e in filtered)
-        total_input_tokens = sum(e.input_tokens for e in filtered)
-        total_output_tokens = sum(e.output_tokens for e in filtered)
+        total_requests = sum(g["requests"] for g in groups)
+        total_cost = sum(g["cost_usd"] for g in groups)
+        total_input_tokens = sum(g["input_tokens"] for g in groups)
+        total_output_tokens = sum(g["output_tokens"] for g in groups)
         total_tokens = total_input_tokens + total_output_tokens
 
-        # Cost by model
+        # Cost by model and by task type
         cost_by_model: Dict[str, float] = {}
         requests_by_model: Dict[str, int] = {}
-        for entry in filtered:
-            cost_by_model[entry.model] = cost_by_model.get(entry.model, 0.0) + entry.total_cost
-            requests_by_model[entry.model] = requests_by_model.get(entry.model, 0) + 1
-
-        # Cost by task type
         cost_by_task_type: Dict[str, float] = {}
-        for entry in filtered:
-            cost_by_task_type[entry.task_type] = (
-                cost_by_task_type.get(entry.task_type, 0.0) + entry.total_cost
-            )
+        for g in groups:
+            model, task_type = g["model_name"], g["task_type"]
+            cost_by_model[model] = cost_by_model.get(model, 0.0) + g["cost_usd"]
+            requests_by_model[model] = requests_by_model.get(model, 0) + g["requests"]
+            cost_by_task_type[task_type] = cost_by_task_type.get(task_type, 0.0) + g["cost_usd"]
 
         # Find most expensive and most used
         most_expensive_model = (
@@ -267,7 +295,10 @@ class CostTracker:
         Returns:
             List of recent CostEntry objects
         """
-        return sorted(self.entries, key=lambda e: e.timestamp, reverse=True)[:limit]
+        rows = self.db.query(
+            "SELECT * FROM cost_entries ORDER BY timestamp DESC LIMIT ?", (limit,)
+        )
+        return [self._entry_from_row(row) for row in rows]
 
     def clear_old_entries(self, days: int = 90):
         """
@@ -277,8 +308,11 @@ class CostTracker:
             days: Number of days to keep
         """
         cutoff = datetime.now() - timedelta(days=days)
-        self.entries = [e for e in self.entries if e.timestamp >= cutoff]
-        self._save()
+        try:
+            deleted = self.rollups.prune(cutoff)
+            logger.info(f"Cleared {deleted} cost entries older than {days} days")
+        except Exception as e:
+            logger.error(f"Failed to clear old cost data: {e}")
 
     def _init_schema(self):
         """Initialize database schema if needed."""
@@ -293,79 +327,81 @@ class CostTracker:
                 self.db.run_migration(migration_sql)
                 logger.info("Cost tracking database schema initialized")
 
+        if not self.db.table_exists("cost_entries"):
+            return
+
+        # Older databases only stored the simplified cost_entries schema
+        existing = {row["name"] for row in self.db.query("PRAGMA table_info(cost_entries)")}
+        for column, definition in EXTRA_COLUMNS.items():
+            if column not in existing:
+                self.db.execute(f"ALTER TABLE cost_entries ADD COLUMN {column} {definition}")
+
+        # Hourly/daily rollups; backfilled from existing entries on first run
+        self.rollups.create()
+
     def _check_budgets(self):
         """Check if budgets are exceeded and print warnings."""
+        now = datetime.now()
+
         if self.budget_daily:
-            daily_summary = self.get_summary(period="day")
-            if daily_summary.total_cost > self.budget_daily:
-                print(
-                    f"⚠️  Daily budget exceeded: ${daily_summary.total_cost:.4f} / ${self.budget_daily:.2f}"
-                )
+            daily_cost = self._cost_since(now - timedelta(days=1))
+            if daily_cost > self.budget_daily:
+                print(f"⚠️  Daily budget exceeded: ${daily_cost:.4f} / ${self.budget_daily:.2f}")
 
         if self.budget_monthly:
-            monthly_summary = self.get_summary(period="month")
-            if monthly_summary.total_cost > self.budget_monthly:
+            monthly_cost = self._cost_since(now - timedelta(days=30))
+            if monthly_cost > self.budget_monthly:
                 print(
-                    f"⚠️  Monthly budget exceeded: ${monthly_summary.total_cost:.2f} / ${self.budget_monthly:.2f}"
+                    f"⚠️  Monthly budget exceeded: ${monthly_cost:.2f} / ${self.budget_monthly:.2f}"
                 )
 
-    def _save(self):
-        """Save cost entries to database."""
+    def _cost_since(self, start: datetime) -> float:
+        """Total cost recorded since start, read from the rollups."""
+        totals = self.rollups.window(start)
+        return totals[0]["cost_usd"] if totals else 0.0
+
+    def _save(self, entry: CostEntry):
+        """Save a cost entry to the database and fold it into the rollups."""
         try:
-            # Save only the most recent entry (others are already saved)
-            if self.entries:
-                entry = self.entries[-1]
-                data = {
-                    "timestamp": entry.timestamp.isoformat(),
-                    "task_id": entry.task_id,
-                    "model_name": entry.model,
-                    "input_tokens": entry.input_tokens,
-                    "output_tokens": entry.output_tokens,
-                    "cost_usd": entry.total_cost,
-                    "session_id": None,  # Could be added later
-                }
-                self.db.insert("cost_entries", data)
-                logger.debug(f"Saved cost entry: {entry.model} - ${entry.total_cost:.6f}")
+            data = {
+                "timestamp": entry.timestamp.isoformat(),
+                "task_id": entry.task_id,
+                "model_name": entry.model,
+                "input_tokens": entry.input_tokens,
+                "output_tokens": entry.output_tokens,
+                "cost_usd": entry.total_cost,
+                "session_id": None,  # Could be added later
+                "task_type": entry.task_type,
+                "input_cost": entry.input_cost,
+                "output_cost": entry.output_cost,
+                "success": entry.success,
+                "error": entry.error,
+                "duration_ms": entry.duration_ms,
+            }
+            self.rollups.insert(data)
+            logger.debug(f"Saved cost entry: {entry.model} - ${entry.total_cost:.6f}")
 
         except Exception as e:
             logger.error(f"Failed to save cost data: {e}")
 
-    def _load(self):
-        """Load cost entries from database."""
-        try:
-            if not self.db.table_exists("cost_entries"):
-                self.entries = []
-                return
-
-            # Query all entries from database
-            rows = self.db.query("SELECT * FROM cost_entries ORDER BY timestamp DESC LIMIT 1000")
-
-            # Convert to CostEntry objects
-            # Note: Database has limited fields, so we reconstruct with defaults
-            self.entries = [
-                CostEntry(
-                    timestamp=datetime.fromisoformat(row["timestamp"]),
-                    model=row["model_name"],
-                    task_id=row["task_id"] or "",
-                    task_type="unknown",  # Not stored in simplified schema
-                    input_tokens=row["input_tokens"],
-                    output_tokens=row["output_tokens"],
-                    total_tokens=row["input_tokens"] + row["output_tokens"],
-                    input_cost=0.0,  # Not stored separately
-                    output_cost=0.0,  # Not stored separately
-                    total_cost=row["cost_usd"],
-                    success=True,  # Assume success if stored
-                    error=None,
-                    duration_ms=0.0,  # Not tracked in simplified schema
-                )
-                for row in rows
-            ]
-
-            logger.info(f"Loaded {len(self.entries)} cost entries from database")
-
-        except Exception as e:
-            logger.error(f"Failed to load cost data: {e}")
-            self.entries = []
+    @staticmethod
+    def _entry_from_row(row: Dict) -> CostEntry:
+        """Build a CostEntry from a cost_entries row."""
+        return CostEntry(
+            timestamp=datetime.fromisoformat(row["timestamp"]),
+            model=row["model_name"],
+            task_id=row["task_id"] or "",
+            task_type=row["task_type"],
+            input_tokens=row["input_tokens"],
+            output_tokens=row["output_tokens"],
+            total_tokens=row["input_tokens"] + row["output_tokens"],
+            input_cost=row["input_cost"],
+            output_cost=row["output_cost"],
+            total_cost=row["cost_usd"],
+            success=bool(row["success"]),
+            error=row["error"],
+            duration_ms=row["duration_ms"],
+        )
 
     def export_csv(self, output_path: Path):
         """
@@ -398,22 +434,32 @@ class CostTracker:
                 ]
             )
 
-            # Data
-            for entry in self.entries:
-                writer.writerow(
-                    [
-                        entry.timestamp.isoformat(),
-                        entry.model,
-                        entry.task_id,
-                        entry.task_type,
-                        entry.input_tokens,
-                        entry.output_tokens,
-                        entry.total_tokens,
-                        f"{entry.input_cost:.6f}",
-                        f"{entry.output_cost:.6f}",
-                        f"{entry.total_cost:.6f}",
-                        entry.success,
-                        entry.error or "",
-                        f"{entry.duration_ms:.2f}",
-                    ]
+            # Data, paged so exports do not load all history at once
+            last_id = 0
+            while True:
+                rows = self.db.query(
+                    "SELECT * FROM cost_entries WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, EXPORT_PAGE_SIZE),
                 )
+                if not rows:
+                    break
+                last_id = rows[-1]["id"]
+
+                for entry in map(self._entry_from_row, rows):
+                    writer.writerow(
+                        [
+                            entry.timestamp.isoformat(),
+                            entry.model,
+                            entry.task_id,
+                            entry.task_type,
+                            entry.input_tokens,
+                            entry.output_tokens,
+                            entry.total_tokens,
+                            f"{entry.input_cost:.6f}",
+                            f"{entry.output_cost:.6f}",
+                            f"{entry.total_cost:.6f}",
+                            entry.success,
+                            entry.error or "",
+                            f"{entry.duration_ms:.2f}",
+                        ]
+                    )
@@ -68,6 +68,10 @@ _EXPORTS = {
         "core.runtime.runtime_registry",
         "create_phase1_runtime_registry",
     ),
+    "RuntimeSessionPool": ("core.runtime.session_pool", "RuntimeSessionPool"),
+    "SessionPoolConfig": ("core.runtime.session_pool", "SessionPoolConfig"),
+    "StreamClosed": ("core.runtime.streaming", "StreamClosed"),
+    "stream_blocking": ("core.runtime.streaming", "stream_blocking"),
     "RuntimeFinding": ("core.runtime.types", "RuntimeFinding"),
     "RuntimeResult": ("core.runtime.types", "RuntimeResult"),
     "RuntimeTask": ("core.runtime.types", "RuntimeTask"),
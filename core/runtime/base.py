@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator
 
 from core.runtime.capabilities import CapabilityProfile
 from core.runtime.postflight import evaluate_runtime_task_postflight
 from core.runtime.preflight import evaluate_runtime_task_preflight
+from core.runtime.result_schema import StreamEvent
+from core.runtime.streaming import DEFAULT_STREAM_BUFFER, StreamEmitter, stream_blocking
 from core.runtime.types import RuntimeResult, RuntimeTask
 
+# Batch deadline (epoch seconds) propagated by RuntimeRegistry.as_completed()
+DEADLINE_METADATA_KEY = "deadline_at"
+
 
 class BaseRuntime(ABC):
     """Shared BR3-facing contract for runtime adapters."""
@@ -37,6 +44,13 @@ class BaseRuntime(ABC):
             errors.append("commit_sha is required")
         return errors
 
+    def remaining_timeout(self, task: RuntimeTask, default: float) -> float:
+        """Backend timeout for task: ``default``, capped by any propagated deadline."""
+        deadline_at = task.metadata.get(DEADLINE_METADATA_KEY)
+        if deadline_at is None:
+            return default
+        return max(min(default, deadline_at - time.time()), 0.001)
+
     def evaluate_preflight(self, task: RuntimeTask):
         return evaluate_runtime_task_preflight(task, self.runtime_name)
 
@@ -81,10 +95,45 @@ class BaseRuntime(ABC):
     async def run_execution_step(self, task: RuntimeTask) -> RuntimeResult:
         raise NotImplementedError("Phase 1 scaffold only implements review")
 
-    async def stream_events(self, task: RuntimeTask) -> list[dict[str, Any]]:
-        return []
+    def run_streaming(self, task: RuntimeTask, emit: StreamEmitter) -> RuntimeResult:
+        """Blocking run that reports output chunks through ``emit`` as they arrive.
+
+        Runs on a worker thread. Streaming adapters override this to emit
+        ``token``/``line`` events; the default runs the task normally and emits
+        no chunks.
+        """
+        handlers = {
+            "review": self.run_review,
+            "plan": self.run_plan,
+            "execution": self.run_execution_step,
+            "analysis": self.run_analysis,
+        }
+        handler = handlers.get(task.task_type)
+        if handler is None:
+            raise ValueError(f"Unknown task_type: {task.task_type!r}")
+        return asyncio.run(handler(task))
+
+    async def stream_events(
+        self, task: RuntimeTask, max_buffer: int = DEFAULT_STREAM_BUFFER
+    ) -> AsyncIterator[StreamEvent]:
+        """Run task and yield StreamEvents as output arrives (see core.runtime.streaming).
+
+        The last event is ``completed`` (payload carries the RuntimeResult dict and
+        ttfb_ms/duration_ms) or ``error``.
+        """
+        async for event in stream_blocking(
+            lambda emit: self.run_streaming(task, emit), max_buffer=max_buffer
+        ):
+            yield event
 
     async def cancel(self, task_id: str) -> bool:
+        """Stop backend work for task_id; True if something was cancelled.
+
+        The CLI and Ollama adapters kill the subprocess or abort the HTTP response
+        currently running for task_id. Work that has not reached that point yet
+        (e.g. still probing the CLI) is not interrupted and is only bounded by
+        ``remaining_timeout``. The default has nothing to stop and returns False.
+        """
         return False
 
     async def save_orchestration_checkpoint(self, task: RuntimeTask) -> dict[str, Any]:
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import re
 from dataclasses import asdict, dataclass, field
+from pathlib import Path
 from typing import Any
 
+from core.build_spec_cache import get_build_spec_cache
+
 
 PHASE_HEADER_PATTERN = re.compile(r"^### Phase (\d+):\s*(.+?)\s*$", re.MULTILINE)
 STATUS_PATTERN = re.compile(r"\*\*Status:\*\*\s*([^\n]+)")
@@ -89,6 +92,16 @@ def parse_build_phases(build_text: str) -> list[PhaseCapabilityRecord]:
     return phases
 
 
+def load_build_phases(build_path: Path) -> list[PhaseCapabilityRecord]:
+    """Parse a BUILD file into phase records, reusing the parse while the file is unchanged.
+
+    Records are shared with other callers through the BUILD spec cache; treat them
+    as read-only.
+    """
+    cache = get_build_spec_cache()
+    return list(cache.get(Path(build_path), "capability_phases", parse_build_phases))
+
+
 def _is_pending_status(status: str) -> bool:
     normalized = str(status).strip().lower()
     return any(token in normalized for token in ("pending", "not_started", "not started", "in_progress", "in progress"))
@@ -99,6 +112,11 @@ def pending_build_phases(build_text: str) -> list[PhaseCapabilityRecord]:
     return [phase for phase in parse_build_phases(build_text) if _is_pending_status(phase.status)]
 
 
+def pending_build_phases_from_file(build_path: Path) -> list[PhaseCapabilityRecord]:
+    """Cached variant of `pending_build_phases` that reads the BUILD file itself."""
+    return [phase for phase in load_build_phases(build_path) if _is_pending_status(phase.status)]
+
+
 def evaluate_phase_capabilities(
     phase: PhaseCapabilityRecord,
     *,
@@ -5,8 +5,6 @@ from __future__ import annotations
 import asyncio
 import json
 import shutil
-import subprocess
-import tempfile
 import time
 from typing import Callable
 
@@ -14,6 +12,8 @@ from core.runtime.policy_result import POLICY_ACTION_BLOCK
 from core.ai_code_review import CodeReviewer
 from core.cluster.cross_model_review import build_review_prompt, log_runtime_capability, parse_findings
 from core.runtime.base import BaseRuntime
+from core.runtime.session_pool import RuntimeSessionPool
+from core.runtime.streaming import StreamEmitter, json_line_emitter
 from core.runtime.types import RuntimeFinding, RuntimeResult, RuntimeTask
 
 
@@ -28,10 +28,12 @@ class ClaudeRuntime(BaseRuntime):
         reviewer_factory: Callable[..., CodeReviewer] | None = None,
         command: str = "claude",
         model: str = "sonnet",
+        session_pool: RuntimeSessionPool | None = None,
     ):
         self._reviewer_factory = reviewer_factory
         self.command = command
         self.model = model
+        self.session_pool = session_pool or RuntimeSessionPool(self.runtime_name)
 
     def get_capabilities(self) -> dict[str, object]:
         return {
@@ -39,7 +41,7 @@ class ClaudeRuntime(BaseRuntime):
             "analysis": False,
             "plan": False,
             "execution": False,
-            "streaming": False,
+            "streaming": True,
             "shell": False,
             "browser": False,
             "subagents": False,
@@ -53,7 +55,19 @@ class ClaudeRuntime(BaseRuntime):
     async def run_review(self, task: RuntimeTask) -> RuntimeResult:
         return await asyncio.to_thread(self._run_review_blocking, task)
 
-    def _run_review_blocking(self, task: RuntimeTask) -> RuntimeResult:
+    async def cancel(self, task_id: str) -> bool:
+        """Kill the Claude CLI process running task_id, if any."""
+        return self.session_pool.cancel(task_id)
+
+    def run_streaming(self, task: RuntimeTask, emit: StreamEmitter) -> RuntimeResult:
+        """Run review with ``--output-format stream-json``, emitting each event line."""
+        if task.task_type == "review":
+            return self._run_review_blocking(task, emit)
+        return super().run_streaming(task, emit)
+
+    def _run_review_blocking(
+        self, task: RuntimeTask, emit: StreamEmitter | None = None
+    ) -> RuntimeResult:
         start = time.time()
         errors = self.validate_task(task)
         if errors:
@@ -120,8 +134,11 @@ class ClaudeRuntime(BaseRuntime):
             )
             return blocked
 
-        if shutil.which(self.command):
-            return self._run_via_claude_cli(task, start, preflight=preflight)
+        cli_path = self.session_pool.probe(
+            f"which:{self.command}", lambda: shutil.which(self.command), ok=bool
+        )
+        if cli_path:
+            return self._run_via_claude_cli(task, start, preflight=preflight, emit=emit)
         if self._reviewer_factory:
             return self._run_via_reviewer_factory(task, start, preflight=preflight)
 
@@ -153,16 +170,19 @@ class ClaudeRuntime(BaseRuntime):
             metadata={"mode": "parallel_shadow", "isolated": True},
         )
 
-    def _run_via_claude_cli(self, task: RuntimeTask, start: float, preflight) -> RuntimeResult:
+    def _run_via_claude_cli(
+        self, task: RuntimeTask, start: float, preflight, emit: StreamEmitter | None = None
+    ) -> RuntimeResult:
         exit_code = None
         try:
-            with tempfile.TemporaryDirectory(prefix="br3-claude-shadow-") as temp_dir:
+            with self.session_pool.workspace("br3-claude-shadow-") as temp_dir:
                 prompt = build_review_prompt(task.diff_text, task.spec_text)
                 cmd = [
                     self.command,
                     "-p",
                     "--output-format",
-                    "json",
+                    "json" if emit is None else "stream-json",
+                    *(() if emit is None else ("--verbose",)),
                     "--dangerously-skip-permissions",
                     "--tools",
                     "",
@@ -170,19 +190,25 @@ class ClaudeRuntime(BaseRuntime):
                     self.model,
                     prompt,
                 ]
-                result = subprocess.run(
+                result = self.session_pool.run(
                     cmd,
+                    prompt=prompt,
                     cwd=temp_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=90,
+                    timeout=self.remaining_timeout(task, 90),
+                    on_line=json_line_emitter(emit) if emit is not None else None,
+                    task_id=task.task_id,
                 )
                 exit_code = result.returncode
                 if result.returncode != 0:
+                    self.session_pool.invalidate()
                     stderr = result.stderr.strip() or "Claude CLI returned a non-zero exit status"
                     raise RuntimeError(stderr)
 
-                payload = json.loads(result.stdout)
+                payload = (
+                    json.loads(result.stdout)
+                    if emit is None
+                    else _stream_json_result(result.stdout)
+                )
                 message = payload.get("result", "")
                 findings = [
                     RuntimeFinding(
@@ -349,3 +375,17 @@ class ClaudeRuntime(BaseRuntime):
                 metrics={"duration_ms": duration_ms, "cost_usd": None, "exit_code": 1},
                 metadata={"mode": "parallel_shadow", "isolated": False},
             )
+
+
+def _stream_json_result(stdout: str) -> dict:
+    """Final ``type: result`` event of ``--output-format stream-json`` output."""
+    for line in reversed(stdout.splitlines()):
+        if not line.strip():
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(event, dict) and event.get("type") == "result":
+            return event
+    raise RuntimeError("Claude CLI stream ended without a result event")
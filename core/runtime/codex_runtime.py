@@ -3,8 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import subprocess
-import tempfile
 import time
 from pathlib import Path
 
@@ -19,6 +17,8 @@ from core.cluster.cross_model_review import (
 )
 from core.runtime.base import BaseRuntime
 from core.runtime.policy_result import POLICY_ACTION_BLOCK
+from core.runtime.session_pool import RuntimeSessionPool
+from core.runtime.streaming import StreamEmitter, json_line_emitter
 from core.runtime.types import RuntimeFinding, RuntimeResult, RuntimeTask
 
 
@@ -28,9 +28,48 @@ class CodexRuntime(BaseRuntime):
     runtime_name = "codex"
     backend_name = "codex-cli"
 
-    def __init__(self, command: str = "codex", timeout_seconds: int = 60):
+    def __init__(
+        self,
+        command: str = "codex",
+        timeout_seconds: int = 60,
+        session_pool: RuntimeSessionPool | None = None,
+    ):
         self.command = command
         self.timeout_seconds = timeout_seconds
+        self.session_pool = session_pool or RuntimeSessionPool(self.runtime_name)
+
+    def _ensure_compatible(self) -> dict:
+        """Version compatibility, cached by the session pool (raises when unsupported)."""
+        return self.session_pool.probe(
+            f"version:{self.command}", lambda: ensure_codex_compatible(self.command)
+        )
+
+    def _check_auth(self, project_root: str) -> tuple[bool, str | None]:
+        """Auth file + CLI probe, cached by the session pool while valid."""
+        return self.session_pool.probe(
+            f"auth:{self.command}",
+            lambda: check_codex_auth(project_root=project_root, command=self.command),
+            ok=lambda outcome: outcome[0],
+        )
+
+    def _run_cli(
+        self,
+        task: RuntimeTask,
+        cmd: list[str],
+        prompt: str,
+        emit: StreamEmitter | None = None,
+    ):
+        result = self.session_pool.run(
+            cmd,
+            prompt=prompt,
+            timeout=self.remaining_timeout(task, self.timeout_seconds),
+            on_line=json_line_emitter(emit) if emit is not None else None,
+            task_id=task.task_id,
+        )
+        if result.returncode != 0:
+            # Auth may have expired or the CLI changed under us — re-probe next task
+            self.session_pool.invalidate()
+        return result
 
     def get_capabilities(self) -> dict[str, object]:
         return {
@@ -58,7 +97,23 @@ class CodexRuntime(BaseRuntime):
     async def run_execution_step(self, task: RuntimeTask) -> RuntimeResult:
         return await asyncio.to_thread(self._run_execution_blocking, task)
 
-    def _run_review_blocking(self, task: RuntimeTask) -> RuntimeResult:
+    async def cancel(self, task_id: str) -> bool:
+        """Kill the Codex CLI process running task_id, if any."""
+        return self.session_pool.cancel(task_id)
+
+    def run_streaming(self, task: RuntimeTask, emit: StreamEmitter) -> RuntimeResult:
+        """Run task, emitting each ``codex exec --json`` event line as it is printed."""
+        if task.task_type == "review":
+            return self._run_review_blocking(task, emit)
+        if task.task_type == "plan":
+            return self._run_plan_blocking(task, emit)
+        if task.task_type == "execution":
+            return self._run_execution_blocking(task, emit)
+        return super().run_streaming(task, emit)
+
+    def _run_review_blocking(
+        self, task: RuntimeTask, emit: StreamEmitter | None = None
+    ) -> RuntimeResult:
         start = time.time()
         exit_code = None
         errors = self.validate_task(task)
@@ -121,9 +176,9 @@ class CodexRuntime(BaseRuntime):
             return blocked
 
         try:
-            with tempfile.TemporaryDirectory(prefix="br3-codex-shadow-") as temp_dir:
+            with self.session_pool.workspace("br3-codex-shadow-") as temp_dir:
                 try:
-                    version_info = ensure_codex_compatible(self.command)
+                    version_info = self._ensure_compatible()
                 except RuntimeError as exc:
                     return RuntimeResult(
                         task_id=task.task_id,
@@ -135,7 +190,7 @@ class CodexRuntime(BaseRuntime):
                         metadata={"mode": "parallel_shadow", "isolated": True},
                     )
 
-                auth_valid, auth_error = check_codex_auth(project_root=temp_dir, command=self.command)
+                auth_valid, auth_error = self._check_auth(temp_dir)
                 if not auth_valid:
                     return RuntimeResult(
                         task_id=task.task_id,
@@ -166,12 +221,7 @@ class CodexRuntime(BaseRuntime):
                     "--",
                     prompt,
                 ]
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=self.timeout_seconds,
-                )
+                result = self._run_cli(task, cmd, prompt, emit)
                 exit_code = result.returncode
                 if result.returncode != 0:
                     stderr = result.stderr.strip() or "Codex returned a non-zero exit status"
@@ -283,11 +333,19 @@ class CodexRuntime(BaseRuntime):
                 metadata={"mode": "parallel_shadow", "isolated": True},
             )
 
-    def _run_plan_blocking(self, task: RuntimeTask) -> RuntimeResult:
-        return self._run_command_task_blocking(task, mode="compiled_command_bundle", cwd_override=None)
+    def _run_plan_blocking(
+        self, task: RuntimeTask, emit: StreamEmitter | None = None
+    ) -> RuntimeResult:
+        return self._run_command_task_blocking(
+            task, mode="compiled_command_bundle", cwd_override=None, emit=emit
+        )
 
-    def _run_execution_blocking(self, task: RuntimeTask) -> RuntimeResult:
-        return self._run_command_task_blocking(task, mode="begin_workflow", cwd_override=task.project_root)
+    def _run_execution_blocking(
+        self, task: RuntimeTask, emit: StreamEmitter | None = None
+    ) -> RuntimeResult:
+        return self._run_command_task_blocking(
+            task, mode="begin_workflow", cwd_override=task.project_root, emit=emit
+        )
 
     def _run_command_task_blocking(
         self,
@@ -295,6 +353,7 @@ class CodexRuntime(BaseRuntime):
         *,
         mode: str,
         cwd_override: str | None,
+        emit: StreamEmitter | None = None,
     ) -> RuntimeResult:
         start = time.time()
         exit_code = None
@@ -329,10 +388,10 @@ class CodexRuntime(BaseRuntime):
             )
 
         try:
-            with tempfile.TemporaryDirectory(prefix="br3-codex-plan-") as temp_dir:
-                version_info = ensure_codex_compatible(self.command)
+            with self.session_pool.workspace("br3-codex-plan-") as temp_dir:
+                version_info = self._ensure_compatible()
                 auth_root = cwd_override or temp_dir
-                auth_valid, auth_error = check_codex_auth(project_root=auth_root, command=self.command)
+                auth_valid, auth_error = self._check_auth(auth_root)
                 if not auth_valid:
                     raise RuntimeError(auth_error)
                 command_cwd = cwd_override or temp_dir
@@ -355,12 +414,7 @@ class CodexRuntime(BaseRuntime):
                     "--",
                     task.spec_text,
                 ]
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=self.timeout_seconds,
-                )
+                result = self._run_cli(task, cmd, task.spec_text, emit)
                 exit_code = result.returncode
                 if result.returncode != 0:
                     stderr = result.stderr.strip() or "Codex returned a non-zero exit status"
@@ -108,6 +108,17 @@ class ContextInjector:
             )
             return task
 
+        section_stats = getattr(bundle, "section_stats", None) or {}
+        if section_stats:
+            hits = sum(1 for stats in section_stats.values() if stats.get("cache_hit"))
+            logger.debug(
+                "ContextInjector: %s bundle sections cached %d/%d, build %.1fms",
+                runtime_name,
+                hits,
+                len(section_stats),
+                sum(stats.get("build_ms", 0.0) for stats in section_stats.values()),
+            )
+
         if not bundle.sections or bundle.token_total == 0:
             return task
 
@@ -125,6 +136,15 @@ class ContextInjector:
         )
         return task_with_context
 
+    def cache_stats(self) -> dict[str, dict[str, float]]:
+        """Per-section bundle cache hit rate and average build time since startup.
+
+        Returns an empty dict until the first bundle has been routed.
+        """
+        if self._router is None:
+            return {}
+        return self._router.cache_stats()
+
 
 def _extract_query(task: "RuntimeTask") -> str:
     """Extract a query string from a RuntimeTask for context routing."""
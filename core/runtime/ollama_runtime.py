@@ -6,16 +6,19 @@ import asyncio
 import json
 import logging
 import os
+import socket
 import subprocess
+import threading
 import time
 import urllib.request
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from core.cluster.cluster_config import get_below_host, get_ollama_port
 from core.cluster.cross_model_review import build_review_prompt, parse_findings
 from core.runtime.base import BaseRuntime
 from core.runtime.claude_runtime import ClaudeRuntime
+from core.runtime.streaming import StreamEmitter
 from core.runtime.types import RuntimeFinding, RuntimeResult, RuntimeTask
 
 logger = logging.getLogger(__name__)
@@ -68,6 +71,64 @@ def _check_ollama_health(base_url: str, port: int = _DEFAULT_OLLAMA_PORT) -> boo
         return False
 
 
+def _response_socket(resp) -> socket.socket | None:
+    """The socket under an urllib response, or None if it cannot be reached."""
+    return getattr(getattr(getattr(resp, "fp", None), "raw", None), "_sock", None)
+
+
+def _set_read_timeout(resp, seconds: float) -> None:
+    """Best-effort: cap the next socket read of an urllib response at ``seconds``."""
+    sock = _response_socket(resp)
+    if sock is not None:
+        sock.settimeout(max(seconds, 0.001))
+
+
+def _abort_response(resp) -> None:
+    """Unblock a read in progress on another thread by shutting the socket down."""
+    sock = _response_socket(resp)
+    try:
+        if sock is not None:
+            sock.shutdown(socket.SHUT_RDWR)
+        resp.close()
+    except OSError:
+        pass
+
+
+def _read_chat_stream(
+    resp, on_token: Callable[[str], None], deadline: float | None = None
+) -> tuple[str, dict[str, Any]]:
+    """Consume a streamed /api/chat response (NDJSON). Returns (message_text, final_line).
+
+    urllib's timeout only bounds each socket read, so ``deadline`` (a
+    ``time.monotonic()`` value) is enforced across the whole stream.
+    """
+    parts: list[str] = []
+    final: dict[str, Any] = {}
+    while True:
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("Ollama stream timed out before the final chunk")
+            _set_read_timeout(resp, remaining)
+        raw = resp.readline()
+        if not raw:
+            break
+        line = raw.decode("utf-8").strip()
+        if not line:
+            continue
+        chunk = json.loads(line)
+        if chunk.get("error"):
+            raise RuntimeError(f"Ollama stream error: {chunk['error']}")
+        token = chunk.get("message", {}).get("content", "")
+        if token:
+            parts.append(token)
+            on_token(token)
+        if chunk.get("done"):
+            final = chunk
+            break
+    return "".join(parts), final
+
+
 class OllamaRuntime(BaseRuntime):
     """Run tasks against Ollama /api/chat on the cluster inference node (Below/Jimmy).
 
@@ -89,6 +150,9 @@ class OllamaRuntime(BaseRuntime):
         self._host = host  # None = resolve from cluster.json at call time
         self.port = port
         self.timeout = timeout
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Any] = {}  # task_id -> open /api/chat response
+        self._cancelled: set[str] = set()
 
     def _get_base_url(self) -> str:
         return self._host if self._host else _resolve_ollama_base_url()
@@ -99,7 +163,7 @@ class OllamaRuntime(BaseRuntime):
             "analysis": True,
             "plan": True,
             "execution": False,
-            "streaming": False,
+            "streaming": True,
             "shell": False,
             "browser": False,
             "subagents": False,
@@ -111,13 +175,26 @@ class OllamaRuntime(BaseRuntime):
             "local_inference": True,
         }
 
-    def _call_ollama(self, prompt: str, base_url: str) -> tuple[str, dict[str, Any]]:
-        """POST to Ollama /api/chat. Returns (message_text, usage_dict)."""
+    def _call_ollama(
+        self,
+        prompt: str,
+        base_url: str,
+        timeout: float | None = None,
+        on_token: Callable[[str], None] | None = None,
+        task_id: str | None = None,
+    ) -> tuple[str, dict[str, Any]]:
+        """POST to Ollama /api/chat. Returns (message_text, usage_dict).
+
+        With ``on_token`` the request is made with ``"stream": true`` and each
+        content delta is passed to it as it arrives; usage comes from the final
+        ``done`` line. With ``task_id`` the open response is registered so
+        ``cancel(task_id)`` can abort it.
+        """
         payload = json.dumps(
             {
                 "model": self.model,
                 "messages": [{"role": "user", "content": prompt}],
-                "stream": False,
+                "stream": on_token is not None,
                 "think": False,
                 "options": {
                     "num_ctx": int(os.environ.get("BR3_OLLAMA_NUM_CTX", "4096")),
@@ -133,13 +210,30 @@ class OllamaRuntime(BaseRuntime):
             headers={"Content-Type": "application/json"},
         )
 
-        with urllib.request.urlopen(req, timeout=self.timeout) as resp:  # noqa: S310
-            status = resp.status
-            if status != 200:
-                raise RuntimeError(f"Ollama returned HTTP {status}")
-            body = json.loads(resp.read().decode("utf-8"))
+        budget = timeout or self.timeout
+        deadline = time.monotonic() + budget
+        with urllib.request.urlopen(req, timeout=budget) as resp:  # noqa: S310
+            if task_id is not None:
+                with self._lock:
+                    self._inflight[task_id] = resp
+            try:
+                status = resp.status
+                if status != 200:
+                    raise RuntimeError(f"Ollama returned HTTP {status}")
+                if on_token is None:
+                    body = json.loads(resp.read().decode("utf-8"))
+                    message = body.get("message", {}).get("content", "")
+                else:
+                    message, body = _read_chat_stream(resp, on_token, deadline)
+            except Exception:
+                self._raise_if_cancelled(task_id)
+                raise
+            finally:
+                if task_id is not None:
+                    with self._lock:
+                        self._inflight.pop(task_id, None)
+            self._raise_if_cancelled(task_id)
 
-        message = body.get("message", {}).get("content", "")
         usage: dict[str, Any] = {
             "prompt_tokens": body.get("prompt_eval_count", 0),
             "completion_tokens": body.get("eval_count", 0),
@@ -147,6 +241,23 @@ class OllamaRuntime(BaseRuntime):
         }
         return message, usage
 
+    def _raise_if_cancelled(self, task_id: str | None) -> None:
+        with self._lock:
+            if task_id not in self._cancelled:
+                return
+            self._cancelled.discard(task_id)
+        raise RuntimeError(f"Ollama request cancelled for task {task_id}")
+
+    async def cancel(self, task_id: str) -> bool:
+        """Abort the /api/chat response open for task_id, if any."""
+        with self._lock:
+            resp = self._inflight.pop(task_id, None)
+            if resp is None:
+                return False
+            self._cancelled.add(task_id)
+        _abort_response(resp)
+        return True
+
     def _fallback_to_claude(self, task: RuntimeTask, reason: str, start: float) -> RuntimeResult:
         """Silently fall back to ClaudeRuntime on health-check failure or 503/timeout."""
         logger.warning(
@@ -181,7 +292,13 @@ class OllamaRuntime(BaseRuntime):
     async def run_review(self, task: RuntimeTask) -> RuntimeResult:
         return await asyncio.to_thread(self._run_blocking, task)
 
-    def _run_blocking(self, task: RuntimeTask) -> RuntimeResult:
+    def run_streaming(self, task: RuntimeTask, emit: StreamEmitter) -> RuntimeResult:
+        """Run review with a streamed /api/chat call, emitting one event per token chunk."""
+        if task.task_type == "review":
+            return self._run_blocking(task, emit)
+        return super().run_streaming(task, emit)
+
+    def _run_blocking(self, task: RuntimeTask, emit: StreamEmitter | None = None) -> RuntimeResult:
         start = time.time()
         base_url = self._get_base_url()
 
@@ -204,13 +321,26 @@ class OllamaRuntime(BaseRuntime):
             )
 
         prompt = build_review_prompt(task.diff_text, task.spec_text)
+        emitted = 0
+
+        def on_token(token: str) -> None:
+            nonlocal emitted
+            emit("token", token)
+            emitted += 1
 
         try:
-            message, usage = self._call_ollama(prompt, base_url)
+            message, usage = self._call_ollama(
+                prompt,
+                base_url,
+                timeout=self.remaining_timeout(task, self.timeout),
+                on_token=on_token if emit is not None else None,
+                task_id=task.task_id,
+            )
         except Exception as exc:  # noqa: BLE001
             error_str = str(exc)
-            # 503 / timeout / connection refused → silent fallback to Claude
-            is_fallback_trigger = (
+            # 503 / timeout / connection refused → silent fallback to Claude, unless
+            # tokens already reached the stream consumer (a fallback would mix outputs)
+            is_fallback_trigger = emitted == 0 and (
                 "503" in error_str
                 or "timed out" in error_str.lower()
                 or "timeout" in error_str.lower()
@@ -235,7 +365,7 @@ class OllamaRuntime(BaseRuntime):
                 error_class=exc.__class__.__name__,
                 error_message=error_str,
                 metrics={"duration_ms": duration_ms, "model": self.model},
-                metadata={"mode": "local_inference"},
+                metadata={"mode": "local_inference", "streamed_chunks": emitted},
             )
 
         duration_ms = int((time.time() - start) * 1000)
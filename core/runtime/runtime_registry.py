@@ -7,6 +7,22 @@ pre-commit hook in .git/hooks/pre-commit enforces this at commit time.
 CLI entry (Phase 2 — unified dispatcher):
     python -m core.runtime.runtime_registry execute <builder> <spec_path>
 
+Batched fan-out:
+    registry.execute_many(tasks, timeout_seconds=300)   # results in task order
+    async for index, result in registry.as_completed(tasks): ...
+
+    Tasks run concurrently under a registry-wide semaphore plus an optional
+    per-runtime limit (RuntimeRegistration.max_concurrency). A deadline is
+    propagated to adapters as task.metadata["deadline_at"] (epoch seconds);
+    tasks still running when it expires are cancelled through
+    BaseRuntime.cancel(task_id) and reported as DeadlineExceeded errors.
+
+Streaming:
+    async for event in registry.stream(task): ...
+
+    Yields StreamEvents (started, token/line chunks, then completed or error)
+    as the adapter produces output; see core.runtime.streaming.
+
 Exit codes:
     0 — success
     2 — unknown builder (not registered)
@@ -16,17 +32,22 @@ Exit codes:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 import os
 import sys
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, replace
 from pathlib import Path
+from typing import AsyncIterator, Iterable
 
-from core.runtime.base import BaseRuntime
+from core.runtime.base import DEADLINE_METADATA_KEY, BaseRuntime
+from core.runtime.result_schema import StreamEvent
 from core.runtime.claude_runtime import ClaudeRuntime
 from core.runtime.codex_runtime import CodexRuntime
 from core.runtime.ollama_runtime import OllamaRuntime
+from core.runtime.session_pool import RuntimeSessionPool, SessionPoolConfig
 from core.runtime.types import RuntimeResult, RuntimeTask
 
 # ---------------------------------------------------------------------------
@@ -87,6 +108,9 @@ logger = logging.getLogger(__name__)
 
 SUPPORTED_RUNTIME_NAMES = ("claude", "codex", "ollama")
 
+# Registry-wide cap on concurrently dispatched tasks in one execute_many() batch
+DEFAULT_MAX_CONCURRENCY = 8
+
 
 @dataclass
 class RuntimeRegistration:
@@ -95,6 +119,7 @@ class RuntimeRegistration:
     name: str
     adapter: BaseRuntime
     dispatch_mode: str = "direct"
+    max_concurrency: int | None = None  # per-runtime cap in execute_many(); None = no cap
 
     def describe(self) -> dict[str, object]:
         return {
@@ -113,8 +138,9 @@ class RuntimeRegistry:
     and always honours ``cache_control`` metadata from the task envelope verbatim.
     """
 
-    def __init__(self):
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
         self._registrations: dict[str, RuntimeRegistration] = {}
+        self.max_concurrency = max_concurrency
 
     def register(self, registration: RuntimeRegistration) -> None:
         self._registrations[registration.name] = registration
@@ -136,6 +162,18 @@ class RuntimeRegistry:
     def supported_names(self) -> list[str]:
         return list(self._registrations.keys())
 
+    def _resolve(self, task: RuntimeTask, caller: str) -> RuntimeRegistration:
+        """Registration for ``task.authoritative_runtime``, falling back to claude."""
+        runtime_name = task.authoritative_runtime or "claude"
+        if runtime_name not in self._registrations:
+            logger.warning(
+                "%s: requested runtime %r not registered; falling back to claude",
+                caller,
+                runtime_name,
+            )
+            runtime_name = "claude"
+        return self._registrations[runtime_name]
+
     def execute(self, task: RuntimeTask) -> RuntimeResult:
         """Synchronous shim — the ONLY authorised path to dispatch a local-model task.
 
@@ -147,18 +185,10 @@ class RuntimeRegistry:
           ``task.metadata.get("cache_control")`` is forwarded verbatim to the
           adapter — never stripped or modified here.
         """
-        runtime_name = task.authoritative_runtime or "claude"
-        if runtime_name not in self._registrations:
-            logger.warning(
-                "execute(): requested runtime %r not registered; falling back to claude",
-                runtime_name,
-            )
-            runtime_name = "claude"
-
-        registration = self._registrations[runtime_name]
+        registration = self._resolve(task, "execute()")
         result = asyncio.run(self._dispatch_to_adapter(registration.adapter, task))
         _emit_runtime_dispatched(
-            runtime_name,
+            registration.name,
             task,
             returncode=0 if result.status == "success" else 1,
         )
@@ -166,23 +196,201 @@ class RuntimeRegistry:
 
     async def execute_async(self, task: RuntimeTask) -> RuntimeResult:
         """Async variant of execute() for callers already in an event loop."""
-        runtime_name = task.authoritative_runtime or "claude"
-        if runtime_name not in self._registrations:
-            logger.warning(
-                "execute_async(): requested runtime %r not registered; falling back to claude",
-                runtime_name,
+        registration = self._resolve(task, "execute_async()")
+        result = await self._dispatch_to_adapter(registration.adapter, task)
+        _emit_runtime_dispatched(
+            registration.name,
+            task,
+            returncode=0 if result.status == "success" else 1,
+        )
+        return result
+
+    async def stream(self, task: RuntimeTask) -> AsyncIterator[StreamEvent]:
+        """Streaming variant of execute_async(): yield StreamEvents as output arrives.
+
+        Routing is identical to execute(). The final event is ``completed``
+        (payload: result dict, ttfb_ms, duration_ms) or ``error``.
+        """
+        registration = self._resolve(task, "stream()")
+        async for event in registration.adapter.stream_events(task):
+            if event.event_type in {"completed", "error"}:
+                status = event.payload.get("result", {}).get("status")
+                _emit_runtime_dispatched(
+                    registration.name,
+                    task,
+                    returncode=0 if status == "success" else 1,
+                )
+            yield event
+
+    def execute_many(
+        self,
+        tasks: Iterable[RuntimeTask],
+        timeout_seconds: float | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[RuntimeResult]:
+        """Synchronous fan-out — dispatch tasks concurrently, results in task order.
+
+        Routing and cache_control handling are identical to execute(). Wall time
+        is bounded by the slowest task (subject to the concurrency limits), not
+        the sum of all tasks.
+        """
+        return asyncio.run(
+            self.execute_many_async(
+                tasks, timeout_seconds=timeout_seconds, max_concurrency=max_concurrency
             )
-            runtime_name = "claude"
+        )
 
-        registration = self._registrations[runtime_name]
-        result = await self._dispatch_to_adapter(registration.adapter, task)
+    async def execute_many_async(
+        self,
+        tasks: Iterable[RuntimeTask],
+        timeout_seconds: float | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[RuntimeResult]:
+        """Async variant of execute_many() for callers already in an event loop."""
+        tasks = list(tasks)
+        results: list[RuntimeResult | None] = [None] * len(tasks)
+        async for index, result in self.as_completed(
+            tasks, timeout_seconds=timeout_seconds, max_concurrency=max_concurrency
+        ):
+            results[index] = result
+        return results
+
+    async def as_completed(
+        self,
+        tasks: Iterable[RuntimeTask],
+        timeout_seconds: float | None = None,
+        max_concurrency: int | None = None,
+    ) -> AsyncIterator[tuple[int, RuntimeResult]]:
+        """Dispatch tasks concurrently and yield ``(index, result)`` as each finishes.
+
+        Args:
+            tasks:           Tasks to dispatch; each is routed like execute().
+            timeout_seconds: Deadline for the whole batch. It is propagated to
+                             adapters via task.metadata["deadline_at"]; tasks still
+                             running when it expires are cancelled and yielded as
+                             DeadlineExceeded error results.
+            max_concurrency: Batch-wide cap (defaults to the registry's). Per-runtime
+                             caps come from RuntimeRegistration.max_concurrency.
+
+        Adapter exceptions are yielded as error results rather than aborting the
+        batch. If the consumer stops iterating early, the remaining tasks are
+        cancelled through BaseRuntime.cancel().
+        """
+        tasks = list(tasks)
+        deadline_at = time.time() + timeout_seconds if timeout_seconds is not None else None
+        global_slots = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        runtime_slots = {
+            name: asyncio.Semaphore(registration.max_concurrency)
+            for name, registration in self._registrations.items()
+            if registration.max_concurrency
+        }
+
+        pending: dict[asyncio.Task, tuple[int, RuntimeRegistration, RuntimeTask]] = {}
+        for index, task in enumerate(tasks):
+            registration = self._resolve(task, "as_completed()")
+            if deadline_at is not None:
+                task = replace(task, metadata={**task.metadata, DEADLINE_METADATA_KEY: deadline_at})
+            future = asyncio.create_task(
+                self._dispatch_limited(
+                    registration,
+                    task,
+                    global_slots,
+                    runtime_slots.get(registration.name),
+                )
+            )
+            pending[future] = (index, registration, task)
+
+        try:
+            while pending:
+                remaining = None if deadline_at is None else max(deadline_at - time.time(), 0)
+                done, _ = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for future in done:
+                    index, registration, task = pending.pop(future)
+                    yield index, self._finish(registration, task, future)
+
+            # Deadline expired with tasks still running
+            while pending:
+                future, (index, registration, task) = pending.popitem()
+                cancelled = await self._cancel_dispatch(future, registration, task)
+                result = RuntimeResult(
+                    task_id=task.task_id,
+                    runtime=registration.name,
+                    backend=registration.adapter.backend_name,
+                    status="error",
+                    error_class="DeadlineExceeded",
+                    error_message=f"Deadline of {timeout_seconds}s exceeded; task cancelled",
+                    metadata={"backend_cancelled": cancelled},
+                )
+                _emit_runtime_dispatched(registration.name, task, returncode=1)
+                yield index, result
+        finally:
+            # Consumer stopped early (break / aclose / outer cancellation)
+            for future, (_index, registration, task) in pending.items():
+                await self._cancel_dispatch(future, registration, task)
+
+    async def _dispatch_limited(
+        self,
+        registration: RuntimeRegistration,
+        task: RuntimeTask,
+        global_slots: asyncio.Semaphore,
+        runtime_slots: asyncio.Semaphore | None,
+    ) -> RuntimeResult:
+        # Take the runtime slot first so a saturated runtime never holds global slots
+        async with runtime_slots or contextlib.nullcontext():
+            async with global_slots:
+                return await self._dispatch_to_adapter(registration.adapter, task)
+
+    @staticmethod
+    def _finish(
+        registration: RuntimeRegistration, task: RuntimeTask, future: asyncio.Task
+    ) -> RuntimeResult:
+        """Turn a finished dispatch into a result, converting adapter exceptions."""
+        exc = future.exception()
+        if exc is None:
+            result = future.result()
+        else:
+            logger.warning(
+                "as_completed(): runtime %r raised for task %s: %s",
+                registration.name,
+                task.task_id,
+                exc,
+            )
+            result = RuntimeResult(
+                task_id=task.task_id,
+                runtime=registration.name,
+                backend=registration.adapter.backend_name,
+                status="error",
+                error_class=exc.__class__.__name__,
+                error_message=str(exc),
+            )
         _emit_runtime_dispatched(
-            runtime_name,
+            registration.name,
             task,
             returncode=0 if result.status == "success" else 1,
         )
         return result
 
+    @staticmethod
+    async def _cancel_dispatch(
+        future: asyncio.Task, registration: RuntimeRegistration, task: RuntimeTask
+    ) -> bool:
+        """Cancel a running dispatch locally and in the backend. Never raises."""
+        future.cancel()
+        try:
+            return bool(await registration.adapter.cancel(task.task_id))
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "as_completed(): cancel failed for %r task %s: %s",
+                registration.name,
+                task.task_id,
+                exc,
+            )
+            return False
+
     @staticmethod
     async def _dispatch_to_adapter(adapter: BaseRuntime, task: RuntimeTask) -> RuntimeResult:
         """Route to the correct adapter method by task_type."""
@@ -207,11 +415,24 @@ class RuntimeRegistry:
 def create_runtime_registry(config: dict | None = None) -> RuntimeRegistry:
     """Build the runtime registry used by BR3 runtime-aware paths."""
     config = config or {}
-    timeout = config.get("backends", {}).get("codex", {}).get("timeout_seconds", 60)
-    ollama_cfg = config.get("backends", {}).get("ollama", {})
+    backends = config.get("backends", {})
+    timeout = backends.get("codex", {}).get("timeout_seconds", 60)
+    ollama_cfg = backends.get("ollama", {})
     registry = RuntimeRegistry()
-    registry.register(RuntimeRegistration(name="claude", adapter=ClaudeRuntime()))
-    registry.register(RuntimeRegistration(name="codex", adapter=CodexRuntime(timeout_seconds=timeout)))
+    registry.register(
+        RuntimeRegistration(
+            name="claude",
+            adapter=ClaudeRuntime(session_pool=_session_pool("claude", backends)),
+        )
+    )
+    registry.register(
+        RuntimeRegistration(
+            name="codex",
+            adapter=CodexRuntime(
+                timeout_seconds=timeout, session_pool=_session_pool("codex", backends)
+            ),
+        )
+    )
     registry.register(
         RuntimeRegistration(
             name="ollama",
@@ -227,6 +448,12 @@ def create_runtime_registry(config: dict | None = None) -> RuntimeRegistry:
     return registry
 
 
+def _session_pool(name: str, backends: dict) -> RuntimeSessionPool:
+    """Session pool for a CLI runtime from ``backends.<name>.session_pool``."""
+    pool_cfg = SessionPoolConfig.from_dict(backends.get(name, {}).get("session_pool"))
+    return RuntimeSessionPool(name, pool_cfg)
+
+
 def create_phase1_runtime_registry(config: dict | None = None) -> RuntimeRegistry:
     """Backward-compatible alias for the Phase 1 shadow registry."""
     return create_runtime_registry(config)
@@ -0,0 +1,436 @@
+"""Warm session pool for CLI-backed runtimes (codex, claude).
+
+Every CLI review used to pay for a fresh temp workspace, a ``--version``
+compatibility probe, an auth probe (itself a full CLI exec) and a new CLI
+process. The pool removes that per-task startup cost:
+
+  - probe results (version, auth, binary lookup) are cached with a TTL;
+    failures are never cached, and a failed CLI run invalidates the cache
+  - isolated workspaces are pre-created, wiped between tasks, health-checked
+    on release and recycled after ``recycle_after`` uses
+  - optional long-lived CLI worker processes (``worker_command``) are reused
+    across tasks, health-checked on checkout and recycled after
+    ``recycle_after`` tasks
+
+Worker protocol (one JSON object per line on stdin/stdout):
+    request:  {"id": "...", "argv": [...], "prompt": "...", "cwd": "..."}
+    response: {"id": "...", "returncode": 0, "stdout": "...", "stderr": "..."}
+``stdout`` is exactly what the one-shot CLI invocation (``argv``) would print,
+so runtimes parse both paths identically.
+
+With ``enabled=False`` the pool degrades to the original behaviour: a fresh
+TemporaryDirectory, an uncached probe and a one-shot subprocess per task.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class SessionPoolConfig:
+    """Tunables for one runtime's session pool."""
+
+    enabled: bool = True
+    probe_ttl_seconds: float = 300.0
+    max_idle_workspaces: int = 4
+    recycle_after: int = 50
+    worker_command: list[str] | None = None
+    max_idle_workers: int = 2
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any] | None) -> "SessionPoolConfig":
+        """Build from a ``backends.<runtime>.session_pool`` config block."""
+        payload = payload or {}
+        fields = cls.__dataclass_fields__
+        return cls(**{key: value for key, value in payload.items() if key in fields})
+
+
+class CliWorker:
+    """A long-lived CLI process answering JSON-lines requests."""
+
+    def __init__(self, argv: list[str]):
+        self.argv = list(argv)
+        self.tasks_served = 0
+        self._process = subprocess.Popen(
+            self.argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        self._responses: queue.Queue[str | None] = queue.Queue()
+        self._reader = threading.Thread(
+            target=self._read_responses, name="cli-worker-reader", daemon=True
+        )
+        self._reader.start()
+
+    def _read_responses(self) -> None:
+        for line in self._process.stdout:
+            self._responses.put(line)
+        self._responses.put(None)  # EOF — worker exited
+
+    def healthy(self) -> bool:
+        return self._process.poll() is None
+
+    def run(
+        self, argv: list[str], prompt: str, cwd: str | None, timeout: float
+    ) -> subprocess.CompletedProcess:
+        """Send one request and wait for its response.
+
+        Raises:
+            subprocess.TimeoutExpired: no response within timeout (worker is killed).
+            RuntimeError:              worker exited or sent a malformed response.
+        """
+        request_id = uuid.uuid4().hex
+        request = {"id": request_id, "argv": argv, "prompt": prompt, "cwd": cwd}
+        try:
+            self._process.stdin.write(json.dumps(request) + "\n")
+            self._process.stdin.flush()
+        except OSError as exc:
+            raise RuntimeError(f"CLI worker {self.argv[0]} is not accepting requests: {exc}")
+
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = self._responses.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self.close()
+                raise subprocess.TimeoutExpired(argv, timeout)
+            if line is None:
+                raise RuntimeError(f"CLI worker {self.argv[0]} exited mid-request")
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                logger.debug("CliWorker: ignoring non-JSON output line: %r", line[:200])
+                continue
+            if response.get("id") != request_id:
+                continue
+            self.tasks_served += 1
+            return subprocess.CompletedProcess(
+                argv,
+                int(response.get("returncode", 1)),
+                stdout=response.get("stdout", ""),
+                stderr=response.get("stderr", ""),
+            )
+
+    def close(self) -> None:
+        if self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+        for stream in (self._process.stdin, self._process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+def _release_all(workspaces: list[tuple[str, int]], workers: list[CliWorker]) -> None:
+    for path, _uses in workspaces:
+        shutil.rmtree(path, ignore_errors=True)
+    for worker in workers:
+        worker.close()
+    workspaces.clear()
+    workers.clear()
+
+
+class RuntimeSessionPool:
+    """Cached probes, reusable workspaces and optional warm CLI workers for one runtime.
+
+    Usage::
+
+        pool = RuntimeSessionPool("codex")
+        version = pool.probe("version:codex", lambda: ensure_codex_compatible("codex"))
+        with pool.workspace("br3-codex-shadow-") as workspace:
+            result = pool.run(cmd, prompt=prompt, timeout=60)
+    """
+
+    def __init__(self, name: str, config: SessionPoolConfig | None = None):
+        self.name = name
+        self.config = config or SessionPoolConfig()
+        self._lock = threading.Lock()
+        self._probes: dict[str, tuple[float, Any]] = {}
+        self._idle_workspaces: list[tuple[str, int]] = []
+        self._idle_workers: list[CliWorker] = []
+        self._running: dict[str, Callable[[], None]] = {}  # task_id -> kill its CLI process
+        self._stats = {
+            "probe_hits": 0,
+            "probe_misses": 0,
+            "workspaces_created": 0,
+            "workspaces_reused": 0,
+            "workspaces_recycled": 0,
+            "workers_started": 0,
+            "worker_tasks": 0,
+            "workers_recycled": 0,
+        }
+        # Idle workspaces and workers are released when the pool is collected or at exit
+        self._finalizer = weakref.finalize(
+            self, _release_all, self._idle_workspaces, self._idle_workers
+        )
+
+    # -- probes --------------------------------------------------------------
+
+    def probe(self, key: str, fn: Callable[[], T], ok: Callable[[T], bool] = lambda _: True) -> T:
+        """Return a cached probe result, running ``fn`` on a miss or after the TTL.
+
+        Only results for which ``ok(result)`` is true are cached; exceptions
+        propagate and are never cached, so a fixed install/login is picked up
+        on the next task.
+        """
+        if self.config.enabled:
+            with self._lock:
+                cached = self._probes.get(key)
+                if cached is not None and cached[0] > time.monotonic():
+                    self._stats["probe_hits"] += 1
+                    return cached[1]
+
+        result = fn()
+        with self._lock:
+            self._stats["probe_misses"] += 1
+            if self.config.enabled and ok(result):
+                self._probes[key] = (time.monotonic() + self.config.probe_ttl_seconds, result)
+        return result
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Drop one cached probe result (or all of them)."""
+        with self._lock:
+            if key is None:
+                self._probes.clear()
+            else:
+                self._probes.pop(key, None)
+
+    # -- workspaces ----------------------------------------------------------
+
+    @contextmanager
+    def workspace(self, prefix: str) -> Iterator[str]:
+        """Check out an empty, isolated workspace directory for one task."""
+        if not self.config.enabled:
+            with tempfile.TemporaryDirectory(prefix=prefix) as temp_dir:
+                yield temp_dir
+            return
+
+        with self._lock:
+            path, uses = self._idle_workspaces.pop() if self._idle_workspaces else (None, 0)
+            self._stats["workspaces_reused" if path else "workspaces_created"] += 1
+        if path is None:
+            path = tempfile.mkdtemp(prefix=f"br3-{self.name}-pool-")
+
+        try:
+            yield path
+        finally:
+            self._release_workspace(path, uses + 1)
+
+    def _release_workspace(self, path: str, uses: int) -> None:
+        reusable = uses < self.config.recycle_after and _wipe_directory(path)
+        with self._lock:
+            if reusable and len(self._idle_workspaces) < self.config.max_idle_workspaces:
+                self._idle_workspaces.append((path, uses))
+                return
+            self._stats["workspaces_recycled"] += 1
+        shutil.rmtree(path, ignore_errors=True)
+
+    # -- CLI execution -------------------------------------------------------
+
+    def run(
+        self,
+        argv: list[str],
+        *,
+        prompt: str,
+        timeout: float,
+        cwd: str | None = None,
+        on_line: Callable[[str], None] | None = None,
+        task_id: str | None = None,
+    ) -> subprocess.CompletedProcess:
+        """Run one CLI invocation, on a warm worker when one is configured.
+
+        Without ``worker_command`` (or with the pool disabled) this is the plain
+        one-shot ``subprocess.run(argv, ...)`` the runtimes always used.
+
+        ``on_line`` is called with each stdout line as it is produced (one-shot
+        runs stream live; worker responses are replayed line by line). If it
+        raises, the CLI process is killed and the exception propagates.
+
+        With ``task_id`` the process is registered so ``cancel(task_id)`` can kill
+        it while it runs.
+        """
+        if not (self.config.enabled and self.config.worker_command):
+            if on_line is None and task_id is None:
+                return subprocess.run(
+                    argv, cwd=cwd, capture_output=True, text=True, timeout=timeout
+                )
+            try:
+                return _run_streaming_subprocess(
+                    argv, cwd, timeout, on_line,
+                    on_start=lambda process: self._track(task_id, process.kill),
+                )
+            finally:
+                self._untrack(task_id)
+
+        worker = self._checkout_worker()
+        self._track(task_id, worker.close)
+        try:
+            result = worker.run(argv, prompt, cwd, timeout)
+        except BaseException:
+            worker.close()
+            raise
+        finally:
+            self._untrack(task_id)
+        self._release_worker(worker)
+        if on_line is not None:
+            for line in result.stdout.splitlines():
+                on_line(line)
+        return result
+
+    def cancel(self, task_id: str) -> bool:
+        """Kill the CLI process running task_id; True if one was running.
+
+        A killed one-shot run returns a negative returncode; a killed worker
+        makes its ``run`` raise and is discarded rather than reused.
+        """
+        with self._lock:
+            kill = self._running.pop(task_id, None)
+        if kill is None:
+            return False
+        kill()
+        return True
+
+    def _track(self, task_id: str | None, kill: Callable[[], None]) -> None:
+        if task_id is not None:
+            with self._lock:
+                self._running[task_id] = kill
+
+    def _untrack(self, task_id: str | None) -> None:
+        if task_id is not None:
+            with self._lock:
+                self._running.pop(task_id, None)
+
+    def _checkout_worker(self) -> CliWorker:
+        with self._lock:
+            while self._idle_workers:
+                worker = self._idle_workers.pop()
+                if worker.healthy():
+                    return worker
+                self._stats["workers_recycled"] += 1
+                worker.close()
+            self._stats["workers_started"] += 1
+        logger.debug("RuntimeSessionPool[%s]: starting CLI worker", self.name)
+        return CliWorker(self.config.worker_command)
+
+    def _release_worker(self, worker: CliWorker) -> None:
+        with self._lock:
+            self._stats["worker_tasks"] += 1
+            if (
+                worker.healthy()
+                and worker.tasks_served < self.config.recycle_after
+                and len(self._idle_workers) < self.config.max_idle_workers
+            ):
+                self._idle_workers.append(worker)
+                return
+            self._stats["workers_recycled"] += 1
+        worker.close()
+
+    # -- lifecycle -----------------------------------------------------------
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                **self._stats,
+                "idle_workspaces": len(self._idle_workspaces),
+                "idle_workers": len(self._idle_workers),
+            }
+
+    def close(self) -> None:
+        """Remove idle workspaces and stop idle workers."""
+        with self._lock:
+            _release_all(self._idle_workspaces, self._idle_workers)
+            self._probes.clear()
+
+
+def _run_streaming_subprocess(
+    argv: list[str],
+    cwd: str | None,
+    timeout: float,
+    on_line: Callable[[str], None] | None,
+    on_start: Callable[[subprocess.Popen], None] | None = None,
+) -> subprocess.CompletedProcess:
+    """subprocess.run equivalent that hands each stdout line to on_line as it arrives.
+
+    ``on_start`` receives the process right after it is spawned (for cancellation).
+    """
+    process = subprocess.Popen(
+        argv, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1
+    )
+    if on_start is not None:
+        on_start(process)
+    stderr_chunks: list[str] = []
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True
+    )
+    stderr_reader.start()
+    timed_out = threading.Event()
+
+    def expire() -> None:
+        timed_out.set()
+        process.kill()
+
+    timer = threading.Timer(timeout, expire)
+    timer.start()
+    stdout_lines: list[str] = []
+    try:
+        for line in process.stdout:
+            stdout_lines.append(line)
+            if on_line is not None:
+                on_line(line.rstrip("\n"))
+        returncode = process.wait()
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        timer.cancel()
+        stderr_reader.join(timeout=5)
+        process.stdout.close()
+        process.stderr.close()
+
+    stdout = "".join(stdout_lines)
+    stderr = "".join(stderr_chunks)
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(argv, timeout, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(argv, returncode, stdout=stdout, stderr=stderr)
+
+
+def _wipe_directory(path: str) -> bool:
+    """Empty a workspace in place; False if it is missing or cannot be cleaned."""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        return os.access(path, os.W_OK)
+    except OSError as exc:
+        logger.debug("RuntimeSessionPool: discarding workspace %s: %s", path, exc)
+        return False
@@ -0,0 +1,195 @@
+"""Streaming bridge between blocking runtime adapters and async consumers.
+
+Adapters do their CLI/HTTP work on a worker thread. While running they report
+token- or line-level chunks through an ``emit(event_type, message, payload)``
+callback; ``stream_blocking`` turns those into an async iterator of
+``StreamEvent`` for dashboards, the websocket broadcaster and API responses.
+
+Event sequence for one run:
+    started    → emitted immediately
+    token/line → adapter chunks, as they arrive
+    completed  → payload: result (RuntimeResult dict), ttfb_ms, duration_ms, chunks
+    error      → instead of completed, if the adapter raised
+
+Backpressure: chunks pass through a bounded buffer (``max_buffer`` events).
+When the consumer falls behind, ``emit`` blocks the adapter thread until there
+is room. If the consumer stops iterating, ``emit`` raises ``StreamClosed`` so
+the adapter unwinds (and kills its subprocess) instead of blocking forever.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Protocol
+
+from core.runtime.result_schema import StreamEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STREAM_BUFFER = 256
+
+# Event types that carry adapter output; the first one marks time-to-first-byte
+CHUNK_EVENT_TYPES = frozenset({"token", "line"})
+
+_END = object()
+
+
+class StreamClosed(RuntimeError):
+    """The consumer stopped reading; the producing adapter should stop."""
+
+
+class StreamEmitter(Protocol):
+    def __call__(
+        self, event_type: str, message: str = "", payload: dict[str, Any] | None = None
+    ) -> None: ...
+
+
+def json_line_emitter(emit: StreamEmitter) -> Callable[[str], None]:
+    """Per-line callback emitting ``line`` events; JSON lines carry the parsed object."""
+
+    def on_line(line: str) -> None:
+        if not line.strip():
+            return
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            event = None
+        emit("line", line, event if isinstance(event, dict) else None)
+
+    return on_line
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class EventStream:
+    """Bounded, thread-safe event buffer drained by an async consumer."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_buffer: int = DEFAULT_STREAM_BUFFER):
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffer)
+        self._closed = threading.Event()
+        self._sequence = 0
+        self._sequence_lock = threading.Lock()
+
+    def event(
+        self, event_type: str, message: str = "", payload: dict[str, Any] | None = None
+    ) -> StreamEvent:
+        with self._sequence_lock:
+            self._sequence += 1
+            sequence = self._sequence
+        return StreamEvent(
+            event_type=event_type,
+            sequence=sequence,
+            message=message,
+            payload=payload or {},
+            timestamp=_utc_now(),
+        )
+
+    def emit(
+        self, event_type: str, message: str = "", payload: dict[str, Any] | None = None
+    ) -> None:
+        """Queue a chunk from the producer thread, blocking while the buffer is full."""
+        self._put(self.event(event_type, message, payload))
+
+    def finish(self) -> None:
+        """Mark the end of the stream (producer thread)."""
+        try:
+            self._put(_END)
+        except StreamClosed:
+            pass
+
+    def close(self) -> None:
+        """Consumer is done; unblock and stop the producer."""
+        self._closed.set()
+
+    def _put(self, item: object) -> None:
+        if self._closed.is_set():
+            raise StreamClosed("stream consumer has gone away")
+        future = asyncio.run_coroutine_threadsafe(self._queue.put(item), self._loop)
+        while True:
+            try:
+                future.result(timeout=0.25)
+                return
+            except concurrent.futures.TimeoutError:
+                if self._closed.is_set():
+                    future.cancel()
+                    raise StreamClosed("stream consumer has gone away")
+
+    def __aiter__(self) -> "EventStream":
+        return self
+
+    async def __anext__(self) -> StreamEvent:
+        item = await self._queue.get()
+        if item is _END:
+            raise StopAsyncIteration
+        return item
+
+
+async def stream_blocking(
+    producer: Callable[[StreamEmitter], Any],
+    max_buffer: int = DEFAULT_STREAM_BUFFER,
+) -> AsyncIterator[StreamEvent]:
+    """Run ``producer(emit)`` on a worker thread and yield its events as they arrive.
+
+    Args:
+        producer:   Blocking callable that reports chunks via ``emit`` and returns
+                    the RuntimeResult.
+        max_buffer: Events buffered before ``emit`` blocks the producer.
+
+    The final ``completed`` event carries the result dict plus ``ttfb_ms``
+    (time to the first token/line chunk; None if the adapter produced none),
+    ``duration_ms`` and the chunk count; the same numbers are recorded in the
+    result's ``metrics``.
+    """
+    stream = EventStream(asyncio.get_running_loop(), max_buffer)
+    start = time.monotonic()
+    yield stream.event("started")
+
+    def produce() -> Any:
+        try:
+            return producer(stream.emit)
+        finally:
+            stream.finish()
+
+    worker = asyncio.ensure_future(asyncio.to_thread(produce))
+    ttfb_ms: float | None = None
+    chunks = 0
+    try:
+        async for event in stream:
+            if event.event_type in CHUNK_EVENT_TYPES:
+                chunks += 1
+                if ttfb_ms is None:
+                    ttfb_ms = round((time.monotonic() - start) * 1000, 1)
+            yield event
+
+        try:
+            result = await worker
+        except Exception as exc:  # noqa: BLE001 — surfaced as a terminal error event
+            logger.warning("stream_blocking: producer raised: %s", exc)
+            yield stream.event(
+                "error", str(exc), {"error_class": exc.__class__.__name__}
+            )
+            return
+
+        timing = {
+            "ttfb_ms": ttfb_ms,
+            "duration_ms": round((time.monotonic() - start) * 1000, 1),
+            "chunks": chunks,
+        }
+        if hasattr(result, "metrics"):
+            result.metrics.update(timing)
+        logger.debug("stream_blocking: %s", timing)
+        payload = {"result": result.to_dict() if hasattr(result, "to_dict") else result}
+        yield stream.event("completed", payload={**payload, **timing})
+    finally:
+        stream.close()
+        # An abandoned producer ends with StreamClosed; don't warn about it
+        worker.add_done_callback(lambda done: done.cancelled() or done.exception())
@@ -10,7 +10,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from core.runtime.capability_gate import pending_build_phases, evaluate_phase_capabilities
+from core.runtime.capability_gate import pending_build_phases_from_file, evaluate_phase_capabilities
 from core.runtime.command_compiler import compile_command_bundle
 from core.runtime.context_compiler import compile_command_task
 from core.runtime.runtime_registry import RuntimeRegistry, create_runtime_registry
@@ -191,8 +191,7 @@ async def run_begin_workflow(
         result.notes.append("BR3 approval gate blocked `/begin` execution before any phase lock was acquired.")
         return result
 
-    build_text = build_path.read_text(encoding="utf-8")
-    phases = pending_build_phases(build_text)
+    phases = pending_build_phases_from_file(build_path)
     if request.allowed_phase_numbers:
         allowed = set(request.allowed_phase_numbers)
         phases = [phase for phase in phases if phase.number in allowed]
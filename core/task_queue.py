@@ -3,13 +3,22 @@ Task Queue Manager
 
 Manages execution queue for task orchestration. Handles task queuing,
 dequeuing, status tracking, and completion management.
+
+Readiness is tracked incrementally: each task keeps a count of unmet
+dependencies and a reverse index maps a task to its dependents, so
+completing a task only touches the tasks that depend on it. Ready tasks sit
+on a heap ordered by PriorityScheduler score (or first-ready order when no
+scheduler is configured).
 """
 
+import heapq
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime
 
+from core.priority_scheduler import PriorityScheduler
+
 
 class TaskStatus(Enum):
     """Task execution status"""
@@ -61,18 +70,60 @@ class TaskQueue:
     - Handle dependencies
     - Manage completion
     - Support retries
+
+    Status changes must go through queue methods (use set_status() when
+    restoring state) so the ready-set index stays consistent.
     """
 
-    def __init__(self, max_retries: int = 3):
+    def __init__(self, max_retries: int = 3, scheduler: Optional[PriorityScheduler] = None):
+        """
+        Initialize queue.
+
+        Args:
+            max_retries: Attempts allowed before a task is marked failed
+            scheduler: Orders ready tasks by priority score; ready tasks are
+                served in the order they became ready when omitted
+        """
         self.tasks: Dict[str, QueuedTask] = {}
-        self.execution_order: List[str] = []
         self.max_retries = max_retries
+        self.scheduler = scheduler
 
         # Statistics
         self.tasks_queued = 0
         self.tasks_completed = 0
         self.tasks_failed = 0
 
+        self._reset_index()
+
+    def _reset_index(self):
+        """Reset ready-set tracking"""
+        # dependency id -> ids of tasks that list it (may be added before the dependency)
+        self._dependents: Dict[str, List[str]] = {}
+        # task id -> dependencies not yet completed
+        self._unmet: Dict[str, int] = {}
+        # task id -> position in execution order (first time the task became ready)
+        self._order: Dict[str, int] = {}
+        # (-score, position, task id); entries for tasks no longer READY are dropped lazily
+        self._ready_heap: List[Tuple[float, int, str]] = []
+        self._in_heap: Set[str] = set()
+        # Tasks added as PENDING that have not yet been marked BLOCKED
+        self._unclassified: List[str] = []
+
+    @property
+    def execution_order(self) -> List[str]:
+        """Task IDs in the order they first became ready"""
+        return list(self._order)
+
+    @execution_order.setter
+    def execution_order(self, order: List[str]):
+        """Restore a saved execution order and rebuild the ready heap from it"""
+        self._order = {task_id: position for position, task_id in enumerate(dict.fromkeys(order))}
+        self._ready_heap = []
+        self._in_heap = set()
+        for task in self.tasks.values():
+            if task.status == TaskStatus.READY:
+                self._push_ready(task)
+
     def add_task(self, task: QueuedTask) -> bool:
         """
         Add task to queue.
@@ -89,11 +140,24 @@ class TaskQueue:
         self.tasks[task.id] = task
         self.tasks_queued += 1
 
-        # Update execution order if task is ready
-        if self._is_ready(task):
+        unmet = 0
+        for dep_id in task.dependencies:
+            self._dependents.setdefault(dep_id, []).append(task.id)
+            dep_task = self.tasks.get(dep_id)
+            if not dep_task or dep_task.status != TaskStatus.COMPLETED:
+                unmet += 1
+        self._unmet[task.id] = unmet
+
+        if task.status == TaskStatus.COMPLETED:
+            # Restored as completed: release anything already waiting on it
+            self._release_dependents(task.id)
+        elif task.status == TaskStatus.READY or (
+            unmet == 0 and task.status in (TaskStatus.PENDING, TaskStatus.BLOCKED)
+        ):
             task.status = TaskStatus.READY
-            if task.id not in self.execution_order:
-                self.execution_order.append(task.id)
+            self._push_ready(task)
+        elif task.status == TaskStatus.PENDING:
+            self._unclassified.append(task.id)
 
         return True
 
@@ -117,14 +181,17 @@ class TaskQueue:
         Returns:
             Next ready task, or None if queue empty
         """
-        # Update ready status for all pending tasks
         self._update_ready_tasks()
 
-        # Find first ready task in execution order
-        for task_id in self.execution_order:
+        # Drop heap entries for tasks that were started, skipped or removed since
+        heap = self._ready_heap
+        while heap:
+            task_id = heap[0][2]
             task = self.tasks.get(task_id)
             if task and task.status == TaskStatus.READY:
                 return task
+            heapq.heappop(heap)
+            self._in_heap.discard(task_id)
 
         return None
 
@@ -163,11 +230,10 @@ class TaskQueue:
         if not task:
             return False
 
-        task.status = TaskStatus.COMPLETED
+        self._set_status(task, TaskStatus.COMPLETED)
         task.completed_at = datetime.now()
         self.tasks_completed += 1
 
-        # Update dependent tasks
         self._update_ready_tasks()
 
         return True
@@ -192,14 +258,14 @@ class TaskQueue:
 
         if task.retry_count < self.max_retries:
             # Retry - reset to ready
-            task.status = TaskStatus.READY
+            self._set_status(task, TaskStatus.READY)
             task.started_at = None
             return True
         else:
             # Max retries exceeded - only increment failed count once
             if task.status != TaskStatus.FAILED:
                 self.tasks_failed += 1
-            task.status = TaskStatus.FAILED
+            self._set_status(task, TaskStatus.FAILED)
             return False
 
     def skip_task(self, task_id: str, reason: str) -> bool:
@@ -217,10 +283,30 @@ class TaskQueue:
         if not task:
             return False
 
-        task.status = TaskStatus.SKIPPED
+        self._set_status(task, TaskStatus.SKIPPED)
         task.error_message = f"Skipped: {reason}"
         return True
 
+    def set_status(self, task_id: str, status: TaskStatus) -> bool:
+        """
+        Set a task's status directly, e.g. when restoring from a checkpoint.
+
+        Unlike complete_task(), statistics and timestamps are left untouched.
+
+        Args:
+            task_id: ID of task to update
+            status: New status
+
+        Returns:
+            True if updated, False if task not found
+        """
+        task = self.tasks.get(task_id)
+        if not task:
+            return False
+
+        self._set_status(task, status)
+        return True
+
     def get_task(self, task_id: str) -> Optional[QueuedTask]:
         """Get task by ID"""
         return self.tasks.get(task_id)
@@ -297,33 +383,67 @@ class TaskQueue:
     def clear(self):
         """Clear all tasks from queue"""
         self.tasks = {}
-        self.execution_order = []
         self.tasks_queued = 0
         self.tasks_completed = 0
         self.tasks_failed = 0
+        self._reset_index()
 
     def _is_ready(self, task: QueuedTask) -> bool:
         """Check if task is ready (all dependencies completed)"""
-        if not task.dependencies:
-            return True
-
-        for dep_id in task.dependencies:
-            dep_task = self.tasks.get(dep_id)
-            if not dep_task or dep_task.status != TaskStatus.COMPLETED:
-                return False
-
-        return True
+        return self._unmet.get(task.id, 0) == 0
 
     def _update_ready_tasks(self):
-        """Update ready status for all pending/blocked tasks"""
-        for task in self.tasks.values():
-            if task.status in [TaskStatus.PENDING, TaskStatus.BLOCKED]:
-                if self._is_ready(task):
-                    task.status = TaskStatus.READY
-                    if task.id not in self.execution_order:
-                        self.execution_order.append(task.id)
-                else:
-                    task.status = TaskStatus.BLOCKED
+        """Mark newly added tasks with unmet dependencies as blocked"""
+        for task_id in self._unclassified:
+            task = self.tasks.get(task_id)
+            if task and task.status == TaskStatus.PENDING:
+                task.status = TaskStatus.BLOCKED
+        self._unclassified = []
+
+    def _set_status(self, task: QueuedTask, status: TaskStatus):
+        """Change a task's status and propagate completion to its dependents"""
+        previous = task.status
+        task.status = status
+
+        if status == TaskStatus.COMPLETED and previous != TaskStatus.COMPLETED:
+            self._release_dependents(task.id)
+        elif previous == TaskStatus.COMPLETED and status != TaskStatus.COMPLETED:
+            for dependent_id in self._dependents.get(task.id, []):
+                self._unmet[dependent_id] += 1
+
+        if status == TaskStatus.READY:
+            self._push_ready(task)
+
+    def _release_dependents(self, task_id: str):
+        """Decrement unmet counts of a completed task's dependents"""
+        for dependent_id in self._dependents.get(task_id, []):
+            self._unmet[dependent_id] -= 1
+            dependent = self.tasks[dependent_id]
+            if self._unmet[dependent_id] == 0 and dependent.status in (
+                TaskStatus.PENDING,
+                TaskStatus.BLOCKED,
+            ):
+                dependent.status = TaskStatus.READY
+                self._push_ready(dependent)
+
+    def _push_ready(self, task: QueuedTask):
+        """Put a READY task on the heap (once) and record its execution position"""
+        position = self._order.setdefault(task.id, len(self._order))
+        if task.id in self._in_heap:
+            return
+
+        score = 0.0
+        if self.scheduler is not None:
+            score = self.scheduler.calculate_priority(
+                task_id=task.id,
+                base_priority=getattr(task, "priority", 5),
+                dependencies_count=len(task.dependencies),
+                dependents_count=len(self._dependents.get(task.id, [])),
+                estimated_minutes=task.estimated_minutes,
+                is_critical_path=getattr(task, "critical_path", False),
+            )
+        heapq.heappush(self._ready_heap, (-score, position, task.id))
+        self._in_heap.add(task.id)
 
     def get_stats(self) -> Dict:
         """Get queue statistics"""
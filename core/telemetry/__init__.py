@@ -22,6 +22,7 @@ from .event_collector import EventCollector, EventFilter
 from .metrics_analyzer import MetricsAnalyzer, MetricType, Metric, MetricsSummary
 from .threshold_monitor import ThresholdMonitor, Threshold, Alert, AlertLevel
 from .performance_tracker import PerformanceTracker, PerformanceMetrics, Timer
+from .quantile_sketch import QuantileSketch
 
 __all__ = [
     # Event schemas
@@ -49,4 +50,5 @@ __all__ = [
     "PerformanceTracker",
     "PerformanceMetrics",
     "Timer",
+    "QuantileSketch",
 ]
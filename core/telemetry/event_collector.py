@@ -7,13 +7,19 @@ Features:
 - Persistent storage with rotation and compression
 - Event querying and retrieval
 - Automatic cleanup of old events
+- Optional write-behind persistence: a bounded queue drained by a background
+  writer thread that inserts events in batches (one transaction per batch)
 """
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
+import atexit
 import json
+import queue
+import threading
+import time
 import uuid
 import logging
 
@@ -23,6 +29,21 @@ from core.persistence.database import Database
 
 logger = logging.getLogger(__name__)
 
+# What collect() does when the write-behind queue is full
+BACKPRESSURE_POLICIES = ("block", "drop_oldest", "sample")
+
+# Queue marker that stops the write-behind writer thread
+_STOP = object()
+
+
+class _FlushMarker:
+    """Queue marker; ``done`` is set once every event queued before it is written."""
+
+    __slots__ = ("done",)
+
+    def __init__(self):
+        self.done = threading.Event()
+
 
 @dataclass
 class EventFilter:
@@ -48,6 +69,13 @@ class EventCollector:
         max_file_size: int = 1_000_000,  # 1MB
         retention_days: int = 30,
         use_sqlite: bool = True,
+        write_behind: bool = False,
+        queue_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 0.25,
+        backpressure: str = "block",
+        sample_every: int = 10,
+        write_wait_timeout: float = 5.0,
     ):
         """
         Initialize event collector.
@@ -60,7 +88,24 @@ class EventCollector:
             max_file_size: Maximum file size before rotation (bytes)
             retention_days: Days to retain old rotated files
             use_sqlite: Use SQLite for persistence (default: True)
+            write_behind: Persist to SQLite from a background writer thread
+                instead of on the caller's thread
+            queue_size: Maximum events waiting for the writer thread
+            batch_size: Maximum events inserted per transaction
+            flush_interval: Seconds the writer waits to fill a batch
+            backpressure: Policy when the queue is full - "block" waits,
+                "drop_oldest" discards the oldest queued event, "sample" keeps
+                one in `sample_every` events once the queue is 3/4 full
+            sample_every: Sampling ratio for the "sample" policy
+            write_wait_timeout: Seconds flush() and SQLite reads wait for queued
+                events to be written before going ahead without them
         """
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"Unknown backpressure policy {backpressure!r}; "
+                f"expected one of {BACKPRESSURE_POLICIES}"
+            )
+
         self.storage_path = storage_path or Path.cwd() / ".buildrunner" / "events.json"
         self.db_path = db_path or Path.cwd() / ".buildrunner" / "telemetry.db"
         self.buffer_size = buffer_size
@@ -86,6 +131,25 @@ class EventCollector:
         self.buffer: List[Event] = []
         self.listeners: List[Callable[[Event], None]] = []
 
+        # Write-behind state
+        self.write_behind = write_behind and self.db is not None
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.backpressure = backpressure
+        self.sample_every = max(1, sample_every)
+        self.write_wait_timeout = write_wait_timeout
+        self.dropped_events = 0
+        self._sample_counter = 0
+        self._write_queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        if self.write_behind:
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="event-collector-writer", daemon=True
+            )
+            self._writer.start()
+            atexit.register(self.close)
+
         # Load existing events
         self._load()
 
@@ -154,6 +218,10 @@ class EventCollector:
         CREATE INDEX IF NOT EXISTS idx_session_id ON events(session_id) WHERE session_id IS NOT NULL;
         CREATE INDEX IF NOT EXISTS idx_build_id ON events(build_id) WHERE build_id IS NOT NULL;
         CREATE INDEX IF NOT EXISTS idx_type_timestamp ON events(event_type, timestamp DESC);
+        -- Covering index for MetricsAnalyzer task rollups (no table lookups per row)
+        CREATE INDEX IF NOT EXISTS idx_task_rollup ON events(
+            event_type, timestamp, success, duration_ms, cost_usd, tokens_used, model_used
+        );
 
         -- Statistics view
         CREATE VIEW IF NOT EXISTS event_statistics AS
@@ -190,8 +258,10 @@ class EventCollector:
         if not event.event_id:
             event.event_id = str(uuid.uuid4())
 
-        # Persist to SQLite immediately (non-blocking)
-        if self.use_sqlite and self.db:
+        # Persist to SQLite: hand off to the writer thread, or insert inline
+        if self.write_behind and not self._closed:
+            self._enqueue(event)
+        elif self.use_sqlite and self.db:
             try:
                 self._persist_event(event)
             except Exception as e:
@@ -208,23 +278,29 @@ class EventCollector:
             except Exception as e:
                 logger.warning(f"Event listener failed: {e}")
 
-        # Auto-flush if buffer is full
+        # Auto-flush if buffer is full (JSON only; the SQLite writer keeps its own pace)
         if self.auto_flush and len(self.buffer) >= self.buffer_size:
-            self.flush()
+            self._flush_buffer()
 
         return event.event_id
 
     def flush(self):
         """Flush buffered events to storage."""
+        self._wait_for_writes()
+        self._flush_buffer()
+
+    def _flush_buffer(self):
+        """Move buffered events to the in-memory list and append them to disk."""
         if not self.buffer:
             return
 
         # Add buffer to events
-        self.events.extend(self.buffer)
+        new_events = list(self.buffer)
+        self.events.extend(new_events)
         self.buffer.clear()
 
-        # Save to disk
-        self._save()
+        # Append to disk (only the new events)
+        self._append(new_events)
 
     def query(
         self,
@@ -377,6 +453,24 @@ class EventCollector:
         if listener in self.listeners:
             self.listeners.remove(listener)
 
+    def query_rows(self, sql: str, params: tuple = ()) -> List[Dict[str, any]]:
+        """
+        Run a read-only query (e.g. a GROUP BY aggregate) against the SQLite events table.
+
+        Queued write-behind events are written first.
+
+        Args:
+            sql: SELECT statement over the events table
+            params: Query parameters
+
+        Returns:
+            List of rows as dictionaries (empty when SQLite is disabled)
+        """
+        if not (self.use_sqlite and self.db):
+            return []
+        self._wait_for_writes()
+        return self.db.query(sql, params)
+
     def _query_sqlite(
         self,
         filter: Optional[EventFilter] = None,
@@ -392,6 +486,9 @@ class EventCollector:
         Returns:
             List of matching events
         """
+        # Read-your-writes: land queued events before querying
+        self._wait_for_writes()
+
         # Build SQL query
         sql = "SELECT * FROM events WHERE 1=1"
         params = []
@@ -436,8 +533,9 @@ class EventCollector:
                 event_type = EventType(row["event_type"])
                 timestamp = datetime.fromisoformat(row["timestamp"])
 
-                # Determine event class based on type
-                if "TASK_" in row["event_type"]:
+                # Determine event class based on type (values are lowercase)
+                type_name = row["event_type"].upper()
+                if "TASK_" in type_name:
                     event = TaskEvent(
                         event_type=event_type,
                         timestamp=timestamp,
@@ -457,7 +555,7 @@ class EventCollector:
                         error_message=row.get("error_message", ""),
                         metadata=json.loads(row["metadata"]) if row.get("metadata") else {},
                     )
-                elif "BUILD_" in row["event_type"]:
+                elif "BUILD_" in type_name:
                     event = BuildEvent(
                         event_type=event_type,
                         timestamp=timestamp,
@@ -474,7 +572,7 @@ class EventCollector:
                         error_message=row.get("error_message", ""),
                         metadata=json.loads(row["metadata"]) if row.get("metadata") else {},
                     )
-                elif "ERROR_" in row["event_type"] or "EXCEPTION_" in row["event_type"]:
+                elif "ERROR_" in type_name or "EXCEPTION_" in type_name:
                     event = ErrorEvent(
                         event_type=event_type,
                         timestamp=timestamp,
@@ -488,7 +586,7 @@ class EventCollector:
                         severity=row.get("severity", "error"),
                         metadata=json.loads(row["metadata"]) if row.get("metadata") else {},
                     )
-                elif "PERFORMANCE_" in row["event_type"]:
+                elif "PERFORMANCE_" in type_name:
                     event = PerformanceEvent(
                         event_type=event_type,
                         timestamp=timestamp,
@@ -531,6 +629,23 @@ class EventCollector:
         if not self.db:
             return
 
+        # Insert into database
+        try:
+            self.db.insert("events", self._event_row(event))
+        except Exception as e:
+            logger.error(f"Failed to insert event into database: {e}")
+            raise
+
+    def _event_row(self, event: Event) -> Dict[str, any]:
+        """
+        Build the events-table row for an event.
+
+        Args:
+            event: Event to convert
+
+        Returns:
+            Column values as dictionary
+        """
         # Build event data dictionary with all possible fields
         data = {
             "event_id": event.event_id,
@@ -599,12 +714,178 @@ class EventCollector:
                 }
             )
 
-        # Insert into database
+        return data
+
+    def _enqueue(self, event: Event):
+        """
+        Hand an event to the writer thread, applying the backpressure policy.
+
+        Args:
+            event: Event to persist
+        """
+        q = self._write_queue
+        if self.backpressure == "block":
+            q.put(event)
+            return
+
+        if self.backpressure == "sample":
+            if q.maxsize and q.qsize() >= q.maxsize * 3 // 4:
+                self._sample_counter += 1
+                if self._sample_counter % self.sample_every:
+                    self.dropped_events += 1
+                    return
+            try:
+                q.put_nowait(event)
+            except queue.Full:
+                self.dropped_events += 1
+            return
+
+        # drop_oldest: evict the oldest queued event. Flush and stop markers are
+        # never evicted, so a flush() never returns before its events are written.
+        while True:
+            try:
+                q.put_nowait(event)
+                return
+            except queue.Full:
+                pass
+            with q.mutex:
+                if len(q.queue) < q.maxsize:
+                    continue  # the writer made room meanwhile
+                for index, queued in enumerate(q.queue):
+                    if isinstance(queued, Event):
+                        del q.queue[index]
+                        q.queue.append(event)  # one out, one in: unfinished_tasks unchanged
+                        self.dropped_events += 1
+                        return
+            # Only markers are queued; wait for the writer to take one
+            q.put(event)
+            return
+
+    def _writer_loop(self):
+        """Drain the write-behind queue, one transaction per batch."""
+        q = self._write_queue
+        while True:
+            item = q.get()
+            if item is _STOP:
+                q.task_done()
+                return
+            if isinstance(item, _FlushMarker):
+                item.done.set()
+                q.task_done()
+                continue
+
+            batch = [item]
+            marker = None
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = q.get(timeout=remaining) if remaining > 0 else q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP or isinstance(item, _FlushMarker):
+                    marker = item
+                    break
+                batch.append(item)
+
+            self._write_batch(batch)
+            for _ in batch:
+                q.task_done()
+            if marker is not None:
+                q.task_done()
+                if marker is _STOP:
+                    return
+                marker.done.set()
+
+    def _write_batch(self, events: List[Event]):
+        """
+        Insert a batch of events with executemany, grouped by column set.
+
+        Args:
+            events: Events to persist
+        """
+        groups: Dict[tuple, List[tuple]] = {}
+        for event in events:
+            try:
+                row = self._event_row(event)
+            except Exception as e:
+                logger.error(f"Failed to serialize event {event.event_id}: {e}")
+                continue
+            groups.setdefault(tuple(row), []).append(tuple(row.values()))
+
+        for columns, rows in groups.items():
+            try:
+                # OR IGNORE: a duplicate event_id must not roll back the whole batch
+                self.db.insert_many("events", list(columns), rows, or_ignore=True)
+            except Exception as e:
+                logger.error(f"Failed to insert {len(rows)} events into database: {e}")
+
+    def _wait_for_writes(self) -> bool:
+        """
+        Wait until every event queued so far has been written.
+
+        Waits on a marker behind those events rather than for the queue to
+        empty, so producers that keep collecting can't hold it up, and gives
+        up after ``write_wait_timeout`` seconds.
+
+        Returns:
+            True if the queued events were written, False on timeout
+        """
+        if self._writer is None or not self._writer.is_alive():
+            return True
+        deadline = time.monotonic() + self.write_wait_timeout
+        marker = _FlushMarker()
         try:
-            self.db.insert("events", data)
+            self._write_queue.put(marker, timeout=self.write_wait_timeout)
+        except queue.Full:
+            logger.warning("Telemetry write queue full; reading without waiting for the writer")
+            return False
+        if not marker.done.wait(max(0.0, deadline - time.monotonic())):
+            logger.warning(
+                f"Telemetry writer did not catch up within {self.write_wait_timeout}s"
+            )
+            return False
+        return True
+
+    def close(self, timeout: float = 10.0):
+        """
+        Drain the write-behind queue, stop the writer thread and flush the buffer.
+
+        Later collect() calls persist synchronously.
+
+        Args:
+            timeout: Seconds to wait for the writer to drain
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is not None:
+            atexit.unregister(self.close)
+            if self._writer.is_alive():
+                self._write_queue.put(_STOP)
+                self._writer.join(timeout)
+            # Events enqueued while close() was racing collect()
+            leftovers = []
+            while not self._writer.is_alive():
+                try:
+                    item = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._write_queue.task_done()
+                if isinstance(item, Event):
+                    leftovers.append(item)
+                elif isinstance(item, _FlushMarker):
+                    item.done.set()
+            if leftovers:
+                self._write_batch(leftovers)
+        self.flush()
+
+    def _append(self, events: List[Event]):
+        """Append new events to disk with automatic rotation."""
+        try:
+            self.event_storage.append([e.to_dict() for e in events])
         except Exception as e:
-            logger.error(f"Failed to insert event into database: {e}")
-            raise
+            logger.error(f"Failed to save events: {e}")
 
     def _save(self):
         """Save events to disk with automatic rotation."""
@@ -681,6 +962,7 @@ class EventCollector:
         """
         # Use SQLite statistics view if available
         if self.use_sqlite and self.db:
+            self._wait_for_writes()
             try:
                 # Get statistics from view
                 stats_rows = self.db.query("SELECT * FROM event_statistics")
@@ -707,6 +989,7 @@ class EventCollector:
                     "oldest_event": time_result["oldest"] if time_result else None,
                     "newest_event": time_result["newest"] if time_result else None,
                     "listeners": len(self.listeners),
+                    "dropped_events": self.dropped_events,
                 }
             except Exception as e:
                 logger.error(f"Failed to get statistics from SQLite: {e}")
@@ -8,6 +8,10 @@ Generates metrics from telemetry events:
 - Error rates
 - Security violations
 - Model usage patterns
+
+With SQLite enabled on the collector, summaries, top errors and trends are
+computed with GROUP BY queries over the indexed events table; the in-memory
+path is only used when SQLite is disabled.
 """
 
 from dataclasses import dataclass, field
@@ -18,6 +22,28 @@ from typing import Dict, List, Optional
 from .event_collector import EventCollector, EventFilter
 from .event_schemas import EventType, TaskEvent, ErrorEvent
 
+# Event types stored with TaskEvent / ErrorEvent columns, and security event types
+TASK_EVENT_TYPES = (
+    EventType.TASK_STARTED,
+    EventType.TASK_COMPLETED,
+    EventType.TASK_FAILED,
+    EventType.TASK_CANCELLED,
+)
+ERROR_EVENT_TYPES = (EventType.ERROR_OCCURRED, EventType.EXCEPTION_RAISED)
+SECURITY_EVENT_TYPES = (
+    EventType.SECURITY_VIOLATION,
+    EventType.SECRET_DETECTED,
+    EventType.SQL_INJECTION_DETECTED,
+)
+
+# TaskEvent numeric columns get_performance_trends can read from SQLite
+TREND_COLUMNS = ("duration_ms", "cost_usd", "tokens_used", "file_count", "line_count")
+
+
+def _in_clause(event_types) -> str:
+    """Inline IN (...) list for EventType members (enum values are fixed identifiers)."""
+    return "(" + ", ".join(f"'{t.value}'" for t in event_types) + ")"
+
 
 class MetricType(str, Enum):
     """Types of metrics."""
@@ -132,6 +158,16 @@ class MetricsAnalyzer:
         elif period == "week":
             start_time = now - timedelta(weeks=1)
             end_time = now
+        elif self._use_sql():  # "all"
+            row = self.collector.query_rows(
+                "SELECT MIN(timestamp) AS oldest, MAX(timestamp) AS newest FROM events"
+            )
+            if row and row[0]["oldest"]:
+                start_time = datetime.fromisoformat(row[0]["oldest"])
+                end_time = datetime.fromisoformat(row[0]["newest"])
+            else:
+                start_time = now
+                end_time = now
         else:  # "all"
             # Get all events
             all_events = self.collector.query()
@@ -142,10 +178,6 @@ class MetricsAnalyzer:
                 start_time = now
                 end_time = now
 
-        # Query events
-        filter = EventFilter(start_time=start_time, end_time=end_time)
-        events = self.collector.query(filter=filter)
-
         # Initialize summary
         summary = MetricsSummary(
             period=period,
@@ -153,6 +185,14 @@ class MetricsAnalyzer:
             end_time=end_time,
         )
 
+        if self._use_sql():
+            self._summarize_sql(summary)
+            return summary
+
+        # Query events
+        filter = EventFilter(start_time=start_time, end_time=end_time)
+        events = self.collector.query(filter=filter)
+
         if not events:
             return summary
 
@@ -179,6 +219,82 @@ class MetricsAnalyzer:
 
         return summary
 
+    def _use_sql(self) -> bool:
+        """Whether the collector's SQLite events table can answer aggregate queries."""
+        return bool(self.collector.use_sqlite and self.collector.db)
+
+    def _summarize_sql(self, summary: MetricsSummary):
+        """Fill a summary with GROUP BY queries over the summary's time window."""
+        window = " AND timestamp >= ? AND timestamp <= ?"
+        params = (summary.start_time.isoformat(), summary.end_time.isoformat())
+        tasks = f"event_type IN {_in_clause(TASK_EVENT_TYPES)}" + window
+
+        row = self.collector.query_rows(
+            f"""
+            SELECT COUNT(*) AS total,
+                   SUM(CASE WHEN success THEN 1 ELSE 0 END) AS successful,
+                   COUNT(CASE WHEN duration_ms > 0 THEN 1 END) AS timed,
+                   AVG(CASE WHEN duration_ms > 0 THEN duration_ms END) AS avg_duration,
+                   COALESCE(SUM(cost_usd), 0) AS cost,
+                   COALESCE(SUM(tokens_used), 0) AS tokens
+            FROM events WHERE {tasks}
+            """,
+            params,
+        )[0]
+
+        summary.total_tasks = row["total"]
+        if summary.total_tasks:
+            summary.successful_tasks = row["successful"] or 0
+            summary.failed_tasks = summary.total_tasks - summary.successful_tasks
+            summary.success_rate = (summary.successful_tasks / summary.total_tasks) * 100
+            summary.total_cost_usd = row["cost"]
+            summary.total_tokens = row["tokens"]
+            summary.avg_cost_per_task = summary.total_cost_usd / summary.total_tasks
+
+        # Percentiles use the in-memory path's index (sorted[int(n * q)]). Only the slowest
+        # tail above the p95 rank is fetched, so SQLite keeps a small top-N heap, not a full sort.
+        timed = row["timed"]
+        if timed:
+            summary.avg_duration_ms = row["avg_duration"]
+            tail = self.collector.query_rows(
+                f"SELECT duration_ms FROM events WHERE {tasks} AND duration_ms > 0 "
+                "ORDER BY duration_ms DESC LIMIT ?",
+                params + (timed - int(timed * 0.95),),
+            )
+            summary.p95_duration_ms = tail[timed - 1 - int(timed * 0.95)]["duration_ms"]
+            summary.p99_duration_ms = tail[timed - 1 - int(timed * 0.99)]["duration_ms"]
+
+        for model in self.collector.query_rows(
+            f"""
+            SELECT model_used, COUNT(*) AS n FROM events
+            WHERE {tasks} AND model_used IS NOT NULL AND model_used != ''
+            GROUP BY model_used ORDER BY n DESC, MAX(timestamp) DESC
+            """,
+            params,
+        ):
+            summary.models_used[model["model_used"]] = model["n"]
+        if summary.models_used:
+            summary.most_used_model = next(iter(summary.models_used))
+
+        for error in self.collector.query_rows(
+            f"""
+            SELECT COALESCE(NULLIF(error_type, ''), 'unknown') AS error_type, COUNT(*) AS n
+            FROM events WHERE event_type IN {_in_clause(ERROR_EVENT_TYPES)}{window}
+            GROUP BY 1
+            """,
+            params,
+        ):
+            summary.errors_by_type[error["error_type"]] = error["n"]
+        summary.total_errors = sum(summary.errors_by_type.values())
+        if summary.total_tasks > 0:
+            summary.error_rate = (summary.total_errors / summary.total_tasks) * 100
+
+        summary.security_violations = self.collector.query_rows(
+            f"SELECT COUNT(*) AS n FROM events "
+            f"WHERE event_type IN {_in_clause(SECURITY_EVENT_TYPES)}{window}",
+            params,
+        )[0]["n"]
+
     def _analyze_tasks(self, events: List[TaskEvent], summary: MetricsSummary):
         """Analyze task events."""
         if not events:
@@ -333,6 +449,38 @@ class MetricsAnalyzer:
         Returns:
             List of error info dicts
         """
+        if self._use_sql():
+            rows = self.collector.query_rows(
+                f"""
+                SELECT error_type, n, error_message, component, timestamp FROM (
+                    SELECT error_type, error_message, component, timestamp,
+                           COUNT(*) OVER (PARTITION BY error_type) AS n,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY error_type ORDER BY timestamp DESC
+                           ) AS rn
+                    FROM (
+                        SELECT COALESCE(NULLIF(error_type, ''), 'unknown') AS error_type,
+                               error_message, component, timestamp
+                        FROM events WHERE event_type IN {_in_clause(ERROR_EVENT_TYPES)}
+                    )
+                )
+                WHERE rn = 1 ORDER BY n DESC, timestamp DESC LIMIT ?
+                """,
+                (limit,),
+            )
+            return [
+                {
+                    "error_type": row["error_type"],
+                    "count": row["n"],
+                    "example": {
+                        "message": row["error_message"] or "",
+                        "component": row["component"] or "",
+                        "timestamp": datetime.fromisoformat(row["timestamp"]),
+                    },
+                }
+                for row in rows
+            ]
+
         error_events = self.collector.query(
             filter=EventFilter(event_types=[EventType.ERROR_OCCURRED, EventType.EXCEPTION_RAISED])
         )
@@ -385,6 +533,29 @@ class MetricsAnalyzer:
         now = datetime.now()
         trends = {}
 
+        if self._use_sql():
+            for i in range(days):
+                trends[(now - timedelta(days=i)).strftime("%Y-%m-%d")] = []
+            if metric not in TREND_COLUMNS or not trends:
+                return trends
+            oldest_day = now - timedelta(days=days - 1)
+            rows = self.collector.query_rows(
+                f"""
+                SELECT substr(timestamp, 1, 10) AS day, {metric} AS value FROM events
+                WHERE event_type IN {_in_clause(TASK_EVENT_TYPES)}
+                  AND timestamp >= ? AND timestamp <= ? AND {metric} > 0
+                ORDER BY timestamp DESC
+                """,
+                (
+                    oldest_day.strftime("%Y-%m-%d"),
+                    now.replace(hour=23, minute=59, second=59).isoformat(),
+                ),
+            )
+            for row in rows:
+                if row["day"] in trends:
+                    trends[row["day"]].append(row["value"])
+            return trends
+
         for i in range(days):
             day = now - timedelta(days=i)
             day_start = day.replace(hour=0, minute=0, second=0)
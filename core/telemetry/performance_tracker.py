@@ -7,15 +7,26 @@ Tracks:
 - Throughput (tasks per second)
 - API latency
 - System health
+
+Durations are folded on record into per-operation, per-hour quantile sketches,
+so windowed percentiles merge a bounded number of buckets instead of sorting
+raw measurements. Raw measurements are appended in batches to a SQLite log.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
+import atexit
+import threading
 import time
 import json
 
+from core.persistence.database import Database
+
+from .quantile_sketch import QuantileSketch
+
 
 @dataclass
 class PerformanceMetrics:
@@ -51,22 +62,89 @@ class PerformanceMetrics:
     by_operation: Dict[str, Dict[str, float]] = field(default_factory=dict)
 
 
+class _OperationBucket:
+    """Aggregates for one operation type over one time bucket."""
+
+    __slots__ = ("durations", "cpu_sum", "cpu_count", "memory_sum", "memory_count", "memory_peak")
+
+    def __init__(self):
+        self.durations = QuantileSketch()
+        self.cpu_sum = 0.0
+        self.cpu_count = 0
+        self.memory_sum = 0.0
+        self.memory_count = 0
+        self.memory_peak = 0.0
+
+    def add(self, duration_ms: float, cpu_percent: float, memory_mb: float):
+        self.durations.add(duration_ms)
+        if cpu_percent > 0:
+            self.cpu_sum += cpu_percent
+            self.cpu_count += 1
+        if memory_mb > 0:
+            self.memory_sum += memory_mb
+            self.memory_count += 1
+            self.memory_peak = max(self.memory_peak, memory_mb)
+
+
 class PerformanceTracker:
     """Tracks system performance metrics."""
 
-    def __init__(self, storage_path: Optional[Path] = None):
+    # Width of the time buckets sketches are kept in; windows resolve to whole buckets
+    BUCKET_SECONDS = 3600
+
+    def __init__(
+        self,
+        storage_path: Optional[Path] = None,
+        retention_days: int = 7,
+        recent_size: int = 1000,
+        flush_every: int = 100,
+    ):
         """
         Initialize performance tracker.
 
         Args:
-            storage_path: Path to store performance data
+            storage_path: Path to store performance data. Measurements are
+                appended to a SQLite log next to it (same name, .db suffix);
+                an existing JSON file at this path is imported once.
+            retention_days: Days of sketches kept in memory
+            recent_size: Number of raw recent measurements kept in memory
+            flush_every: Measurements buffered before appending to the log
         """
         self.storage_path = storage_path or Path.cwd() / ".buildrunner" / "performance.json"
+        self.db_path = self.storage_path.with_suffix(".db")
+        self.retention_days = retention_days
+        self.flush_every = flush_every
 
-        self.measurements: List[Dict[str, any]] = []
+        # Recent raw measurements (bounded); history lives in the SQLite log
+        self.measurements: Deque[Dict[str, any]] = deque(maxlen=recent_size)
         self.active_timers: Dict[str, float] = {}
 
+        # operation_type -> bucket index -> aggregates
+        self._buckets: Dict[str, Dict[int, _OperationBucket]] = {}
+        self._pending: List[tuple] = []
+        self._last_bucket = 0
+        self._lock = threading.Lock()
+
+        self.db = Database(self.db_path)
+        self.db.run_migration(
+            """
+            CREATE TABLE IF NOT EXISTS measurements (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                operation_type TEXT NOT NULL,
+                duration_ms REAL NOT NULL,
+                cpu_percent REAL,
+                memory_mb REAL,
+                metadata TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_measurements_timestamp ON measurements(timestamp);
+            CREATE INDEX IF NOT EXISTS idx_measurements_duration
+                ON measurements(duration_ms DESC);
+            """
+        )
+
         self._load()
+        atexit.register(self._save)
 
     def start_timer(self, operation_id: str):
         """
@@ -127,8 +205,9 @@ class PerformanceTracker:
             memory_mb: Memory usage in MB
             metadata: Additional metadata
         """
+        now = datetime.now()
         measurement = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "operation_type": operation_type,
             "duration_ms": duration_ms,
             "cpu_percent": cpu_percent,
@@ -136,10 +215,14 @@ class PerformanceTracker:
             "metadata": metadata or {},
         }
 
-        self.measurements.append(measurement)
+        with self._lock:
+            self.measurements.append(measurement)
+            self._add_to_bucket(measurement, now.timestamp())
+            self._pending.append(self._row(measurement))
+            flush = len(self._pending) >= self.flush_every
 
-        # Auto-save periodically
-        if len(self.measurements) % 100 == 0:
+        # Append to the log periodically
+        if flush:
             self._save()
 
     def get_metrics(
@@ -150,6 +233,10 @@ class PerformanceTracker:
         """
         Get performance metrics.
 
+        Merges the per-hour sketches covering the window, so the cost depends
+        on the number of buckets, not the number of measurements. Percentiles
+        are within 1% relative error; the window starts at the hour boundary.
+
         Args:
             operation_type: Filter by operation type
             hours: Number of hours to analyze
@@ -159,81 +246,67 @@ class PerformanceTracker:
         """
         now = datetime.now()
         start_time = now - timedelta(hours=hours)
-
-        # Filter measurements
-        filtered = []
-        for m in self.measurements:
-            timestamp = datetime.fromisoformat(m["timestamp"])
-            if timestamp < start_time:
-                continue
-
-            if operation_type and m["operation_type"] != operation_type:
-                continue
-
-            filtered.append(m)
-
-        if not filtered:
+        first_bucket = int(start_time.timestamp() // self.BUCKET_SECONDS)
+
+        # Merge buckets per operation type
+        merged: Dict[str, _OperationBucket] = {}
+        with self._lock:
+            for op_type, buckets in self._buckets.items():
+                if operation_type and op_type != operation_type:
+                    continue
+                window = [b for idx, b in buckets.items() if idx >= first_bucket]
+                if not window:
+                    continue
+                total = merged[op_type] = _OperationBucket()
+                for bucket in window:
+                    total.durations.merge(bucket.durations)
+                    total.cpu_sum += bucket.cpu_sum
+                    total.cpu_count += bucket.cpu_count
+                    total.memory_sum += bucket.memory_sum
+                    total.memory_count += bucket.memory_count
+                    total.memory_peak = max(total.memory_peak, bucket.memory_peak)
+
+        if not merged:
             return PerformanceMetrics(start_time=start_time, end_time=now)
 
-        # Calculate metrics
-        durations = [m["duration_ms"] for m in filtered]
-        cpu_values = [m["cpu_percent"] for m in filtered if m["cpu_percent"] > 0]
-        memory_values = [m["memory_mb"] for m in filtered if m["memory_mb"] > 0]
-
-        sorted_durations = sorted(durations)
-        total_operations = len(filtered)
-
-        # Timing metrics
-        avg_duration = sum(durations) / len(durations) if durations else 0
-        min_duration = min(durations) if durations else 0
-        max_duration = max(durations) if durations else 0
-
-        p50_idx = int(len(sorted_durations) * 0.50)
-        p95_idx = int(len(sorted_durations) * 0.95)
-        p99_idx = int(len(sorted_durations) * 0.99)
-
-        p50 = sorted_durations[p50_idx] if sorted_durations else 0
-        p95 = sorted_durations[p95_idx] if sorted_durations else 0
-        p99 = sorted_durations[p99_idx] if sorted_durations else 0
+        durations = QuantileSketch.merged(op.durations for op in merged.values())
+        cpu_count = sum(op.cpu_count for op in merged.values())
+        memory_count = sum(op.memory_count for op in merged.values())
+        total_operations = durations.count
 
         # Throughput
         time_span_seconds = (now - start_time).total_seconds()
         ops_per_second = total_operations / time_span_seconds if time_span_seconds > 0 else 0
 
-        # Resource usage
-        avg_cpu = sum(cpu_values) / len(cpu_values) if cpu_values else 0
-        avg_memory = sum(memory_values) / len(memory_values) if memory_values else 0
-        peak_memory = max(memory_values) if memory_values else 0
-
         # By operation type
-        by_operation = {}
-        operation_types = set(m["operation_type"] for m in filtered)
-
-        for op_type in operation_types:
-            op_measurements = [m for m in filtered if m["operation_type"] == op_type]
-            op_durations = [m["duration_ms"] for m in op_measurements]
-
-            by_operation[op_type] = {
-                "count": len(op_measurements),
-                "avg_duration_ms": sum(op_durations) / len(op_durations),
-                "min_duration_ms": min(op_durations),
-                "max_duration_ms": max(op_durations),
+        by_operation = {
+            op_type: {
+                "count": op.durations.count,
+                "avg_duration_ms": op.durations.avg,
+                "min_duration_ms": op.durations.min,
+                "max_duration_ms": op.durations.max,
             }
+            for op_type, op in merged.items()
+        }
 
         return PerformanceMetrics(
             start_time=start_time,
             end_time=now,
             total_operations=total_operations,
-            avg_duration_ms=avg_duration,
-            min_duration_ms=min_duration,
-            max_duration_ms=max_duration,
-            p50_duration_ms=p50,
-            p95_duration_ms=p95,
-            p99_duration_ms=p99,
+            avg_duration_ms=durations.avg,
+            min_duration_ms=durations.min,
+            max_duration_ms=durations.max,
+            p50_duration_ms=durations.quantile(0.50),
+            p95_duration_ms=durations.quantile(0.95),
+            p99_duration_ms=durations.quantile(0.99),
             operations_per_second=ops_per_second,
-            avg_cpu_percent=avg_cpu,
-            avg_memory_mb=avg_memory,
-            peak_memory_mb=peak_memory,
+            avg_cpu_percent=(
+                sum(op.cpu_sum for op in merged.values()) / cpu_count if cpu_count else 0
+            ),
+            avg_memory_mb=(
+                sum(op.memory_sum for op in merged.values()) / memory_count if memory_count else 0
+            ),
+            peak_memory_mb=max(op.memory_peak for op in merged.values()),
             by_operation=by_operation,
         )
 
@@ -252,15 +325,26 @@ class PerformanceTracker:
         Returns:
             List of operation measurements
         """
-        filtered = self.measurements
+        self._save()
 
+        sql = "SELECT * FROM measurements"
+        params: tuple = ()
         if operation_type:
-            filtered = [m for m in filtered if m["operation_type"] == operation_type]
-
-        # Sort by duration (slowest first)
-        sorted_ops = sorted(filtered, key=lambda m: m["duration_ms"], reverse=True)
-
-        return sorted_ops[:limit]
+            sql += " WHERE operation_type = ?"
+            params = (operation_type,)
+        sql += " ORDER BY duration_ms DESC LIMIT ?"
+
+        return [
+            {
+                "timestamp": row["timestamp"],
+                "operation_type": row["operation_type"],
+                "duration_ms": row["duration_ms"],
+                "cpu_percent": row["cpu_percent"] or 0.0,
+                "memory_mb": row["memory_mb"] or 0.0,
+                "metadata": json.loads(row["metadata"]) if row["metadata"] else {},
+            }
+            for row in self.db.query(sql, params + (limit,))
+        ]
 
     def get_current_metrics(self) -> PerformanceMetrics:
         """
@@ -279,11 +363,16 @@ class PerformanceTracker:
         # Get active operations count
         active_operations = len(self.active_timers)
 
-        # Get total operations and average time
-        total_operations = len(self.measurements)
+        # Get total operations (retention window) and average time
+        with self._lock:
+            total_operations = sum(
+                bucket.durations.count
+                for buckets in self._buckets.values()
+                for bucket in buckets.values()
+            )
+            recent_measurements = list(self.measurements)[-100:]  # Last 100
         avg_operation_time_ms = 0.0
-        if self.measurements:
-            recent_measurements = self.measurements[-100:]  # Last 100
+        if recent_measurements:
             durations = [m["duration_ms"] for m in recent_measurements]
             avg_operation_time_ms = sum(durations) / len(durations) if durations else 0.0
 
@@ -316,46 +405,126 @@ class PerformanceTracker:
         Args:
             days: Number of days to keep
         """
-        from datetime import timedelta
-
         cutoff = datetime.now() - timedelta(days=days)
 
-        self.measurements = [
-            m for m in self.measurements if datetime.fromisoformat(m["timestamp"]) >= cutoff
-        ]
-
         self._save()
+        self.db.delete("measurements", "timestamp < ?", (cutoff.isoformat(),))
+
+        with self._lock:
+            self._prune_buckets(int(cutoff.timestamp() // self.BUCKET_SECONDS))
+            recent = [
+                m for m in self.measurements if datetime.fromisoformat(m["timestamp"]) >= cutoff
+            ]
+            self.measurements.clear()
+            self.measurements.extend(recent)
+
+    def _add_to_bucket(self, measurement: Dict[str, any], epoch: float):
+        """Fold a measurement into its operation/time bucket (caller holds the lock)."""
+        index = int(epoch // self.BUCKET_SECONDS)
+        buckets = self._buckets.setdefault(measurement["operation_type"], {})
+        bucket = buckets.get(index)
+        if bucket is None:
+            bucket = buckets[index] = _OperationBucket()
+        bucket.add(
+            measurement["duration_ms"], measurement["cpu_percent"], measurement["memory_mb"]
+        )
 
-    def _save(self):
-        """Save measurements to disk."""
-        try:
-            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-
-            data = {
-                "measurements": self.measurements,
-                "version": "1.0",
-            }
+        # A new hour started: drop buckets that aged out of retention
+        if index > self._last_bucket:
+            self._last_bucket = index
+            self._prune_buckets(index - self.retention_days * 86400 // self.BUCKET_SECONDS)
+
+    def _prune_buckets(self, oldest_index: int):
+        """Drop buckets before oldest_index (caller holds the lock)."""
+        for op_type in list(self._buckets):
+            buckets = self._buckets[op_type]
+            for index in [i for i in buckets if i < oldest_index]:
+                del buckets[index]
+            if not buckets:
+                del self._buckets[op_type]
+
+    @staticmethod
+    def _row(measurement: Dict[str, any]) -> tuple:
+        """Log row for a measurement."""
+        return (
+            measurement["timestamp"],
+            measurement["operation_type"],
+            measurement["duration_ms"],
+            measurement["cpu_percent"],
+            measurement["memory_mb"],
+            json.dumps(measurement["metadata"]) if measurement["metadata"] else None,
+        )
 
-            with open(self.storage_path, "w") as f:
-                json.dump(data, f, indent=2)
+    def _save(self):
+        """Append buffered measurements to the SQLite log."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
 
+        try:
+            self.db.insert_many(
+                "measurements",
+                [
+                    "timestamp",
+                    "operation_type",
+                    "duration_ms",
+                    "cpu_percent",
+                    "memory_mb",
+                    "metadata",
+                ],
+                pending,
+            )
         except Exception as e:
             print(f"Warning: Failed to save performance data: {e}")
 
     def _load(self):
-        """Load measurements from disk."""
-        if not self.storage_path.exists():
-            return
-
+        """Rebuild sketches and recent measurements from the log."""
         try:
-            with open(self.storage_path, "r") as f:
-                data = json.load(f)
-
-            self.measurements = data.get("measurements", [])
+            self._import_legacy_json()
+
+            cutoff = datetime.now() - timedelta(days=self.retention_days)
+            rows = self.db.conn.execute(
+                "SELECT timestamp, operation_type, duration_ms, cpu_percent, memory_mb "
+                "FROM measurements WHERE timestamp >= ? ORDER BY timestamp",
+                (cutoff.isoformat(),),
+            )
+            with self._lock:
+                for timestamp, operation_type, duration_ms, cpu_percent, memory_mb in rows:
+                    measurement = {
+                        "timestamp": timestamp,
+                        "operation_type": operation_type,
+                        "duration_ms": duration_ms,
+                        "cpu_percent": cpu_percent or 0.0,
+                        "memory_mb": memory_mb or 0.0,
+                        "metadata": {},
+                    }
+                    self._add_to_bucket(
+                        measurement, datetime.fromisoformat(timestamp).timestamp()
+                    )
+                    self.measurements.append(measurement)
 
         except Exception as e:
             print(f"Warning: Failed to load performance data: {e}")
-            self.measurements = []
+
+    def _import_legacy_json(self):
+        """One-time import of a pre-SQLite performance.json into an empty log."""
+        if self.storage_path.suffix != ".json" or not self.storage_path.exists():
+            return
+        if self.db.query_one("SELECT 1 AS found FROM measurements LIMIT 1"):
+            return
+
+        with open(self.storage_path, "r") as f:
+            data = json.load(f)
+
+        self.db.insert_many(
+            "measurements",
+            ["timestamp", "operation_type", "duration_ms", "cpu_percent", "memory_mb", "metadata"],
+            [
+                self._row({"cpu_percent": 0.0, "memory_mb": 0.0, "metadata": {}, **m})
+                for m in data.get("measurements", [])
+            ],
+        )
 
 
 # Context manager for timing operations
@@ -396,7 +565,3 @@ class Timer:
             duration_ms=self.duration_ms,
             metadata=self.metadata,
         )
-
-
-# Missing import
-from datetime import timedelta
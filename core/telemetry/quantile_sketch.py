@@ -0,0 +1,151 @@
+"""
+Quantile Sketch - Mergeable, bounded-memory percentile estimation
+
+A DDSketch-style sketch: positive values are counted in logarithmic buckets so
+every quantile is returned within a fixed relative error (default 1%) of the
+true value, whatever the distribution. Sketches built over different time
+buckets merge exactly by adding bucket counts, so windowed percentiles never
+rescan raw measurements.
+
+Usage:
+    sketch = QuantileSketch()
+    for duration_ms in durations:
+        sketch.add(duration_ms)
+    sketch.quantile(0.95)
+
+    hourly = [sketch_a, sketch_b]
+    merged = QuantileSketch.merged(hourly)
+"""
+
+import math
+from typing import Dict, Iterable, Optional
+
+
+class QuantileSketch:
+    """Relative-error quantile sketch with count/sum/min/max."""
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 1024):
+        """
+        Initialize sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of returned quantiles
+            max_bins: Bin cap; beyond it the lowest bins are collapsed, which
+                keeps memory bounded and only degrades the smallest quantiles
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, count: int = 1):
+        """
+        Add a value.
+
+        Args:
+            value: Value to add (values <= 0 are counted as zero)
+            count: Number of occurrences
+        """
+        if value > 0:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0) + count
+            if len(self.bins) > self.max_bins:
+                self._collapse()
+        else:
+            self.zero_count += count
+
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "QuantileSketch"):
+        """
+        Merge another sketch into this one.
+
+        Args:
+            other: Sketch with the same relative accuracy
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @classmethod
+    def merged(
+        cls, sketches: Iterable["QuantileSketch"], relative_accuracy: float = 0.01
+    ) -> "QuantileSketch":
+        """
+        Build a new sketch from several sketches.
+
+        Args:
+            sketches: Sketches to merge
+            relative_accuracy: Relative accuracy of the sketches
+
+        Returns:
+            Merged sketch
+        """
+        result = cls(relative_accuracy=relative_accuracy)
+        for sketch in sketches:
+            result.merge(sketch)
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+
+        Uses the same rank as sorted(values)[int(n * q)].
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if self.count == 0:
+            return None
+
+        rank = min(int(self.count * q), self.count - 1)
+        if rank < self.zero_count:
+            return min(self.min, 0.0)
+
+        seen = self.zero_count
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                value = 2 * self._gamma**key / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+
+        return self.max
+
+    @property
+    def avg(self) -> float:
+        """Mean of added values (0.0 when empty)."""
+        return self.sum / self.count if self.count else 0.0
+
+    def _collapse(self):
+        """Fold the lowest bins together until the bin cap holds."""
+        keys = sorted(self.bins)
+        excess = len(keys) - self.max_bins
+        target = keys[excess]
+        for key in keys[:excess]:
+            self.bins[target] += self.bins.pop(key)
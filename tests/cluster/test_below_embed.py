@@ -7,6 +7,9 @@ malformed response. All HTTP calls are mocked; no real network access.
 
 from __future__ import annotations
 
+import threading
+import time
+
 import pytest
 import httpx
 
@@ -20,6 +23,7 @@ from core.cluster.below.embed import (
     MalformedEmbedResponse,
     check_below_embed_available,
     embed_batch,
+    embed_coalesced,
     reset_circuit_breaker,
 )
 
@@ -291,3 +295,141 @@ class TestCircuitBreakerReset:
             result = embed_batch(["hello"])
 
         assert len(result) == 1
+
+
+# ---------------------------------------------------------------------------
+# Micro-batcher
+# ---------------------------------------------------------------------------
+
+
+class TestEmbedCoalesced:
+    @staticmethod
+    def _recording_embed_batch(calls: list, delay: float = 0.0):
+        def fake(texts, *, model=EMBED_MODEL, **_kwargs):
+            calls.append(list(texts))
+            if delay:
+                time.sleep(delay)
+            return [[float(len(t))] * EMBED_DIM for t in texts]
+        return fake
+
+    def test_single_caller_round_trip(self):
+        calls: list = []
+        with patch("core.cluster.below.embed.embed_batch", self._recording_embed_batch(calls)):
+            result = embed_coalesced(["abc", "de"])
+        assert [v[0] for v in result] == [3.0, 2.0]
+        assert calls == [["abc", "de"]]
+
+    def test_concurrent_callers_share_batches(self):
+        calls: list = []
+        texts = [f"prompt-{i:02d}" + "x" * i for i in range(16)]
+        results: dict = {}
+        barrier = threading.Barrier(len(texts))
+
+        def worker(text):
+            barrier.wait()
+            results[text] = embed_coalesced([text])[0][0]
+
+        with patch("core.cluster.below.embed.embed_batch",
+                   self._recording_embed_batch(calls, delay=0.01)):
+            threads = [threading.Thread(target=worker, args=(t,)) for t in texts]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert results == {t: float(len(t)) for t in texts}
+        assert sum(len(c) for c in calls) == len(texts)
+        assert len(calls) < len(texts)
+
+    def test_batch_error_fans_out_to_every_waiter(self):
+        def offline(texts, **_kwargs):
+            raise BelowOfflineError("down")
+
+        errors = []
+
+        def worker():
+            try:
+                embed_coalesced(["x"])
+            except BelowOfflineError as exc:
+                errors.append(exc)
+
+        with patch("core.cluster.below.embed.embed_batch", offline):
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert len(errors) == 4
+
+    def test_open_circuit_fails_without_http(self):
+        from core.cluster.below.embed import _CIRCUIT_THRESHOLD, _circuit
+
+        for _ in range(_CIRCUIT_THRESHOLD):
+            _circuit.record_failure()
+        with patch("core.cluster.below.embed.httpx.post") as mock_post:
+            with pytest.raises(BelowOfflineError, match="circuit breaker"):
+                embed_coalesced(["x"])
+        mock_post.assert_not_called()
+
+    def test_empty_texts_raises_value_error(self):
+        with pytest.raises(ValueError, match="at least one text"):
+            embed_coalesced([])
+
+    def test_dispatch_failure_keeps_batcher_running(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        import core.cluster.below.embed as embed_mod
+
+        class FlakyPool(ThreadPoolExecutor):
+            failed = False
+
+            def submit(self, fn, *args, **kwargs):
+                if not FlakyPool.failed:
+                    FlakyPool.failed = True
+                    raise RuntimeError("pool unavailable")
+                return super().submit(fn, *args, **kwargs)
+
+        batcher = embed_mod._MicroBatcher(0.001, 8, 2)
+        batcher._pool = FlakyPool(max_workers=2)
+        calls: list = []
+        with patch.object(embed_mod, "_batcher", batcher), \
+                patch("core.cluster.below.embed.embed_batch", self._recording_embed_batch(calls)):
+            with pytest.raises(RuntimeError, match="pool unavailable"):
+                embed_coalesced(["first"])
+            assert embed_coalesced(["second"])[0][0] == 6.0
+        assert calls == [["second"]]
+
+    def test_late_batch_skips_cancelled_futures(self):
+        from concurrent.futures import Future
+
+        import core.cluster.below.embed as embed_mod
+
+        batcher = embed_mod._MicroBatcher(0.001, 8, 2)
+        gone, waiting = Future(), Future()
+        gone.cancel()
+        calls: list = []
+        with patch("core.cluster.below.embed.embed_batch", self._recording_embed_batch(calls)):
+            batcher._send(EMBED_MODEL, [("ab", gone), ("abc", waiting)])
+
+        assert gone.cancelled()
+        assert waiting.result(timeout=1)[0] == 3.0
+        assert (batcher.batches_sent, batcher.items_sent) == (1, 2)
+
+    def test_result_wait_is_bounded(self):
+        import core.cluster.below.embed as embed_mod
+
+        release = threading.Event()
+
+        def stuck(texts, **_kwargs):
+            release.wait(5)
+            return [[0.0] * EMBED_DIM for _ in texts]
+
+        batcher = embed_mod._MicroBatcher(0.001, 8, 2)
+        try:
+            with patch.object(embed_mod, "_batcher", batcher), \
+                    patch.object(embed_mod, "MICRO_BATCH_RESULT_TIMEOUT_SECONDS", 0.1), \
+                    patch("core.cluster.below.embed.embed_batch", stuck):
+                with pytest.raises(BelowOfflineError, match="timed out"):
+                    embed_coalesced(["x"])
+        finally:
+            release.set()
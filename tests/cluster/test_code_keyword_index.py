@@ -0,0 +1,122 @@
+"""
+tests/cluster/test_code_keyword_index.py
+
+Unit tests for core.cluster.code_keyword_index — FTS5 keyword leg and
+reciprocal-rank fusion used by node_semantic's hybrid /api/search.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from core.cluster.code_keyword_index import CodeKeywordIndex, identifier_parts, rrf_fuse
+
+
+def _row(chunk_id: str, text: str, repo: str = "br3", file: str = "core/x.py") -> dict:
+    return {"id": chunk_id, "text": text, "repo": repo, "file": file, "start_line": 1, "end_line": 3}
+
+
+@pytest.fixture
+def index(tmp_path) -> CodeKeywordIndex:
+    kw = CodeKeywordIndex(tmp_path / "codebase_fts.db")
+    kw.upsert([
+        _row("a:c0", "def parse_phase_dependencies(spec):\n    return {}"),
+        _row("b:c0", "class SemanticCache:\n    pass", file="core/cache.py"),
+        _row("c:c0", "raise BelowOfflineError('embed circuit breaker is open')", repo="other"),
+    ])
+    return kw
+
+
+class TestSearch:
+    def test_exact_identifier(self, index):
+        hits = index.search("parse_phase_dependencies")
+        assert [h["id"] for h in hits] == ["a:c0"]
+        assert hits[0]["file"] == "core/x.py"
+
+    def test_camel_case_identifier(self, index):
+        assert [h["id"] for h in index.search("SemanticCache")] == ["b:c0"]
+
+    def test_identifier_parts_match_natural_language(self, index):
+        assert "a:c0" in [h["id"] for h in index.search("phase dependencies")]
+        assert "b:c0" in [h["id"] for h in index.search("semantic cache")]
+
+    def test_error_string(self, index):
+        assert index.search("circuit breaker is open")[0]["id"] == "c:c0"
+
+    def test_repo_filter(self, index):
+        assert index.search("circuit breaker", repo="br3") == []
+
+    def test_punctuation_only_query_is_empty(self, index):
+        assert index.search('"()"') == []
+
+
+class TestMaintenance:
+    def test_upsert_replaces_same_id(self, index):
+        index.upsert([_row("a:c0", "def renamed_function():\n    pass")])
+        assert index.search("parse_phase_dependencies") == []
+        assert [h["id"] for h in index.search("renamed_function")] == ["a:c0"]
+        assert index.count() == 3
+
+    def test_delete(self, index):
+        index.delete(["b:c0"])
+        assert index.search("SemanticCache") == []
+        assert index.ids() == {"a:c0", "c:c0"}
+
+
+class TestHelpers:
+    def test_identifier_parts(self):
+        assert identifier_parts("HTTPServer run_index x") == "http server run index"
+
+    def test_rrf_rewards_agreement(self):
+        fused = rrf_fuse([["a", "b", "c"], ["c", "b"]])
+        assert {doc for doc, _ in fused[:2]} == {"b", "c"}
+        assert fused[-1][0] == "a"
+
+
+class _FakeVectorQuery:
+    def __init__(self, rows: list[dict]):
+        self._rows = rows
+        self.limit_value = None
+
+    def metric(self, _name):
+        return self
+
+    def limit(self, n):
+        self.limit_value = n
+        return self
+
+    def where(self, _clause):
+        return self
+
+    def to_list(self):
+        return self._rows[: self.limit_value]
+
+
+class TestHybridSearch:
+    def test_overfetch_survives_per_file_dedup(self, tmp_path, monkeypatch):
+        import asyncio
+
+        import core.cluster.node_semantic as ns
+
+        # Two chunks per file: without over-fetch the dedup halves the result count
+        rows = [
+            dict(_row(f"f{i}:c{j}", f"chunk {j} of module{i}", file=f"core/m{i}.py"),
+                 _distance=0.1 * (2 * i + j))
+            for i in range(4) for j in range(2)
+        ]
+        query = _FakeVectorQuery(rows)
+        table = type("FakeTable", (), {"search": lambda self, _emb: query})()
+        kw = CodeKeywordIndex(tmp_path / "codebase_fts.db")
+        kw.upsert([_row("k:c0", "unrelated_identifier", file="core/k.py")])
+
+        monkeypatch.setattr(ns, "DISABLE_INDEXER", False)
+        monkeypatch.setattr(ns, "_get_db", lambda: (None, table))
+        monkeypatch.setattr(ns, "_get_embedder", lambda: None)
+        monkeypatch.setattr(ns, "_embed_query", lambda *_args: [0.0])
+        monkeypatch.setattr(ns, "_get_keyword_index", lambda: kw)
+
+        body = asyncio.run(ns.search(ns.SearchRequest(query="module", n_results=3)))
+
+        assert query.limit_value == 3 * ns.SEARCH_OVERFETCH
+        assert [h["file"] for h in body["results"]] == ["core/m0.py", "core/m1.py", "core/m2.py"]
+        assert body["results"][0]["similarity"] == round(1 / (1 + 0.0), 4)
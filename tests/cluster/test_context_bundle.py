@@ -3,15 +3,18 @@
 Unit-level coverage for the bundle assembler:
   1. Flag OFF → empty bundle
   2. filter_private_lines drops [private] lines and preserves [privately] / [private-note]
-  3. count_tokens raises RuntimeError on exit 2 (fail-closed tokenizer)
+  3. count_tokens falls back to count-tokens.sh, and raises RuntimeError when
+     that is missing too (fail-closed)
   4. assemble propagates tokenizer error (no byte fallback)
   5. All five source types present in a populated bundle
   6. to_prompt_block renders the expected <cluster-context> envelope
+  7. Tokenizers load once per process; trimming cuts at a token boundary within budget
 """
 
 from __future__ import annotations
 
 import os
+import re
 import sqlite3
 from pathlib import Path
 from typing import Generator
@@ -58,38 +61,141 @@ def test_filter_private_lines_preserves_word_boundary_negatives() -> None:
 
 
 # ---------------------------------------------------------------------------
-# count_tokens — exit-2 fail-closed
+# count_tokens — in-process tokenizer registry, fail-closed
 # ---------------------------------------------------------------------------
 
-def test_count_tokens_raises_on_exit_2(tmp_path: Path) -> None:
+def _fixed_token_counts(tokens: int):
+    """count_tokens_batch side_effect: every section counts as ``tokens``."""
+    return lambda texts, model: [tokens] * len(texts)
+
+
+def _make_word_tokenizer():
+    from core.cluster.tokenizer_registry import OffsetTokenizer
+
+    class WordTokenizer(OffsetTokenizer):
+        """One token per whitespace-delimited word (trailing whitespace included)."""
+
+        name = "words"
+
+        def encode_batch(self, texts: list[str]) -> list[list[int]]:
+            return [[len(m.group()) for m in re.finditer(r"\S+\s*", t)] for t in texts]
+
+        def _scan(self, text: str, max_tokens: int) -> tuple[int, int | None]:
+            starts = [m.start() for m in re.finditer(r"\S+\s*", text)]
+            return len(starts), (starts[max_tokens] if len(starts) > max_tokens else None)
+
+    return WordTokenizer()
+
+
+@pytest.fixture()
+def word_tokenizers() -> Generator[dict, None, None]:
+    """Register a word tokenizer for every model, counting loads."""
+    from core.cluster import tokenizer_registry
+
+    loads = {"count": 0}
+
+    def load():
+        loads["count"] += 1
+        return _make_word_tokenizer()
+
+    tokenizer_registry.reset_tokenizers()
+    with mock.patch.dict(
+        tokenizer_registry._LOADERS, {"cl100k_base": load, "qwen2.5": load}
+    ):
+        yield loads
+    tokenizer_registry.reset_tokenizers()
+
+
+def _missing_tokenizer():
+    raise ImportError("No module named 'tiktoken'")
+
+
+def test_count_tokens_raises_when_tokenizer_missing(tmp_path: Path) -> None:
+    from core.cluster import context_bundle, tokenizer_registry
+
+    tokenizer_registry.reset_tokenizers()
+    try:
+        with mock.patch.dict(
+            tokenizer_registry._LOADERS, {"cl100k_base": _missing_tokenizer}
+        ), mock.patch.object(tokenizer_registry, "_COUNT_TOKENS_SH", tmp_path / "none.sh"):
+            with pytest.raises(RuntimeError, match="tokenizer unavailable"):
+                context_bundle.count_tokens("some text", "claude")
+            # Failure is remembered — still refused, never estimated
+            with pytest.raises(RuntimeError, match="tokenizer unavailable"):
+                context_bundle.count_tokens_batch(["a", "b"], "codex")
+    finally:
+        tokenizer_registry.reset_tokenizers()
+
+
+def test_missing_tokenizer_falls_back_to_count_tokens_script(tmp_path: Path, caplog) -> None:
+    from core.cluster import context_bundle, tokenizer_registry
+
+    script = tmp_path / "count-tokens.sh"
+    script.write_text('#!/bin/sh\n[ "$1" = "--model" ] || exit 1\nwc -w < "$3" | tr -d " "\n')
+    script.chmod(0o755)
+
+    tokenizer_registry.reset_tokenizers()
+    try:
+        with mock.patch.dict(
+            tokenizer_registry._LOADERS, {"cl100k_base": _missing_tokenizer}
+        ), mock.patch.object(tokenizer_registry, "_COUNT_TOKENS_SH", script):
+            with caplog.at_level("WARNING", logger="core.cluster.tokenizer_registry"):
+                assert context_bundle.count_tokens_batch(["a b c", "d"], "claude") == [3, 1]
+            assert "FALLING BACK" in caplog.text
+
+            text = " ".join(f"w{i}" for i in range(30))
+            trimmed, tokens = context_bundle._trim_to_budget(text, "claude", 10)
+            assert tokens <= 10
+            assert trimmed.startswith("w0 w1")
+    finally:
+        tokenizer_registry.reset_tokenizers()
+
+
+def test_qwen_tokenizer_found_in_hf_cache_without_download(tmp_path: Path, monkeypatch) -> None:
+    from core.cluster import tokenizer_registry
+
+    snapshot = tmp_path / "hub" / "models--Qwen--Qwen2.5-7B-Instruct" / "snapshots" / "abc"
+    snapshot.mkdir(parents=True)
+    (snapshot / "tokenizer.json").write_text("{}")
+    monkeypatch.setenv("HF_HUB_CACHE", str(tmp_path / "hub"))
+    monkeypatch.delenv("BR3_QWEN_TOKENIZER", raising=False)
+    monkeypatch.setattr(tokenizer_registry, "_QWEN_TOKENIZER_JSON", tmp_path / "none.json")
+
+    assert tokenizer_registry._qwen_tokenizer_path() == snapshot / "tokenizer.json"
+
+    (snapshot / "tokenizer.json").unlink()
+    with pytest.raises(FileNotFoundError, match="not found"):
+        tokenizer_registry._qwen_tokenizer_path()
+
+
+def test_count_tokens_rejects_unknown_model() -> None:
     from core.cluster import context_bundle
 
-    fake_script = tmp_path / "count-tokens.sh"
-    fake_script.write_text("#!/bin/sh\nexit 2\n")
-    fake_result = mock.Mock(returncode=2, stdout="", stderr="tokenizer missing")
-    with mock.patch.object(context_bundle, "_COUNT_TOKENS_SH", fake_script), \
-         mock.patch("core.cluster.context_bundle.subprocess.run", return_value=fake_result):
-        with pytest.raises(RuntimeError, match="tokenizer unavailable"):
-            context_bundle.count_tokens("some text", "claude")
+    with pytest.raises(ValueError, match="Unknown model"):
+        context_bundle.count_tokens("x", "gpt-9")
 
 
-def test_count_tokens_rejects_unknown_model(tmp_path: Path) -> None:
+def test_tokenizer_loaded_once_and_batched(word_tokenizers) -> None:
     from core.cluster import context_bundle
 
-    fake_script = tmp_path / "count-tokens.sh"
-    fake_script.write_text("#!/bin/sh\nexit 0\n")
-    with mock.patch.object(context_bundle, "_COUNT_TOKENS_SH", fake_script):
-        with pytest.raises(ValueError, match="Unknown model"):
-            context_bundle.count_tokens("x", "gpt-9")
+    assert context_bundle.count_tokens("one two three", "claude") == 3
+    assert context_bundle.count_tokens_batch(["a b", "", "c d e f"], "codex") == [2, 0, 4]
+    assert context_bundle.count_tokens("x y", "ollama") == 2
+    # One load per tokenizer name (cl100k_base shared by claude/codex, plus qwen2.5)
+    assert word_tokenizers["count"] == 2
 
 
-def test_count_tokens_missing_script_raises(tmp_path: Path) -> None:
+def test_trim_to_budget_cuts_at_token_boundary(word_tokenizers) -> None:
     from core.cluster import context_bundle
 
-    missing = tmp_path / "does-not-exist.sh"
-    with mock.patch.object(context_bundle, "_COUNT_TOKENS_SH", missing):
-        with pytest.raises(RuntimeError, match="count-tokens.sh not found"):
-            context_bundle.count_tokens("x", "claude")
+    text = " ".join(f"word{i}" for i in range(100))
+    trimmed, tokens = context_bundle._trim_to_budget(text, "claude", 20)
+
+    marker = context_bundle._TRIM_MARKER
+    kept = 20 - context_bundle.count_tokens(marker, "claude")
+    assert trimmed.endswith(marker)
+    assert tokens == context_bundle.count_tokens(trimmed, "claude") == 20
+    assert trimmed[: -len(marker)].split() == [f"word{i}" for i in range(kept)]
 
 
 # ---------------------------------------------------------------------------
@@ -108,7 +214,7 @@ def test_assemble_flag_off_returns_empty_bundle() -> None:
 
 
 def test_assemble_propagates_tokenizer_failure(tmp_path: Path) -> None:
-    """If count_tokens raises RuntimeError, assemble must re-raise (no byte fallback)."""
+    """If token counting raises RuntimeError, assemble must re-raise (no byte fallback)."""
     from core.cluster.context_bundle import ContextBundleAssembler
 
     br_dir = tmp_path / ".buildrunner"
@@ -124,7 +230,7 @@ def test_assemble_propagates_tokenizer_failure(tmp_path: Path) -> None:
         _DECISIONS_LOG=br_dir / "decisions.log",
         _DECISIONS_PUBLIC_LOG=br_dir / "decisions.public.log",
     ), mock.patch(
-        "core.cluster.context_bundle.count_tokens",
+        "core.cluster.context_bundle.count_tokens_batch",
         side_effect=RuntimeError("tokenizer unavailable"),
     ), mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
         with pytest.raises(RuntimeError, match="tokenizer unavailable"):
@@ -189,8 +295,9 @@ def populated_sources(tmp_path: Path) -> Generator[dict, None, None]:
 def test_bundle_contains_all_five_source_types(populated_sources) -> None:
     from core.cluster.context_bundle import ContextBundleAssembler
 
-    with mock.patch("core.cluster.context_bundle.count_tokens", return_value=50), \
-         mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
+    with mock.patch(
+        "core.cluster.context_bundle.count_tokens_batch", side_effect=_fixed_token_counts(50)
+    ), mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
         bundle = ContextBundleAssembler().assemble(model="claude", token_budget=32_000)
 
     source_types = {s.source_type for s in bundle.sections}
@@ -200,8 +307,9 @@ def test_bundle_contains_all_five_source_types(populated_sources) -> None:
 def test_to_prompt_block_wraps_sections(populated_sources) -> None:
     from core.cluster.context_bundle import ContextBundleAssembler
 
-    with mock.patch("core.cluster.context_bundle.count_tokens", return_value=50), \
-         mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
+    with mock.patch(
+        "core.cluster.context_bundle.count_tokens_batch", side_effect=_fixed_token_counts(50)
+    ), mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
         bundle = ContextBundleAssembler().assemble(model="claude", token_budget=32_000)
 
     block = bundle.to_prompt_block()
@@ -209,3 +317,125 @@ def test_to_prompt_block_wraps_sections(populated_sources) -> None:
     assert block.rstrip().endswith("</cluster-context>")
     assert "## LOGS" in block
     assert "## DECISIONS" in block
+
+
+def test_assemble_trims_over_budget_section(populated_sources, word_tokenizers) -> None:
+    from core.cluster.context_bundle import ContextBundleAssembler
+
+    research = populated_sources["tmp_path"] / "research-library" / "long.md"
+    research.write_text(" ".join(f"finding{i}" for i in range(500)))
+
+    with mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
+        bundle = ContextBundleAssembler().assemble(model="claude", token_budget=60)
+
+    assert bundle.token_total <= 60
+    assert bundle.token_total == sum(s.tokens for s in bundle.sections)
+    assert bundle.budget["tokenizer"] == "cl100k_base"
+    research_section = next(s for s in bundle.sections if s.source_type == "research")
+    assert research_section.content.endswith("...[trimmed to budget]")
+
+
+# ---------------------------------------------------------------------------
+# Section cache — rebuild only sections whose source fingerprint changed
+# ---------------------------------------------------------------------------
+
+def _assemble(assembler, query: str = ""):
+    with mock.patch(
+        "core.cluster.context_bundle.count_tokens_batch", side_effect=_fixed_token_counts(50)
+    ), mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
+        return assembler.assemble(model="claude", token_budget=32_000, query=query)
+
+
+def _cache_hits(bundle) -> dict[str, bool]:
+    return {source: stats["cache_hit"] for source, stats in bundle.section_stats.items()}
+
+
+def test_second_assemble_reuses_all_sections(populated_sources) -> None:
+    from core.cluster.context_bundle import ContextBundleAssembler
+
+    assembler = ContextBundleAssembler()
+    first = _assemble(assembler)
+    second = _assemble(assembler)
+
+    assert list(first.section_stats) == ["logs", "decisions", "memory", "intel", "research"]
+    assert not any(_cache_hits(first).values())
+    assert all(_cache_hits(second).values())
+    assert [s.content for s in second.sections] == [s.content for s in first.sections]
+    assert second.to_dict()["section_stats"] == second.section_stats
+
+    stats = assembler.cache_stats()
+    assert stats["memory"]["hits"] == 1 and stats["memory"]["misses"] == 1
+    assert stats["memory"]["hit_rate"] == 0.5
+    assert stats["memory"]["avg_build_ms"] >= 0.0
+
+
+def test_changed_sources_are_rebuilt(populated_sources) -> None:
+    from core.cluster.context_bundle import ContextBundleAssembler
+
+    tmp_path = populated_sources["tmp_path"]
+    assembler = ContextBundleAssembler()
+    _assemble(assembler)
+
+    (tmp_path / ".buildrunner" / "browser.log").write_text("browser entry\nnew browser line")
+    conn = sqlite3.connect(str(tmp_path / ".lockwood" / "memory.db"))
+    conn.execute("INSERT INTO memories VALUES (?, ?)", ("fresh memory", "2026-04-21T00:00:00Z"))
+    conn.commit()
+    conn.close()
+
+    bundle = _assemble(assembler)
+
+    assert _cache_hits(bundle) == {
+        "logs": False,
+        "decisions": True,
+        "memory": False,
+        "intel": True,
+        "research": True,
+    }
+    sections = {s.source_type: s.content for s in bundle.sections}
+    assert "new browser line" in sections["logs"]
+    assert "fresh memory" in sections["memory"]
+
+
+def test_query_change_rebuilds_research_only(populated_sources) -> None:
+    from core.cluster.context_bundle import ContextBundleAssembler
+
+    assembler = ContextBundleAssembler()
+    with mock.patch(
+        "core.cluster.context_bundle._rerank_research_candidates",
+        side_effect=lambda query, candidates, top_k: candidates[:top_k],
+    ):
+        _assemble(assembler, query="first")
+        same = _assemble(assembler, query="first")
+        other = _assemble(assembler, query="second")
+
+    assert all(_cache_hits(same).values())
+    assert [s for s, hit in _cache_hits(other).items() if not hit] == ["research"]
+
+
+def test_cache_disabled_always_rebuilds(populated_sources) -> None:
+    from core.cluster.context_bundle import ContextBundleAssembler
+
+    assembler = ContextBundleAssembler(cache_sections=False)
+    _assemble(assembler)
+    bundle = _assemble(assembler)
+
+    assert not any(_cache_hits(bundle).values())
+
+
+def test_context_route_reuses_sections_across_requests(populated_sources) -> None:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    import api.routes.context as context_route
+
+    app = FastAPI()
+    app.include_router(context_route.router)
+    with mock.patch.object(context_route, "_context_router", None), mock.patch(
+        "core.cluster.context_bundle.count_tokens_batch", side_effect=_fixed_token_counts(50)
+    ), mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
+        client = TestClient(app)
+        first = client.get("/context/claude").json()["bundle"]["section_stats"]
+        second = client.get("/context/claude").json()["bundle"]["section_stats"]
+
+    assert not any(stats["cache_hit"] for stats in first.values())
+    assert all(stats["cache_hit"] for stats in second.values())
@@ -7,6 +7,7 @@ Verifies the per-model routing contract:
   4. Flag OFF → empty bundle with config budget preserved
   5. Flag ON delegates to assembler with model-specific budget
   6. All five source types are declared for every model
+  7. Per-section cache stats are reported from the assembler
 """
 
 from __future__ import annotations
@@ -58,7 +59,7 @@ def test_route_flag_on_delegates_to_assembler_with_budget() -> None:
 
     router = ContextRouter()
     fake_assembler = mock.Mock()
-    fake_assembler.assemble.return_value = mock.Mock()
+    fake_assembler.assemble.return_value = mock.Mock(section_stats={})
     router._assembler = fake_assembler
 
     with mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
@@ -87,3 +88,14 @@ def test_list_models_excludes_aliases() -> None:
     from core.cluster.context_router import ContextRouter
 
     assert ContextRouter().list_models() == ["claude", "codex", "ollama"]
+
+
+def test_cache_stats_delegates_to_assembler() -> None:
+    from core.cluster.context_router import ContextRouter
+
+    router = ContextRouter()
+    stats = {"logs": {"hits": 3, "misses": 1, "hit_rate": 0.75, "avg_build_ms": 0.2}}
+    router._assembler = mock.Mock()
+    router._assembler.cache_stats.return_value = stats
+
+    assert router.cache_stats() == stats
@@ -0,0 +1,148 @@
+"""
+tests/cluster/test_hunt_title_dedup.py
+
+Unit tests for hunt_sourcer title dedup — batched embedding, the persistent
+title-embedding cache, and the matrix/LSH dedup pass. Below is mocked.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import threading
+
+import pytest
+
+import core.cluster.hunt_sourcer as sourcer
+from core.cluster.title_index import dedup_embeddings
+
+
+class _FakeResponse:
+    status_code = 200
+
+    def __init__(self, embeddings):
+        self._embeddings = embeddings
+
+    def json(self):
+        return {"embeddings": self._embeddings}
+
+
+class _FakeClient:
+    def __init__(self, vectors, calls):
+        self._vectors = vectors
+        self._calls = calls
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def post(self, url, json):
+        self._calls.append(list(json["input"]))
+        return _FakeResponse([self._vectors[t] for t in json["input"]])
+
+
+@pytest.fixture
+def below(monkeypatch, tmp_path):
+    """Fake Below embed endpoint + a fresh cache; returns the list of embed batches sent."""
+    vectors = {
+        "RTX 3090 FTW3": [1.0, 0.0, 0.0],
+        "rtx 3090 ftw3 ultra": [0.98, 0.05, 0.0],
+        "DDR5 64GB kit": [0.0, 1.0, 0.0],
+        "Ryzen 9 7950X": [0.0, 0.0, 1.0],
+    }
+    calls = []
+    monkeypatch.setattr(sourcer.httpx, "AsyncClient", lambda **kw: _FakeClient(vectors, calls))
+    monkeypatch.setattr(
+        sourcer, "_title_cache", sourcer.TitleEmbeddingCache(tmp_path / "titles.db")
+    )
+    return calls
+
+
+def _items(*names):
+    return [{"name": name} for name in names]
+
+
+@pytest.mark.asyncio
+async def test_dedup_batches_and_caches_titles(below, monkeypatch):
+    monkeypatch.setattr(sourcer, "EMBED_BATCH_SIZE", 2)
+    items = _items("RTX 3090 FTW3", "DDR5 64GB kit", "rtx 3090 ftw3 ultra", "RTX 3090 FTW3")
+
+    kept = await sourcer._dedup_by_title_similarity(items, 0.85)
+
+    assert [i["name"] for i in kept] == ["RTX 3090 FTW3", "DDR5 64GB kit"]
+    assert below == [["RTX 3090 FTW3", "DDR5 64GB kit"], ["rtx 3090 ftw3 ultra"]]
+
+    # Next hunt cycle: only the unseen title is embedded
+    kept = await sourcer._dedup_by_title_similarity(
+        _items("DDR5 64GB kit", "Ryzen 9 7950X", "RTX 3090 FTW3"), 0.85
+    )
+    assert len(kept) == 3
+    assert below[2:] == [["Ryzen 9 7950X"]]
+
+
+@pytest.mark.asyncio
+async def test_items_without_embeddings_are_kept(below):
+    items = _items("RTX 3090 FTW3", "", "rtx 3090 ftw3 ultra")
+
+    kept = await sourcer._dedup_by_title_similarity(items, 0.85)
+
+    assert [i["name"] for i in kept] == ["RTX 3090 FTW3", ""]
+
+
+def test_cache_persists_across_instances(tmp_path):
+    cache = sourcer.TitleEmbeddingCache(tmp_path / "titles.db")
+    cache.put_many("m", {"RTX 3090": [0.5, 0.25]})
+
+    reopened = sourcer.TitleEmbeddingCache(tmp_path / "titles.db")
+
+    assert reopened.get_many("m", ["rtx  3090", "other"]) == {"rtx  3090": [0.5, 0.25]}
+    assert reopened.get_many("other-model", ["RTX 3090"]) == {}
+
+
+def test_cache_shared_across_threads(tmp_path):
+    cache = sourcer.TitleEmbeddingCache(tmp_path / "titles.db")
+    cache.put_many("m", {"RTX 3090": [0.5, 0.25]})
+
+    # e.g. the sourcer thread after the API event loop opened the connection
+    result = {}
+    worker = threading.Thread(
+        target=lambda: result.update(cache.get_many("m", ["RTX 3090"]))
+    )
+    worker.start()
+    worker.join()
+
+    assert result == {"RTX 3090": [0.5, 0.25]}
+
+
+def test_cache_returns_every_title_sharing_a_hash(tmp_path):
+    cache = sourcer.TitleEmbeddingCache(tmp_path / "titles.db")
+    cache.put_many("m", {"RTX 3090": [0.5, 0.25]})
+
+    found = cache.get_many("m", ["RTX 3090", "rtx 3090", "Rtx  3090"])
+
+    assert found == {t: [0.5, 0.25] for t in ("RTX 3090", "rtx 3090", "Rtx  3090")}
+
+
+def _random_unit(rng, dim):
+    vec = [rng.gauss(0.0, 1.0) for _ in range(dim)]
+    norm = math.sqrt(sum(x * x for x in vec))
+    return [x / norm for x in vec]
+
+
+def test_lsh_dedup_matches_exact_on_near_duplicates():
+    rng = random.Random(3)
+    dim = 32
+    vectors = []
+    for _ in range(300):
+        base = _random_unit(rng, dim)
+        vectors.append(base)
+        # Near-duplicate listing (cosine ~0.99)
+        vectors.append([x + rng.gauss(0.0, 0.02) for x in base])
+
+    exact = dedup_embeddings(vectors, 0.85, lsh_min_items=10_000)
+    bucketed = dedup_embeddings(vectors, 0.85, lsh_min_items=1)
+
+    assert exact == list(range(0, 600, 2))
+    assert bucketed == exact
@@ -0,0 +1,109 @@
+"""
+tests/cluster/test_index_manifest.py
+
+Unit tests for core.cluster.index_manifest — the persisted per-file manifest
+used by node_semantic.run_index for incremental, delete-aware indexing.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from core.cluster.index_manifest import IndexManifest, ManifestEntry, content_hash
+
+
+def _write(path: Path, text: str, mtime: float | None = None) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def _indexed(manifest: IndexManifest, files: list[Path]) -> IndexManifest:
+    plan = manifest.diff(files)
+    manifest.apply(plan, {k: [f"{k}:c0"] for k in plan.changed})
+    return manifest
+
+
+class TestDiff:
+    def test_new_files_are_changed(self, tmp_path):
+        a = _write(tmp_path / "repo" / "a.py", "x = 1\n")
+        plan = IndexManifest(tmp_path / "m.json").diff([a])
+        assert list(plan.changed) == [str(a)]
+        assert plan.changed[str(a)].hash == content_hash(a)
+        assert not plan.stale_chunk_ids
+
+    def test_unchanged_stat_skips_hashing(self, tmp_path):
+        a = _write(tmp_path / "a.py", "x = 1\n")
+        manifest = _indexed(IndexManifest(tmp_path / "m.json"), [a])
+        plan = manifest.diff([a])
+        assert plan.unchanged == 1
+        assert not plan.changed and not plan.touched
+
+    def test_touched_file_with_same_content_is_not_reembedded(self, tmp_path):
+        a = _write(tmp_path / "a.py", "x = 1\n", mtime=1_000_000)
+        manifest = _indexed(IndexManifest(tmp_path / "m.json"), [a])
+        os.utime(a, (2_000_000, 2_000_000))
+        plan = manifest.diff([a])
+        assert not plan.changed
+        assert plan.touched[str(a)].chunk_ids == [f"{a}:c0"]
+        assert not plan.stale_chunk_ids
+
+    def test_modified_file_marks_old_chunks_stale(self, tmp_path):
+        a = _write(tmp_path / "a.py", "x = 1\n", mtime=1_000_000)
+        manifest = _indexed(IndexManifest(tmp_path / "m.json"), [a])
+        _write(a, "x = 2\ny = 3\n", mtime=2_000_000)
+        plan = manifest.diff([a])
+        assert str(a) in plan.changed
+        assert plan.stale_chunk_ids == {f"{a}:c0"}
+
+    def test_deleted_file_marks_chunks_stale(self, tmp_path):
+        a = _write(tmp_path / "a.py", "x = 1\n")
+        b = _write(tmp_path / "b.py", "y = 1\n")
+        manifest = _indexed(IndexManifest(tmp_path / "m.json"), [a, b])
+        plan = manifest.diff([a])
+        assert plan.deleted == [str(b)]
+        assert plan.stale_chunk_ids == {f"{b}:c0"}
+
+
+class TestApply:
+    def test_failed_files_are_dropped_for_retry(self, tmp_path):
+        a = _write(tmp_path / "a.py", "x = 1\n")
+        b = _write(tmp_path / "b.py", "y = 1\n")
+        manifest = IndexManifest(tmp_path / "m.json")
+        plan = manifest.diff([a, b])
+        manifest.apply(plan, {str(a): ["a:c0"]})
+        assert set(manifest.files) == {str(a)}
+        assert str(b) in manifest.diff([a, b]).changed
+
+    def test_deleted_files_are_removed(self, tmp_path):
+        a = _write(tmp_path / "a.py", "x = 1\n")
+        manifest = _indexed(IndexManifest(tmp_path / "m.json"), [a])
+        manifest.apply(manifest.diff([]), {})
+        assert manifest.files == {}
+        assert manifest.all_chunk_ids() == set()
+
+
+class TestPersistence:
+    def test_roundtrip(self, tmp_path):
+        path = tmp_path / "lance" / "codebase.manifest.json"
+        manifest = IndexManifest(path, {"/r/a.py": ManifestEntry(1.5, 10, "abc", ["a:c0", "a:c1"])})
+        manifest.save()
+        loaded = IndexManifest.load(path)
+        assert loaded.files == manifest.files
+        assert not path.with_suffix(".json.tmp").exists()
+
+    def test_restart_reindexes_nothing(self, tmp_path):
+        a = _write(tmp_path / "a.py", "x = 1\n")
+        path = tmp_path / "m.json"
+        _indexed(IndexManifest(path), [a]).save()
+        plan = IndexManifest.load(path).diff([a])
+        assert plan.unchanged == 1 and not plan.changed
+
+    def test_missing_or_corrupt_file_yields_empty(self, tmp_path):
+        assert IndexManifest.load(tmp_path / "nope.json").files == {}
+        bad = tmp_path / "bad.json"
+        bad.write_text("{not json")
+        assert IndexManifest.load(bad).files == {}
@@ -103,6 +103,11 @@ def mock_sources(tmp_path: Path) -> Generator[dict[str, Path], None, None]:
         }
 
 
+def _fixed_token_counts(tokens: int):
+    """count_tokens_batch side_effect: every section counts as ``tokens``."""
+    return lambda texts, model: [tokens] * len(texts)
+
+
 def _get_sources_cited(bundle) -> set[str]:
     """Return the set of source_type names that have non-empty content."""
     return {
@@ -125,8 +130,10 @@ def test_all_five_sources(mock_sources, model: str, budget: int) -> None:
     """Each model's bundle must cite at least one item from EACH of the 5 source types."""
     from core.cluster.context_bundle import ContextBundleAssembler
 
-    # Patch count_tokens to return a safe integer (tokenizer may not be installed in CI)
-    with mock.patch("core.cluster.context_bundle.count_tokens", return_value=100):
+    # Patch count_tokens_batch to return safe integers (tokenizer may not be installed in CI)
+    with mock.patch(
+        "core.cluster.context_bundle.count_tokens_batch", side_effect=_fixed_token_counts(100)
+    ):
         with mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
             assembler = ContextBundleAssembler()
             bundle = assembler.assemble(model=model, token_budget=budget)
@@ -149,7 +156,9 @@ def test_all_three_models_pass(mock_sources) -> None:
     results: dict[str, set[str]] = {}
     required = {"logs", "decisions", "memory", "intel", "research"}
 
-    with mock.patch("core.cluster.context_bundle.count_tokens", return_value=100):
+    with mock.patch(
+        "core.cluster.context_bundle.count_tokens_batch", side_effect=_fixed_token_counts(100)
+    ):
         with mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
             assembler = ContextBundleAssembler()
             for model, budget in [("claude", 32_000), ("codex", 48_000), ("ollama", 16_000)]:
@@ -210,7 +219,9 @@ def test_prompt_block_format(mock_sources) -> None:
     """Bundle.to_prompt_block() produces a valid <cluster-context> block."""
     from core.cluster.context_bundle import ContextBundleAssembler
 
-    with mock.patch("core.cluster.context_bundle.count_tokens", return_value=100):
+    with mock.patch(
+        "core.cluster.context_bundle.count_tokens_batch", side_effect=_fixed_token_counts(100)
+    ):
         with mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
             assembler = ContextBundleAssembler()
             bundle = assembler.assemble(model="codex", token_budget=48_000)
@@ -30,6 +30,11 @@ PUBLIC_LINE_1 = "[public] Phase 12: context parity shipped"
 PUBLIC_LINE_2 = "2026-04-20T12:00:00Z PHASE-12 COMPLETE <model> key-decision"
 
 
+def _fixed_token_counts(tokens: int):
+    """count_tokens_batch side_effect: every section counts as ``tokens``."""
+    return lambda texts, model: [tokens] * len(texts)
+
+
 # ---------------------------------------------------------------------------
 # test_filter_private_lines — Python filter function
 # ---------------------------------------------------------------------------
@@ -202,7 +207,9 @@ def test_bundle_no_private_leak(canary_sources) -> None:
     """Assemble bundles for all models; canary must NOT appear in any bundle output."""
     from core.cluster.context_bundle import ContextBundleAssembler
 
-    with mock.patch("core.cluster.context_bundle.count_tokens", return_value=100):
+    with mock.patch(
+        "core.cluster.context_bundle.count_tokens_batch", side_effect=_fixed_token_counts(100)
+    ):
         with mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
             assembler = ContextBundleAssembler()
 
@@ -305,7 +312,9 @@ def test_research_canary_never_reaches_bundle(tmp_path: Path) -> None:
         _JIMMY_MEMORY_DB=missing_db,
         _JIMMY_INTEL_DB=missing_db,
     ):
-        with mock.patch.object(context_bundle, "count_tokens", return_value=100):
+        with mock.patch.object(
+            context_bundle, "count_tokens_batch", side_effect=_fixed_token_counts(100)
+        ):
             with mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
                 assembler = ContextBundleAssembler()
                 bundle = assembler.assemble(model="claude", token_budget=32_000)
@@ -0,0 +1,319 @@
+"""
+tests/cluster/test_node_analysis_incremental.py
+
+Unit tests for incremental log ingestion in core.cluster.node_analysis —
+byte-offset tailing with rotation detection, the streaming pattern
+detectors / correlation join, and the live-state API endpoints.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+
+import pytest
+
+import core.cluster.node_analysis as na
+from core.cluster.log_tail import LogTail
+
+
+# ---------------------------------------------------------------------------
+# LogTail
+# ---------------------------------------------------------------------------
+
+
+def test_tail_reads_only_appended_lines(tmp_path):
+    log = tmp_path / "browser.log"
+    log.write_text("one\ntwo\npart")
+    tail = LogTail(log)
+
+    assert tail.read_lines() == (["one", "two"], False)
+    assert tail.read_lines() == ([], False)
+
+    with open(log, "a") as f:
+        f.write("ial\nthree\n")
+    assert tail.read_lines() == (["partial", "three"], False)
+
+
+def test_tail_bootstrap_reads_only_the_end(tmp_path):
+    log = tmp_path / "browser.log"
+    log.write_text("".join(f"line {n}\n" for n in range(10_000)))
+    tail = LogTail(log, tail_lines=5, bootstrap_bytes=200)
+
+    lines, _ = tail.read_lines()
+
+    assert lines == [f"line {n}" for n in range(9995, 10_000)]
+    assert tail.offset == log.stat().st_size
+
+
+def test_tail_detects_rotation_and_truncation(tmp_path):
+    log = tmp_path / "browser.log"
+    log.write_text("old 1\nold 2\n")
+    tail = LogTail(log)
+    tail.read_lines()
+
+    rotated = tmp_path / "browser.log.new"
+    rotated.write_text("new 1\n")
+    os.replace(rotated, log)
+    assert tail.read_lines() == (["new 1"], True)
+
+    # Truncated in place (same inode) to below the checkpoint
+    log.write_text("t\n")
+    assert tail.read_lines() == (["t"], True)
+
+
+# ---------------------------------------------------------------------------
+# Pattern window
+# ---------------------------------------------------------------------------
+
+
+def _random_entries(rng: random.Random, count: int) -> list[dict]:
+    entries = []
+    for n in range(count):
+        ts = f"2026-01-01T00:{n // 60 % 60:02d}:{n % 60:02d}Z"
+        kind = rng.choice(["query", "edge", "auth", "console", "device", "net"])
+        if kind == "query":
+            entries.append({
+                "timestamp": ts, "log_type": "supabase", "event_type": "query",
+                "method": rng.choice(["GET", "HEAD"]), "url": "/rest/v1/t",
+                "status_code": rng.choice([200, 200, 404, 500]),
+                "response_size": rng.choice([0, 10]),
+                "duration_ms": rng.choice([50, 900, 400_000]), "level": "info",
+                "message": "GET /rest/v1/t",
+            })
+        elif kind == "edge":
+            entries.append({
+                "timestamp": ts, "log_type": "browser", "event_type": "network",
+                "level": "error", "url": "https://x/functions/v1/plan",
+                "status_code": rng.choice([0, 400, 502]), "duration_ms": 40_000,
+                "message": "POST https://x/functions/v1/plan",
+            })
+        elif kind == "auth":
+            entries.append({
+                "timestamp": ts, "log_type": "browser", "event_type": "console",
+                "level": "info", "message": "TOKEN_REFRESHED",
+            })
+        elif kind == "console":
+            entries.append({
+                "timestamp": ts, "log_type": "browser", "event_type": "console",
+                "level": "error", "message": rng.choice(["boom A", "boom B", "vite hmr"]),
+            })
+        elif kind == "device":
+            entries.append({
+                "timestamp": ts, "log_type": "device", "event_type": "log",
+                "level": "info", "message": rng.choice(["network down", "ok"]),
+            })
+        else:
+            entries.append({
+                "timestamp": ts, "log_type": "browser", "event_type": "network",
+                "level": "warn", "url": "https://x/api", "status_code": 404,
+                "duration_ms": 20, "message": "GET https://x/api",
+            })
+    return entries
+
+
+def _summary(patterns: list[dict]) -> list[tuple]:
+    return sorted(
+        (p["pattern_type"], p["severity"], p["count"])
+        for p in patterns
+        if p["pattern_type"] not in ("new_error", "regression")
+    )
+
+
+def test_window_matches_full_detection_after_evictions():
+    rng = random.Random(5)
+    window = na._PatternWindow(per_source=60)
+    sources = ["a/browser.log", "a/supabase.log", "b/device.log"]
+
+    for _ in range(30):
+        source = rng.choice(sources)
+        window.add(source, _random_entries(rng, rng.randint(1, 25)))
+        if rng.random() < 0.1:
+            window.drop(rng.choice(sources))
+
+        expected = _summary(na._detect_patterns(window.entries()))
+        assert _summary(window.patterns([])) == expected
+
+
+def test_new_error_fires_once(monkeypatch):
+    monkeypatch.setattr(na, "_known_fingerprints", set())
+    window = na._PatternWindow()
+    entry = {"timestamp": "2026-01-01T00:00:00Z", "log_type": "browser",
+             "event_type": "console", "level": "error", "message": "fresh failure"}
+    window.add("p/browser.log", [entry])
+
+    first = [p["pattern_type"] for p in window.patterns([entry])]
+    second = [p["pattern_type"] for p in window.patterns([])]
+
+    assert "new_error" in first
+    assert "new_error" not in second
+
+
+# ---------------------------------------------------------------------------
+# Ingestion loop
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def project(monkeypatch, tmp_path):
+    monkeypatch.setattr(na, "PROJECTS_DIR", str(tmp_path))
+    monkeypatch.setattr(na, "_log_tails", {})
+    monkeypatch.setattr(na, "_window", na._PatternWindow())
+    log_dir = tmp_path / "app" / ".buildrunner"
+    log_dir.mkdir(parents=True)
+    return log_dir
+
+
+def test_ingest_parses_only_new_lines(project):
+    supa = project / "supabase.log"
+    supa.write_text(
+        "[2026-01-01T00:00:00Z] [QUERY] GET /rest/v1/a 200 12ms 0b\n"
+        "  ⚠ EMPTY_200 — rls\n"
+        "[2026-01-01T00:00:01Z] [QUERY] GET /rest/v1/b 500 20ms 5b\n"
+    )
+
+    first, _ = na._ingest_new_entries(["app"])
+    assert [e["url"] for e in first] == ["/rest/v1/a"]  # second entry may get warnings
+    assert first[0]["level"] == "warn" and first[0]["project"] == "app"
+
+    # Idle poll completes the pending entry
+    assert [e["status_code"] for e in na._ingest_new_entries(["app"])[0]] == [500]
+    assert na._ingest_new_entries(["app"]) == ([], [])
+
+    browser = project / "browser.log"
+    browser.write_text("".join(
+        f"[2026-01-01T00:00:0{n}Z] [LOG] TOKEN_REFRESHED\n" for n in range(6)
+    ))
+    assert len(na._ingest_new_entries(["app"])[0]) == 6
+
+    patterns = {p["pattern_type"] for p in na._window.patterns([])}
+    assert {"auth_refresh_loop", "server_error"} <= patterns
+
+
+def test_stale_log_is_evicted(project):
+    browser = project / "browser.log"
+    browser.write_text("[2026-01-01T00:00:00Z] [ERROR] boom\n")
+    na._ingest_new_entries(["app"])
+    assert len(na._window) == 1
+
+    old = browser.stat().st_mtime - (na.MAX_LOG_AGE_HOURS + 1) * 3600
+    os.utime(browser, (old, old))
+    na._ingest_new_entries(["app"])
+
+    assert len(na._window) == 0
+    assert na._log_tails == {}
+
+
+# ---------------------------------------------------------------------------
+# Streaming detectors
+# ---------------------------------------------------------------------------
+
+
+def test_auth_burst_count_tracks_inserts_and_evictions():
+    rng = random.Random(1)
+    detector = na._AuthRefreshLoop()
+    live = []
+    for seq in range(400):
+        if live and rng.random() < 0.4:
+            e, facts = live.pop(rng.randrange(len(live)))
+            detector.update(0, e, facts, -1)
+        else:
+            e = {"timestamp": f"2026-01-01T00:{rng.randint(0, 9):02d}:{rng.randint(0, 59):02d}Z",
+                 "message": "TOKEN_REFRESHED"}
+            facts = na._entry_facts(e)
+            detector.update(seq, e, facts, 1)
+            live.append((e, facts))
+
+        times = sorted(f["auth_ts"] for _, f in live)
+        expected = sum(1 for i in range(len(times) - 4) if times[i + 4] - times[i] <= 30)
+        assert detector.bursts == expected
+        assert detector.count == len(live)
+
+
+def test_correlation_join_fires_once_per_bucket():
+    window = na._PatternWindow()
+    failure = {"timestamp": "2026-01-01T00:00:00.100Z", "log_type": "supabase",
+               "status_code": 401, "message": "GET /rest/v1/me 401"}
+    redirect = {"timestamp": "2026-01-01T00:00:00.300Z", "log_type": "browser",
+                "message": "redirecting to /login"}
+
+    assert window.add("s", [failure]) == []
+    fired = window.add("b", [redirect])
+    assert [c["rule_name"] for c in fired] == ["Auth Cascade"]
+    assert sorted(fired[0]["sources"]) == ["browser", "supabase"]
+
+    # Same bucket again: already fired
+    assert window.add("b", [dict(redirect)]) == []
+
+    # Once the bucket is evicted it can fire again
+    window.drop("b")
+    window.drop("s")
+    window.add("s", [dict(failure)])
+    assert [c["rule_name"] for c in window.add("b", [dict(redirect)])] == ["Auth Cascade"]
+
+
+# ---------------------------------------------------------------------------
+# Live-state endpoints
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_patterns_endpoint_serves_snapshot(monkeypatch):
+    snapshot = [{"fingerprint": "abc", "pattern_type": "server_error"},
+                {"fingerprint": "def", "pattern_type": "new_error"}]
+    monkeypatch.setattr(na, "_pattern_snapshot", snapshot)
+    monkeypatch.setattr(na, "_get_db", lambda: pytest.fail("queried the DB"))
+
+    assert (await na.get_patterns())["patterns"] == snapshot
+
+
+@pytest.mark.asyncio
+async def test_clusters_endpoint_memoizes_by_log_version(project, monkeypatch):
+    monkeypatch.setenv("PROJECTS_DIR", na.PROJECTS_DIR)
+    monkeypatch.setattr(na, "_cluster_cache", {})
+    calls = []
+
+    def fake_summary(path, lines):
+        calls.append(len(lines))
+        return {"skipped": False, "log": str(path), "lines_processed": len(lines)}
+
+    monkeypatch.setattr(na, "_cluster_summary", fake_summary)
+    (project / "browser.log").write_text(
+        "".join(f"[2026-01-01T00:00:00Z] [LOG] line {n}\n" for n in range(40))
+    )
+    na._ingest_new_entries(["app"])
+    assert calls == []  # ingesting never clusters
+
+    first = await na.get_log_clusters(project="app")
+    second = await na.get_log_clusters()
+    assert first == second == {
+        "skipped": False, "log": str(project / "browser.log"), "lines_processed": 40,
+    }
+    assert calls == [40]
+
+    # New lines bump the log version: the next request re-clusters
+    with open(project / "browser.log", "a") as f:
+        f.write("[2026-01-01T00:00:01Z] [LOG] more\n")
+    na._ingest_new_entries(["app"])
+    assert calls == [40]
+    await na.get_log_clusters(project="app")
+    assert calls == [40, 41]
+
+
+@pytest.mark.asyncio
+async def test_clusters_endpoint_does_not_cache_failures(project, monkeypatch):
+    monkeypatch.setenv("PROJECTS_DIR", na.PROJECTS_DIR)
+    monkeypatch.setattr(na, "_cluster_cache", {})
+    replies = [
+        {"skipped": True, "reason": "clustering failed: Below offline"},
+        {"skipped": False, "cluster_count": 2},
+    ]
+    monkeypatch.setattr(na, "_cluster_summary", lambda path, lines: replies.pop(0))
+    (project / "browser.log").write_text(
+        "".join(f"[2026-01-01T00:00:00Z] [LOG] line {n}\n" for n in range(40))
+    )
+    na._ingest_new_entries(["app"])
+
+    assert (await na.get_log_clusters(project="app"))["skipped"] is True
+    assert (await na.get_log_clusters(project="app"))["cluster_count"] == 2
+    assert (await na.get_log_clusters(project="app"))["cluster_count"] == 2
@@ -0,0 +1,91 @@
+"""
+tests/cluster/test_query_embedding_cache.py
+
+Unit tests for core.cluster.query_embedding_cache — LRU/TTL behaviour,
+per-model keying, and single-flight coalescing of concurrent misses.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from core.cluster.query_embedding_cache import QueryEmbeddingCache
+
+
+class _CountingEncoder:
+    def __init__(self, delay: float = 0.0):
+        self.calls: list[str] = []
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self, text: str) -> list[float]:
+        with self._lock:
+            self.calls.append(text)
+        if self.delay:
+            time.sleep(self.delay)
+        return [float(len(text)), 1.0]
+
+
+def test_hit_after_miss():
+    cache, enc = QueryEmbeddingCache(), _CountingEncoder()
+    assert cache.get_or_compute("m", "find run_index", enc) == [14.0, 1.0]
+    assert cache.get_or_compute("m", "  find   run_index ", enc) == [14.0, 1.0]
+    assert enc.calls == ["find run_index"]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+
+def test_keyed_by_model():
+    cache, enc = QueryEmbeddingCache(), _CountingEncoder()
+    cache.get_or_compute("code-model", "q", enc)
+    cache.get_or_compute("research-model", "q", enc)
+    assert len(enc.calls) == 2
+
+
+def test_lru_eviction():
+    cache, enc = QueryEmbeddingCache(maxsize=2), _CountingEncoder()
+    for q in ("a", "b", "a", "c"):
+        cache.get_or_compute("m", q, enc)
+    cache.get_or_compute("m", "a", enc)   # still cached (recently used)
+    cache.get_or_compute("m", "b", enc)   # evicted by "c"
+    assert enc.calls == ["a", "b", "c", "b"]
+
+
+def test_ttl_expiry():
+    cache, enc = QueryEmbeddingCache(ttl_seconds=0.0), _CountingEncoder()
+    cache.get_or_compute("m", "q", enc)
+    cache.get_or_compute("m", "q", enc)
+    assert len(enc.calls) == 2
+
+
+def test_concurrent_identical_misses_encode_once():
+    cache, enc = QueryEmbeddingCache(), _CountingEncoder(delay=0.05)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("m", "q", enc)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert enc.calls == ["q"]
+    assert results == [[1.0, 1.0]] * 8
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] + stats["coalesced"] == 7
+
+
+def test_failure_is_not_cached_and_propagates():
+    cache = QueryEmbeddingCache()
+
+    def boom(_text):
+        raise RuntimeError("model not loaded")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute("m", "q", boom)
+    enc = _CountingEncoder()
+    assert cache.get_or_compute("m", "q", enc) == [1.0, 1.0]
@@ -6,10 +6,15 @@ Verifies:
 - cache_control passed verbatim (not stripped)
 - execute_async() works in an async context
 - Unknown task_type returns error envelope without raising
+- execute_many() / as_completed() fan out concurrently under the limits,
+  propagate the deadline and cancel overdue tasks through adapter.cancel()
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
+from dataclasses import replace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -186,6 +191,162 @@ async def test_execute_async_routes_correctly() -> None:
     assert result.runtime == "claude"
 
 
+# ---------------------------------------------------------------------------
+# execute_many() / as_completed() fan-out tests
+# ---------------------------------------------------------------------------
+
+
+def _make_slow_adapter(runtime_name: str, delay: float, running: list | None = None) -> MagicMock:
+    """Adapter whose run_review sleeps ``delay`` seconds; tracks peak concurrency."""
+    adapter = _make_mock_adapter(runtime_name)
+    adapter.cancel = AsyncMock(return_value=True)
+    state = {"active": 0}
+
+    async def _review(task: RuntimeTask) -> RuntimeResult:
+        state["active"] += 1
+        if running is not None:
+            running.append(state["active"])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            state["active"] -= 1
+        return _make_result(runtime_name, task_id=task.task_id)
+
+    adapter.run_review = AsyncMock(side_effect=_review)
+    return adapter
+
+
+def _make_fanout_registry(delays: dict[str, float], **limits: int) -> RuntimeRegistry:
+    registry = RuntimeRegistry()
+    for name, delay in delays.items():
+        registry.register(
+            RuntimeRegistration(
+                name=name,
+                adapter=_make_slow_adapter(name, delay),
+                max_concurrency=limits.get(name),
+            )
+        )
+    return registry
+
+
+def _shadow_tasks(*runtimes: str) -> list[RuntimeTask]:
+    return [_make_task(authoritative_runtime=name) for name in runtimes]
+
+
+def test_execute_many_takes_as_long_as_slowest_runtime() -> None:
+    registry = _make_fanout_registry({"claude": 0.2, "codex": 0.2, "ollama": 0.3})
+
+    start = time.monotonic()
+    results = registry.execute_many(_shadow_tasks("claude", "codex", "ollama"))
+    elapsed = time.monotonic() - start
+
+    assert [r.runtime for r in results] == ["claude", "codex", "ollama"]
+    assert all(r.status == "success" for r in results)
+    assert elapsed < 0.6
+
+
+def test_execute_many_honours_per_runtime_limit() -> None:
+    running: list[int] = []
+    registry = RuntimeRegistry()
+    registry.register(
+        RuntimeRegistration(
+            name="claude",
+            adapter=_make_slow_adapter("claude", 0.05, running),
+            max_concurrency=1,
+        )
+    )
+
+    tasks = [replace(_make_task(), task_id=f"t{i}") for i in range(4)]
+    results = registry.execute_many(tasks)
+
+    assert [r.task_id for r in results] == ["t0", "t1", "t2", "t3"]
+    assert max(running) == 1
+
+
+def test_execute_many_honours_global_limit() -> None:
+    running: list[int] = []
+    registry = RuntimeRegistry(max_concurrency=2)
+    registry.register(
+        RuntimeRegistration(name="claude", adapter=_make_slow_adapter("claude", 0.05, running))
+    )
+
+    registry.execute_many([replace(_make_task(), task_id=f"t{i}") for i in range(5)])
+
+    assert max(running) == 2
+
+
+def test_execute_many_deadline_cancels_overdue_tasks() -> None:
+    registry = _make_fanout_registry({"claude": 0.01, "ollama": 5.0})
+
+    results = registry.execute_many(_shadow_tasks("claude", "ollama"), timeout_seconds=0.2)
+
+    assert results[0].status == "success"
+    assert results[1].status == "error"
+    assert results[1].error_class == "DeadlineExceeded"
+    assert results[1].metadata["backend_cancelled"] is True
+    ollama_adapter = registry.get("ollama").adapter
+    ollama_adapter.cancel.assert_awaited_once_with("test-shim-abc123")
+    dispatched = ollama_adapter.run_review.call_args.args[0]
+    assert dispatched.metadata["deadline_at"] == pytest.approx(time.time() + 0.2, abs=1.0)
+
+
+def test_execute_many_converts_adapter_exception_to_error_result() -> None:
+    registry = _make_fanout_registry({"claude": 0.01, "ollama": 0.01})
+    registry.get("ollama").adapter.run_review = AsyncMock(side_effect=OSError("socket closed"))
+
+    results = registry.execute_many(_shadow_tasks("claude", "ollama"))
+
+    assert results[0].status == "success"
+    assert results[1].status == "error"
+    assert results[1].error_class == "OSError"
+
+
+@pytest.mark.asyncio
+async def test_as_completed_yields_fastest_first() -> None:
+    registry = _make_fanout_registry({"claude": 0.2, "codex": 0.01, "ollama": 0.1})
+
+    order = [
+        index
+        async for index, _ in registry.as_completed(_shadow_tasks("claude", "codex", "ollama"))
+    ]
+
+    assert order == [1, 2, 0]
+
+
+@pytest.mark.asyncio
+async def test_as_completed_early_exit_cancels_remaining() -> None:
+    registry = _make_fanout_registry({"claude": 0.01, "ollama": 5.0})
+
+    stream = registry.as_completed(_shadow_tasks("claude", "ollama"))
+    async for index, _ in stream:
+        assert index == 0
+        break
+    await stream.aclose()
+
+    registry.get("ollama").adapter.cancel.assert_awaited_once_with("test-shim-abc123")
+
+
+@pytest.mark.asyncio
+async def test_stream_routes_to_authoritative_runtime_and_yields_events() -> None:
+    from core.runtime.result_schema import StreamEvent
+
+    registry, claude_adapter, ollama_adapter = _make_registry_with_mock_adapters()
+
+    async def fake_stream(task):
+        yield StreamEvent(event_type="started", sequence=1)
+        yield StreamEvent(event_type="token", sequence=2, message="[]")
+        yield StreamEvent(
+            event_type="completed", sequence=3, payload={"result": {"status": "completed"}}
+        )
+
+    ollama_adapter.stream_events = fake_stream
+
+    events = [event async for event in registry.stream(_make_task(authoritative_runtime="ollama"))]
+
+    assert [event.event_type for event in events] == ["started", "token", "completed"]
+    claude_adapter.stream_events.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # Integration: create_runtime_registry returns a registry with execute()
 # ---------------------------------------------------------------------------
@@ -199,3 +360,42 @@ def test_create_runtime_registry_has_execute() -> None:
     assert "claude" in registry.list_names()
     assert "ollama" in registry.list_names()
     assert "codex" in registry.list_names()
+
+
+def test_deadline_kills_claude_cli_process(tmp_path, monkeypatch) -> None:
+    import os
+    import sys
+
+    from core.runtime.claude_runtime import ClaudeRuntime
+
+    monkeypatch.setattr(
+        "core.cluster.cross_model_review.RUNTIME_CAPABILITY_LOG", tmp_path / "capability.jsonl"
+    )
+    pid_file = tmp_path / "cli.pid"
+    fake_cli = tmp_path / "claude"
+    fake_cli.write_text(
+        f"#!{sys.executable}\n"
+        "import os, time\n"
+        f"open({str(pid_file)!r}, 'w').write(str(os.getpid()))\n"
+        "time.sleep(30)\n"
+    )
+    fake_cli.chmod(0o755)
+    registry = RuntimeRegistry()
+    adapter = ClaudeRuntime(command=str(fake_cli))
+    registry.register(RuntimeRegistration(name="claude", adapter=adapter))
+
+    start = time.monotonic()
+    results = registry.execute_many([_make_task()], timeout_seconds=1.0)
+
+    assert time.monotonic() - start < 5
+    assert results[0].error_class == "DeadlineExceeded"
+    assert results[0].metadata["backend_cancelled"] is True
+    pid = int(pid_file.read_text())
+    for _ in range(50):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            break
+        time.sleep(0.05)
+    else:
+        pytest.fail("claude CLI process still running after the deadline")
@@ -18,6 +18,7 @@ import pytest
 
 from core.cluster.below.semantic_cache import (
     SemanticCache,
+    _VectorIndex,
     _cosine_similarity,
     _hash_prompt,
 )
@@ -244,6 +245,36 @@ class TestTTLEviction:
 
         assert result is None, "Expired entry should not be returned"
 
+    def test_eviction_keeps_other_partitions_indexed(self, tmp_path):
+        cache = SemanticCache(
+            db_path=tmp_path / "ttl_cache.db",
+            threshold=0.95,
+            ttl_days=1,
+            warmup_days=0,
+        )
+        vec = _unit_vec(1.0)
+        with patch.object(cache, "_embed", return_value=vec):
+            cache.store("claude", "review", "old prompt", "old answer")
+            cache.store("claude", "summarize", "fresh prompt", "fresh answer")
+            cache.lookup("claude", "review", "old prompt")
+            cache.lookup("claude", "summarize", "fresh prompt")
+
+        review = cache._indexes[("claude", "review")]
+        summarize = cache._indexes[("claude", "summarize")]
+        cache._conn.execute(
+            "UPDATE answer_cache SET stored_at = ? WHERE method = 'review'",
+            (time.time() - 2 * 86400,),
+        )
+        cache._conn.commit()
+
+        with patch.object(cache, "_embed", return_value=vec):
+            assert cache.lookup("claude", "review", "old prompt") is None
+            assert cache.lookup("claude", "summarize", "fresh prompt") == "fresh answer"
+
+        # Expired row removed in place; neither partition was dropped and rebuilt
+        assert cache._indexes[("claude", "review")] is review and len(review) == 0
+        assert cache._indexes[("claude", "summarize")] is summarize and len(summarize) == 1
+
 
 # ---------------------------------------------------------------------------
 # Admin CLI (stats, inspect, clear)
@@ -335,3 +366,70 @@ class TestHelpers:
             result = cache.lookup("claude", "classify", "Summarize the changelog")
 
         assert result is None, "Dissimilar prompts must not produce false-positive hits"
+
+
+# ---------------------------------------------------------------------------
+# In-memory vector index
+# ---------------------------------------------------------------------------
+
+
+class TestVectorIndex:
+    def test_top1_picks_nearest(self):
+        index = _VectorIndex()
+        index.upsert(1, "h1", _unit_vec(1.0), 0.0)
+        b = [0.0, 1.0] + [0.0] * (EMBED_DIM - 2)
+        index.upsert(2, "h2", b, 0.0)
+        row_id, score = index.top1([0.1, 0.9] + [0.0] * (EMBED_DIM - 2))
+        assert row_id == 2
+        assert score == pytest.approx(_cosine_similarity([0.1, 0.9], [0.0, 1.0]), abs=1e-5)
+
+    def test_upsert_same_hash_replaces_row(self):
+        index = _VectorIndex()
+        index.upsert(1, "h", _unit_vec(1.0), 0.0)
+        index.upsert(5, "h", _unit_vec(1.0), 0.0)
+        assert len(index) == 1
+        assert index.id_for_hash("h") == 5
+        assert index.max_id == 5
+
+    def test_remove_swaps_last_row_in(self):
+        index = _VectorIndex()
+        a, b = _dissimilar_vecs()
+        index.upsert(1, "h1", a, 0.0)
+        index.upsert(2, "h2", b, 0.0)
+        index.remove(1)
+        assert len(index) == 1
+        assert index.id_for_hash("h1") is None
+        assert index.top1(b)[0] == 2
+
+    def test_store_after_load_is_visible_without_reload(self, cache):
+        vec_a, vec_b = _dissimilar_vecs()
+        with patch.object(cache, "_embed", return_value=vec_a):
+            cache.store("claude", "test", "first", "a1")
+            assert cache.lookup("claude", "test", "first") == "a1"
+        with patch.object(cache, "_embed", return_value=vec_b):
+            cache.store("claude", "test", "second", "a2")
+            assert cache.lookup("claude", "test", "second") == "a2"
+        assert len(cache._indexes[("claude", "test")]) == 2
+
+    def test_rows_from_other_writers_are_picked_up(self, tmp_path):
+        db = tmp_path / "shared.db"
+        reader = SemanticCache(db_path=db, warmup_days=0)
+        writer = SemanticCache(db_path=db, warmup_days=0)
+        vec = _unit_vec(1.0)
+        with patch.object(reader, "_embed", return_value=vec):
+            assert reader.lookup("claude", "test", "prompt") is None
+        with patch.object(writer, "_embed", return_value=vec):
+            writer.store("claude", "test", "prompt", "from writer")
+        with patch.object(reader, "_embed", return_value=vec):
+            assert reader.lookup("claude", "test", "prompt") == "from writer"
+
+    def test_row_deleted_elsewhere_is_a_miss(self, tmp_path):
+        db = tmp_path / "shared.db"
+        reader = SemanticCache(db_path=db, warmup_days=0)
+        vec = _unit_vec(1.0)
+        with patch.object(reader, "_embed", return_value=vec):
+            reader.store("claude", "test", "prompt", "answer")
+            assert reader.lookup("claude", "test", "prompt") == "answer"
+        SemanticCache(db_path=db).clear()
+        with patch.object(reader, "_embed", return_value=vec):
+            assert reader.lookup("claude", "test", "prompt") is None
@@ -0,0 +1,143 @@
+"""
+Benchmark: CodexRuntime per-task overhead with the CLI session pool on vs. off.
+
+Runs CodexRuntime review tasks against a stub ``codex`` CLI that sleeps
+``--startup-ms`` on every process start (standing in for interpreter/auth
+startup) and answers instantly otherwise. Three configurations are timed:
+
+    pool off        fresh workspace, version probe, auth probe and CLI process per task
+    pool            cached probes + reused workspaces, one CLI process per task
+    pool + worker   cached probes + reused workspaces + one warm CLI worker process
+
+Run:
+    python -m tests.performance.bench_cli_session_pool
+    python -m tests.performance.bench_cli_session_pool --tasks 50 --startup-ms 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+
+from core.cluster import cross_model_review
+from core.runtime.codex_runtime import CodexRuntime
+from core.runtime.session_pool import RuntimeSessionPool, SessionPoolConfig
+from core.runtime.types import RuntimeTask
+
+_STUB_CLI = textwrap.dedent(
+    """
+    import io, json, os, sys, time
+    from contextlib import redirect_stdout
+
+    time.sleep(float(os.environ.get("STUB_STARTUP_MS", "0")) / 1000)
+
+    def handle(args):
+        if args == ["--version"]:
+            print("codex-cli 0.120.0")
+            return 0
+        prompt = args[-1]
+        if prompt == "reply with only: ok":
+            print("ok")
+            return 0
+        if "--output-last-message" in args:
+            path = args[args.index("--output-last-message") + 1]
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write("[]")
+        print(json.dumps({"type": "thread.started", "thread_id": "stub"}))
+        print(json.dumps({"type": "turn.completed", "usage": {"input_tokens": len(prompt)}}))
+        return 0
+
+    if sys.argv[1:] == ["--serve"]:
+        for line in sys.stdin:
+            request = json.loads(line)
+            out = io.StringIO()
+            with redirect_stdout(out):
+                code = handle(request["argv"][1:])
+            response = {"id": request["id"], "returncode": code, "stdout": out.getvalue()}
+            sys.stdout.write(json.dumps(response) + "\\n")
+            sys.stdout.flush()
+    else:
+        sys.exit(handle(sys.argv[1:]))
+    """
+)
+
+
+def _install_stub(root: Path, startup_ms: int) -> list[str]:
+    """Write the stub CLI and a fake auth file; return the CLI argv prefix."""
+    script = root / "stub_codex.py"
+    script.write_text(_STUB_CLI, encoding="utf-8")
+    launcher = root / "codex"
+    launcher.write_text(
+        f"#!/bin/sh\nSTUB_STARTUP_MS={startup_ms} exec {sys.executable} {script} \"$@\"\n",
+        encoding="utf-8",
+    )
+    launcher.chmod(0o755)
+
+    auth = root / ".codex" / "auth.json"
+    auth.parent.mkdir()
+    auth.write_text(json.dumps({"tokens": {"access_token": "stub"}}), encoding="utf-8")
+    return [str(launcher)]
+
+
+def _task(n: int, project_root: str) -> RuntimeTask:
+    return RuntimeTask(
+        task_id=f"bench-{n}",
+        task_type="review",
+        diff_text="diff --git a/x.py b/x.py\n+pass\n",
+        spec_text="# spec",
+        project_root=project_root,
+        commit_sha="abc123",
+    )
+
+
+def _run(runtime: CodexRuntime, tasks: int, project_root: str) -> list[float]:
+    samples = []
+    for n in range(tasks):
+        start = time.perf_counter()
+        result = asyncio.run(runtime.run_review(_task(n, project_root)))
+        samples.append((time.perf_counter() - start) * 1000)
+        if result.status != "completed":
+            raise SystemExit(f"task failed: {result.error_class}: {result.error_message}")
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CLI session pool overhead benchmark")
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--startup-ms", type=int, default=150)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        command = _install_stub(root, args.startup_ms)
+        # Keep auth lookups and capability logs inside the sandbox
+        cross_model_review.HOME = root
+        cross_model_review.RUNTIME_CAPABILITY_LOG = root / "runtime-capability.log"
+
+        configs = {
+            "pool off": SessionPoolConfig(enabled=False),
+            "pool": SessionPoolConfig(),
+            "pool + worker": SessionPoolConfig(worker_command=command + ["--serve"]),
+        }
+        print(f"{args.tasks} review tasks, stub CLI startup {args.startup_ms} ms")
+        print(f"{'mode':<14}  {'first ms':>9}  {'median ms':>10}  {'total s':>8}")
+        for name, config in configs.items():
+            pool = RuntimeSessionPool("codex", config)
+            runtime = CodexRuntime(command=command[0], session_pool=pool)
+            samples = _run(runtime, args.tasks, tmp)
+            pool.close()
+            print(
+                f"{name:<14}  {samples[0]:>9.1f}  {statistics.median(samples):>10.1f}"
+                f"  {sum(samples) / 1000:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
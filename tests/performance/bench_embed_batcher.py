@@ -0,0 +1,121 @@
+"""
+Benchmark: Below embed throughput — per-caller embed_batch vs. micro-batched embed_coalesced.
+
+Starts a local stand-in for Below's Ollama `/api/embed` endpoint (threaded
+http.server, fixed per-request latency plus a small per-item cost, deterministic
+768-d vectors) and points core.cluster.below.embed at it. Each of C concurrent
+callers then embeds single prompts in a loop, the way SemanticCache does.
+
+Run:
+    python -m tests.performance.bench_embed_batcher
+    python -m tests.performance.bench_embed_batcher --concurrency 1 8 64 --requests 400 \\
+        --latency-ms 25 --per-item-ms 0.2
+
+Reports embeds/second and HTTP requests issued for both paths.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core.cluster.below import embed as below_embed
+
+
+class _StandInEmbedServer:
+    """Minimal Ollama /api/embed stand-in. Counts requests and embedded items."""
+
+    def __init__(self, latency_s: float, per_item_s: float) -> None:
+        self.requests = 0
+        self.items = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):  # noqa: N802 — http.server API
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                texts = body.get("input", [])
+                with server._lock:
+                    server.requests += 1
+                    server.items += len(texts)
+                time.sleep(latency_s + per_item_s * len(texts))
+                vectors = [
+                    [((hash(t) >> (i % 32)) & 0xFF) / 255.0 for i in range(below_embed.EMBED_DIM)]
+                    for t in texts
+                ]
+                payload = json.dumps({"model": body.get("model"), "embeddings": vectors}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *_args):
+                pass
+
+        class Server(ThreadingHTTPServer):
+            request_queue_size = 256  # 64 direct callers connect at once
+
+        self._httpd = Server(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}/api/embed"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self) -> "_StandInEmbedServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.items = 0
+
+
+def _run(fn, concurrency: int, total: int) -> float:
+    per_caller = max(1, total // concurrency)
+
+    def caller(idx: int) -> None:
+        for n in range(per_caller):
+            fn([f"caller {idx} prompt {n}"])
+
+    threads = [threading.Thread(target=caller, args=(i,)) for i in range(concurrency)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return per_caller * concurrency / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Below embed micro-batcher throughput benchmark")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 64])
+    parser.add_argument("--requests", type=int, default=256, help="embeds per run (split over callers)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="stand-in per-request latency")
+    parser.add_argument("--per-item-ms", type=float, default=0.2, help="stand-in per-item cost")
+    args = parser.parse_args()
+
+    with _StandInEmbedServer(args.latency_ms / 1000, args.per_item_ms / 1000) as server:
+        below_embed.BELOW_EMBED_URL = server.url
+        print(f"stand-in {server.url} latency={args.latency_ms}ms per_item={args.per_item_ms}ms")
+        print(f"{'callers':>7}  {'direct/s':>9}  {'direct req':>10}  {'batched/s':>9}  {'batched req':>11}")
+        for c in args.concurrency:
+            server.reset_counts()
+            direct = _run(below_embed.embed_batch, c, args.requests)
+            direct_reqs = server.requests
+            server.reset_counts()
+            batched = _run(below_embed.embed_coalesced, c, args.requests)
+            batched_reqs = server.requests
+            print(f"{c:>7}  {direct:>9.1f}  {direct_reqs:>10}  {batched:>9.1f}  {batched_reqs:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark: MetricsAnalyzer dashboard queries — SQLite GROUP BY vs. in-memory Event scan.
+
+Seeds a telemetry.db with a month of task/error events (default 2,000 per day)
+and times calculate_summary over a 30-day window, period="all", get_top_errors
+and a 30-day get_performance_trends, first through the SQL pushdown and then
+through the legacy path (EventCollector.query + Python aggregation).
+
+Run:
+    python -m tests.performance.bench_metrics_summary
+    python -m tests.performance.bench_metrics_summary --per-day 5000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from core.telemetry import EventCollector, MetricsAnalyzer
+
+_MODELS = ("haiku", "sonnet", "opus")
+_ERRORS = ("ImportError", "KeyError", "TimeoutError", "ValueError", "")
+
+
+def _seed(collector: EventCollector, days: int, per_day: int, rng: random.Random) -> None:
+    now = datetime.now()
+    task_rows, error_rows = [], []
+    for n in range(days * per_day):
+        ts = (now - timedelta(seconds=rng.uniform(0, days * 86400))).isoformat()
+        if n % 20 == 0:
+            error_rows.append(
+                (f"e-{n}", "error_occurred", ts, rng.choice(_ERRORS), f"boom {n}", "builder")
+            )
+        else:
+            ok = rng.random() > 0.1
+            task_rows.append(
+                (
+                    f"t-{n}",
+                    "task_completed" if ok else "task_failed",
+                    ts,
+                    f"task-{n}",
+                    rng.choice(_MODELS),
+                    rng.uniform(50, 5000),
+                    rng.randint(100, 8000),
+                    rng.uniform(0.001, 0.2),
+                    ok,
+                )
+            )
+    collector.db.insert_many(
+        "events",
+        [
+            "event_id",
+            "event_type",
+            "timestamp",
+            "task_id",
+            "model_used",
+            "duration_ms",
+            "tokens_used",
+            "cost_usd",
+            "success",
+        ],
+        task_rows,
+    )
+    collector.db.insert_many(
+        "events",
+        ["event_id", "event_type", "timestamp", "error_type", "error_message", "component"],
+        error_rows,
+    )
+
+
+def _time(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MetricsAnalyzer SQL pushdown benchmark")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--per-day", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        collector = EventCollector(
+            storage_path=Path(tmp) / "events.json", db_path=Path(tmp) / "telemetry.db"
+        )
+        _seed(collector, args.days, args.per_day, random.Random(0))
+        now = datetime.now()
+        month = (now - timedelta(days=args.days), now)
+
+        sql = MetricsAnalyzer(collector)
+        legacy = MetricsAnalyzer(collector)
+        legacy._use_sql = lambda: False
+
+        cases = {
+            "summary (30d window)": lambda a: a.calculate_summary(
+                start_time=month[0], end_time=month[1]
+            ),
+            'summary (period="all")': lambda a: a.calculate_summary(period="all"),
+            "top errors": lambda a: a.get_top_errors(limit=10),
+            "trends (30d)": lambda a: a.get_performance_trends(days=args.days),
+        }
+        print(f"{args.days * args.per_day} events over {args.days} days")
+        print(f"{'query':<24}  {'sql ms':>8}  {'legacy ms':>10}")
+        for name, fn in cases.items():
+            sql_ms = _time(lambda: fn(sql), args.repeat)
+            legacy_ms = _time(lambda: fn(legacy), 1)
+            print(f"{name:<24}  {sql_ms:>8.1f}  {legacy_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark: ParallelBuildCoordinator heartbeat and claim throughput across processes.
+
+Spawns N worker processes against one shared coordination state. Each worker
+registers an instance, then (after a start barrier) sends ``--heartbeats``
+heartbeats, then races every other worker to claim each phase of a generated
+BUILD spec. Throughput is total operations divided by the wall time of the
+slowest worker; the claim phase also checks that every phase was won by
+exactly one instance.
+
+Run:
+    python -m tests.performance.bench_parallel_state_store
+    python -m tests.performance.bench_parallel_state_store --instances 2 8 32 --heartbeats 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from core.parallel_build_coordinator import ParallelBuildCoordinator
+
+
+def _write_spec(root: Path, phases: int) -> Path:
+    """BUILD spec with independent phases, each owning its own file."""
+    spec = root / "BUILD_bench.md"
+    spec.write_text(
+        "".join(
+            f"## Phase {n}: Bench {n}\n\n**Component:** `src/bench_{n}.py`\n\n"
+            for n in range(1, phases + 1)
+        ),
+        encoding="utf-8",
+    )
+    return spec
+
+
+def _worker(spec: str, state: str, heartbeats: int, barrier, results) -> None:
+    coord = ParallelBuildCoordinator(Path(spec), state_file=Path(state))
+    instance_id = coord.register_instance()
+    phases = coord.build_dependency_graph().phases
+
+    barrier.wait()
+    start = time.perf_counter()
+    for _ in range(heartbeats):
+        coord.update_heartbeat(instance_id)
+    heartbeat_seconds = time.perf_counter() - start
+
+    barrier.wait()
+    won = []
+    start = time.perf_counter()
+    for phase in phases:
+        if coord.claim_phase(instance_id, phase):
+            won.append(phase)
+            coord.mark_completed(instance_id)
+            instance_id = coord.register_instance()
+    claim_seconds = time.perf_counter() - start
+
+    results.put((heartbeat_seconds, claim_seconds, len(phases), won))
+
+
+def _run(instances: int, heartbeats: int, phases: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        spec = _write_spec(root, phases)
+        state = root / "parallel_state.db"
+        # Create the state up front so workers don't race on first-time setup
+        ParallelBuildCoordinator(spec, state_file=state)
+
+        ctx = mp.get_context("spawn")
+        barrier = ctx.Barrier(instances)
+        results = ctx.Queue()
+        procs = [
+            ctx.Process(target=_worker, args=(str(spec), str(state), heartbeats, barrier, results))
+            for _ in range(instances)
+        ]
+        for proc in procs:
+            proc.start()
+        samples = [results.get() for _ in procs]
+        for proc in procs:
+            proc.join()
+
+    winners = Counter(phase for *_, won in samples for phase in won)
+    if sorted(winners) != sorted(str(n) for n in range(1, phases + 1)) or any(
+        count != 1 for count in winners.values()
+    ):
+        raise SystemExit(f"claim race broken: {dict(winners)}")
+
+    heartbeat_wall = max(sample[0] for sample in samples)
+    claim_wall = max(sample[1] for sample in samples)
+    return {
+        "heartbeats_per_s": instances * heartbeats / heartbeat_wall,
+        "claims_per_s": sum(sample[2] for sample in samples) / claim_wall,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Parallel build coordination throughput")
+    parser.add_argument("--instances", type=int, nargs="+", default=[2, 8, 32])
+    parser.add_argument("--heartbeats", type=int, default=100)
+    parser.add_argument("--phases", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{args.heartbeats} heartbeats/instance, {args.phases} contended phases")
+    print(f"{'instances':>9}  {'heartbeats/s':>13}  {'claim attempts/s':>17}")
+    for instances in args.instances:
+        stats = _run(instances, args.heartbeats, args.phases)
+        print(
+            f"{instances:>9}  {stats['heartbeats_per_s']:>13.0f}"
+            f"  {stats['claims_per_s']:>17.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: SemanticCache lookup latency vs. cache size.
+
+Seeds an answer_cache DB with N random 768-d entries under one (model, method)
+partition and reports p50/p99 latency of the nearest-neighbour lookup
+(`SemanticCache._query`, embedding excluded) at 1k, 10k and 100k entries.
+
+Run:
+    python -m tests.performance.bench_semantic_cache
+    python -m tests.performance.bench_semantic_cache --sizes 1000 10000 --lookups 500
+
+NumPy is used for the matrix–vector top-1 when installed; without it the
+pure-Python fallback is timed (expect 100k to be slow).
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import statistics
+import struct
+import tempfile
+import time
+from pathlib import Path
+
+from core.cluster.below.semantic_cache import EMBED_DIM, SemanticCache, _numpy
+
+
+def _random_vec(rng: random.Random) -> list[float]:
+    return [rng.random() * 2.0 - 1.0 for _ in range(EMBED_DIM)]
+
+
+def _seed(db_path: Path, n: int, rng: random.Random) -> None:
+    cache = SemanticCache(db_path=db_path)
+    cache._ensure_init()
+    cache._conn.close()
+    conn = sqlite3.connect(str(db_path))
+    now = time.time()
+    pack = struct.Struct(f"{EMBED_DIM}f").pack
+    conn.executemany(
+        "INSERT INTO answer_cache (model, method, prompt_hash, embedding, answer, stored_at) "
+        "VALUES ('bench', 'lookup', ?, ?, ?, ?)",
+        ((f"h{i}", pack(*_random_vec(rng)), f"answer {i}", now) for i in range(n)),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def bench(size: int, lookups: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench_cache.db"
+        _seed(db_path, size, rng)
+        cache = SemanticCache(db_path=db_path, warmup_days=0)
+        cache._ensure_init()
+
+        t0 = time.perf_counter()
+        cache._query("bench", "lookup", _random_vec(rng), "cold")
+        load_ms = (time.perf_counter() - t0) * 1000
+
+        queries = [_random_vec(rng) for _ in range(lookups)]
+        samples = []
+        for q in queries:
+            t0 = time.perf_counter()
+            cache._query("bench", "lookup", q, "miss")
+            samples.append((time.perf_counter() - t0) * 1000)
+        cache._conn.close()
+
+    return {
+        "size": size,
+        "first_lookup_ms": round(load_ms, 1),
+        "p50_ms": round(statistics.median(samples), 3),
+        "p99_ms": round(_percentile(samples, 99), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SemanticCache lookup latency benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    backend = "numpy" if _numpy() is not None else "pure-python"
+    print(f"backend={backend} dim={EMBED_DIM} lookups={args.lookups}")
+    print(f"{'entries':>8}  {'first(ms)':>10}  {'p50(ms)':>9}  {'p99(ms)':>9}")
+    for size in args.sizes:
+        r = bench(size, args.lookups)
+        print(f"{r['size']:>8}  {r['first_lookup_ms']:>10}  {r['p50_ms']:>9}  {r['p99_ms']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark: TaskQueue scheduling throughput on large task DAGs.
+
+Builds a random DAG (each task depends on up to ``--deps`` earlier tasks drawn
+from a sliding window) and drains it with the usual get_next_task /
+start_task / complete_task loop. The incremental ready-set queue is compared
+with the previous full-rescan algorithm, reproduced below, which walked every
+task and dependency on each get_next_task and complete_task call. The rescan
+baseline is quadratic, so it stops after ``--rescan-budget`` seconds and
+reports the throughput it reached (marked ``partial``).
+
+Run:
+    python -m tests.performance.bench_task_queue
+    python -m tests.performance.bench_task_queue --tasks 10000 100000 --deps 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from core.priority_scheduler import PriorityScheduler
+from core.task_queue import QueuedTask, TaskQueue, TaskStatus
+
+
+def _make_dag(count: int, deps: int, window: int, seed: int) -> list[QueuedTask]:
+    rng = random.Random(seed)
+    tasks = []
+    for n in range(count):
+        low = max(0, n - window)
+        parents = rng.sample(range(low, n), min(deps, n - low)) if n else []
+        tasks.append(
+            QueuedTask(
+                id=f"t{n}",
+                name=f"Task {n}",
+                description="bench",
+                file_path=f"src/t{n}.py",
+                estimated_minutes=rng.randint(5, 120),
+                complexity="simple",
+                domain="backend",
+                dependencies=[f"t{p}" for p in parents],
+            )
+        )
+    return tasks
+
+
+def _drain(queue: TaskQueue) -> int:
+    drained = 0
+    while (task := queue.get_next_task()) is not None:
+        queue.start_task(task.id)
+        queue.complete_task(task.id)
+        drained += 1
+    return drained
+
+
+def _bench_indexed(tasks: list[QueuedTask], scheduler: PriorityScheduler | None) -> dict:
+    queue = TaskQueue(scheduler=scheduler)
+    start = time.perf_counter()
+    queue.add_tasks(tasks)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    drained = _drain(queue)
+    seconds = time.perf_counter() - start
+    if drained != len(tasks):
+        raise SystemExit(f"indexed queue drained {drained}/{len(tasks)} tasks")
+    return {"build_s": build, "tasks_per_s": drained / seconds, "partial": False}
+
+
+def _bench_rescan(tasks: list[QueuedTask], budget: float) -> dict:
+    """Previous TaskQueue scheduling: full rescan with list-membership order."""
+    by_id = {task.id: task for task in tasks}
+    order: list[str] = []
+
+    def is_ready(task: QueuedTask) -> bool:
+        for dep_id in task.dependencies:
+            dep = by_id.get(dep_id)
+            if not dep or dep.status != TaskStatus.COMPLETED:
+                return False
+        return True
+
+    def update_ready() -> None:
+        for task in by_id.values():
+            if task.status in [TaskStatus.PENDING, TaskStatus.BLOCKED]:
+                if is_ready(task):
+                    task.status = TaskStatus.READY
+                    if task.id not in order:
+                        order.append(task.id)
+                else:
+                    task.status = TaskStatus.BLOCKED
+
+    start = time.perf_counter()
+    for task in tasks:
+        if is_ready(task):
+            task.status = TaskStatus.READY
+            if task.id not in order:
+                order.append(task.id)
+    build = time.perf_counter() - start
+
+    drained = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < budget:
+        update_ready()
+        task = next((by_id[t] for t in order if by_id[t].status == TaskStatus.READY), None)
+        if task is None:
+            break
+        task.status = TaskStatus.IN_PROGRESS
+        task.status = TaskStatus.COMPLETED
+        update_ready()
+        drained += 1
+    seconds = time.perf_counter() - start
+    return {
+        "build_s": build,
+        "tasks_per_s": drained / seconds if seconds else 0.0,
+        "partial": drained < len(tasks),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TaskQueue scheduling throughput")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--deps", type=int, default=3, help="Max dependencies per task")
+    parser.add_argument("--window", type=int, default=50, help="How far back deps reach")
+    parser.add_argument("--rescan-budget", type=float, default=10.0, help="Seconds per rescan run")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"random DAG, <= {args.deps} deps/task within a {args.window}-task window")
+    print(f"{'tasks':>8}  {'queue':<18}  {'build s':>8}  {'tasks/s':>10}")
+    for count in args.tasks:
+        runs = [
+            ("rescan (previous)", lambda dag: _bench_rescan(dag, args.rescan_budget)),
+            ("indexed fifo", lambda dag: _bench_indexed(dag, None)),
+            ("indexed scheduler", lambda dag: _bench_indexed(dag, PriorityScheduler())),
+        ]
+        for label, run in runs:
+            stats = run(_make_dag(count, args.deps, args.window, args.seed))
+            note = "  partial" if stats["partial"] else ""
+            print(
+                f"{count:>8}  {label:<18}  {stats['build_s']:>8.2f}"
+                f"  {stats['tasks_per_s']:>10.0f}{note}"
+            )
+
+
+if __name__ == "__main__":
+    main()
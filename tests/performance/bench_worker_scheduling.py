@@ -0,0 +1,168 @@
+"""
+Benchmark: WorkerCoordinator scheduling on skewed task-duration workloads.
+
+Discrete-event simulation on a virtual clock (nothing sleeps). Tasks arrive
+either all at once (``burst``) or as a Poisson stream (``poisson``) and their
+durations follow a skewed distribution (lognormal or Pareto). Workers have
+heterogeneous capacities: a task of duration d takes d / capacity on a worker.
+The coordinator only sees a noisy cost estimate, never the true duration.
+
+Two policies are compared:
+
+* ``fifo``: the previous assignment, with one global FIFO queue. A task goes to
+  the first idle worker in registration order, and a worker that finishes
+  pops the queue head.
+* ``stealing``: the current WorkerCoordinator, driven through assign_task /
+  complete_task.
+
+Reports makespan, p50/p95 queue wait (arrival to start) and p95 turnaround
+(arrival to finish). Capacity-aware placement deliberately lets a task wait
+for a faster worker when that finishes it sooner, so compare wait against
+turnaround rather than in isolation.
+
+Run:
+    python -m tests.performance.bench_worker_scheduling
+    python -m tests.performance.bench_worker_scheduling --tasks 5000 --capacities 1 1 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import random
+from collections import deque
+
+from core.parallel.worker_coordinator import WorkerCoordinator
+
+
+def _durations(dist: str, count: int, rng: random.Random) -> list[float]:
+    if dist == "lognormal":
+        return [rng.lognormvariate(0.0, 1.5) for _ in range(count)]
+    # Pareto with alpha 1.5: a few tasks dominate total work
+    return [rng.paretovariate(1.5) for _ in range(count)]
+
+
+def _workload(args, dist: str, arrival: str) -> list[tuple[float, float, float]]:
+    """(arrival time, true duration, estimated cost) per task."""
+    rng = random.Random(args.seed)
+    durations = _durations(dist, args.tasks, rng)
+    if arrival == "burst":
+        arrivals = [0.0] * args.tasks
+    else:
+        # Offered load = args.load of total capacity
+        rate = args.load * sum(args.capacities) / (sum(durations) / len(durations))
+        now, arrivals = 0.0, []
+        for _ in durations:
+            now += rng.expovariate(rate)
+            arrivals.append(now)
+    noise = [rng.lognormvariate(0.0, args.estimate_noise) for _ in durations]
+    return [(a, d, d * n) for a, d, n in zip(arrivals, durations, noise)]
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def _simulate_fifo(workload, capacities) -> tuple[float, list[float], list[float]]:
+    idle = list(range(len(capacities)))  # registration order
+    queue: deque = deque()
+    events: list = []  # (time, worker)
+    waits, turnaround = [], []
+    now = 0.0
+
+    def start(worker: int, task: int) -> None:
+        arrived, duration, _ = workload[task]
+        finish = now + duration / capacities[worker]
+        waits.append(now - arrived)
+        turnaround.append(finish - arrived)
+        heapq.heappush(events, (finish, worker))
+
+    index = 0
+    while index < len(workload) or events:
+        if index < len(workload) and (not events or workload[index][0] <= events[0][0]):
+            now = workload[index][0]
+            if idle:
+                start(idle.pop(0), index)
+            else:
+                queue.append(index)
+            index += 1
+            continue
+
+        now, worker = heapq.heappop(events)
+        if queue:
+            start(worker, queue.popleft())
+        else:
+            idle.append(worker)
+            idle.sort()
+    return now, waits, turnaround
+
+
+def _simulate_stealing(workload, capacities) -> tuple[float, list[float], list[float], int]:
+    coord = WorkerCoordinator(max_workers=len(capacities))
+    workers = [coord.register_worker(metadata={"capacity": c}).worker_id for c in capacities]
+    capacity = dict(zip(workers, capacities))
+    events: list = []  # (time, worker_id, task_id)
+    waits, turnaround = [], []
+    now = 0.0
+
+    def started(worker_id: str) -> None:
+        task_id = coord.workers[worker_id].current_task
+        if task_id is None:
+            return
+        arrived, duration, _ = workload[int(task_id)]
+        finish = now + duration / capacity[worker_id]
+        waits.append(now - arrived)
+        turnaround.append(finish - arrived)
+        heapq.heappush(events, (finish, worker_id, task_id))
+
+    index = 0
+    while index < len(workload) or events:
+        if index < len(workload) and (not events or workload[index][0] <= events[0][0]):
+            now = workload[index][0]
+            worker_id = coord.assign_task(str(index), {"estimated_cost": workload[index][2]})
+            if worker_id:
+                started(worker_id)
+            index += 1
+            continue
+
+        now, worker_id, task_id = heapq.heappop(events)
+        coord.complete_task(worker_id, task_id)
+        started(worker_id)
+    return now, waits, turnaround, coord.steals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Worker scheduling simulation")
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--capacities", type=float, nargs="+", default=[1, 1, 1, 1, 2, 4])
+    parser.add_argument("--load", type=float, default=0.85, help="Poisson offered load")
+    parser.add_argument("--estimate-noise", type=float, default=0.3, help="Lognormal sigma")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    print(
+        f"{args.tasks} tasks, worker capacities {args.capacities}, "
+        f"estimate noise sigma={args.estimate_noise}"
+    )
+    print(
+        f"{'workload':<19}  {'policy':<9}  {'makespan':>9}  {'p50 wait':>9}"
+        f"  {'p95 wait':>9}  {'p95 turnaround':>14}  {'steals':>6}"
+    )
+    for dist in ("lognormal", "pareto"):
+        for arrival in ("burst", "poisson"):
+            workload = _workload(args, dist, arrival)
+            label = f"{dist}/{arrival}"
+            for policy, (makespan, waits, turnaround, stolen) in (
+                ("fifo", (*_simulate_fifo(workload, args.capacities), "-")),
+                ("stealing", _simulate_stealing(workload, args.capacities)),
+            ):
+                print(
+                    f"{label:<19}  {policy:<9}  {makespan:>9.1f}"
+                    f"  {_percentile(waits, 50):>9.2f}  {_percentile(waits, 95):>9.2f}"
+                    f"  {_percentile(turnaround, 95):>14.2f}  {stolen:>6}"
+                )
+
+
+if __name__ == "__main__":
+    main()
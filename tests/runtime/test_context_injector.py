@@ -4,6 +4,7 @@ Verifies the three core invariants of the injection wrapper:
   1. Flag OFF → pure no-op (zero behavior change)
   2. Flag ON + router failure → graceful degrade (task unmodified, warning logged)
   3. Flag ON + router success → <cluster-context> block prepended to task.prompt
+  4. Per-section cache stats are surfaced from the router
 """
 
 from __future__ import annotations
@@ -122,3 +123,28 @@ def test_unknown_runtime_defaults_to_claude() -> None:
         injector.inject(task, runtime_name="unknown-runtime")
 
     assert captured.get("model") == "claude"
+
+
+def test_inject_logs_section_cache_stats(caplog) -> None:
+    from core.runtime.context_injector import ContextInjector
+
+    task = _FakeTask(prompt="original prompt body")
+    bundle = _FakeBundle(sections=[_FakeSection()], token_total=100)
+    bundle.section_stats = {
+        "logs": {"cache_hit": True, "build_ms": 0.5},
+        "memory": {"cache_hit": False, "build_ms": 2.0},
+    }
+
+    with mock.patch.dict(os.environ, {"BR3_AUTO_CONTEXT": "on"}):
+        injector = ContextInjector()
+        assert injector.cache_stats() == {}
+        fake_router = mock.Mock()
+        fake_router.route.return_value = bundle
+        fake_router.cache_stats.return_value = {"logs": {"hit_rate": 1.0}}
+        injector._router = fake_router
+
+        with caplog.at_level("DEBUG", logger="core.runtime.context_injector"):
+            injector.inject(task, runtime_name="codex")
+
+    assert "cached 1/2, build 2.5ms" in caplog.text
+    assert injector.cache_stats() == {"logs": {"hit_rate": 1.0}}
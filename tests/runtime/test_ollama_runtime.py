@@ -358,3 +358,53 @@ def test_local_ready_capability_in_command_capabilities():
     members = caps["local_ready"]["members"]
     for cmd in ["plan-draft", "structural-review", "governance-lint", "intel-scoring", "summarize"]:
         assert cmd in members, f"{cmd} missing from local_ready.members"
+
+
+# ---------------------------------------------------------------------------
+# Cancellation
+# ---------------------------------------------------------------------------
+
+
+def test_cancel_aborts_inflight_request(monkeypatch):
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class HangingChat(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.end_headers()
+            self.wfile.write(b'{"message": {"content": "["}, "done": false}\n')
+            self.wfile.flush()
+            time.sleep(5)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), HangingChat)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(
+        "core.runtime.ollama_runtime._check_ollama_health", lambda base_url, port: True
+    )
+    runtime = OllamaRuntime(host="http://127.0.0.1", port=server.server_port, timeout=30)
+    results = []
+    worker = threading.Thread(
+        target=lambda: results.append(runtime._run_blocking(make_task(), lambda *_: None))
+    )
+    try:
+        worker.start()
+        while not asyncio.run(runtime.cancel("test-ollama-deadbeef")):
+            assert worker.is_alive()
+            time.sleep(0.01)
+        worker.join(timeout=2)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert not worker.is_alive()
+    assert results[0].status == "error"
+    assert "cancelled" in results[0].error_message
+    assert results[0].metadata.get("fallback") is None
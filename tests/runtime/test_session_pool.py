@@ -0,0 +1,179 @@
+"""Tests for RuntimeSessionPool — cached probes, reusable workspaces, warm CLI workers."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from core.runtime.session_pool import RuntimeSessionPool, SessionPoolConfig
+
+_ECHO_WORKER = textwrap.dedent(
+    """
+    import json, os, sys
+    for line in sys.stdin:
+        request = json.loads(line)
+        if request["prompt"] == "exit":
+            sys.exit(0)
+        if request["prompt"] == "hang":
+            continue
+        response = {
+            "id": request["id"],
+            "returncode": 0,
+            "stdout": f"{os.getpid()}:{request['prompt']}",
+            "stderr": "",
+        }
+        sys.stdout.write(json.dumps(response) + "\\n")
+        sys.stdout.flush()
+    """
+)
+
+
+@pytest.fixture()
+def worker_pool(tmp_path: Path):
+    script = tmp_path / "worker.py"
+    script.write_text(_ECHO_WORKER, encoding="utf-8")
+    pool = RuntimeSessionPool(
+        "codex",
+        SessionPoolConfig(worker_command=[sys.executable, str(script)], recycle_after=3),
+    )
+    yield pool
+    pool.close()
+
+
+def test_probe_cached_until_ttl(monkeypatch) -> None:
+    clock = [100.0]
+    monkeypatch.setattr("core.runtime.session_pool.time.monotonic", lambda: clock[0])
+    pool = RuntimeSessionPool("codex", SessionPoolConfig(probe_ttl_seconds=60))
+    calls = []
+
+    def probe():
+        calls.append(1)
+        return {"raw": "codex-cli 0.120.0"}
+
+    assert pool.probe("version", probe) == {"raw": "codex-cli 0.120.0"}
+    pool.probe("version", probe)
+    assert len(calls) == 1
+
+    clock[0] += 61
+    pool.probe("version", probe)
+    assert len(calls) == 2
+    assert pool.stats()["probe_hits"] == 1
+
+
+def test_failed_probe_not_cached() -> None:
+    pool = RuntimeSessionPool("codex")
+    outcomes = iter([(False, "Codex auth expired"), (True, None), (False, "unused")])
+
+    def auth():
+        return pool.probe("auth", lambda: next(outcomes), ok=lambda r: r[0])
+
+    assert auth() == (False, "Codex auth expired")
+    assert auth() == (True, None)
+    assert auth() == (True, None)
+
+    pool.invalidate("auth")
+    assert auth() == (False, "unused")
+
+
+def test_disabled_pool_never_caches() -> None:
+    pool = RuntimeSessionPool("codex", SessionPoolConfig(enabled=False))
+    calls = []
+    pool.probe("version", lambda: calls.append(1))
+    pool.probe("version", lambda: calls.append(1))
+    assert len(calls) == 2
+
+
+def test_workspace_reused_empty_and_recycled() -> None:
+    pool = RuntimeSessionPool("codex", SessionPoolConfig(recycle_after=2))
+
+    with pool.workspace("br3-codex-shadow-") as first:
+        (Path(first) / "last_message.txt").write_text("[]")
+        (Path(first) / "nested").mkdir()
+    with pool.workspace("br3-codex-shadow-") as second:
+        assert second == first
+        assert list(Path(second).iterdir()) == []
+    with pool.workspace("br3-codex-shadow-") as third:
+        assert third != first
+
+    assert not Path(first).exists()
+    assert pool.stats()["workspaces_recycled"] == 1
+    pool.close()
+    assert not Path(third).exists()
+
+
+def test_disabled_pool_uses_fresh_temp_workspace() -> None:
+    pool = RuntimeSessionPool("codex", SessionPoolConfig(enabled=False))
+    with pool.workspace("br3-codex-shadow-") as first:
+        assert Path(first).name.startswith("br3-codex-shadow-")
+    assert not Path(first).exists()
+
+
+def test_run_without_worker_is_one_shot_subprocess() -> None:
+    pool = RuntimeSessionPool("codex")
+    result = pool.run([sys.executable, "-c", "print('hi')"], prompt="", timeout=30)
+    assert result.returncode == 0
+    assert result.stdout.strip() == "hi"
+
+
+def test_worker_reused_then_recycled_after_n_tasks(worker_pool) -> None:
+    pids = [
+        worker_pool.run(["codex"], prompt=f"p{n}", timeout=30).stdout.split(":")[0]
+        for n in range(4)
+    ]
+
+    assert pids[0] == pids[1] == pids[2]
+    assert pids[3] != pids[0]
+    stats = worker_pool.stats()
+    assert stats["workers_started"] == 2
+    assert stats["workers_recycled"] == 1
+
+
+def test_dead_worker_replaced_on_checkout(worker_pool) -> None:
+    with pytest.raises(RuntimeError, match="exited"):
+        worker_pool.run(["codex"], prompt="exit", timeout=30)
+
+    result = worker_pool.run(["codex"], prompt="again", timeout=30)
+    assert result.stdout.endswith(":again")
+
+
+def test_worker_timeout_kills_worker(worker_pool) -> None:
+    with pytest.raises(subprocess.TimeoutExpired):
+        worker_pool.run(["codex"], prompt="hang", timeout=0.2)
+
+    assert worker_pool.stats()["idle_workers"] == 0
+    assert worker_pool.run(["codex"], prompt="ok", timeout=30).stdout.endswith(":ok")
+
+
+def test_cancel_kills_running_worker(worker_pool) -> None:
+    import threading
+    import time
+
+    errors = []
+
+    def run() -> None:
+        try:
+            worker_pool.run(["codex"], prompt="hang", timeout=30, task_id="t1")
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    while not worker_pool.cancel("t1"):
+        assert thread.is_alive()
+        time.sleep(0.01)
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert errors and "exited" in str(errors[0])
+    assert worker_pool.stats()["idle_workers"] == 0
+    assert worker_pool.cancel("t1") is False
+
+
+def test_config_from_dict_ignores_unknown_keys() -> None:
+    config = SessionPoolConfig.from_dict({"probe_ttl_seconds": 30, "bogus": 1})
+    assert config.probe_ttl_seconds == 30
+    assert config.enabled is True
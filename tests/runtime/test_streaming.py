@@ -0,0 +1,265 @@
+"""Tests for runtime streaming — StreamEvent iterators, backpressure, TTFB, adapters."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+from core.runtime.base import BaseRuntime
+from core.runtime.ollama_runtime import OllamaRuntime
+from core.runtime.session_pool import RuntimeSessionPool, SessionPoolConfig
+from core.runtime.streaming import StreamClosed, stream_blocking
+from core.runtime.types import RuntimeResult, RuntimeTask
+
+
+def make_task(task_type: str = "review") -> RuntimeTask:
+    return RuntimeTask(
+        task_id="stream-1",
+        task_type=task_type,
+        diff_text="diff --git a/app.py b/app.py\n+print('hello')\n",
+        spec_text="# Spec",
+        project_root="/tmp/project",
+        commit_sha="deadbeef",
+    )
+
+
+def make_result(status: str = "completed") -> RuntimeResult:
+    return RuntimeResult(task_id="stream-1", runtime="fake", backend="fake", status=status)
+
+
+async def collect(events) -> list:
+    return [event async for event in events]
+
+
+class FakeRuntime(BaseRuntime):
+    runtime_name = "fake"
+    backend_name = "fake"
+
+    def get_capabilities(self) -> dict[str, object]:
+        return {"review": True}
+
+    async def run_review(self, task: RuntimeTask) -> RuntimeResult:
+        return make_result()
+
+
+def test_stream_orders_started_chunks_completed() -> None:
+    def producer(emit):
+        for token in ("Hel", "lo"):
+            emit("token", token)
+        return make_result()
+
+    events = asyncio.run(collect(stream_blocking(producer)))
+
+    assert [event.event_type for event in events] == ["started", "token", "token", "completed"]
+    assert [event.sequence for event in events] == [1, 2, 3, 4]
+    completed = events[-1].payload
+    assert completed["chunks"] == 2
+    assert completed["result"]["status"] == "completed"
+    assert completed["result"]["metrics"]["ttfb_ms"] == completed["ttfb_ms"]
+
+
+def test_first_chunk_arrives_before_producer_finishes() -> None:
+    release = threading.Event()
+
+    def producer(emit):
+        emit("line", "first")
+        assert release.wait(5)
+        return make_result()
+
+    async def consume():
+        seen = []
+        async for event in stream_blocking(producer):
+            seen.append(event.event_type)
+            if event.event_type == "line":
+                release.set()
+        return seen
+
+    assert asyncio.run(consume())[-1] == "completed"
+
+
+def test_ttfb_measures_time_to_first_chunk() -> None:
+    def producer(emit):
+        time.sleep(0.05)
+        emit("token", "x")
+        time.sleep(0.2)
+        return make_result()
+
+    completed = asyncio.run(collect(stream_blocking(producer)))[-1].payload
+
+    assert 40 <= completed["ttfb_ms"] < completed["duration_ms"]
+    assert completed["duration_ms"] >= 240
+
+
+def test_bounded_buffer_blocks_producer() -> None:
+    emitted = []
+
+    def producer(emit):
+        for n in range(20):
+            emit("token", str(n))
+            emitted.append(n)
+        return make_result()
+
+    async def consume():
+        stream = stream_blocking(producer, max_buffer=2)
+        assert (await stream.__anext__()).event_type == "started"
+        await asyncio.sleep(0.2)
+        backlog = len(emitted)
+        rest = [event async for event in stream]
+        return backlog, rest
+
+    backlog, rest = asyncio.run(consume())
+
+    # The producer stalls once the buffer is full instead of running ahead
+    assert backlog <= 3
+    assert len(rest) == 21
+
+
+def test_producer_exception_becomes_error_event() -> None:
+    def producer(emit):
+        emit("line", "partial")
+        raise RuntimeError("CLI crashed")
+
+    events = asyncio.run(collect(stream_blocking(producer)))
+
+    assert [event.event_type for event in events] == ["started", "line", "error"]
+    assert events[-1].message == "CLI crashed"
+    assert events[-1].payload["error_class"] == "RuntimeError"
+
+
+def test_consumer_exit_stops_producer() -> None:
+    stopped = threading.Event()
+
+    def producer(emit):
+        try:
+            while True:
+                emit("token", "x")
+        except StreamClosed:
+            stopped.set()
+            raise
+
+    async def consume():
+        stream = stream_blocking(producer, max_buffer=1)
+        async for event in stream:
+            if event.event_type == "token":
+                break
+        await stream.aclose()
+        await asyncio.to_thread(stopped.wait, 5)
+
+    asyncio.run(consume())
+    assert stopped.is_set()
+
+
+def test_base_stream_events_runs_task_without_chunks() -> None:
+    events = asyncio.run(collect(FakeRuntime().stream_events(make_task())))
+
+    assert [event.event_type for event in events] == ["started", "completed"]
+    assert events[-1].payload["ttfb_ms"] is None
+
+
+def test_base_stream_events_unknown_task_type_is_error() -> None:
+    events = asyncio.run(collect(FakeRuntime().stream_events(make_task("bogus"))))
+
+    assert events[-1].event_type == "error"
+    assert events[-1].payload["error_class"] == "ValueError"
+
+
+def test_session_pool_run_streams_lines() -> None:
+    pool = RuntimeSessionPool("codex", SessionPoolConfig())
+    lines = []
+    script = "import time\nfor n in range(3):\n    print(n, flush=True)\n    time.sleep(0.01)"
+
+    result = pool.run([sys.executable, "-c", script], prompt="", timeout=30, on_line=lines.append)
+
+    assert lines == ["0", "1", "2"]
+    assert result.stdout == "0\n1\n2\n"
+    assert result.returncode == 0
+
+
+def test_session_pool_streaming_run_times_out() -> None:
+    import subprocess
+
+    pool = RuntimeSessionPool("codex", SessionPoolConfig())
+    script = "import time\nprint('start', flush=True)\ntime.sleep(30)"
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        pool.run([sys.executable, "-c", script], prompt="", timeout=0.3, on_line=lambda _: None)
+
+
+class _FakeChatStream:
+    status = 200
+
+    def __init__(self, chunks: list[dict], stall: float = 0.0):
+        self._lines = [json.dumps(chunk).encode("utf-8") + b"\n" for chunk in chunks]
+        self._stall = stall
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def readline(self) -> bytes:
+        if self._lines:
+            return self._lines.pop(0)
+        # Each stalled read stays under a per-read timeout; only the overall deadline stops it
+        time.sleep(self._stall)
+        return b"\n" if self._stall else b""
+
+
+def test_ollama_streams_token_events(monkeypatch) -> None:
+    requests = []
+    chunks = [
+        {"message": {"content": "[]"}, "done": False},
+        {"message": {"content": ""}, "done": True, "prompt_eval_count": 7, "eval_count": 2},
+    ]
+
+    def fake_urlopen(req, timeout):
+        requests.append(json.loads(req.data))
+        return _FakeChatStream(chunks)
+
+    monkeypatch.setattr(
+        "core.runtime.ollama_runtime._check_ollama_health", lambda base_url, port: True
+    )
+    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    runtime = OllamaRuntime(host="http://10.0.1.105")
+
+    events = asyncio.run(collect(runtime.stream_events(make_task())))
+
+    assert requests[0]["stream"] is True
+    assert [event.event_type for event in events] == ["started", "token", "completed"]
+    assert events[1].message == "[]"
+    result = events[-1].payload["result"]
+    assert result["raw_output"] == "[]"
+    assert result["metrics"]["usage"]["prompt_tokens"] == 7
+
+
+def test_ollama_stream_deadline_spans_whole_stream_and_skips_fallback(monkeypatch) -> None:
+    chunks = [{"message": {"content": "[partial"}, "done": False}]
+    fallbacks = []
+
+    monkeypatch.setattr(
+        "core.runtime.ollama_runtime._check_ollama_health", lambda base_url, port: True
+    )
+    monkeypatch.setattr(
+        "urllib.request.urlopen", lambda req, timeout: _FakeChatStream(chunks, stall=0.05)
+    )
+    runtime = OllamaRuntime(host="http://10.0.1.105", timeout=0.3)
+    monkeypatch.setattr(
+        runtime, "_fallback_to_claude", lambda *args: fallbacks.append(args) or make_result()
+    )
+
+    started = time.monotonic()
+    events = asyncio.run(collect(runtime.stream_events(make_task())))
+
+    assert time.monotonic() - started < 2
+    assert [event.event_type for event in events][:2] == ["started", "token"]
+    assert fallbacks == []
+    result = events[-1].payload["result"]
+    assert result["status"] == "error"
+    assert result["error_class"] == "TimeoutError"
+    assert result["metadata"]["streamed_chunks"] == 1
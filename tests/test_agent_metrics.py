@@ -47,7 +47,7 @@ class TestAgentMetricsBasics:
     def test_initialization(self, metrics_tracker):
         """Test AgentMetrics initialization."""
         assert metrics_tracker is not None
-        assert metrics_tracker.metrics == []
+        assert list(metrics_tracker.metrics) == []
         assert metrics_tracker.storage_path is not None
         assert metrics_tracker.db_path is not None
 
@@ -301,7 +301,7 @@ class TestSummaryGeneration:
                 cost_usd=0.05,
                 success=True,
             )
-            metrics_tracker.metrics.append(metric)
+            metrics_tracker.add_metric(metric)
 
         # Record 5 metrics for old period
         old_time = base_time - timedelta(days=15)
@@ -319,7 +319,7 @@ class TestSummaryGeneration:
                 cost_usd=0.05,
                 success=True,
             )
-            metrics_tracker.metrics.append(metric)
+            metrics_tracker.add_metric(metric)
 
         # Get summary for 7-day period (should only include recent)
         summary = metrics_tracker.get_summary("refactor", time_period_days=7)
@@ -433,8 +433,8 @@ class TestBestModelSelection:
 class TestPersistence:
     """Test persistence to JSON and SQLite."""
 
-    def test_metrics_saved_to_json(self, temp_dir):
-        """Test metrics are saved to JSON file."""
+    def test_metrics_saved_to_sqlite(self, temp_dir):
+        """Test metrics are saved to SQLite without rewriting a JSON file."""
         storage_path = temp_dir / "agent_metrics.json"
         db_path = temp_dir / "telemetry.db"
 
@@ -450,13 +450,14 @@ class TestPersistence:
             success=True,
         )
 
-        assert storage_path.exists()
-        data = json.loads(storage_path.read_text())
-        assert len(data) == 1
-        assert data[0]["task_id"] == "task-persist-001"
+        assert not storage_path.exists()
+        rows = metrics.db.query("SELECT task_id FROM agent_metrics")
+        assert [row["task_id"] for row in rows] == ["task-persist-001"]
+        hourly = metrics.db.query("SELECT tasks FROM agent_metrics_hourly")
+        assert [row["tasks"] for row in hourly] == [1]
 
-    def test_metrics_loaded_from_json(self, temp_dir):
-        """Test metrics are loaded from JSON file on initialization."""
+    def test_metrics_available_after_restart(self, temp_dir):
+        """Test a new instance answers from SQLite without loading history into memory."""
         storage_path = temp_dir / "agent_metrics.json"
         db_path = temp_dir / "telemetry.db"
 
@@ -473,10 +474,37 @@ class TestPersistence:
             success=True,
         )
 
-        # Create second instance (should load from file)
+        # Create second instance (history stays in the database)
         metrics2 = AgentMetrics(storage_path=storage_path, db_path=db_path)
-        assert len(metrics2.metrics) == 1
-        assert metrics2.metrics[0].task_id == "task-load-001"
+        assert len(metrics2.metrics) == 0
+        assert metrics2.get_summary("test").total_tasks == 1
+        assert metrics2.get_best_model_for_agent_type("test") == ModelType.SONNET.value
+
+    def test_legacy_json_imported_once(self, temp_dir):
+        """Test a pre-SQLite agent_metrics.json is imported into an empty database."""
+        storage_path = temp_dir / "agent_metrics.json"
+        db_path = temp_dir / "telemetry.db"
+        legacy = AgentMetric(
+            timestamp=datetime.now() - timedelta(days=1),
+            agent_type="review",
+            task_id="legacy-001",
+            task_description="Legacy review",
+            model_used=ModelType.OPUS.value,
+            duration_ms=1000.0,
+            input_tokens=100,
+            output_tokens=50,
+            total_tokens=150,
+            cost_usd=0.01,
+            success=True,
+        )
+        storage_path.write_text(json.dumps([legacy.to_dict()]))
+
+        AgentMetrics(storage_path=storage_path, db_path=db_path)
+        metrics = AgentMetrics(storage_path=storage_path, db_path=db_path)
+
+        summary = metrics.get_summary("review")
+        assert summary.total_tasks == 1
+        assert summary.total_cost_usd == pytest.approx(0.01)
 
     def test_export_metrics(self, temp_dir):
         """Test exporting metrics to file."""
@@ -499,6 +527,8 @@ class TestPersistence:
         success = metrics.export_metrics(export_path)
         assert success is True
         assert export_path.exists()
+        exported = json.loads(export_path.read_text())
+        assert [item["task_id"] for item in exported] == ["task-export-001"]
 
     def test_import_metrics(self, temp_dir):
         """Test importing metrics from file."""
@@ -535,6 +565,70 @@ class TestPersistence:
         assert len(metrics.metrics) == 1
 
 
+class TestRollupSummaries:
+    """Test summaries answered from the hourly/daily rollups."""
+
+    def test_summary_matches_raw_metrics(self, metrics_tracker):
+        """Test rollup-based summaries agree with aggregating every metric."""
+        now = datetime.now()
+        recorded = []
+        for i in range(200):
+            metric = AgentMetric(
+                timestamp=now - timedelta(hours=i * 1.7, minutes=i * 7),
+                agent_type="implement" if i % 3 else "test",
+                task_id=f"rollup-{i}",
+                task_description="Rollup check",
+                model_used=[ModelType.HAIKU, ModelType.SONNET, ModelType.OPUS][i % 3].value,
+                duration_ms=100.0 + i * 13 % 997,
+                input_tokens=1000 + i,
+                output_tokens=200 + i,
+                total_tokens=1200 + 2 * i,
+                cost_usd=0.001 * (1 + i % 17),
+                success=i % 5 != 0,
+                test_pass_rate=0.5 + (i % 2) / 2,
+                files_created=i % 4,
+            )
+            metrics_tracker.add_metric(metric)
+            recorded.append(metric)
+
+        cutoff = datetime.now() - timedelta(days=7)
+        expected = [m for m in recorded if m.agent_type == "implement" and m.timestamp >= cutoff]
+        summary = metrics_tracker.get_summary("implement", time_period_days=7)
+
+        assert summary.total_tasks == len(expected)
+        assert summary.successful_tasks == sum(m.success for m in expected)
+        assert summary.total_cost_usd == pytest.approx(sum(m.cost_usd for m in expected))
+        assert summary.min_duration_ms == min(m.duration_ms for m in expected)
+        assert summary.max_duration_ms == max(m.duration_ms for m in expected)
+        assert summary.total_tokens == sum(m.total_tokens for m in expected)
+        assert summary.avg_files_created == pytest.approx(
+            sum(m.files_created for m in expected) / len(expected)
+        )
+        assert sum(summary.model_usage.values()) == len(expected)
+
+    def test_recent_metrics_bounded(self, temp_dir):
+        """Test only a bounded window of recent metrics is kept in memory."""
+        metrics = AgentMetrics(
+            storage_path=temp_dir / "agent_metrics.json",
+            db_path=temp_dir / "telemetry.db",
+            recent_size=3,
+        )
+        for i in range(5):
+            metrics.record_metric(
+                agent_type="explore",
+                task_id=f"bounded-{i}",
+                task_description="Bounded",
+                model_used=ModelType.HAIKU.value,
+                duration_ms=10.0,
+                input_tokens=10,
+                output_tokens=10,
+                success=True,
+            )
+
+        assert [m.task_id for m in metrics.metrics] == ["bounded-2", "bounded-3", "bounded-4"]
+        assert metrics.get_summary("explore").total_tasks == 5
+
+
 class TestPerformanceMetrics:
     """Test performance metric calculations."""
 
@@ -622,3 +716,4 @@ class TestClearAndReset:
         metrics_tracker.clear_metrics()
         assert len(metrics_tracker.metrics) == 0
         assert not metrics_tracker.storage_path.exists()
+        assert metrics_tracker.get_summary("explore") is None
@@ -335,10 +335,10 @@ def test_event_storage_thread_safe(tmp_path):
         t.join(timeout=5)
 
     assert not errors, f"Concurrent save() errors: {errors}"
-    # File must still be valid JSON
-    content = (tmp_path / "events.json").read_text()
-    data = json.loads(content)
-    assert "events" in data
+    # File must still be valid JSON Lines holding exactly one save()'s events
+    lines = (tmp_path / "events.json").read_text().splitlines()
+    data = [json.loads(line) for line in lines]
+    assert len(data) == 1 and data[0]["type"] == "test"
 
 
 # ---------------------------------------------------------------------------
@@ -129,6 +129,17 @@ class TestFileRotator:
         assert len(rotated_files) >= 1
         assert rotated_1 in rotated_files
 
+    def test_rotations_within_one_second_do_not_collide(self, temp_file):
+        """Test back-to-back rotations keep every rotated file."""
+        rotator = FileRotator(compress=False)
+        rotated = []
+        for i in range(3):
+            temp_file.write_text(f"segment {i}")
+            rotated.append(rotator.rotate_file(temp_file))
+
+        assert len(set(rotated)) == 3
+        assert sorted(p.read_text() for p in rotated) == ["segment 0", "segment 1", "segment 2"]
+
     def test_decompress_file(self, temp_file):
         """Test file decompression."""
         rotator = FileRotator()
@@ -268,6 +279,86 @@ class TestEventStorage:
         assert "total_files" in stats
 
 
+class TestSegmentedEventStorage:
+    """Test append-only JSON Lines segments and the segment index."""
+
+    @staticmethod
+    def _events(start: int, count: int, day: int = 1):
+        return [
+            {"event_id": str(i), "timestamp": f"2025-01-{day:02d}T10:{i % 60:02d}:00.{i:06d}"}
+            for i in range(start, start + count)
+        ]
+
+    def test_append_only_writes_new_events(self, temp_file):
+        """Test append() extends the active segment instead of rewriting it."""
+        storage = EventStorage(storage_path=temp_file)
+        storage.append(self._events(0, 3))
+        before = temp_file.read_bytes()
+
+        storage.append(self._events(3, 2))
+
+        assert temp_file.read_bytes().startswith(before)
+        assert len(temp_file.read_text().splitlines()) == 5
+        assert [e["event_id"] for e in storage.load()] == ["0", "1", "2", "3", "4"]
+
+    def test_legacy_active_file_is_converted(self, temp_file):
+        """Test an indented {"events": [...]} file is readable and appendable."""
+        legacy = self._events(0, 2)
+        temp_file.write_text(json.dumps({"events": legacy, "version": "1.0"}, indent=2))
+
+        storage = EventStorage(storage_path=temp_file)
+        storage.append(self._events(2, 1))
+
+        assert [e["event_id"] for e in storage.load()] == ["0", "1", "2"]
+        assert storage.get_storage_stats()["current_event_count"] == 3
+
+    def test_limit_reads_only_newest_segments(self, temp_dir):
+        """Test limit and time-bounded reads skip segments via the index."""
+        storage_path = temp_dir / "events.json"
+        storage = EventStorage(storage_path=storage_path, max_file_size=1, compress=True)
+        for day in range(1, 6):
+            storage.append(self._events(day * 10, 10, day=day))
+
+        assert len(storage.get_rotated_files()) == 4
+        assert storage.index_path.exists()
+
+        opened = []
+        original = storage.iter_segment
+
+        def spy(path):
+            opened.append(path)
+            return original(path)
+
+        storage.iter_segment = spy
+        newest = storage.load_all_events(limit=5)
+        assert [e["event_id"] for e in newest] == ["59", "58", "57", "56", "55"]
+        assert opened == [storage_path]
+
+        opened.clear()
+        day2 = storage.load_all_events(
+            start_time="2025-01-02T00:00:00", end_time="2025-01-02T23:59:59"
+        )
+        assert sorted(e["event_id"] for e in day2) == [str(i) for i in range(20, 30)]
+        assert len(opened) == 1
+
+        assert len(storage.load_all_events()) == 50
+        assert storage.get_storage_stats()["total_event_count"] == 50
+
+    def test_index_survives_restart_and_cleanup(self, temp_dir):
+        """Test a reopened storage uses the sidecar index and forgets deleted segments."""
+        storage_path = temp_dir / "events.json"
+        storage = EventStorage(storage_path=storage_path, max_file_size=1, compress=False)
+        for day in range(1, 4):
+            storage.append(self._events(day * 10, 2, day=day))
+
+        reopened = EventStorage(storage_path=storage_path, max_file_size=1, compress=False)
+        oldest = min(reopened.get_rotated_files(), key=lambda p: p.name)
+        oldest.unlink()
+
+        assert len(reopened.load_all_events()) == 4
+        assert oldest.name not in json.loads(reopened.index_path.read_text())["segments"]
+
+
 class TestEventCollectorIntegration:
     """Test EventCollector integration with rotation."""
 
@@ -189,6 +189,111 @@ class TestDeduplication:
         assert sim > 0.9
 
 
+class TestTitleEmbeddingDedup:
+    """Stored title embeddings + in-memory dedup window."""
+
+    def test_title_index_best_match(self):
+        from core.cluster.title_index import TitleIndex
+        index = TitleIndex()
+        index.add(1, "alpha", [1.0, 0.0, 0.0])
+        index.add(2, "beta", [0.0, 1.0, 0.0])
+        assert not index.add(3, "wrong dim", [1.0, 0.0])
+
+        item_id, title, sim = index.best_match([0.1, 2.0, 0.0])
+        assert (item_id, title) == (2, "beta")
+        assert sim > 0.99
+        assert len(index) == 2
+
+    def test_embedding_round_trip(self):
+        from core.cluster.title_index import pack_embedding, unpack_embedding
+        vec = [0.5, -1.25, 3.0]
+        assert unpack_embedding(pack_embedding(vec)) == vec
+
+    @pytest.mark.asyncio
+    async def test_scoring_embeds_each_title_once(self):
+        import core.cluster.intel_scoring as scoring
+        conn = _setup_test_db()
+        vectors = {
+            "Claude 5 released": [1.0, 0.0, 0.0],
+            "Claude 5 is out": [0.99, 0.05, 0.0],
+            "New MCP server": [0.0, 1.0, 0.0],
+        }
+        for title in vectors:
+            conn.execute("INSERT INTO intel_items (title, source) VALUES (?, ?)", (title, "t"))
+        conn.commit()
+
+        batches = []
+
+        async def fake_batch(texts):
+            batches.append(list(texts))
+            return [vectors[t] for t in texts]
+
+        reply = json.dumps({
+            "relevance": 5, "urgency": 5, "actionability": 5,
+            "category": "general-news", "priority": "low", "summary": "ok",
+        })
+        with patch.object(scoring, "_call_below_embed_batch", side_effect=fake_batch), \
+                patch.object(scoring, "_call_below_embed", AsyncMock()) as single, \
+                patch.object(scoring, "_call_below_chat", AsyncMock(return_value=reply)):
+            stats = await scoring.score_intel_items()
+            # Already-scored titles are read back from the DB, not re-embedded
+            assert await scoring._check_duplicate_by_embedding("Claude 5 out now") is False
+
+        assert stats["duplicates"] == 1
+        assert stats["scored"] == 2
+        assert batches == [list(vectors)]
+        single.assert_awaited_once_with("Claude 5 out now")
+        stored = conn.execute(
+            "SELECT COUNT(*) FROM intel_items WHERE title_embedding IS NOT NULL"
+        ).fetchone()[0]
+        assert stored == 3
+        conn.close()
+
+    @pytest.mark.asyncio
+    async def test_window_backfills_missing_embeddings(self):
+        import core.cluster.intel_scoring as scoring
+        conn = _setup_test_db()
+        conn.execute(
+            "INSERT INTO intel_items (title, source, scored) VALUES (?, ?, 1)", ("Old", "t")
+        )
+        conn.commit()
+
+        with patch.object(
+            scoring, "_call_below_embed_batch", AsyncMock(return_value=[[0.0, 1.0]])
+        ) as batch:
+            index = await scoring._load_dedup_index(conn, "intel")
+            assert len(index) == 1
+            await scoring._load_dedup_index(conn, "intel")
+
+        batch.assert_awaited_once_with(["Old"])
+        conn.close()
+
+    @pytest.mark.asyncio
+    async def test_store_embeddings_chunks_batches(self):
+        import core.cluster.intel_scoring as scoring
+        conn = _setup_test_db()
+        titles = [f"Title {i}" for i in range(5)]
+        for title in titles:
+            conn.execute("INSERT INTO intel_items (title, source) VALUES (?, ?)", (title, "t"))
+        conn.commit()
+        items = [tuple(r) for r in conn.execute("SELECT id, title FROM intel_items ORDER BY id")]
+
+        batches = []
+
+        async def fake_batch(texts):
+            batches.append(list(texts))
+            # The middle chunk fails; the others are still stored
+            return None if len(batches) == 2 else [[1.0, 0.0]] * len(texts)
+
+        with patch.object(scoring, "EMBED_BATCH_SIZE", 2), \
+                patch.object(scoring, "_call_below_embed_batch", side_effect=fake_batch):
+            stored = await scoring._store_title_embeddings(conn, "intel", items)
+
+        assert batches == [titles[0:2], titles[2:4], titles[4:5]]
+        assert sorted(stored) == [items[0][0], items[1][0], items[4][0]]
+        conn.close()
+
+
 # --- Confidence Flagging Tests ---
 
 class TestConfidenceFlagging:
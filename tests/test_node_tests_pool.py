@@ -0,0 +1,126 @@
+"""
+Tests for Walter's test executor pool: per-project "latest wins" run slots,
+one in-flight run per project with concurrency across projects, and the
+queue-wait / run-duration metrics in /api/health.
+"""
+
+import os
+import tempfile
+import threading
+from collections import deque
+
+import pytest
+
+os.environ.setdefault("TEST_DB", tempfile.mktemp(suffix=".db"))
+
+import core.cluster.node_tests as mod
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(autouse=True)
+def fresh_scheduler(monkeypatch, tmp_path):
+    """Empty scheduler state and repos dir for each test."""
+    monkeypatch.setattr(mod, "_sched_cond", threading.Condition())
+    monkeypatch.setattr(mod, "_pending_runs", {})
+    monkeypatch.setattr(mod, "_ready_projects", deque())
+    monkeypatch.setattr(mod, "_active_projects", set())
+    monkeypatch.setattr(mod, "_queue_waits", deque(maxlen=200))
+    monkeypatch.setattr(mod, "_run_durations", deque(maxlen=200))
+    monkeypatch.setattr(mod, "_run_status", {})
+    monkeypatch.setattr(mod, "_inflight_projects", set())
+    monkeypatch.setattr(mod, "_executors_stop", threading.Event())
+    monkeypatch.setattr(mod, "REPOS_DIR", str(tmp_path))
+
+
+def _item(run_id, project, changed=None):
+    return {"run_id": run_id, "project": project, "repo_path": f"/repos/{project}",
+            "trigger": "watch", "changed": changed or []}
+
+
+def test_latest_run_wins_its_project_slot():
+    mod._enqueue_run(_item("w-1", "app", ["a.ts"]))
+    mod._enqueue_run(_item("w-2", "app", ["b.ts"]))
+    mod._enqueue_run(_item("w-3", "api", ["c.py"]))
+
+    assert list(mod._ready_projects) == ["app", "api"]
+    assert mod._pending_runs["app"]["run_id"] == "w-2"
+    assert mod._pending_runs["app"]["changed"] == ["a.ts", "b.ts"]
+    assert mod._run_status["w-1"]["status"] == "skipped"
+    assert mod._run_status["w-1"]["reason"] == "superseded by w-2"
+
+    # A superseded full run keeps the replacement full
+    mod._enqueue_run(_item("m-1", "api"))
+    mod._enqueue_run(_item("w-4", "api", ["d.py"]))
+    assert mod._pending_runs["api"]["changed"] == []
+
+
+def test_one_run_per_project_and_parallel_across_projects(monkeypatch):
+    started = {}
+    release = {}
+    order = []
+    lock = threading.Lock()
+
+    def fake_execute(run_id, project, repo_path, trigger, changed):
+        with lock:
+            order.append(run_id)
+            started[run_id].set()
+        assert release[run_id].wait(5)
+
+    monkeypatch.setattr(mod, "_execute_test_run", fake_execute)
+    for run_id in ("a-1", "b-1", "a-2"):
+        started[run_id] = threading.Event()
+        release[run_id] = threading.Event()
+    pool = [
+        threading.Thread(target=mod._test_executor, daemon=True, name=f"pool-{n}")
+        for n in range(3)
+    ]
+    for thread in pool:
+        thread.start()
+
+    try:
+        mod._enqueue_run(_item("a-1", "app"))
+        mod._enqueue_run(_item("b-1", "api"))
+        assert started["a-1"].wait(5) and started["b-1"].wait(5)
+
+        # Same project while its run is in flight: waits despite an idle executor
+        mod._enqueue_run(_item("a-2", "app"))
+        assert not started["a-2"].wait(0.2)
+
+        release["a-1"].set()
+        assert started["a-2"].wait(5)
+        assert mod._run_status["a-2"]["status"] == "running"
+    finally:
+        for event in release.values():
+            event.set()
+        # Stop the pool before monkeypatch restores the real scheduler state
+        mod._stop_executors()
+        for thread in pool:
+            thread.join(timeout=5)
+
+    assert not any(thread.is_alive() for thread in pool)
+    assert sorted(order[:2]) == ["a-1", "b-1"] and order[2] == "a-2"
+
+
+def test_worker_share_splits_cores_across_pool(monkeypatch):
+    monkeypatch.setattr(mod.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(mod, "TEST_POOL_SIZE", 2)
+    assert mod._worker_share(8) == 4
+    assert mod._worker_share(2) == 2
+
+    monkeypatch.setattr(mod, "TEST_POOL_SIZE", 16)
+    assert mod._worker_share(4) == 1
+
+
+def test_health_reports_queue_wait_and_run_duration():
+    mod._queue_waits.extend([1.0, 2.0, 30.0])
+    mod._run_durations.extend([60.0, 120.0])
+    mod._enqueue_run(_item("w-1", "app"))
+
+    body = TestClient(mod.app).get("/api/health").json()
+
+    assert body["queue_depth"] == 1
+    assert body["queued_projects"] == ["app"]
+    assert body["running"] is False
+    assert body["queue_wait"] == {"count": 3, "p50_s": 2.0, "p95_s": 30.0, "max_s": 30.0}
+    assert body["run_duration"]["count"] == 2
+    assert body["run_duration"]["max_s"] == 120.0
@@ -24,6 +24,7 @@ from core.parallel import (
     WorkerStatus,
     LiveDashboard,
     DashboardConfig,
+    FileLockIndex,
 )
 
 
@@ -247,6 +248,104 @@ def test_cleanup_old_sessions():
         assert manager.get_session(s2.session_id) is not None
 
 
+def test_directory_lock_conflicts():
+    """Test directory-prefix locks conflict with files below them."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = SessionManager(storage_path=Path(tmpdir) / "sessions.json")
+        s1 = manager.create_session("Build 1")
+        s2 = manager.create_session("Build 2")
+        manager.start_session(s1.session_id)
+        manager.start_session(s2.session_id)
+
+        manager.lock_files(s1.session_id, ["src/api/"])
+
+        with pytest.raises(ValueError, match="already locked"):
+            manager.lock_files(s2.session_id, ["src/api/routes/x.py"])
+        manager.lock_files(s2.session_id, ["src/apiary.py", "src/ui/app.py"])
+
+        # A directory lock also conflicts with files already locked below it
+        with pytest.raises(ValueError, match=s2.session_id):
+            manager.lock_files(s1.session_id, ["src/ui/"])
+
+        manager.unlock_files(s1.session_id)
+        manager.lock_files(s2.session_id, ["src/api/routes/x.py"])
+
+
+def test_inactive_session_locks_do_not_block():
+    """Test locks held by non-running sessions are ignored."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = SessionManager(storage_path=Path(tmpdir) / "sessions.json")
+        s1 = manager.create_session("Build 1")
+        s2 = manager.create_session("Build 2")
+        manager.start_session(s1.session_id)
+        manager.start_session(s2.session_id)
+
+        manager.lock_files(s1.session_id, ["file1.py"])
+        manager.complete_session(s1.session_id)
+
+        manager.lock_files(s2.session_id, ["file1.py"])
+        assert "file1.py" in manager.get_session(s2.session_id).files_locked
+
+
+def test_file_lock_index_paths():
+    """Test path normalization and pruning in the lock trie."""
+    index = FileLockIndex()
+    index.add("a", ["./src//core.py", "docs/"])
+
+    assert index.owners("src/core.py") == ["a"]
+    assert index.conflicts("b", ["src/core.py", "docs/guide.md", "src/"]) == {
+        "src/core.py": "a",
+        "docs/guide.md": "a",
+        "src/": "a",
+    }
+    assert index.conflicts("a", ["src/core.py"]) == {}
+
+    index.remove("a", ["src/core.py", "docs/"])
+    assert index.conflicts("b", ["src/", "docs/guide.md"]) == {}
+    assert index._root.children == {}
+
+
+def test_lock_updates_append_to_journal():
+    """Test locks append deltas instead of rewriting the snapshot."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_path = Path(tmpdir) / "sessions.json"
+        manager = SessionManager(storage_path=storage_path)
+        session = manager.create_session("Build", total_tasks=4)
+        manager.start_session(session.session_id)
+        manager._save()
+        snapshot = storage_path.read_text()
+
+        manager.lock_files(session.session_id, ["src/a.py", "src/b.py"])
+        manager.unlock_files(session.session_id, ["src/a.py"])
+        manager.update_progress(session.session_id, completed_tasks=2)
+
+        assert storage_path.read_text() == snapshot
+        entries = [json.loads(line) for line in manager.journal_path.read_text().splitlines()]
+        assert [entry["op"] for entry in entries] == ["lock", "unlock", "session"]
+
+        reloaded = SessionManager(storage_path=storage_path)
+        restored = reloaded.get_session(session.session_id)
+        assert restored.files_locked == {"src/b.py"}
+        assert restored.progress_percent == 50.0
+        assert reloaded.lock_index.owners("src/b.py") == [session.session_id]
+
+
+def test_journal_compaction():
+    """Test journal is folded into the snapshot once it grows too long."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_path = Path(tmpdir) / "sessions.json"
+        manager = SessionManager(storage_path=storage_path)
+        manager.JOURNAL_COMPACT_ENTRIES = 3
+        session = manager.create_session("Build")
+
+        manager.lock_files(session.session_id, ["a.py"])
+        manager.lock_files(session.session_id, ["b.py"])
+
+        assert not manager.journal_path.exists()
+        data = json.loads(storage_path.read_text())
+        assert sorted(data["sessions"][0]["files_locked"]) == ["a.py", "b.py"]
+
+
 # ===== Worker Coordinator Tests =====
 
 
@@ -462,6 +561,122 @@ def test_list_workers():
     assert len(busy) == 1
 
 
+def test_queued_task_placed_on_least_loaded_worker():
+    """Test tasks queue on the worker expected to finish them first."""
+    coordinator = WorkerCoordinator(max_workers=2)
+    w1 = coordinator.register_worker()
+    w2 = coordinator.register_worker()
+
+    coordinator.assign_task("long", {"estimated_minutes": 120})
+    coordinator.assign_task("short", {"estimated_minutes": 5})
+    coordinator.assign_task("next", {"estimated_minutes": 10})
+
+    # "next" waits behind the short task, not the long one
+    coordinator.complete_task(w2.worker_id, "short")
+    assert coordinator.get_worker(w2.worker_id).current_task == "next"
+    assert coordinator.get_worker(w1.worker_id).current_task == "long"
+
+
+def test_idle_worker_steals_queued_task():
+    """Test an idle worker with an empty deque steals queued work."""
+    coordinator = WorkerCoordinator(max_workers=2)
+    w1 = coordinator.register_worker()
+    w2 = coordinator.register_worker()
+
+    coordinator.assign_task("a", {"estimated_minutes": 60})
+    coordinator.assign_task("b", {"estimated_minutes": 60})
+    coordinator.assign_task("c", {"estimated_minutes": 10})
+    coordinator.assign_task("d", {"estimated_minutes": 10})
+
+    coordinator.complete_task(w1.worker_id, "a")
+    coordinator.complete_task(w1.worker_id, coordinator.get_worker(w1.worker_id).current_task)
+
+    assert coordinator.get_worker(w1.worker_id).status == WorkerStatus.BUSY
+    assert coordinator.steals == 1
+    assert coordinator.task_queue == []
+
+
+def test_steal_skips_head_task_that_would_not_finish_sooner():
+    """Test a thief takes a later task from a deque when the head isn't worth stealing."""
+    coordinator = WorkerCoordinator(max_workers=2)
+    medium = coordinator.register_worker(metadata={"capacity": 2})
+    coordinator.assign_task("run", {"estimated_minutes": 2})
+    coordinator.assign_task("big", {"estimated_minutes": 10})
+    coordinator.assign_task("small", {"estimated_minutes": 1})
+
+    # The slower thief would finish "big" after medium does, but "small" well before
+    thief = coordinator.register_worker(metadata={"capacity": 1})
+
+    assert coordinator.get_worker(thief.worker_id).current_task == "small"
+    assert [t["task_id"] for t in coordinator.task_queue] == ["big"]
+    assert coordinator.get_worker(medium.worker_id).current_task == "run"
+
+
+def test_steal_tries_busiest_victim_first():
+    """Test stealing starts with the worker that has the most queued work."""
+    coordinator = WorkerCoordinator(max_workers=3)
+    w1 = coordinator.register_worker()
+    w2 = coordinator.register_worker()
+    coordinator.assign_task("run-1", {"estimated_minutes": 20})
+    coordinator.assign_task("run-2", {"estimated_minutes": 20})
+    coordinator.assign_task("older", {"estimated_minutes": 4})
+    coordinator.assign_task("newer", {"estimated_minutes": 20})
+    owner = {
+        t["task_id"]: wid
+        for wid, local in coordinator._local_queues.items()
+        for t in local
+    }
+    assert owner["older"] != owner["newer"]
+
+    # "newer" sits on the worker with more queued work, so it goes first
+    thief = coordinator.register_worker()
+
+    assert coordinator.get_worker(thief.worker_id).current_task == "newer"
+    assert [t["task_id"] for t in coordinator.task_queue] == ["older"]
+    assert {coordinator.get_worker(w.worker_id).current_task for w in (w1, w2)} == {
+        "run-1", "run-2",
+    }
+
+
+def test_idle_workers_prefer_capacity():
+    """Test immediate dispatch favours the fastest idle worker."""
+    coordinator = WorkerCoordinator(max_workers=2)
+    coordinator.register_worker()
+    fast = coordinator.register_worker(metadata={"capacity": 4})
+
+    assert coordinator.assign_task("task-1", {}) == fast.worker_id
+
+
+def test_task_cost_estimation():
+    """Test explicit estimates win over description-based complexity."""
+    coordinator = WorkerCoordinator()
+
+    assert coordinator.estimate_cost({"estimated_minutes": 30}) == 30.0
+    assert coordinator.estimate_cost({}) == coordinator.DEFAULT_TASK_COST
+    complex_cost = coordinator.estimate_cost(
+        {"description": "Redesign distributed database schema migration for security"}
+    )
+    simple_cost = coordinator.estimate_cost({"description": "Fix typo in comment"})
+    assert complex_cost > simple_cost
+
+    # Complexity scores are converted to minutes, like explicit estimates
+    low, high = coordinator.COMPLEXITY_MINUTES
+    assert low <= simple_cost < complex_cost <= high
+
+
+def test_new_worker_takes_backlog():
+    """Test a newly registered worker picks up queued tasks."""
+    coordinator = WorkerCoordinator(max_workers=2)
+    w1 = coordinator.register_worker()
+    coordinator.assign_task("task-1", {})
+    coordinator.assign_task("task-2", {})
+
+    w2 = coordinator.register_worker()
+
+    assert coordinator.get_worker(w2.worker_id).current_task == "task-2"
+    assert coordinator.task_queue == []
+
+
 # ===== Live Dashboard Tests =====
 
 
@@ -0,0 +1,269 @@
+"""
+Tests for ParallelBuildCoordinator on the SQLite coordination store
+"""
+
+import json
+import multiprocessing as mp
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from core.build_spec_cache import BuildSpecCache, get_build_spec_cache
+from core.parallel_build_coordinator import (
+    InstanceStatus,
+    ParallelBuildCoordinator,
+    analyze_build_spec,
+)
+from core.runtime.capability_gate import load_build_phases
+
+SPEC = """# BUILD
+
+## Phase 1: Core
+
+**Component:** `src/core.py`
+
+## Phase 2: API
+
+**Depends on:** Phase 1
+**Component:** `src/api.py`
+
+## Phase 3: UI
+
+**Depends on:** Phase 1
+**Component:** `src/core.py`
+
+## Phase 4: Docs
+
+**Component:** `src/core.py`
+"""
+
+
+@pytest.fixture
+def spec(tmp_path):
+    path = tmp_path / "BUILD_test.md"
+    path.write_text(SPEC)
+    return path
+
+
+@pytest.fixture
+def coord(spec, tmp_path):
+    return ParallelBuildCoordinator(spec, state_file=tmp_path / "parallel_state.db")
+
+
+def _claim(args):
+    spec, state, phase = args
+    coord = ParallelBuildCoordinator(Path(spec), state_file=Path(state))
+    instance_id = coord.register_instance()
+    return coord.claim_phase(instance_id, phase)
+
+
+class TestInstanceLifecycle:
+    """Registration, heartbeats and coordinator election"""
+
+    def test_first_instance_is_coordinator(self, coord):
+        first = coord.register_instance()
+        second = coord.register_instance()
+
+        assert coord.is_coordinator(first)
+        assert not coord.is_coordinator(second)
+
+    def test_release_elects_next_running_instance(self, coord):
+        first = coord.register_instance()
+        second = coord.register_instance()
+
+        coord.release_instance(first)
+
+        assert coord.is_coordinator(second)
+        assert coord.get_instance(first) is None
+
+    def test_heartbeat_and_progress(self, coord):
+        instance_id = coord.register_instance()
+
+        assert coord.update_heartbeat(instance_id)
+        assert coord.update_progress(instance_id, 0.5)
+        assert coord.get_instance(instance_id).progress == 0.5
+        assert not coord.update_heartbeat("missing")
+
+    def test_state_shared_between_coordinators(self, coord, spec, tmp_path):
+        instance_id = coord.register_instance()
+        other = ParallelBuildCoordinator(spec, state_file=tmp_path / "parallel_state.db")
+
+        assert [i.id for i in other.get_all_instances()] == [instance_id]
+
+
+class TestPhaseClaims:
+    """Compare-and-set phase claims"""
+
+    def test_claim_respects_dependencies(self, coord):
+        instance_id = coord.register_instance()
+
+        assert not coord.claim_phase(instance_id, "2")
+        assert coord.claim_phase(instance_id, "1")
+        coord.mark_completed(instance_id)
+
+        assert coord.get_available_phases() == ["2", "3", "4"]
+
+    def test_phase_claimed_once(self, coord):
+        first = coord.register_instance()
+        second = coord.register_instance()
+
+        assert coord.claim_phase(first, "1")
+        assert not coord.claim_phase(second, "1")
+        assert coord.get_claimed_phases() == {"1": first}
+
+    def test_completed_phase_cannot_be_claimed(self, coord):
+        first = coord.register_instance()
+        coord.claim_phase(first, "1")
+        coord.mark_completed(first)
+
+        second = coord.register_instance()
+        assert not coord.claim_phase(second, "1")
+
+    def test_file_conflict_blocks_claim(self, coord):
+        core = coord.register_instance()
+        docs = coord.register_instance()
+        assert coord.claim_phase(core, "1")
+
+        # Phase 4 shares src/core.py with the running Phase 1
+        assert not coord.claim_phase(docs, "4")
+
+        coord.release_phase(core)
+        assert coord.get_instance(core).files_locked == []
+        assert coord.claim_phase(docs, "4")
+
+    def test_concurrent_claims_have_single_winner(self, spec, tmp_path):
+        state = tmp_path / "parallel_state.db"
+        ParallelBuildCoordinator(spec, state_file=state)
+
+        with mp.get_context("spawn").Pool(4) as pool:
+            outcomes = pool.map(_claim, [(str(spec), str(state), "1")] * 8)
+
+        assert outcomes.count(True) == 1
+
+
+class TestStaleInstances:
+    """Heartbeat timeout handling"""
+
+    def test_cleanup_abandons_stale_instance(self, coord):
+        stale = coord.register_instance()
+        fresh = coord.register_instance()
+        coord.claim_phase(stale, "1")
+        old = (datetime.now() - timedelta(seconds=coord.HEARTBEAT_TIMEOUT + 60)).isoformat()
+        coord.store._conn.execute(
+            "UPDATE instances SET last_heartbeat = ? WHERE id = ?", (old, stale)
+        )
+
+        assert coord.cleanup_stale_instances() == [stale]
+
+        instance = coord.get_instance(stale)
+        assert instance.status == InstanceStatus.ABANDONED
+        assert instance.phase is None
+        assert coord.is_coordinator(fresh)
+        assert "1" in coord.get_available_phases()
+
+
+class TestSpecAnalysis:
+    """Parse-once BUILD spec analysis"""
+
+    def test_single_pass_analysis(self):
+        analysis = analyze_build_spec(SPEC)
+
+        assert analysis.phases == ["1", "2", "3", "4"]
+        assert analysis.dependencies == {"2": ["1"], "3": ["1"]}
+        assert analysis.parallel_safe == [["1", "4"], ["2", "3"]]
+        assert analysis.phase_files["2"] == ["src/api.py"]
+        assert analysis.file_conflicts == {
+            "1->3": ["src/core.py"],
+            "1->4": ["src/core.py"],
+            "3->4": ["src/core.py"],
+        }
+
+    def test_queries_do_not_reread_unchanged_spec(self, coord, spec, monkeypatch):
+        coord.get_available_phases()
+        reads = []
+        original = Path.read_text
+        monkeypatch.setattr(
+            Path, "read_text", lambda self, *a, **k: reads.append(self) or original(self, *a, **k)
+        )
+
+        coord.get_available_phases()
+        coord.claim_phase(coord.register_instance(), "1")
+        coord.detect_file_conflicts()
+
+        assert reads == []
+
+    def test_changed_spec_is_reparsed(self, coord, spec):
+        assert "5" not in coord.get_available_phases()
+
+        spec.write_text(SPEC + "\n## Phase 5: Extra\n\n**Component:** `src/extra.py`\n")
+
+        assert "5" in coord.get_available_phases()
+
+    def test_returned_analysis_is_a_copy(self, coord):
+        coord.build_dependency_graph().phases.append("99")
+        coord.extract_phase_files("1").append("src/other.py")
+
+        assert coord.build_dependency_graph().phases == ["1", "2", "3", "4"]
+        assert coord.extract_phase_files("1") == ["src/core.py"]
+
+    def test_cache_keyed_by_name(self, spec):
+        cache = BuildSpecCache()
+
+        assert cache.get(spec, "lines", lambda text: len(text.splitlines())) > 0
+        assert cache.get(spec, "phases", analyze_build_spec).phases[0] == "1"
+        cache.get(spec, "phases", analyze_build_spec)
+
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_capability_gate_uses_cache(self, tmp_path):
+        build = tmp_path / "BUILD_gate.md"
+        build.write_text(
+            "### Phase 1: Setup\n**Status:** pending\n"
+            "**Files to CREATE:**\n- `src/a.py`\n"
+        )
+
+        first = load_build_phases(build)
+        hits = get_build_spec_cache().hits
+
+        assert load_build_phases(build)[0] is first[0]
+        assert first[0].files == ["src/a.py"]
+        assert get_build_spec_cache().hits == hits + 1
+
+
+class TestLegacyMigration:
+    """Import of the v1 parallel_state.json"""
+
+    def test_json_state_imported_once(self, spec, tmp_path):
+        now = datetime.now().isoformat()
+        legacy = {
+            "version": "1.0",
+            "build_spec": str(spec),
+            "started_at": now,
+            "coordinator_id": "a",
+            "instances": {
+                "a": {
+                    "id": "a",
+                    "status": "running",
+                    "phase": "2",
+                    "tasks": [],
+                    "files_locked": ["src/api.py"],
+                    "started_at": now,
+                    "last_heartbeat": now,
+                    "progress": 0.25,
+                },
+            },
+            "phase_analysis": {},
+            "completed_phases": ["1"],
+            "sync_points": [],
+        }
+        (tmp_path / "parallel_state.json").write_text(json.dumps(legacy))
+
+        coord = ParallelBuildCoordinator(spec, state_file=tmp_path / "parallel_state.json")
+
+        assert coord.state_file == tmp_path / "parallel_state.db"
+        assert coord.is_coordinator("a")
+        assert coord.get_claimed_phases() == {"2": "a"}
+        assert coord.get_instance("a").files_locked == ["src/api.py"]
+        assert coord.get_available_phases() == ["3", "4"]
+        assert coord.get_status()["completed_phases"] == ["1"]
@@ -4,12 +4,14 @@ Tests for BuildRunner persistence layer (Database and models)
 
 import pytest
 from pathlib import Path
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
+import random
 import tempfile
 import os
 
 from core.persistence.database import Database
 from core.persistence.models import CostEntry, MetricEntry
+from core.persistence.rollups import RollupTables, window_segments
 
 
 @pytest.fixture
@@ -304,6 +306,108 @@ class TestMetricEntry:
         assert "id" not in data  # Should be removed if None
 
 
+class TestRollupTables:
+    """Test hourly/daily rollups kept in step with a raw table."""
+
+    @pytest.fixture
+    def rollups(self, initialized_db):
+        rollups = RollupTables(
+            initialized_db,
+            raw_table="cost_entries",
+            prefix="cost_rollup",
+            keys=["model_name"],
+            measures={
+                "requests": ("sum", "1"),
+                "cost_usd": ("sum", "cost_usd"),
+                "max_cost_usd": ("max", "cost_usd"),
+            },
+        )
+        rollups.create()
+        return rollups
+
+    @staticmethod
+    def _row(timestamp, model, cost):
+        return {
+            "timestamp": timestamp.isoformat(),
+            "model_name": model,
+            "input_tokens": 1,
+            "output_tokens": 1,
+            "cost_usd": cost,
+        }
+
+    def test_window_matches_raw_rows(self, rollups):
+        """Test rollup windows agree with filtering the raw rows."""
+        rng = random.Random(7)
+        base = datetime(2025, 1, 1, 0, 0)
+        rows = [
+            self._row(
+                base + timedelta(minutes=rng.randint(0, 10 * 24 * 60)),
+                rng.choice(["haiku", "sonnet"]),
+                round(rng.uniform(0.01, 1.0), 4),
+            )
+            for _ in range(500)
+        ]
+        rollups.insert_many(rows)
+
+        for _ in range(25):
+            start = base + timedelta(minutes=rng.randint(-60, 10 * 24 * 60))
+            end = start + timedelta(minutes=rng.randint(0, 5 * 24 * 60))
+            expected = [
+                r
+                for r in rows
+                if r["model_name"] == "sonnet"
+                and start.isoformat() <= r["timestamp"] < end.isoformat()
+            ]
+
+            result = rollups.window(start, end, filters={"model_name": "sonnet"})
+
+            if not expected:
+                assert result == []
+                continue
+            assert result[0]["requests"] == len(expected)
+            assert result[0]["cost_usd"] == pytest.approx(sum(r["cost_usd"] for r in expected))
+            assert result[0]["max_cost_usd"] == max(r["cost_usd"] for r in expected)
+
+    def test_window_segments_cover_window(self):
+        """Test a multi-day window is split into raw, hourly and daily pieces."""
+        segments = window_segments(datetime(2025, 1, 1, 22, 30), datetime(2025, 1, 4, 1, 15))
+
+        assert segments == [
+            ("raw", "2025-01-01T22:30:00", "2025-01-01T23:00:00"),
+            ("raw", "2025-01-04T01:00:00", "2025-01-04T01:15:00"),
+            ("hourly", "2025-01-01T23", "2025-01-02T00"),
+            ("hourly", "2025-01-04T00", "2025-01-04T01"),
+            ("daily", "2025-01-02", "2025-01-04"),
+        ]
+
+    def test_backfill_and_prune(self, initialized_db):
+        """Test rollups are backfilled from existing rows and stay exact after pruning."""
+        base = datetime(2025, 1, 1, 12, 0)
+        for minutes in range(0, 600, 10):
+            initialized_db.insert(
+                "cost_entries", self._row(base + timedelta(minutes=minutes), "haiku", 0.5)
+            )
+
+        rollups = RollupTables(
+            initialized_db,
+            raw_table="cost_entries",
+            prefix="cost_rollup",
+            keys=["model_name"],
+            measures={"requests": ("sum", "1"), "cost_usd": ("sum", "cost_usd")},
+        )
+        assert rollups.create() is True
+        assert rollups.window()[0]["requests"] == 60
+
+        deleted = rollups.prune(base + timedelta(minutes=95))
+
+        assert deleted == 10
+        assert rollups.window()[0]["requests"] == 50
+        hourly = initialized_db.query_one(
+            "SELECT requests FROM cost_rollup_hourly WHERE bucket = '2025-01-01T13'"
+        )
+        assert hourly["requests"] == 2
+
+
 class TestCostTrackerIntegration:
     """Test CostTracker integration with SQLite."""
 
@@ -337,3 +441,94 @@ class TestCostTrackerIntegration:
             assert len(results) == 1
             assert results[0]["model_name"] == "claude-sonnet-4"
             assert results[0]["input_tokens"] == 1000
+
+    def test_cost_tracker_summary_from_rollups(self, capsys):
+        """Test summaries and budget checks are answered from the rollups."""
+        from core.routing.cost_tracker import CostTracker
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test_tracker.db"
+            tracker = CostTracker(storage_path=db_path, budget_daily=0.01)
+
+            for i in range(4):
+                tracker.record(
+                    model="haiku" if i % 2 else "sonnet",
+                    task_id=f"task-{i}",
+                    task_type="review" if i < 3 else "code_generation",
+                    input_tokens=100,
+                    output_tokens=50,
+                    input_cost=0.002,
+                    output_cost=0.001,
+                )
+            tracker.rollups.insert(
+                {
+                    "timestamp": (datetime.now() - timedelta(days=100)).isoformat(),
+                    "model_name": "opus",
+                    "task_type": "review",
+                    "input_tokens": 1,
+                    "output_tokens": 1,
+                    "cost_usd": 5.0,
+                }
+            )
+
+            assert "Daily budget exceeded: $0.0120" in capsys.readouterr().out
+
+            # A new tracker answers from the database without loading entries
+            reopened = CostTracker(storage_path=db_path)
+            day = reopened.get_summary("day")
+            assert day.total_requests == 4
+            assert day.total_cost == pytest.approx(0.012)
+            assert day.requests_by_model == {"haiku": 2, "sonnet": 2}
+            assert day.cost_by_task_type == pytest.approx(
+                {"review": 0.009, "code_generation": 0.003}
+            )
+            assert reopened.get_summary("all").total_requests == 5
+
+            recent = reopened.get_recent_entries(limit=1)[0]
+            assert recent.task_id == "task-3"
+            assert recent.task_type == "code_generation"
+            assert recent.input_cost == pytest.approx(0.002)
+
+            reopened.clear_old_entries(days=90)
+            assert reopened.get_summary("all").total_requests == 4
+
+    def test_cost_tracker_upgrades_simplified_schema(self):
+        """Test an existing simplified cost_entries table is upgraded and backfilled."""
+        from core.routing.cost_tracker import CostTracker
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "legacy.db"
+            db = Database(db_path)
+            db.run_migration(
+                """
+                CREATE TABLE cost_entries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    task_id TEXT,
+                    model_name TEXT NOT NULL,
+                    input_tokens INTEGER NOT NULL,
+                    output_tokens INTEGER NOT NULL,
+                    cost_usd REAL NOT NULL,
+                    session_id TEXT
+                )
+                """
+            )
+            db.insert(
+                "cost_entries",
+                {
+                    "timestamp": (datetime.now() - timedelta(hours=2)).isoformat(),
+                    "task_id": "legacy",
+                    "model_name": "opus",
+                    "input_tokens": 10,
+                    "output_tokens": 5,
+                    "cost_usd": 0.25,
+                },
+            )
+            db.close()
+
+            tracker = CostTracker(storage_path=db_path)
+            summary = tracker.get_summary("day")
+
+            assert summary.total_requests == 1
+            assert summary.cost_by_task_type == {"unknown": 0.25}
+            assert tracker.get_recent_entries()[0].task_type == "unknown"
@@ -7,6 +7,7 @@ and completion handling.
 
 import pytest
 from datetime import datetime, timedelta
+from core.priority_scheduler import PriorityScheduler, SchedulingStrategy
 from core.task_queue import TaskQueue, QueuedTask, TaskStatus
 
 
@@ -665,3 +666,98 @@ class TestTaskQueue:
         ready = queue.get_ready_tasks()
         assert len(ready) == 1
         assert ready[0].id == "task3"
+
+
+def make_task(task_id, dependencies=None, estimated_minutes=60):
+    """Build a QueuedTask with test defaults"""
+    return QueuedTask(
+        id=task_id,
+        name=task_id,
+        description="Desc",
+        file_path=f"core/{task_id}.py",
+        estimated_minutes=estimated_minutes,
+        complexity="simple",
+        domain="backend",
+        dependencies=dependencies or [],
+    )
+
+
+class TestReadySetTracking:
+    """Test suite for incremental ready-set tracking"""
+
+    def test_dependency_added_after_dependent(self):
+        """Test dependents queued before their dependency are released on completion"""
+        queue = TaskQueue()
+        queue.add_task(make_task("b", ["a"]))
+        queue.add_task(make_task("a"))
+
+        assert queue.get_next_task().id == "a"
+        queue.start_task("a")
+        queue.complete_task("a")
+
+        assert queue.get_next_task().id == "b"
+
+    def test_waits_for_all_dependencies(self):
+        """Test task with several dependencies waits for the last one"""
+        queue = TaskQueue()
+        queue.add_tasks([make_task("a"), make_task("b"), make_task("c", ["a", "b"])])
+
+        queue.start_task("a")
+        queue.complete_task("a")
+        assert queue.tasks["c"].status == TaskStatus.BLOCKED
+
+        queue.start_task("b")
+        queue.complete_task("b")
+        assert queue.tasks["c"].status == TaskStatus.READY
+
+    def test_drains_in_first_ready_order(self):
+        """Test ready tasks are served in the order they became ready"""
+        queue = TaskQueue()
+        queue.add_tasks([make_task("a"), make_task("b", ["a"]), make_task("c")])
+
+        order = []
+        while (task := queue.get_next_task()) is not None:
+            queue.start_task(task.id)
+            queue.complete_task(task.id)
+            order.append(task.id)
+
+        assert order == ["a", "c", "b"]
+        assert queue.execution_order == ["a", "c", "b"]
+        assert queue.is_complete()
+
+    def test_scheduler_orders_ready_tasks(self):
+        """Test ready tasks are ordered by PriorityScheduler score"""
+        queue = TaskQueue(scheduler=PriorityScheduler(SchedulingStrategy.SHORTEST_FIRST))
+        queue.add_tasks([make_task("long", estimated_minutes=240), make_task("short", [], 5)])
+
+        assert queue.get_next_task().id == "short"
+
+    def test_retried_task_keeps_its_place(self):
+        """Test failed task re-enters the ready set ahead of later tasks"""
+        queue = TaskQueue()
+        queue.add_tasks([make_task("a"), make_task("b")])
+
+        queue.start_task("a")
+        queue.fail_task("a", "flaky")
+
+        assert queue.get_next_task().id == "a"
+
+    def test_set_status_completed_releases_dependents(self):
+        """Test restoring a completed status unblocks dependents"""
+        queue = TaskQueue()
+        queue.add_tasks([make_task("a"), make_task("b", ["a"])])
+
+        assert queue.set_status("a", TaskStatus.COMPLETED)
+
+        assert queue.tasks["b"].status == TaskStatus.READY
+        assert queue.tasks_completed == 0
+        assert not queue.set_status("missing", TaskStatus.COMPLETED)
+
+    def test_restored_execution_order(self):
+        """Test assigning a saved execution order changes serving order"""
+        queue = TaskQueue()
+        queue.add_tasks([make_task("a"), make_task("b")])
+
+        queue.execution_order = ["b", "a"]
+
+        assert queue.get_next_task().id == "b"
@@ -9,6 +9,9 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from tempfile import TemporaryDirectory
 import json
+import random
+import threading
+import time
 
 from core.telemetry import (
     Event,
@@ -26,6 +29,7 @@ from core.telemetry import (
     Threshold,
     AlertLevel,
     PerformanceTracker,
+    QuantileSketch,
     Timer,
 )
 
@@ -451,6 +455,146 @@ class TestEventCollector:
             assert collector2.events[0].event_id == "persist-1"
 
 
+class TestEventCollectorWriteBehind:
+    """Test background-thread batched SQLite persistence."""
+
+    def _collector(self, tmpdir, **kwargs):
+        return EventCollector(
+            storage_path=Path(tmpdir) / "events.json",
+            db_path=Path(tmpdir) / "telemetry.db",
+            write_behind=True,
+            **kwargs,
+        )
+
+    def test_query_sees_queued_events(self):
+        """Test read-your-writes: queries wait for events queued before them."""
+        with TemporaryDirectory() as tmpdir:
+            collector = self._collector(tmpdir, flush_interval=5.0)
+            collector.collect(TaskEvent(event_type=EventType.TASK_COMPLETED, task_id="t-1"))
+            collector.collect(BuildEvent(event_type=EventType.BUILD_STARTED, build_id="b-1"))
+
+            results = collector.query()
+            assert {e.event_id for e in results} == {e.event_id for e in collector.buffer}
+            assert collector.get_statistics()["total_events"] == 2
+            collector.close()
+
+    def test_batches_use_one_transaction(self):
+        """Test events are inserted with executemany, not one insert each."""
+        with TemporaryDirectory() as tmpdir:
+            collector = self._collector(tmpdir, batch_size=50)
+            calls = []
+            original = collector.db.insert_many
+
+            def spy(table, columns, rows, or_ignore=False):
+                calls.append(len(rows))
+                return original(table, columns, rows, or_ignore=or_ignore)
+
+            collector.db.insert_many = spy
+            for i in range(100):
+                collector.collect(Event(event_type=EventType.TASK_STARTED, event_id=f"e-{i}"))
+            collector.close()
+
+            assert sum(calls) == 100
+            assert len(calls) < 100
+            count = collector.db.query_one("SELECT COUNT(*) AS n FROM events")["n"]
+            assert count == 100
+
+    def test_close_drains_queue(self):
+        """Test shutdown persists everything queued and falls back to inline writes."""
+        with TemporaryDirectory() as tmpdir:
+            collector = self._collector(tmpdir, flush_interval=5.0)
+            for i in range(10):
+                collector.collect(Event(event_type=EventType.TASK_STARTED, event_id=f"e-{i}"))
+            collector.close()
+            assert not collector._writer.is_alive()
+
+            collector.collect(Event(event_type=EventType.TASK_STARTED, event_id="late"))
+            count = collector.db.query_one("SELECT COUNT(*) AS n FROM events")["n"]
+            assert count == 11
+
+    def test_auto_flush_does_not_wait_for_writer(self):
+        """Test a full JSON buffer flushes without waiting on a stalled SQLite writer."""
+        with TemporaryDirectory() as tmpdir:
+            collector = self._collector(tmpdir, buffer_size=5, write_wait_timeout=0.2)
+            release = threading.Event()
+            original = collector._write_batch
+
+            def stalled(events):
+                release.wait(5)
+                original(events)
+
+            collector._write_batch = stalled
+            start = time.monotonic()
+            for i in range(12):
+                collector.collect(Event(event_type=EventType.TASK_STARTED, event_id=f"e-{i}"))
+            assert time.monotonic() - start < 0.2
+            assert len(collector.events) == 10
+
+            # Reads give up after write_wait_timeout instead of hanging
+            start = time.monotonic()
+            collector.query_rows("SELECT COUNT(*) AS n FROM events")
+            assert 0.15 < time.monotonic() - start < 2.0
+
+            release.set()
+            collector.close()
+            count = collector.db.query_one("SELECT COUNT(*) AS n FROM events")["n"]
+            assert count == 12
+
+    def test_drop_oldest_when_full(self):
+        """Test drop_oldest keeps the newest events when the queue is full."""
+        with TemporaryDirectory() as tmpdir:
+            collector = self._collector(tmpdir, queue_size=5, backpressure="drop_oldest")
+            # Stop the writer so the queue fills deterministically
+            collector.close()
+            collector._closed = False
+            for i in range(8):
+                collector._enqueue(Event(event_type=EventType.TASK_STARTED, event_id=f"e-{i}"))
+
+            assert collector.dropped_events == 3
+            queued = [collector._write_queue.get_nowait().event_id for _ in range(5)]
+            assert queued == ["e-3", "e-4", "e-5", "e-6", "e-7"]
+
+    def test_drop_oldest_never_drops_flush_marker(self):
+        """Test drop_oldest evicts events around a queued flush marker, not the marker."""
+        from core.telemetry.event_collector import _FlushMarker
+
+        with TemporaryDirectory() as tmpdir:
+            collector = self._collector(tmpdir, queue_size=3, backpressure="drop_oldest")
+            collector.close()
+            collector._closed = False
+            marker = _FlushMarker()
+            collector._write_queue.put_nowait(marker)
+            for i in range(4):
+                collector._enqueue(Event(event_type=EventType.TASK_STARTED, event_id=f"e-{i}"))
+
+            assert not marker.done.is_set()
+            assert collector.dropped_events == 2
+            queued = [collector._write_queue.get_nowait() for _ in range(3)]
+            assert queued[0] is marker
+            assert [e.event_id for e in queued[1:]] == ["e-2", "e-3"]
+
+    def test_sample_when_nearly_full(self):
+        """Test sample keeps one in sample_every events above the high-water mark."""
+        with TemporaryDirectory() as tmpdir:
+            collector = self._collector(
+                tmpdir, queue_size=100, backpressure="sample", sample_every=4
+            )
+            collector.close()
+            for _ in range(75):
+                collector._write_queue.put_nowait(Event(event_type=EventType.TASK_STARTED))
+            for _ in range(20):
+                collector._enqueue(Event(event_type=EventType.TASK_STARTED))
+
+            assert collector.dropped_events == 15
+            assert collector._write_queue.qsize() == 80
+
+    def test_rejects_unknown_policy(self):
+        """Test an unknown backpressure policy is rejected."""
+        with TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError):
+                self._collector(tmpdir, backpressure="spill")
+
+
 class TestMetricsAnalyzer:
     """Test MetricsAnalyzer functionality."""
 
@@ -520,6 +664,112 @@ class TestMetricsAnalyzer:
             assert summary.total_tasks == 3
 
 
+class TestMetricsAnalyzerSQL:
+    """Test SQL-side aggregation matches the in-memory path."""
+
+    def _events(self):
+        now = datetime.now()
+        events = []
+        for i in range(40):
+            events.append(
+                TaskEvent(
+                    event_type=EventType.TASK_FAILED if i % 5 == 0 else EventType.TASK_COMPLETED,
+                    timestamp=now - timedelta(hours=i),
+                    event_id=f"task-{i}",
+                    task_id=f"t{i}",
+                    model_used="sonnet" if i % 3 else "haiku",
+                    duration_ms=float(100 + i * 10) if i % 4 else 0.0,
+                    tokens_used=100 * i,
+                    cost_usd=0.01 * i,
+                    success=i % 5 != 0,
+                )
+            )
+        for i, error_type in enumerate(["ImportError", "ImportError", "", "KeyError"]):
+            events.append(
+                ErrorEvent(
+                    event_type=EventType.ERROR_OCCURRED,
+                    timestamp=now - timedelta(hours=i, minutes=30),
+                    event_id=f"err-{i}",
+                    error_type=error_type,
+                    error_message=f"message {i}",
+                    component="builder",
+                )
+            )
+        events.append(
+            Event(event_type=EventType.SECRET_DETECTED, timestamp=now, event_id="sec-1")
+        )
+        return events
+
+    def _analyzers(self, tmpdir):
+        sql = EventCollector(
+            storage_path=Path(tmpdir) / "sql.json", db_path=Path(tmpdir) / "telemetry.db"
+        )
+        memory = EventCollector(storage_path=Path(tmpdir) / "memory.json", use_sqlite=False)
+        events = self._events()
+        for collector in (sql, memory):
+            for event in events:
+                collector.collect(event)
+        return MetricsAnalyzer(sql), MetricsAnalyzer(memory)
+
+    @pytest.mark.parametrize("period", ["day", "week", "all"])
+    def test_summary_matches_in_memory(self, period):
+        """Test GROUP BY summary equals the Python summary."""
+        with TemporaryDirectory() as tmpdir:
+            sql, memory = self._analyzers(tmpdir)
+            expected = memory.calculate_summary(period=period)
+            actual = sql.calculate_summary(period=period)
+
+            for name in (
+                "total_tasks",
+                "successful_tasks",
+                "failed_tasks",
+                "success_rate",
+                "p95_duration_ms",
+                "p99_duration_ms",
+                "total_tokens",
+                "total_errors",
+                "error_rate",
+                "errors_by_type",
+                "models_used",
+                "most_used_model",
+                "security_violations",
+            ):
+                assert getattr(actual, name) == getattr(expected, name), name
+            assert actual.avg_duration_ms == pytest.approx(expected.avg_duration_ms)
+            assert actual.total_cost_usd == pytest.approx(expected.total_cost_usd)
+            if period == "all":
+                assert (actual.start_time, actual.end_time) == (
+                    expected.start_time,
+                    expected.end_time,
+                )
+
+    def test_top_errors_match_in_memory(self):
+        """Test error top-N with the most recent example per type."""
+        with TemporaryDirectory() as tmpdir:
+            sql, memory = self._analyzers(tmpdir)
+            actual = sql.get_top_errors(limit=2)
+
+            assert actual == memory.get_top_errors(limit=2)
+            assert actual[0]["error_type"] == "ImportError"
+            assert actual[0]["count"] == 2
+            assert actual[0]["example"]["message"] == "message 0"
+
+    def test_performance_trends(self):
+        """Test trends are bucketed by day from one query."""
+        with TemporaryDirectory() as tmpdir:
+            sql, memory = self._analyzers(tmpdir)
+            trends = sql.get_performance_trends(days=3, metric="duration_ms")
+
+            assert list(trends) == list(memory.get_performance_trends(days=3))
+            assert sum(len(v) for v in trends.values()) == sum(
+                1 for e in self._events() if isinstance(e, TaskEvent) and e.duration_ms > 0
+            )
+            assert all(v > 0 for values in trends.values() for v in values)
+            assert sql.get_performance_trends(days=2, metric="bogus") == {
+                k: [] for k in list(trends)[:2]
+            }
+
+
 class TestPerformanceTracker:
     """Test PerformanceTracker functionality."""
 
@@ -545,6 +795,105 @@ class TestPerformanceTracker:
             # Verify metric was recorded
             assert len(tracker.measurements) > 0
 
+    def test_get_metrics_from_sketches(self):
+        """Test windowed metrics merge per-operation sketches."""
+        with TemporaryDirectory() as tmpdir:
+            tracker = PerformanceTracker(storage_path=Path(tmpdir) / "perf.json")
+            for i in range(1, 1001):
+                tracker.record_measurement("build", duration_ms=float(i), memory_mb=float(i % 7))
+            for i in range(1, 101):
+                tracker.record_measurement("api_call", duration_ms=float(i) / 10)
+
+            metrics = tracker.get_metrics(hours=1)
+            assert metrics.total_operations == 1100
+            assert metrics.max_duration_ms == 1000.0
+            assert metrics.peak_memory_mb == 6.0
+            assert metrics.p95_duration_ms == pytest.approx(950, rel=0.02)
+            assert metrics.by_operation["api_call"]["count"] == 100
+            assert metrics.by_operation["build"]["min_duration_ms"] == 1.0
+
+            build = tracker.get_metrics(operation_type="build", hours=1)
+            assert build.p50_duration_ms == pytest.approx(501, rel=0.02)
+            assert set(build.by_operation) == {"build"}
+
+    def test_log_survives_restart(self):
+        """Test measurements are appended to SQLite and reloaded."""
+        with TemporaryDirectory() as tmpdir:
+            storage_path = Path(tmpdir) / "perf.json"
+            tracker = PerformanceTracker(storage_path=storage_path, flush_every=10)
+            for i in range(25):
+                tracker.record_measurement("build", duration_ms=float(i), metadata={"n": i})
+
+            slowest = tracker.get_slowest_operations(limit=2)
+            assert [m["duration_ms"] for m in slowest] == [24.0, 23.0]
+            assert slowest[0]["metadata"] == {"n": 24}
+
+            reloaded = PerformanceTracker(storage_path=storage_path)
+            assert reloaded.get_metrics().total_operations == 25
+            assert not storage_path.exists()
+
+    def test_imports_legacy_json(self):
+        """Test a pre-SQLite performance.json is imported once."""
+        with TemporaryDirectory() as tmpdir:
+            storage_path = Path(tmpdir) / "perf.json"
+            legacy = [
+                {
+                    "timestamp": datetime.now().isoformat(),
+                    "operation_type": "api_call",
+                    "duration_ms": 42.0,
+                    "cpu_percent": 0.0,
+                    "memory_mb": 0.0,
+                    "metadata": {},
+                }
+            ]
+            storage_path.write_text(json.dumps({"measurements": legacy, "version": "1.0"}))
+
+            PerformanceTracker(storage_path=storage_path)
+            tracker = PerformanceTracker(storage_path=storage_path)
+            assert tracker.get_metrics().total_operations == 1
+            assert tracker.get_slowest_operations()[0]["duration_ms"] == 42.0
+
+
+class TestQuantileSketch:
+    """Test QuantileSketch accuracy and merging."""
+
+    def test_relative_accuracy(self):
+        """Test quantiles stay within the configured relative error."""
+        rng = random.Random(0)
+        values = [rng.lognormvariate(5, 1.5) for _ in range(5000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for v in values:
+            sketch.add(v)
+
+        ordered = sorted(values)
+        for q in (0.0, 0.5, 0.9, 0.95, 0.99, 1.0):
+            exact = ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.01)
+        assert sketch.count == 5000
+        assert sketch.avg == pytest.approx(sum(values) / len(values))
+
+    def test_merge_equals_single_sketch(self):
+        """Test merging bucket sketches matches one sketch over all values."""
+        whole, parts = QuantileSketch(), [QuantileSketch() for _ in range(4)]
+        for i in range(1000):
+            whole.add(float(i))
+            parts[i % 4].add(float(i))
+
+        merged = QuantileSketch.merged(parts)
+        for q in (0.5, 0.95, 0.99):
+            assert merged.quantile(q) == whole.quantile(q)
+        assert (merged.min, merged.max, merged.count) == (0.0, 999.0, 1000)
+
+    def test_bins_are_bounded(self):
+        """Test the bin cap holds and high quantiles stay accurate."""
+        sketch = QuantileSketch(max_bins=64)
+        for i in range(1, 100_000, 7):
+            sketch.add(i / 1000)
+
+        assert len(sketch.bins) <= 64
+        assert sketch.quantile(0.99) == pytest.approx(99.0, rel=0.02)
+        assert QuantileSketch().quantile(0.5) is None
+
 
 class TestIntegration:
     """Integration tests for complete telemetry workflow."""
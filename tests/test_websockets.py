@@ -12,7 +12,10 @@ from api.websockets.live_updates import (
     broadcast_telemetry_event,
     broadcast_progress_update,
     broadcast_session_update,
+    broadcast_runtime_stream,
+    manager,
 )
+from core.runtime.result_schema import StreamEvent
 from core.telemetry import Event, EventType
 from datetime import datetime
 
@@ -182,3 +185,22 @@ class TestBroadcastFunctions:
     async def test_broadcast_session_update(self):
         """Test broadcasting session update"""
         assert callable(broadcast_session_update)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_runtime_stream(self, monkeypatch):
+        """Runtime stream events are broadcast as runtime_stream messages"""
+        sent = []
+
+        async def fake_broadcast(message):
+            sent.append(message)
+
+        monkeypatch.setattr(manager, "broadcast", fake_broadcast)
+        event = StreamEvent(event_type="token", sequence=3, message="Hel")
+
+        await broadcast_runtime_stream("task-1", "ollama", event)
+
+        assert sent[0]["type"] == "runtime_stream"
+        assert sent[0]["task_id"] == "task-1"
+        assert sent[0]["runtime"] == "ollama"
+        assert sent[0]["event_type"] == "token"
+        assert sent[0]["message"] == "Hel"